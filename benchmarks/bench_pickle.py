@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Benchmark pickling an IDFDocument for transfer to worker processes.
+
+Compares the compact ``IDFDocument.__reduce__`` (object data only, schema
+referenced by version, references rebuilt on load) against a "full state"
+pickle that serializes every slot -- the schema, per-object schema
+fragments and the reference graph -- which is what pickling a document
+cost before compact support was added.
+
+Reports payload size and ``dumps``/``loads`` wall-clock time for the
+synthetic model generated by ``bench.py``.
+
+Usage:
+    uv run python benchmarks/bench_pickle.py
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench import generate_test_idf
+
+from idfkit import load_idf
+from idfkit.document import IDFDocument
+from idfkit.objects import IDFObject, _new_object
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+ITERATIONS = 10
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class _FullStatePickler(pickle.Pickler):
+    """Pickler that serializes documents and objects slot-by-slot."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, IDFDocument):
+            cls = type(obj)
+            state = {slot: getattr(obj, slot) for slot in IDFDocument.__slots__}
+            return (cls.__new__, (cls,), (None, state))
+        if isinstance(obj, IDFObject):
+            state = (
+                obj._type,
+                obj._name,
+                obj._data,
+                obj._schema,
+                obj._document,
+                obj._field_order,
+                obj._ref_fields,
+                obj._version,
+            )
+            return (_new_object, (type(obj)._class_key,), state)
+        return NotImplemented
+
+
+def _dumps_full(doc: IDFDocument) -> bytes:
+    buf = io.BytesIO()
+    _FullStatePickler(buf, protocol=PROTOCOL).dump(doc)
+    return buf.getvalue()
+
+
+def _dumps_compact(doc: IDFDocument) -> bytes:
+    return pickle.dumps(doc, protocol=PROTOCOL)
+
+
+def _time(func: Any, *args: Any) -> float:
+    times: list[float] = []
+    for _ in range(ITERATIONS):
+        gc.collect()
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        idf_path = Path(tmp) / "bench.idf"
+        idf_path.write_text(generate_test_idf())
+        doc = load_idf(str(idf_path))
+
+    print(f"Model: {len(doc)} objects, {len(doc.references)} references\n")
+    print(f"{'Strategy':<12} {'Size (KiB)':>12} {'dumps (ms)':>12} {'loads (ms)':>12}")
+
+    for label, dumps in (("full state", _dumps_full), ("compact", _dumps_compact)):
+        payload = dumps(doc)
+        dump_t = _time(dumps, doc)
+        load_t = _time(pickle.loads, payload)
+        print(f"{label:<12} {len(payload) / 1024:>12.1f} {dump_t * 1000:>12.2f} {load_t * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import BatchStore, TabularSpec, TimeSeriesSpec, simulate_batch
+
+store = BatchStore(
+    "sweep.sqlite3",
+    timeseries=[TimeSeriesSpec("Zone Mean Air Temperature", "ZONE 1", environment="annual")],
+    tabular=[TabularSpec("AnnualBuildingUtilityPerformanceSummary", "Site and Source Energy")],
+)
+
+# Extract in the workers, then drop the run directories
+batch = simulate_batch(jobs, reducer=store.extract, keep_run_dirs=False)
+store.ingest(zip([job.label for job in jobs], batch.values))
+
+# Compare runs
+eui = store.get_tabular_value(
+    "AnnualBuildingUtilityPerformanceSummary",
+    "Site and Source Energy",
+    "Total Site Energy",
+    "Energy Per Total Building Area",
+)
+temps = store.to_dataframe("Zone Mean Air Temperature", "ZONE 1")  # one column per label
+# --8<-- [end:example]
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import simulate_batch
+
+batch = simulate_batch(jobs, dedupe=True)
+print(f"{len(batch)} results from {len(batch) - batch.deduplicated} simulations")
+# --8<-- [end:example]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import SQLiteWorkQueue, collect_batch, iter_batch_results, submit_batch
+
+queue = SQLiteWorkQueue("/var/tmp/sweep.db")
+batch_id = submit_batch(queue, jobs)
+
+# Start workers in as many processes on this host as you like:
+#   python -m idfkit.simulation.distributed /var/tmp/sweep.db --idle-timeout 60
+
+# Stream results as they finish...
+for event in iter_batch_results(queue, batch_id):
+    print(f"[{event.completed}/{event.total}] {event.label}: {event.result.success}")
+
+# ...or wait for the whole batch
+batch = collect_batch(queue, batch_id)
+# --8<-- [end:example]
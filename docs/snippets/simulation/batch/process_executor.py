@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import simulate_batch
+
+# Each worker process copies, writes and hashes its own models
+batch = simulate_batch(jobs, max_workers=32, executor="process")
+# --8<-- [end:example]
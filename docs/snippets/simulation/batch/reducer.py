@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import SimulationResult, simulate_batch
+
+
+def kpis(result: SimulationResult) -> dict[str, float]:
+    sql = result.sql
+    assert sql is not None
+    return {
+        "eui": float(
+            sql.get_tabular_value(
+                "AnnualBuildingUtilityPerformanceSummary",
+                "Site and Source Energy",
+                "Total Site Energy",
+                "Energy Per Total Building Area",
+            )
+        ),
+        "unmet_hours": float(
+            sql.get_tabular_value(
+                "SystemSummary",
+                "Time Setpoint Not Met",
+                "Facility",
+                "During Occupied Heating",
+            )
+        ),
+    }
+
+
+batch = simulate_batch(jobs, reducer=kpis, keep_run_dirs=False)
+for job, values in zip(jobs, batch.values):
+    print(job.label, values)
+# --8<-- [end:example]
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import JobScheduler, simulate_batch
+
+scheduler = JobScheduler(
+    "~/.cache/idfkit/runtimes.json",  # runtime history, updated after each run
+    memory_budget=32e9,  # bytes across running jobs
+)
+batch = simulate_batch(jobs, scheduler=scheduler)
+# --8<-- [end:example]
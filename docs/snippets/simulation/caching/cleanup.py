@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from idfkit.simulation import SimulationCache
+from idfkit.simulation import CacheKey, SimulationCache
 
 cache: SimulationCache = ...  # type: ignore[assignment]
+key: CacheKey = ...  # type: ignore[assignment]
 # --8<-- [start:example]
 # Clear everything
 cache.clear()
 
-# Or manually delete specific entries
-import shutil
+# Trim to 10 GB, dropping least recently used entries first
+cache.prune(max_bytes=10 * 1024**3)
 
-shutil.rmtree(cache.cache_dir / "abc123...")
+# Or delete a specific entry
+cache.remove(key)
 # --8<-- [end:example]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from idfkit.simulation import SimulationJob
+
+jobs: list[SimulationJob] = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+from idfkit.simulation import RemoteSimulationCache, S3FileSystem, simulate_batch
+
+cache = RemoteSimulationCache(
+    S3FileSystem(bucket="my-simulations"),
+    prefix="cache/v1",
+    max_bytes=20 * 1024**3,  # local tier only
+)
+
+# Every host running this reuses results published by the others
+batch = simulate_batch(jobs, cache=cache)
+# --8<-- [end:example]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+# --8<-- [start:example]
+from idfkit.simulation import SimulationCache
+
+cache = SimulationCache(max_bytes=50 * 1024**3, eviction="lru")
+
+stats = cache.stats()
+print(f"{stats.entries} entries, {stats.total_bytes / 1e9:.1f} GB, hit rate {stats.hit_rate:.0%}")
+
+for entry in cache.entries()[:5]:
+    print(entry.key.hex_digest[:12], entry.size_bytes, entry.hits)
+# --8<-- [end:example]
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+# --8<-- [start:example]
+from idfkit.simulation import SimulationCache
+
+# Keep only the SQLite database and the error report of each run
+cache = SimulationCache(outputs=("*.sql", "*.err"))
+
+# Gzip entries unused for 30 days; they are expanded on their next hit
+cache.compress(older_than=30 * 24 * 3600)
+# --8<-- [end:example]
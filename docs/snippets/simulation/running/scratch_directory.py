@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from idfkit import IDFDocument
+from idfkit.simulation import simulate
+
+model: IDFDocument = ...  # type: ignore[assignment]
+weather: str = ...  # type: ignore[assignment]
+# --8<-- [start:example]
+# Run in RAM; or set IDFKIT_SCRATCH_DIR=/dev/shm for every run
+result = simulate(model, weather, scratch_dir="/dev/shm")
+# --8<-- [end:example]
+# --8<-- [start:prune]
+from idfkit.simulation import prune_input_store
+
+prune_input_store("/dev/shm")  # remove inputs no run directory uses
+# --8<-- [end:prune]
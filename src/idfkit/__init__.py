@@ -32,6 +32,9 @@ if TYPE_CHECKING:
 
 __version__ = "0.1.0"
 
+# Document diffing
+from .diff import DocumentDiff, FieldChange, ObjectChange, diff_documents
+
 # Core classes
 from .document import IDFDocument
 from .epjson_parser import parse_epjson
@@ -94,7 +97,7 @@ from .introspection import FieldDescription, ObjectDescription
 from .objects import IDFCollection, IDFObject
 
 # Reference graph
-from .references import ReferenceGraph
+from .references import CompactReferenceGraph, ReferenceGraph
 
 # Schedule builders
 from .schedules.builder import (
@@ -106,10 +109,14 @@ from .schedules.builder import (
 # Schema access
 from .schema import EpJSONSchema, SchemaManager, get_schema, get_schema_manager
 
+# Version upgrades
+from .transition import UpgradeIssue, UpgradeResult, upgrade
+
 # Validation
 from .validation import (
     ValidationError,
     ValidationResult,
+    Validator,
     validate_document,
     validate_object,
 )
@@ -341,10 +348,13 @@ __all__ = [
     "ENERGYPLUS_VERSIONS",
     "LATEST_VERSION",
     "MINIMUM_VERSION",
+    "CompactReferenceGraph",
+    "DocumentDiff",
     "DuplicateObjectError",
     "EnergyPlusNotFoundError",
     "EpJSONSchema",
     "ExpandObjectsError",
+    "FieldChange",
     "FieldDescription",
     "HorizontalAdjacency",
     "IDFCollection",
@@ -354,6 +364,7 @@ __all__ = [
     "IDFParser",
     "IdfKitError",
     "NoDesignDaysError",
+    "ObjectChange",
     "ObjectDescription",
     "ParseError",
     "Polygon3D",
@@ -363,9 +374,12 @@ __all__ = [
     "SchemaNotFoundError",
     "SimulationError",
     "UnknownObjectTypeError",
+    "UpgradeIssue",
+    "UpgradeResult",
     "ValidationError",
     "ValidationFailedError",
     "ValidationResult",
+    "Validator",
     "Vector3D",
     "VersionNotFoundError",
     "ZoneFootprint",
@@ -386,6 +400,7 @@ __all__ = [
     "create_constant_schedule",
     "create_schedule_type_limits",
     "detect_horizontal_adjacencies",
+    "diff_documents",
     "find_closest_version",
     "footprint_courtyard",
     "footprint_h_shape",
@@ -415,6 +430,7 @@ __all__ = [
     "set_wwr",
     "split_horizontal_surface",
     "translate_building",
+    "upgrade",
     "validate_document",
     "validate_object",
     "version_string",
@@ -481,7 +481,7 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     lines.append("")
     lines.append("from __future__ import annotations")
     lines.append("")
-    lines.append("from collections.abc import Iterator")
+    lines.append("from collections.abc import Callable, Iterable, Iterator, Mapping")
     lines.append("from pathlib import Path")
     lines.append("from typing import Any, Generic, TypeVar")
     lines.append("")
@@ -489,6 +489,7 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     lines.append("from ._generated_types import *  # noqa: F403")
     lines.append("from ._generated_types import _ObjectTypeMap")
     lines.append("from .introspection import ObjectDescription")
+    lines.append("from .memory import MemoryReport")
     lines.append("from .objects import IDFCollection, IDFObject")
     lines.append("from .references import ReferenceGraph")
     lines.append("from .schema import EpJSONSchema")
@@ -512,6 +513,8 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     lines.append("        filepath: Path | str | None = ...,")
     lines.append("        *,")
     lines.append("        strict: Strict = ...,")
+    lines.append("        compact_references: bool = ...,")
+    lines.append("        eager_references: bool = ...,")
     lines.append("    ) -> None: ...")
     lines.append("")
 
@@ -524,6 +527,8 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     lines.append("    def collections(self) -> dict[str, IDFCollection[IDFObject]]: ...")
     lines.append("    @property")
     lines.append("    def references(self) -> ReferenceGraph: ...")
+    lines.append("    def build_references(self) -> None: ...")
+    lines.append("    def use_compact_references(self) -> None: ...")
     lines.append("")
 
     # get_collection — typed access for dynamic string keys (avoids TypedDict Unknown)
@@ -552,6 +557,10 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     # Remaining methods
     lines.append("    def removeidfobject(self, obj: IDFObject) -> None: ...")
     lines.append("    def rename(self, obj_type: str, old_name: str, new_name: str) -> None: ...")
+    lines.append("    def rename_many(")
+    lines.append("        self, renames: Mapping[tuple[str, str], str] | Callable[[IDFObject], str | None]")
+    lines.append("    ) -> int: ...")
+    lines.append("    def update_from_frame(self, obj_type: str, frame: Any) -> int: ...")
     lines.append("    def notify_name_change(self, obj: IDFObject, old_name: str, new_name: str) -> None: ...")
     lines.append(
         "    def notify_reference_change(self, obj: IDFObject, field_name: str, old_value: Any, new_value: Any) -> None: ..."
@@ -569,7 +578,16 @@ def generate_document_pyi(version: tuple[int, int, int] | None = None) -> str:
     lines.append(
         "    def expand(self, *, energyplus: EnergyPlusConfig | None = ..., timeout: float = ...) -> IDFDocument[Strict]: ..."
     )
+    lines.append("    def memory_report(self, *, include_schema_total: bool = ...) -> MemoryReport: ...")
     lines.append("    def copy(self) -> IDFDocument[Strict]: ...")
+    lines.append("    def extract(")
+    lines.append("        self,")
+    lines.append("        objects: Iterable[IDFObject],")
+    lines.append("        *,")
+    lines.append("        include_dependencies: bool = ...,")
+    lines.append("        include_referencing: bool = ...,")
+    lines.append("    ) -> IDFDocument[Strict]: ...")
+    lines.append("    def __reduce__(self) -> tuple[Any, ...]: ...")
     lines.append("")
 
     # Attribute accessor properties
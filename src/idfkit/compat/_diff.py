@@ -1,7 +1,8 @@
 """Schema indexing and cross-version diffing.
 
-Builds lightweight indices of object types and enumerated choice sets
-from ``EpJSONSchema`` instances, then computes diffs between versions.
+Builds lightweight indices of object types, field names and enumerated
+choice sets from ``EpJSONSchema`` instances, then computes diffs between
+versions.
 """
 
 from __future__ import annotations
@@ -23,12 +24,15 @@ class SchemaIndex:
             valid enum/choice string values for that field.
         groups: Mapping from object type name to its IDD group
             (e.g. ``"Zone"`` → ``"Thermal Zones and Surfaces"``).
+        fields: Mapping from object type name to its ordered IDD field
+            names (including ``"name"``, excluding extensible groups).
     """
 
     version: tuple[int, int, int]
     object_types: frozenset[str]
     choices: dict[tuple[str, str], frozenset[str]]
     groups: dict[str, str] = field(default_factory=lambda: {})
+    fields: dict[str, tuple[str, ...]] = field(default_factory=lambda: {})
 
 
 @dataclass(frozen=True)
@@ -43,6 +47,9 @@ class SchemaDiff:
         removed_choices: For each ``(obj_type, field_name)`` key, the set of
             choice values that were removed going from *from_version* to *to_version*.
         added_choices: Choice values that were added.
+        removed_fields: For object types present in both versions, the field
+            names that no longer exist in *to_version*.
+        added_fields: Field names that are new in *to_version*.
     """
 
     from_version: tuple[int, int, int]
@@ -51,6 +58,8 @@ class SchemaDiff:
     added_types: frozenset[str]
     removed_choices: dict[tuple[str, str], frozenset[str]]
     added_choices: dict[tuple[str, str], frozenset[str]]
+    removed_fields: dict[str, frozenset[str]] = field(default_factory=lambda: {})
+    added_fields: dict[str, frozenset[str]] = field(default_factory=lambda: {})
 
 
 def _extract_enum_values(field_schema: dict[str, Any]) -> set[str]:
@@ -78,15 +87,17 @@ def build_schema_index(schema: EpJSONSchema) -> SchemaIndex:
     """Build a :class:`SchemaIndex` from an ``EpJSONSchema``.
 
     Iterates over all object types and their field properties to collect
-    the set of object type names, all enumerated choice values, and
-    IDD group membership.
+    the set of object type names, their field names, all enumerated choice
+    values, and IDD group membership.
     """
     object_types: set[str] = set()
     choices: dict[tuple[str, str], frozenset[str]] = {}
     groups: dict[str, str] = {}
+    fields: dict[str, tuple[str, ...]] = {}
 
     for obj_type in schema.object_types:
         object_types.add(obj_type)
+        fields[obj_type] = tuple(schema.get_all_field_names(obj_type))
         group = schema.get_group(obj_type)
         if group is not None:
             groups[obj_type] = group
@@ -108,14 +119,16 @@ def build_schema_index(schema: EpJSONSchema) -> SchemaIndex:
         object_types=frozenset(object_types),
         choices=choices,
         groups=groups,
+        fields=fields,
     )
 
 
 def diff_schemas(from_index: SchemaIndex, to_index: SchemaIndex) -> SchemaDiff:
     """Compute the diff between two :class:`SchemaIndex` instances.
 
-    Returns a :class:`SchemaDiff` describing which object types and choice
-    values were added or removed between *from_index* and *to_index*.
+    Returns a :class:`SchemaDiff` describing which object types, fields
+    and choice values were added or removed between *from_index* and
+    *to_index*.
     """
     removed_types = from_index.object_types - to_index.object_types
     added_types = to_index.object_types - from_index.object_types
@@ -134,6 +147,17 @@ def diff_schemas(from_index: SchemaIndex, to_index: SchemaIndex) -> SchemaDiff:
         if added:
             added_choices[key] = frozenset(added)
 
+    removed_fields: dict[str, frozenset[str]] = {}
+    added_fields: dict[str, frozenset[str]] = {}
+
+    for obj_type in from_index.object_types & to_index.object_types:
+        from_fields = frozenset(from_index.fields.get(obj_type, ()))
+        to_fields = frozenset(to_index.fields.get(obj_type, ()))
+        if from_fields - to_fields:
+            removed_fields[obj_type] = from_fields - to_fields
+        if to_fields - from_fields:
+            added_fields[obj_type] = to_fields - from_fields
+
     return SchemaDiff(
         from_version=from_index.version,
         to_version=to_index.version,
@@ -141,4 +165,6 @@ def diff_schemas(from_index: SchemaIndex, to_index: SchemaIndex) -> SchemaDiff:
         added_types=added_types,
         removed_choices=removed_choices,
         added_choices=added_choices,
+        removed_fields=removed_fields,
+        added_fields=added_fields,
     )
@@ -0,0 +1,356 @@
+"""
+Structural diff between two IDF documents.
+
+Compares documents object-by-object using per-object content digests and
+the collections' name indexes, so unchanged object types are skipped
+without any field-level comparison.  Digests are 128-bit BLAKE2b hashes
+of a canonical encoding of each object, so equal digests stand in for
+equal content.  Digests are cached per object and
+invalidated through [mutation_version][idfkit.objects.IDFObject.mutation_version],
+which makes repeated diffs against the same baseline cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from weakref import ref
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from .document import IDFDocument
+    from .objects import IDFCollection, IDFObject
+
+_DIGEST_SIZE = 16
+# Integers beyond this cannot round-trip through float
+_MAX_EXACT_INT = 1 << 53
+
+
+class _DigestEntry(ref):  # pyright: ignore[reportMissingTypeArgument]
+    """Weak reference to an object carrying its cached digest.
+
+    One entry per object keeps the cache cheap to hit and adds a single
+    GC-tracked allocation per object; the callback evicts the entry when
+    the object dies, before its id can be reused.
+    """
+
+    __slots__ = ("digest", "key", "version")
+
+    key: int
+    version: int
+    digest: int
+
+
+def _evict(entry: _DigestEntry) -> None:
+    _digest_cache.pop(entry.key, None)
+
+
+# id(object) -> entry
+_digest_cache: dict[int, _DigestEntry] = {}
+
+
+@dataclass
+class FieldChange:
+    """
+    A single field whose value differs between two matched objects.
+
+    Attributes:
+        field: Python-style field name (``"name"`` for a name change)
+        old: Value in the first document (``None`` if unset)
+        new: Value in the second document (``None`` if unset)
+    """
+
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class ObjectChange:
+    """
+    An object present in both documents with differing content.
+
+    Attributes:
+        obj_type: Object type
+        name: Object name in the second document
+        old: The object in the first document
+        new: The object in the second document
+        fields: Per-field changes, in field order
+    """
+
+    obj_type: str
+    name: str
+    old: IDFObject
+    new: IDFObject
+    fields: list[FieldChange]
+
+
+@dataclass
+class DocumentDiff:
+    """
+    Result of [diff_documents][idfkit.diff.diff_documents].
+
+    Attributes:
+        added: Objects only present in the second document
+        removed: Objects only present in the first document
+        changed: Objects present in both documents whose content differs
+    """
+
+    added: list[IDFObject] = field(default_factory=lambda: [])
+    removed: list[IDFObject] = field(default_factory=lambda: [])
+    changed: list[ObjectChange] = field(default_factory=lambda: [])
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the documents are structurally identical."""
+        return not (self.added or self.removed or self.changed)
+
+    def __str__(self) -> str:
+        return f"DocumentDiff(added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)})"
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a field value into a canonical form with a deterministic ``repr``.
+
+    Numbers that compare equal (``1`` and ``1.0``) encode identically;
+    nested lists/dicts (epJSON extensible arrays) become tuples, with dict
+    items sorted by key.
+    """
+    if isinstance(value, bool):
+        return ("b", value)
+    if isinstance(value, float) or (isinstance(value, int) and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT):
+        return ("n", float(value))
+    if isinstance(value, list):
+        return tuple(_canonical(v) for v in value)  # pyright: ignore[reportUnknownVariableType]
+    if isinstance(value, dict):
+        return ("d", tuple(sorted((str(k), _canonical(v)) for k, v in value.items())))  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+    return value
+
+
+def _is_unset(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def object_digest(obj: IDFObject) -> int:
+    """
+    Return a content digest for *obj*, cached until the object is mutated.
+
+    The digest covers the object's name and every field with a value;
+    fields that are ``None`` or blank are treated as unset, so an object
+    parsed from IDF and the same object built with explicit blanks compare
+    equal.  The digest is a 128-bit BLAKE2b hash of a canonical encoding
+    of that content, so it is stable across processes and two objects
+    with equal digests can be treated as equal.
+
+    Examples:
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> zone = model.add("Zone", "Office")
+        >>> before = object_digest(zone)
+        >>> object_digest(zone) == before
+        True
+        >>> zone.x_origin = 5.0
+        >>> object_digest(zone) == before
+        False
+    """
+    version = obj.mutation_version
+    key = id(obj)
+    entry = _digest_cache.get(key)
+    if entry is not None and entry() is obj:
+        if entry.version == version:
+            return entry.digest
+    else:
+        entry = _DigestEntry(obj, _evict)
+        entry.key = key
+        _digest_cache[key] = entry
+
+    items = sorted((field_name, _canonical(value)) for field_name, value in obj.data.items() if not _is_unset(value))
+    encoded = repr((obj.name, items)).encode("utf-8", "surrogatepass")
+    digest = int.from_bytes(hashlib.blake2b(encoded, digest_size=_DIGEST_SIZE).digest(), "big")
+
+    entry.version = version
+    entry.digest = digest
+    return digest
+
+
+def _field_changes(old: IDFObject, new: IDFObject) -> list[FieldChange]:
+    """Compare two objects field-by-field, following the new object's field order."""
+    changes: list[FieldChange] = []
+    if old.name != new.name:
+        changes.append(FieldChange("name", old.name, new.name))
+
+    old_data = old.data
+    new_data = new.data
+    keys: list[str] = list(new.field_order or ())
+    seen = set(keys)
+    for key in (*new_data, *old_data):
+        if key not in seen:
+            seen.add(key)
+            keys.append(key)
+
+    for key in keys:
+        a = old_data.get(key)
+        b = new_data.get(key)
+        if _is_unset(a) and _is_unset(b):
+            continue
+        if a != b:
+            changes.append(FieldChange(key, None if _is_unset(a) else a, None if _is_unset(b) else b))
+    return changes
+
+
+def _type_digest(objects: Iterable[IDFObject]) -> bytes:
+    """Order-insensitive digest of a whole collection (a hash of its sorted object digests)."""
+    digests = sorted(object_digest(obj) for obj in objects)
+    encoded = b"".join(d.to_bytes(_DIGEST_SIZE, "big") for d in digests)
+    return hashlib.blake2b(encoded, digest_size=_DIGEST_SIZE).digest()
+
+
+def _record_change(obj_type: str, obj_a: IDFObject, obj_b: IDFObject, result: DocumentDiff) -> None:
+    """Record *obj_a* -> *obj_b* as changed if any field differs."""
+    changes = _field_changes(obj_a, obj_b)
+    if changes:
+        result.changed.append(ObjectChange(obj_type, obj_b.name, obj_a, obj_b, changes))
+
+
+def _diff_collection(
+    obj_type: str,
+    coll_a: IDFCollection[IDFObject],
+    coll_b: IDFCollection[IDFObject],
+    result: DocumentDiff,
+) -> None:
+    """Match objects of one type and record differences.
+
+    Named objects are matched by name.  Unnamed objects are first matched
+    by content digest, so reordering them is not a change; the rest are
+    paired by position.
+    """
+    by_name_b = coll_b.by_name
+    unnamed_a: list[IDFObject] = []
+    matched_b: set[int] = set()
+
+    for obj_a in coll_a:
+        name = obj_a.name
+        if not name:
+            unnamed_a.append(obj_a)
+            continue
+        obj_b = by_name_b.get(name.upper())
+        if obj_b is None:
+            result.removed.append(obj_a)
+            continue
+        matched_b.add(id(obj_b))
+        if object_digest(obj_a) != object_digest(obj_b):
+            _record_change(obj_type, obj_a, obj_b, result)
+
+    unnamed_b: list[IDFObject] = []
+    for obj_b in coll_b:
+        if not obj_b.name:
+            unnamed_b.append(obj_b)
+        elif id(obj_b) not in matched_b:
+            result.added.append(obj_b)
+
+    _diff_unnamed(obj_type, unnamed_a, unnamed_b, result)
+
+
+def _diff_unnamed(
+    obj_type: str,
+    unnamed_a: list[IDFObject],
+    unnamed_b: list[IDFObject],
+    result: DocumentDiff,
+) -> None:
+    """Match unnamed objects by content digest, then pair the rest by position."""
+    if not unnamed_a or not unnamed_b:
+        result.removed.extend(unnamed_a)
+        result.added.extend(unnamed_b)
+        return
+
+    matched_b: set[int] = set()
+    pool: dict[int, list[IDFObject]] = {}
+    for obj_b in unnamed_b:
+        pool.setdefault(object_digest(obj_b), []).append(obj_b)
+    left_a: list[IDFObject] = []
+    for obj_a in unnamed_a:
+        same = pool.get(object_digest(obj_a))
+        if same:
+            matched_b.add(id(same.pop(0)))
+        else:
+            left_a.append(obj_a)
+    left_b = [obj_b for obj_b in unnamed_b if id(obj_b) not in matched_b]
+
+    for obj_a, obj_b in zip(left_a, left_b, strict=False):
+        _record_change(obj_type, obj_a, obj_b, result)
+    result.removed.extend(left_a[len(left_b) :])
+    result.added.extend(left_b[len(left_a) :])
+
+
+def diff_documents(a: IDFDocument, b: IDFDocument) -> DocumentDiff:
+    """
+    Compute the structural difference between two documents.
+
+    Named objects are matched case-insensitively by name within each
+    object type.  Unnamed objects (e.g. ``Output:Variable``) are matched
+    by content first, so reordering them is not reported as a change;
+    the remaining unnamed objects are paired by position and reported as
+    changed, with any surplus added or removed.  An object type whose
+    object count and order-insensitive digest are identical in both
+    documents is skipped entirely, so diffing
+    a variant against its baseline only does field-level work for the
+    types that were actually edited.
+
+    Args:
+        a: The baseline document
+        b: The document to compare against the baseline
+
+    Returns:
+        A [DocumentDiff][idfkit.diff.DocumentDiff] with added, removed and
+        changed objects
+
+    Examples:
+        Diff a parametric variant against its baseline:
+
+        >>> from idfkit import new_document
+        >>> baseline = new_document()
+        >>> baseline.add("Zone", "Office", x_origin=0.0)  # doctest: +ELLIPSIS
+        Zone('Office')
+        >>> variant = baseline.copy()
+        >>> variant["Zone"]["Office"].x_origin = 10.0
+        >>> variant.add("Zone", "Core")  # doctest: +ELLIPSIS
+        Zone('Core')
+        >>> result = diff_documents(baseline, variant)
+        >>> [obj.name for obj in result.added]
+        ['Core']
+        >>> change = result.changed[0]
+        >>> change.name, change.fields[0].field, change.fields[0].old, change.fields[0].new
+        ('Office', 'x_origin', 0.0, 10.0)
+    """
+    result = DocumentDiff()
+    collections_a = a.collections
+    collections_b = b.collections
+    skipped = 0
+
+    for obj_type in {**collections_a, **collections_b}:
+        coll_a = collections_a.get(obj_type)
+        coll_b = collections_b.get(obj_type)
+        if not coll_b:
+            if coll_a:
+                result.removed.extend(coll_a)
+            continue
+        if not coll_a:
+            result.added.extend(coll_b)
+            continue
+        if len(coll_a) == len(coll_b) and _type_digest(coll_a) == _type_digest(coll_b):
+            skipped += 1
+            continue
+        _diff_collection(obj_type, coll_a, coll_b, result)
+
+    logger.debug(
+        "Diffed documents: %d added, %d removed, %d changed (%d unchanged types skipped)",
+        len(result.added),
+        len(result.removed),
+        len(result.changed),
+        skipped,
+    )
+    return result
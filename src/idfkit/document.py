@@ -12,15 +12,15 @@ from __future__ import annotations
 
 import logging
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from ._compat import EppyDocumentMixin
 from .exceptions import DuplicateObjectError, ValidationFailedError
 from .introspection import ObjectDescription, describe_object_type
-from .objects import IDFCollection, IDFObject
-from .references import ReferenceGraph
+from .objects import IDFCollection, IDFObject, _locate_object  # pyright: ignore[reportPrivateUsage]
+from .references import CompactReferenceGraph, ReferenceGraph
 from .validation import validate_object
 from .versions import LATEST_VERSION
 
@@ -32,6 +32,7 @@ else:
     Strict = TypeVar("Strict", bound=bool, covariant=True)
 
 if TYPE_CHECKING:
+    from .memory import MemoryReport
     from .schema import EpJSONSchema, ParsingCache
     from .simulation.config import EnergyPlusConfig
 
@@ -91,6 +92,57 @@ _PYTHON_TO_IDF = {
 _IDF_TO_PYTHON = {v.upper(): k for k, v in _PYTHON_TO_IDF.items()}
 
 
+def _is_missing(value: Any) -> bool:
+    """Whether a frame cell is a missing value (``None``, ``NaN``, ``pd.NA``, ``NaT``)."""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return value != value
+    # Any pandas missing-value sentinel implies pandas is already imported
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and pandas.isna(value) is True
+
+
+def _frame_to_columns(frame: Any) -> tuple[list[Any], list[tuple[str, list[Any]]]]:
+    """Split a DataFrame or column mapping into row labels and python-named columns.
+
+    Row labels come from a ``name`` column when present, otherwise from the
+    DataFrame index (or integer positions for a plain mapping).
+    """
+    from .objects import to_python_name
+
+    raw: dict[str, list[Any]]
+    index: list[Any] | None = None
+    if hasattr(frame, "columns") and hasattr(frame, "index"):
+        raw = {str(col): frame[col].tolist() for col in frame.columns}
+        index = frame.index.tolist()
+    else:
+        raw = {str(col): list(values) for col, values in frame.items()}
+
+    lengths = {len(values) for values in raw.values()}
+    if len(lengths) > 1:
+        msg = f"All columns must have the same length, got lengths {sorted(lengths)}"
+        raise ValueError(msg)
+    n_rows = lengths.pop() if lengths else len(index or [])
+
+    labels: list[Any]
+    columns: list[tuple[str, list[Any]]] = []
+    name_values: list[Any] | None = None
+    for col, values in raw.items():
+        field_name = to_python_name(col)
+        if field_name == "name":
+            name_values = values
+        else:
+            columns.append((field_name, values))
+    if name_values is not None:
+        labels = name_values
+    elif index is not None:
+        labels = index
+    else:
+        labels = list(range(n_rows))
+    return labels, columns
+
+
 class IDFDocument(EppyDocumentMixin, Generic[Strict]):
     """
     Main container for an EnergyPlus model.
@@ -106,6 +158,8 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
     __slots__ = (
         "_collections",
         "_references",
+        "_references_built",
+        "_removed_names",
         "_schedules_cache",
         "_schema",
         "_strict",
@@ -118,6 +172,8 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
     _collections: dict[str, IDFCollection[IDFObject]]
     _schema: EpJSONSchema | None
     _references: ReferenceGraph
+    _references_built: bool
+    _removed_names: set[str]
     _schedules_cache: dict[str, IDFObject] | None
     _strict: bool
 
@@ -128,6 +184,8 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
         filepath: Path | str | None = None,
         *,
         strict: bool = False,
+        compact_references: bool = False,
+        eager_references: bool = False,
     ) -> None:
         """
         Initialize an IDFDocument.
@@ -141,12 +199,24 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
                 ``AttributeError`` instead of returning ``None``.  This
                 is useful during migration from eppy to catch field-name
                 typos early.  This value is immutable after construction.
+            compact_references: When ``True``, track references with a
+                [CompactReferenceGraph][idfkit.references.CompactReferenceGraph],
+                which uses several times less memory on large models at the
+                cost of somewhat slower lookups.
+            eager_references: When ``True``, index references as objects
+                are added.  By default the reference graph is built in one
+                bulk scan the first time it is needed (a reference query,
+                a rename, or validation), so parse-and-write jobs never
+                pay for it.
         """
         self.version = version or LATEST_VERSION
         self.filepath = Path(filepath) if filepath else None
         self._schema = schema
         self._collections: dict[str, IDFCollection[IDFObject]] = {}
-        self._references = ReferenceGraph()
+        self._references = CompactReferenceGraph() if compact_references else ReferenceGraph()
+        self._references_built = eager_references
+        # Upper-cased names of objects removed before the graph was built
+        self._removed_names: set[str] = set()
         self._schedules_cache: dict[str, IDFObject] | None = None
         self._strict = strict
 
@@ -173,9 +243,84 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
 
     @property
     def references(self) -> ReferenceGraph:
-        """The reference graph for dependency tracking."""
+        """The reference graph for dependency tracking.
+
+        Accessing it builds the graph if it has not been built yet.
+        """
+        if not self._references_built:
+            self.build_references()
         return self._references
 
+    def build_references(self) -> None:
+        """Build the reference graph now instead of on first use.
+
+        Scans every object's reference fields (from the schema parsing
+        cache) in a single pass and registers them in bulk.  References
+        to objects removed before the build are dropped from the reverse
+        index, exactly as removing them from a built graph does.
+        Afterwards the graph is maintained incrementally.  Calling this on
+        a document whose graph is already built does nothing.
+
+        Examples:
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+            Zone('Office')
+            >>> model.add("People", "Office People", zone_or_zonelist_or_space_or_spacelist_name="Office",
+            ...     number_of_people_schedule_name="", validate=False)  # doctest: +ELLIPSIS
+            People('Office People')
+            >>> model.build_references()
+            >>> [obj.name for obj in model.references.get_referencing("Office")]
+            ['Office People']
+        """
+        if self._references_built:
+            return
+        edges: list[tuple[IDFObject, str, str]] = []
+        for obj_type, collection in self._collections.items():
+            type_ref_fields: frozenset[str] | None = None
+            for obj in collection:
+                ref_fields = object.__getattribute__(obj, "_ref_fields")
+                if ref_fields is None:
+                    if type_ref_fields is None:
+                        type_ref_fields = (
+                            self._compute_ref_fields(self._schema, obj_type) if self._schema else frozenset()
+                        )
+                    ref_fields = type_ref_fields
+                data = obj.data
+                for field_name in ref_fields:
+                    value = data.get(field_name)
+                    if value and isinstance(value, str) and value.strip():
+                        edges.append((obj, field_name, value))
+        self._references.register_many(edges)
+        for name_upper in self._removed_names:
+            self._references.drop_referrers(name_upper)
+        self._removed_names.clear()
+        self._references_built = True
+        logger.debug("Built reference graph (%d references)", len(edges))
+
+    def use_compact_references(self) -> None:
+        """Switch reference tracking to a [CompactReferenceGraph][idfkit.references.CompactReferenceGraph].
+
+        The compact graph is built in bulk from the current one.  Use this
+        after loading a large model to shrink the memory held by the
+        reference indexes; queries keep the same results.
+
+        Examples:
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+            Zone('Office')
+            >>> model.use_compact_references()
+            >>> type(model.references).__name__
+            'CompactReferenceGraph'
+        """
+        if isinstance(self._references, CompactReferenceGraph):
+            return
+        if self._references_built:
+            self._references = CompactReferenceGraph.from_graph(self._references)
+        else:
+            self._references = CompactReferenceGraph()
+
     # -------------------------------------------------------------------------
     # Collection Access
     # -------------------------------------------------------------------------
@@ -508,6 +653,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
         field_order: list[str] | None = None
         ref_fields: frozenset[str] | None = None
         parsing_cache: ParsingCache | None = None
+        object_class: type[IDFObject] = IDFObject
         if self._schema:
             resolved_obj_type = self._resolve_schema_obj_type(obj_type)
             obj_schema = self._schema.get_object_schema(resolved_obj_type)
@@ -525,11 +671,13 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             else:
                 field_order = self._schema.get_all_field_names(resolved_obj_type)
             parsing_cache = self._schema.get_parsing_cache(resolved_obj_type)
+            if parsing_cache is not None:
+                object_class = parsing_cache.object_class
             field_order = self._build_field_order_for_add(field_order, field_data, parsing_cache)
             ref_fields = self._compute_ref_fields(self._schema, resolved_obj_type)
 
         # Create object
-        obj = IDFObject(
+        obj = object_class(
             obj_type=resolved_obj_type,
             name=name,
             data=field_data,
@@ -571,7 +719,10 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             self._collections[obj_type].remove(obj)
 
         # Remove from reference graph
-        self._references.unregister(obj)
+        if self._references_built:
+            self._references.unregister(obj)
+        elif obj.name:
+            self._removed_names.add(obj.name.upper())
 
         # Invalidate caches
         if obj_type.upper().startswith("SCHEDULE"):
@@ -613,6 +764,313 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
         # collection index, referencing objects, and graph updates.
         obj.name = new_name
 
+    def rename_many(
+        self,
+        renames: Mapping[tuple[str, str], str] | Callable[[IDFObject], str | None],
+    ) -> int:
+        """
+        Rename many objects at once and update all references.
+
+        Equivalent to calling [rename][idfkit.document.IDFDocument.rename]
+        for each object, but every rename is checked before anything
+        changes and the collection indexes, referencing fields and
+        reference graph are updated in a single pass.  Renames are
+        applied simultaneously, so swapping two names works.
+
+        When objects of different types share an old name but get
+        different new names, each reference is resolved through the
+        schema's object lists to decide which new name it receives.
+
+        Args:
+            renames: Either a mapping of ``(obj_type, old_name)`` to the
+                new name, or a callable that receives each named object
+                and returns its new name (``None`` or the current name
+                to leave it unchanged)
+
+        Returns:
+            Number of objects renamed.
+
+        Raises:
+            KeyError: If a mapping entry names an object that does not exist
+            ValueError: If a new name is empty, or a reference cannot be
+                attributed to one of several renamed objects
+            DuplicateObjectError: If a new name collides with another
+                object of the same type
+
+        Examples:
+            Prefix every zone name before merging models:
+
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> for name in ("Office", "Core"):
+            ...     _ = model.add("Zone", name)
+            >>> model.rename_many(lambda obj: f"B1 {obj.name}" if obj.obj_type == "Zone" else None)
+            2
+            >>> sorted(zone.name for zone in model["Zone"])
+            ['B1 Core', 'B1 Office']
+
+            Swap two names:
+
+            >>> model.rename_many({("Zone", "B1 Core"): "B1 Office", ("Zone", "B1 Office"): "B1 Core"})
+            2
+        """
+        targets = self._resolve_renames(renames)
+        if not targets:
+            return 0
+        by_type = self._check_rename_collisions(targets)
+
+        graph = self.references
+        # Resolved before anything changes, so an ambiguous reference aborts cleanly
+        simple, edge_changes = self._plan_renames(graph, targets)
+
+        # 1. Collection indexes: drop every old key before adding new ones (swap-safe)
+        for obj_type, group in by_type.items():
+            by_name = self._collections[obj_type].by_name
+            for _, old_upper, _ in group:
+                del by_name[old_upper]
+            for obj, _, new_name in group:
+                by_name[new_name.upper()] = obj
+                object.__setattr__(obj, "_name", new_name)
+                object.__setattr__(obj, "_version", obj.mutation_version + 1)
+
+        # 2. Referencing objects' data (the graph still holds the old names here)
+        updated = 0
+        for old_upper, new_name in simple.items():
+            updated += _rewrite_references(graph.get_referencing_with_fields(old_upper), old_upper, new_name)
+        for ref_obj, field_name, old_upper, new_name in edge_changes:
+            updated += _rewrite_references(((ref_obj, field_name),), old_upper, new_name)
+
+        # 3. Graph indexes
+        graph.rename_targets(simple)
+        if edge_changes:
+            graph.update_references(edge_changes)
+
+        if any(obj_type.upper().startswith("SCHEDULE") for obj_type in by_type):
+            self._schedules_cache = None
+
+        logger.debug("Renamed %d objects (updated %d references)", len(targets), updated)
+        return len(targets)
+
+    def _plan_renames(
+        self,
+        graph: ReferenceGraph,
+        targets: list[tuple[IDFObject, str, str]],
+    ) -> tuple[dict[str, str], list[tuple[IDFObject, str, str, str]]]:
+        """Split *targets* into wholesale name moves and per-reference changes.
+
+        Returns ``(simple, changes)``: *simple* maps each old name whose
+        objects all get the same new name to that name.  References to an
+        old name shared by objects getting different new names are matched
+        to one of them through the schema's object lists and returned as
+        ``(obj, field, old_upper, new_name)`` *changes*; references that no
+        renamed type can satisfy (e.g. to a same-named object of another
+        type) are left unchanged.
+        """
+        simple: dict[str, str] = {}
+        shared: set[str] = set()
+        for _, old_upper, new_name in targets:
+            if simple.setdefault(old_upper, new_name) != new_name:
+                shared.add(old_upper)
+        changes: list[tuple[IDFObject, str, str, str]] = []
+        if not shared:
+            return simple, changes
+        for old_upper in shared:
+            del simple[old_upper]
+        new_names: dict[str, dict[str, str]] = {}
+        for obj, old_upper, new_name in targets:
+            if old_upper in shared:
+                new_names.setdefault(old_upper, {})[obj.obj_type] = new_name
+        providers: dict[tuple[str, str], tuple[str, ...] | None] = {}
+        for old_upper, by_type in new_names.items():
+            for ref_obj, field_name in graph.get_referencing_with_fields(old_upper):
+                new_name = self._shared_rename_target(ref_obj, field_name, by_type, providers)
+                if new_name is not None:
+                    changes.append((ref_obj, field_name, old_upper, new_name))
+        return simple, changes
+
+    def _shared_rename_target(
+        self,
+        ref_obj: IDFObject,
+        field_name: str,
+        new_names: dict[str, str],
+        providers: dict[tuple[str, str], tuple[str, ...] | None],
+    ) -> str | None:
+        """New name for one reference to a shared old name, or None if no renamed type can satisfy it.
+
+        *new_names* maps each renamed object type to its new name.
+        """
+        types = self._reference_providers(ref_obj.obj_type, field_name, providers)
+        candidates = {new_names[t] for t in (types or ()) if t in new_names}
+        if types is not None and not candidates:
+            return None
+        if len(candidates) != 1:
+            msg = f"Cannot tell which renamed object {ref_obj.obj_type} '{ref_obj.name}' field '{field_name}' refers to"
+            raise ValueError(msg)
+        return candidates.pop()
+
+    def _resolve_renames(
+        self,
+        renames: Mapping[tuple[str, str], str] | Callable[[IDFObject], str | None],
+    ) -> list[tuple[IDFObject, str, str]]:
+        """Turn a rename mapping or mapper into ``(object, old_upper, new_name)`` triples, skipping no-ops."""
+        targets: dict[int, tuple[IDFObject, str, str]] = {}
+        if callable(renames):
+            for obj in self.all_objects:
+                name = obj.name
+                if not name:
+                    continue
+                new_name = renames(obj)
+                if new_name is not None and new_name != name:
+                    targets[id(obj)] = (obj, name.upper(), new_name)
+        else:
+            for (obj_type, old_name), new_name in renames.items():
+                obj = self.getobject(obj_type, old_name)
+                if obj is None:
+                    raise KeyError(f"No {obj_type} named '{old_name}'")  # noqa: TRY003
+                if new_name != obj.name:
+                    targets[id(obj)] = (obj, obj.name.upper(), new_name)
+                else:
+                    targets.pop(id(obj), None)
+        for obj, _, new_name in targets.values():
+            if not new_name or not new_name.strip():
+                msg = f"Cannot rename {obj.obj_type} '{obj.name}' to an empty name"
+                raise ValueError(msg)
+        return list(targets.values())
+
+    def _check_rename_collisions(
+        self, targets: list[tuple[IDFObject, str, str]]
+    ) -> dict[str, list[tuple[IDFObject, str, str]]]:
+        """Raise DuplicateObjectError if applying *targets* would leave two objects with one name.
+
+        Returns *targets* grouped by object type.
+        """
+        by_type: dict[str, list[tuple[IDFObject, str, str]]] = {}
+        for target in targets:
+            by_type.setdefault(target[0].obj_type, []).append(target)
+        for obj_type, group in by_type.items():
+            by_name = self._collections[obj_type].by_name
+            leaving = {old_upper for _, old_upper, _ in group}
+            arriving: set[str] = set()
+            for _, _, new_name in group:
+                key = new_name.upper()
+                if key in arriving or (key in by_name and key not in leaving):
+                    raise DuplicateObjectError(obj_type, new_name)
+                arriving.add(key)
+        return by_type
+
+    def update_from_frame(self, obj_type: str, frame: Any) -> int:
+        """
+        Write columnar field values back onto existing objects in one pass.
+
+        *frame* is typically a pandas DataFrame produced by
+        [IDFCollection.to_frame][idfkit.objects.IDFCollection.to_frame], but
+        any mapping of column name to sequence of values is accepted.  Rows
+        are matched to objects by the ``name`` column when present,
+        otherwise by the frame's index labels (object names, or integer
+        positions for unnamed object types).
+
+        Values are written straight into each object's data and the
+        reference graph is updated once for all changed reference fields,
+        which is much faster than per-object ``setattr`` for bulk edits.
+        Missing values (``None``/``NaN``/``pd.NA``) clear a field that currently has
+        a value.  Object names are never changed; use
+        [rename][idfkit.document.IDFDocument.rename] for that.
+
+        Args:
+            obj_type: Object type of the rows (e.g. ``"Material"``)
+            frame: DataFrame or ``{column: values}`` mapping
+
+        Returns:
+            Number of objects whose data changed.
+
+        Raises:
+            KeyError: If the document has no objects of *obj_type* or a
+                row does not match an existing object.
+            ValueError: If the columns have inconsistent lengths, or a
+                column is not a field of *obj_type* (checked for
+                non-extensible types, as in ``add``).
+
+        Examples:
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> for name, k in [("Brick", 0.9), ("Gypsum", 0.16)]:
+            ...     _ = model.add("Material", name, roughness="Rough", thickness=0.1,
+            ...         conductivity=k, density=1800.0, specific_heat=900.0)
+            >>> cols = model["Material"].to_columns(fields=["conductivity"])
+            >>> cols["conductivity"] = [k * 2 for k in cols["conductivity"]]
+            >>> model.update_from_frame("Material", cols)
+            2
+            >>> model["Material"]["Gypsum"].conductivity
+            0.32
+        """
+        existing_type = self._find_existing_collection_type(obj_type)
+        if existing_type is None:
+            raise KeyError(f"No {obj_type} objects in document")  # noqa: TRY003
+        collection = self._collections[existing_type]
+
+        labels, columns = _frame_to_columns(frame)
+        self._check_frame_fields(existing_type, columns)
+        targets = self._match_frame_rows(collection, labels)
+
+        ref_fields = object.__getattribute__(targets[0], "_ref_fields") if targets else None
+        ref_changes: list[tuple[IDFObject, str, str | None, str | None]] = []
+        changed_count = 0
+        for row, obj in enumerate(targets):
+            data = obj.data
+            changed = False
+            for field_name, values in columns:
+                value = values[row]
+                if _is_missing(value):
+                    if data.get(field_name) in (None, ""):
+                        continue
+                    value = ""
+                old = data.get(field_name)
+                if old == value and field_name in data:
+                    continue
+                data[field_name] = value
+                changed = True
+                if ref_fields is not None and field_name in ref_fields:
+                    ref_changes.append((
+                        obj,
+                        field_name,
+                        old if isinstance(old, str) else None,
+                        value if isinstance(value, str) else None,
+                    ))
+            if changed:
+                object.__setattr__(obj, "_version", obj.mutation_version + 1)
+                changed_count += 1
+
+        if ref_changes and self._references_built:
+            self._references.update_references(ref_changes)
+
+        logger.debug("Updated %d %s object(s) from frame", changed_count, existing_type)
+        return changed_count
+
+    def _check_frame_fields(self, obj_type: str, columns: list[tuple[str, list[Any]]]) -> None:
+        """Raise ValueError for frame columns that are not schema fields of *obj_type*."""
+        schema = self._schema
+        if schema is None or schema.is_extensible(obj_type):
+            return
+        known = set(schema.get_all_field_names(obj_type))
+        unknown = [field_name for field_name, _ in columns if field_name not in known]
+        if known and unknown:
+            msg = f"Unknown {obj_type} field(s): {', '.join(unknown)}"
+            raise ValueError(msg)
+
+    @staticmethod
+    def _match_frame_rows(collection: IDFCollection[IDFObject], labels: list[Any]) -> list[IDFObject]:
+        """Resolve frame row labels (names or positions) to collection objects."""
+        targets: list[IDFObject] = []
+        for label in labels:
+            if isinstance(label, str):
+                obj = collection.get(label)
+                if obj is None:
+                    raise KeyError(f"No {collection.obj_type} with name '{label}'")  # noqa: TRY003
+                targets.append(obj)
+            else:
+                targets.append(collection[int(label)])
+        return targets
+
     # -------------------------------------------------------------------------
     # Reference Graph
     # -------------------------------------------------------------------------
@@ -640,11 +1098,12 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
                 collection.by_name[new_key] = obj
 
         # 2. Update referencing objects' _data directly (bypass _set_field to avoid recursion)
-        referencing = self._references.get_referencing_with_fields(old_name)
+        referencing = self.references.get_referencing_with_fields(old_name)
         for ref_obj, field_name in referencing:
             current = ref_obj.data.get(field_name, "")
             if isinstance(current, str) and current.upper() == old_name.upper():
                 ref_obj.data[field_name] = new_name
+                object.__setattr__(ref_obj, "_version", ref_obj.mutation_version + 1)
 
         # 3. Update graph indexes
         self._references.rename_target(old_name, new_name)
@@ -663,12 +1122,20 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
 
     def notify_reference_change(self, obj: IDFObject, field_name: str, old_value: Any, new_value: Any) -> None:
         """Called by IDFObject._set_field when a reference field changes."""
+        if not self._references_built:
+            return
         old_str = old_value if isinstance(old_value, str) else None
         new_str = new_value if isinstance(new_value, str) else None
         self._references.update_reference(obj, field_name, old_str, new_str)
 
     def _index_object_references(self, obj: IDFObject) -> None:
-        """Index all references in an object using pre-computed ref_fields."""
+        """Index all references in an object using pre-computed ref_fields.
+
+        Does nothing until the graph has been built; the bulk build picks
+        the object up instead.
+        """
+        if not self._references_built:
+            return
         # Fast path: use pre-computed ref_fields from parser / _ParsingCache
         ref_fields = object.__getattribute__(obj, "_ref_fields")
         if ref_fields is not None:
@@ -716,7 +1183,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             >>> len(refs)
             1
         """
-        return self._references.get_referencing(name)
+        return self.references.get_referencing(name)
 
     def get_references(self, obj: IDFObject) -> set[str]:
         """Get all names that an object references.
@@ -741,7 +1208,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             >>> "PERIMETER_ZN_1" in refs
             True
         """
-        return self._references.get_references(obj)
+        return self.references.get_references(obj)
 
     # -------------------------------------------------------------------------
     # Schedules (common access pattern)
@@ -793,7 +1260,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
         """
         used: set[str] = set()
         for name in self.schedules_dict:
-            if self._references.is_referenced(name):
+            if self.references.is_referenced(name):
                 used.add(name)
         return used
 
@@ -803,7 +1270,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
 
     def get_zone_surfaces(self, zone_name: str) -> list[IDFObject]:
         """Get all surfaces belonging to a zone."""
-        return list(self._references.get_referencing(zone_name))
+        return list(self.references.get_referencing(zone_name))
 
     # -------------------------------------------------------------------------
     # Iteration
@@ -876,6 +1343,34 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
 
         return expand_objects(self, energyplus=energyplus, timeout=timeout)  # type: ignore[reportArgumentType,reportReturnType]  # .pyi uses covariant Strict
 
+    # -------------------------------------------------------------------------
+    # Memory
+    # -------------------------------------------------------------------------
+
+    def memory_report(self, *, include_schema_total: bool = False) -> MemoryReport:
+        """Estimate this document's memory footprint, broken down by object type.
+
+        Covers object wrappers, field data, field-order lists and
+        reference-graph entries, plus the share of the (shared) schema
+        used by the document's object types.  See
+        [memory_report][idfkit.memory.memory_report] for details.
+
+        Args:
+            include_schema_total: Also report the deep size of the whole schema.
+
+        Examples:
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+            Zone('Office')
+            >>> report = model.memory_report()
+            >>> report.types["Zone"].count
+            1
+        """
+        from .memory import memory_report
+
+        return memory_report(self, include_schema_total=include_schema_total)  # type: ignore[reportArgumentType]  # .pyi uses covariant Strict
+
     # -------------------------------------------------------------------------
     # Copying
     # -------------------------------------------------------------------------
@@ -907,6 +1402,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             schema=self._schema,
             filepath=self.filepath,
             strict=self._strict,
+            compact_references=isinstance(self._references, CompactReferenceGraph),
         )
 
         for obj in self.all_objects:
@@ -915,6 +1411,233 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
 
         return new_doc
 
+    def extract(
+        self,
+        objects: Iterable[IDFObject],
+        *,
+        include_dependencies: bool = True,
+        include_referencing: bool = False,
+    ) -> IDFDocument[bool]:
+        """Copy a subset of the model, with what it depends on, into a new document.
+
+        Starting from the seed *objects*, the selection is closed over
+        references: every object named by a reference field of a selected
+        object is selected too, transitively.  Reference values are
+        resolved through the schema's object lists, so a schedule and a
+        zone that happen to share a name are never confused.
+
+        With *include_referencing*, objects that point *at* a seed are
+        selected as well, transitively (a zone pulls in its surfaces, the
+        surfaces their windows), and their own dependencies follow.
+        Reverse links are only followed from seeds and the objects found
+        that way, so selecting a zone does not drag in every other zone
+        that shares its constructions.
+
+        The ``Version`` object, if present, is always copied.  Objects
+        keep their document order; the source document is not modified.
+
+        Args:
+            objects: Seed objects (must belong to this document)
+            include_dependencies: Follow references from the selected
+                objects (constructions, materials, schedules, ...)
+            include_referencing: Also select objects that reference the
+                seeds, transitively
+
+        Returns:
+            A new document with the same version, schema and strictness
+            containing copies of the selected objects
+
+        Raises:
+            ValueError: If a seed object is not in this document
+
+        Examples:
+            Slice one zone out of a model, with its surfaces and
+            everything they need:
+
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> for zone in ("Office", "Core"):
+            ...     _ = model.add("Zone", zone)
+            >>> _ = model.add("Material", "Brick", roughness="Rough", thickness=0.1,
+            ...     conductivity=0.7, density=1900.0, specific_heat=800.0)
+            >>> _ = model.add("Construction", "Wall", outside_layer="Brick")
+            >>> _ = model.add("BuildingSurface:Detailed", "Office Wall", surface_type="Wall",
+            ...     construction_name="Wall", zone_name="Office", outside_boundary_condition="Outdoors",
+            ...     validate=False)
+            >>> office = model.extract([model["Zone"]["Office"]], include_referencing=True)
+            >>> sorted(obj.name for obj in office.all_objects if obj.obj_type != "Version")
+            ['Brick', 'Office', 'Office Wall', 'Wall']
+        """
+        graph = self.references
+        # Keyed by id(): IDFObject equality compares content, not identity
+        selected: dict[int, IDFObject] = {}
+        seeds: list[IDFObject] = []
+        for obj in objects:
+            if _locate_object(self, obj) is None:  # type: ignore[reportArgumentType]  # .pyi uses covariant Strict
+                msg = f"{obj.obj_type} '{obj.name}' is not in this document"
+                raise ValueError(msg)
+            if id(obj) not in selected:
+                selected[id(obj)] = obj
+                seeds.append(obj)
+
+        providers: dict[tuple[str, str], tuple[str, ...] | None] = {}
+
+        if include_referencing:
+            self._close_over_referencing(graph, seeds, selected, providers)
+        if include_dependencies:
+            self._close_over_references(graph, list(selected.values()), selected, providers)
+
+        new_doc: IDFDocument[bool] = IDFDocument(  # type: ignore[reportCallIssue]  # .pyi uses covariant Strict
+            version=self.version,
+            schema=self._schema,
+            filepath=self.filepath,
+            strict=self._strict,
+            compact_references=isinstance(self._references, CompactReferenceGraph),
+        )
+        for obj_type, collection in self._collections.items():
+            for obj in collection:
+                if id(obj) in selected or obj_type == "Version":
+                    new_doc.addidfobject(obj.copy())
+
+        logger.debug("Extracted %d of %d objects (%d seeds)", len(selected), len(self), len(seeds))
+        return new_doc
+
+    def _close_over_referencing(
+        self,
+        graph: ReferenceGraph,
+        stack: list[IDFObject],
+        selected: dict[int, IDFObject],
+        providers: dict[tuple[str, str], tuple[str, ...] | None],
+    ) -> None:
+        """Add objects that reference anything on *stack* to *selected*, transitively."""
+        stack = list(stack)
+        while stack:
+            target = stack.pop()
+            if not target.name:
+                continue
+            for ref_obj, field_name in graph.get_referencing_with_fields(target.name):
+                if id(ref_obj) in selected:
+                    continue
+                types = self._reference_providers(ref_obj.obj_type, field_name, providers)
+                if types is not None and target.obj_type not in types:
+                    continue
+                selected[id(ref_obj)] = ref_obj
+                stack.append(ref_obj)
+
+    def _close_over_references(
+        self,
+        graph: ReferenceGraph,
+        stack: list[IDFObject],
+        selected: dict[int, IDFObject],
+        providers: dict[tuple[str, str], tuple[str, ...] | None],
+    ) -> None:
+        """Add objects referenced by anything on *stack* to *selected*, transitively."""
+        while stack:
+            source = stack.pop()
+            for name, field_name in graph.get_references_with_fields(source):
+                types = self._reference_providers(source.obj_type, field_name, providers)
+                for target in self._resolve_reference(name, types):
+                    if id(target) not in selected:
+                        selected[id(target)] = target
+                        stack.append(target)
+
+    def _reference_providers(
+        self,
+        obj_type: str,
+        field_name: str,
+        cache: dict[tuple[str, str], tuple[str, ...] | None],
+    ) -> tuple[str, ...] | None:
+        """Object types that can satisfy a reference field, or None if unknown."""
+        key = (obj_type, field_name)
+        if key in cache:
+            return cache[key]
+        types: tuple[str, ...] | None = None
+        if self._schema is not None:
+            object_lists = self._schema.get_field_object_list(obj_type, field_name)
+            if object_lists:
+                seen: dict[str, None] = {}
+                for obj_list in object_lists:
+                    for otype in self._schema.get_types_providing_reference(obj_list):
+                        seen[otype] = None
+                types = tuple(seen)
+        cache[key] = types
+        return types
+
+    def _resolve_reference(self, name: str, types: tuple[str, ...] | None) -> Iterator[IDFObject]:
+        """Yield the objects a reference value names, restricted to *types* if known."""
+        if types is None:
+            for collection in self._collections.values():
+                obj = collection.get(name)
+                if obj is not None:
+                    yield obj
+            return
+        for otype in types:
+            collection = self._collections.get(otype)
+            if collection is not None:
+                obj = collection.get(name)
+                if obj is not None:
+                    yield obj
+
+    # -------------------------------------------------------------------------
+    # Pickling
+    # -------------------------------------------------------------------------
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Compact pickle support for shipping documents to worker processes.
+
+        Only object data is serialized: per-type collections become lists
+        of ``(name, data, field_order_index)`` rows, identical field orders
+        are sent once, and the reference graph and per-object schema
+        fragments are omitted.  A schema obtained from the global
+        [SchemaManager][idfkit.schema.SchemaManager] is referenced by
+        version so the receiving process loads its own cached copy;
+        references are re-indexed in a single pass on unpickling.
+
+        Examples:
+            >>> import pickle
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+            Zone('Office')
+            >>> restored = pickle.loads(pickle.dumps(model))
+            >>> restored["Zone"]["Office"].name
+            'Office'
+        """
+        schema = self._schema
+        schema_ref: tuple[int, int, int] | EpJSONSchema | None = schema
+        if schema is not None:
+            from .schema import get_schema_manager
+
+            if get_schema_manager()._cache.get(schema.version) is schema:  # pyright: ignore[reportPrivateUsage]
+                schema_ref = schema.version
+
+        order_index: dict[tuple[str, ...], int] = {}
+        payload: list[tuple[str, list[tuple[str, dict[str, Any], int]]]] = []
+        for obj_type, collection in self._collections.items():
+            rows: list[tuple[str, dict[str, Any], int]] = []
+            for obj in collection:
+                field_order = object.__getattribute__(obj, "_field_order")
+                if field_order is None:
+                    idx = -1
+                else:
+                    key = tuple(field_order)
+                    idx = order_index.setdefault(key, len(order_index))
+                rows.append((obj.name, obj.data, idx))
+            payload.append((obj_type, rows))
+
+        return (
+            _restore_document,
+            (
+                self.version,
+                self.filepath,
+                self._strict,
+                schema_ref,
+                list(order_index),
+                payload,
+                isinstance(self._references, CompactReferenceGraph),
+            ),
+        )
+
     # -------------------------------------------------------------------------
     # String Representation
     # -------------------------------------------------------------------------
@@ -929,3 +1652,66 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
             if collection:
                 lines.append(f"  {obj_type}: {len(collection)} objects")
         return "\n".join(lines)
+
+
+def _rewrite_references(referrers: Iterable[tuple[IDFObject, str]], old_upper: str, new_name: str) -> int:
+    """Point each ``(obj, field)`` in *referrers* that still names *old_upper* at *new_name*."""
+    count = 0
+    for ref_obj, field_name in referrers:
+        data = ref_obj.data
+        current = data.get(field_name)
+        if isinstance(current, str) and current.upper() == old_upper:
+            data[field_name] = new_name
+            object.__setattr__(ref_obj, "_version", ref_obj.mutation_version + 1)
+            count += 1
+    return count
+
+
+def _restore_document(
+    version: tuple[int, int, int],
+    filepath: Path | None,
+    strict: bool,
+    schema_ref: tuple[int, int, int] | EpJSONSchema | None,
+    field_orders: list[tuple[str, ...]],
+    payload: list[tuple[str, list[tuple[str, dict[str, Any], int]]]],
+    compact_references: bool = False,
+) -> IDFDocument[bool]:
+    """Rebuild a document pickled by [IDFDocument.__reduce__][idfkit.document.IDFDocument.__reduce__]."""
+    if isinstance(schema_ref, tuple):
+        from .schema import get_schema
+
+        schema: EpJSONSchema | None = get_schema(schema_ref)
+    else:
+        schema = schema_ref
+
+    doc: IDFDocument[bool] = IDFDocument(  # type: ignore[reportCallIssue]  # .pyi uses covariant Strict
+        version=version, schema=schema, filepath=filepath, strict=strict, compact_references=compact_references
+    )
+
+    for obj_type, rows in payload:
+        object_class: type[IDFObject] = IDFObject
+        obj_schema: dict[str, Any] | None = None
+        ref_fields: frozenset[str] | None = None
+        if schema is not None:
+            pc = schema.get_parsing_cache(obj_type)
+            if pc is not None:
+                object_class = pc.object_class
+                obj_schema = pc.obj_schema
+                ref_fields = pc.ref_fields
+            else:
+                ref_fields = IDFDocument._compute_ref_fields(schema, obj_type)  # pyright: ignore[reportPrivateUsage]
+
+        collection = doc[obj_type]
+        for name, data, order_idx in rows:
+            obj = object_class(
+                obj_type=obj_type,
+                name=name,
+                data=data,
+                schema=obj_schema,
+                document=doc,  # type: ignore[reportArgumentType]  # .pyi uses covariant Strict
+                field_order=list(field_orders[order_idx]) if order_idx >= 0 else None,
+                ref_fields=ref_fields,
+            )
+            collection.add(obj)
+
+    return doc
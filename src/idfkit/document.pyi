@@ -6,7 +6,7 @@ DO NOT EDIT — regenerate with:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
@@ -14,6 +14,7 @@ from ._compat import EppyDocumentMixin
 from ._generated_types import *  # noqa: F403
 from ._generated_types import _ObjectTypeMap
 from .introspection import ObjectDescription
+from .memory import MemoryReport
 from .objects import IDFCollection, IDFObject
 from .references import ReferenceGraph
 from .schema import EpJSONSchema
@@ -35,6 +36,8 @@ class IDFDocument(_ObjectTypeMap, EppyDocumentMixin, Generic[Strict]):  # type:
         filepath: Path | str | None = ...,
         *,
         strict: Strict = ...,
+        compact_references: bool = ...,
+        eager_references: bool = ...,
     ) -> None: ...
     @property
     def strict(self) -> Strict: ...
@@ -44,6 +47,8 @@ class IDFDocument(_ObjectTypeMap, EppyDocumentMixin, Generic[Strict]):  # type:
     def collections(self) -> dict[str, IDFCollection[IDFObject]]: ...
     @property
     def references(self) -> ReferenceGraph: ...
+    def build_references(self) -> None: ...
+    def use_compact_references(self) -> None: ...
     def get_collection(self, obj_type: str) -> IDFCollection[IDFObject]: ...
     def __getattr__(self, name: str) -> IDFCollection[IDFObject]: ...
     def __contains__(self, obj_type: str) -> bool: ...  # type: ignore[override]
@@ -58,6 +63,8 @@ class IDFDocument(_ObjectTypeMap, EppyDocumentMixin, Generic[Strict]):  # type:
     ) -> IDFObject: ...
     def removeidfobject(self, obj: IDFObject) -> None: ...
     def rename(self, obj_type: str, old_name: str, new_name: str) -> None: ...
+    def rename_many(self, renames: Mapping[tuple[str, str], str] | Callable[[IDFObject], str | None]) -> int: ...
+    def update_from_frame(self, obj_type: str, frame: Any) -> int: ...
     def notify_name_change(self, obj: IDFObject, old_name: str, new_name: str) -> None: ...
     def notify_reference_change(self, obj: IDFObject, field_name: str, old_value: Any, new_value: Any) -> None: ...
     def get_referencing(self, name: str) -> set[IDFObject]: ...
@@ -71,7 +78,16 @@ class IDFDocument(_ObjectTypeMap, EppyDocumentMixin, Generic[Strict]):  # type:
     def all_objects(self) -> Iterator[IDFObject]: ...
     def objects_by_type(self) -> Iterator[tuple[str, IDFCollection[IDFObject]]]: ...
     def expand(self, *, energyplus: EnergyPlusConfig | None = ..., timeout: float = ...) -> IDFDocument[Strict]: ...
+    def memory_report(self, *, include_schema_total: bool = ...) -> MemoryReport: ...
     def copy(self) -> IDFDocument[Strict]: ...
+    def extract(
+        self,
+        objects: Iterable[IDFObject],
+        *,
+        include_dependencies: bool = ...,
+        include_referencing: bool = ...,
+    ) -> IDFDocument[Strict]: ...
+    def __reduce__(self) -> tuple[Any, ...]: ...
     @property
     def zones(self) -> IDFCollection[Zone]: ...
     @property
@@ -167,6 +167,7 @@ class EpJSONParser:
             obj_schema: dict[str, Any] | None = None
             base_field_names: tuple[str, ...] | None = None
             ref_fields: frozenset[str] | None = None
+            object_class: type[IDFObject] = IDFObject
             has_name = True
             if schema:
                 pc = schema.get_parsing_cache(obj_type)
@@ -175,6 +176,7 @@ class EpJSONParser:
                     has_name = pc.has_name
                     base_field_names = pc.field_names if has_name else pc.all_field_names
                     ref_fields = pc.ref_fields
+                    object_class = pc.object_class
 
             # epJSON format: {"ObjectType": {"obj_name": {fields...}, ...}}
             objects_dict = cast(dict[str, Any], objects)
@@ -189,7 +191,7 @@ class EpJSONParser:
                 fields_dict = cast(dict[str, Any], fields)
                 field_order = self._build_field_order(base_field_names, fields_dict, pc)
 
-                obj = IDFObject(
+                obj = object_class(
                     obj_type=obj_type,
                     name=name,
                     data=dict(fields_dict),  # Copy the fields dict
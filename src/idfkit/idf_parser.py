@@ -16,7 +16,7 @@ import re
 import time
 from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from .document import IDFDocument
 from .exceptions import IDFParseError, ParseDiagnostic, VersionNotFoundError
@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .schema import EpJSONSchema, ParsingCache
+    from .validation import CompiledValidator, ValidationError, ValidationResult
 
 # Regex patterns for parsing
 _VERSION_PATTERN = re.compile(
@@ -66,6 +67,32 @@ def _coerce_value_fast(field_type: str | None, value: str) -> Any:
     return value
 
 
+@overload
+def parse_idf(
+    filepath: Path | str,
+    schema: EpJSONSchema | None = ...,
+    version: tuple[int, int, int] | None = ...,
+    encoding: str = ...,
+    strict: bool = ...,
+    strict_fields: bool = ...,
+    *,
+    validate: Literal[False] = ...,
+) -> IDFDocument: ...
+
+
+@overload
+def parse_idf(
+    filepath: Path | str,
+    schema: EpJSONSchema | None = ...,
+    version: tuple[int, int, int] | None = ...,
+    encoding: str = ...,
+    strict: bool = ...,
+    strict_fields: bool = ...,
+    *,
+    validate: Literal[True],
+) -> tuple[IDFDocument, ValidationResult]: ...
+
+
 def parse_idf(
     filepath: Path | str,
     schema: EpJSONSchema | None = None,
@@ -73,7 +100,9 @@ def parse_idf(
     encoding: str = "latin-1",
     strict: bool = True,
     strict_fields: bool = False,
-) -> IDFDocument:
+    *,
+    validate: bool = False,
+) -> IDFDocument | tuple[IDFDocument, ValidationResult]:
     """
     Parse an IDF file into an IDFDocument.
 
@@ -83,9 +112,17 @@ def parse_idf(
         version: Optional version override (auto-detected if not provided)
         encoding: File encoding (default: latin-1 for compatibility)
         strict: If True, fail fast on malformed objects (default: True)
+        validate: Also validate the model against the schema and return
+            ``(doc, result)``.  Each object's type, enum, range and
+            required-field checks run as soon as its values are coerced,
+            instead of in a second pass over the document; singleton and
+            reference checks run once parsing is done.  The result is the
+            same as [validate_document][idfkit.validation.validate_document]
+            with its default options.
 
     Returns:
-        Parsed IDFDocument
+        Parsed IDFDocument, or ``(document, ValidationResult)`` when
+        *validate* is True
 
     Raises:
         VersionNotFoundError: If version cannot be detected
@@ -108,6 +145,14 @@ def parse_idf(
             ```python
             model = parse_idf("legacy_building.idf", version=(9, 6, 0))
             ```
+
+        Reject an uploaded model with schema errors while loading it:
+
+            ```python
+            model, result = parse_idf("upload.idf", validate=True)
+            if not result.is_valid:
+                print(result)
+            ```
     """
     filepath = Path(filepath)
 
@@ -115,6 +160,8 @@ def parse_idf(
         raise FileNotFoundError(f"IDF file not found: {filepath}")  # noqa: TRY003
 
     parser = IDFParser(filepath, schema, encoding, strict=strict)
+    if validate:
+        return parser.parse_validated(version, strict_fields=strict_fields)
     return parser.parse(version, strict_fields=strict_fields)
 
 
@@ -156,6 +203,33 @@ class IDFParser:
         Returns:
             Parsed IDFDocument
         """
+        doc, _schema = self._parse(version, strict_fields, None)
+        return doc
+
+    def parse_validated(
+        self, version: tuple[int, int, int] | None = None, *, strict_fields: bool = False
+    ) -> tuple[IDFDocument, ValidationResult]:
+        """
+        Parse the IDF file and validate it against the schema in the same pass.
+
+        Args:
+            version: Optional version override
+
+        Returns:
+            Tuple of the parsed IDFDocument and its ValidationResult
+        """
+        from .validation import _result_from_parse  # pyright: ignore[reportPrivateUsage]
+
+        issues_by_type: dict[str, list[ValidationError]] = {}
+        doc, schema = self._parse(version, strict_fields, issues_by_type)
+        return doc, _result_from_parse(doc, schema, issues_by_type)
+
+    def _parse(
+        self,
+        version: tuple[int, int, int] | None,
+        strict_fields: bool,
+        issues_by_type: dict[str, list[ValidationError]] | None,
+    ) -> tuple[IDFDocument, EpJSONSchema]:
         t0 = time.perf_counter()
         logger.debug("Parsing IDF file %s", self._filepath)
 
@@ -178,12 +252,12 @@ class IDFParser:
         doc = IDFDocument(version=version, schema=schema, filepath=self._filepath, strict=strict_fields)  # type: ignore[reportCallIssue]  # .pyi uses covariant Strict
 
         # Parse objects
-        self._parse_objects(content, doc, schema)
+        self._parse_objects(content, doc, schema, issues_by_type)
 
         elapsed = time.perf_counter() - t0
         logger.info("Parsed %d objects from %s in %.3fs", len(doc), self._filepath, elapsed)
 
-        return doc
+        return doc, schema
 
     def _load_content(self) -> bytes:
         """Load file content, using mmap for large files."""
@@ -222,8 +296,15 @@ class IDFParser:
         content: bytes,
         doc: IDFDocument,
         schema: EpJSONSchema | None,
+        issues_by_type: dict[str, list[ValidationError]] | None = None,
     ) -> None:
-        """Parse all objects from content into document."""
+        """
+        Parse all objects from content into document.
+
+        When *issues_by_type* is given, each object's field values are
+        validated as soon as they are coerced, and the issues of every
+        object added to *doc* are collected under its type.
+        """
         # Strip comments before matching to prevent phantom objects
         # (e.g. "!- X,Y,Z Origin" matching "X," as an object type)
         content = _COMMENT_PATTERN.sub(b"", content)
@@ -261,6 +342,13 @@ class IDFParser:
                 if should_skip:
                     continue
 
+                if issues_by_type is not None:
+                    validator = (
+                        schema.get_validator(decoded_obj_type) if schema is not None and pc is not None else None
+                    )
+                    self._add_validated(match, pc, encoding, doc, validator, issues_by_type)
+                    continue
+
                 obj = self._parse_object_cached(match, pc, encoding)
                 if obj:
                     addidfobject(obj)
@@ -282,13 +370,36 @@ class IDFParser:
                 "Skipped %d unknown object type(s): %s", len(skipped_types), ", ".join(sorted(skipped_types))
             )
 
+    def _add_validated(
+        self,
+        match: re.Match[bytes],
+        pc: ParsingCache | None,
+        encoding: str,
+        doc: IDFDocument,
+        validator: CompiledValidator | None,
+        issues_by_type: dict[str, list[ValidationError]],
+    ) -> None:
+        """Parse, validate and add one object; its issues are kept only if it was added."""
+        obj_issues: list[ValidationError] = []
+        obj = self._parse_object_cached(match, pc, encoding, validator, obj_issues)
+        if obj:
+            doc.addidfobject(obj)
+            issues_by_type.setdefault(obj.obj_type, []).extend(obj_issues)
+
     def _parse_object_cached(
         self,
         match: re.Match[bytes],
         pc: ParsingCache | None,
         encoding: str,
+        validator: CompiledValidator | None = None,
+        issues: list[ValidationError] | None = None,
     ) -> IDFObject | None:
-        """Parse a single object from regex match using cached metadata."""
+        """
+        Parse a single object from regex match using cached metadata.
+
+        With a *validator*, the freshly coerced field values are checked
+        before the object is built and the issues appended to *issues*.
+        """
         obj_type = match.group(1).decode(encoding).strip()
         fields_raw = match.group(2).decode(encoding)
 
@@ -304,8 +415,10 @@ class IDFParser:
             name, remaining_fields = (fields[0], fields[1:]) if has_name else ("", fields)
 
             data = self._build_data_dict_cached(remaining_fields, field_names, pc)
+            if validator is not None and issues is not None:
+                issues.extend(validator.validate_data(obj_type, name, data))
 
-            return IDFObject(
+            return pc.object_class(
                 obj_type=obj_type,
                 name=name,
                 data=data,
@@ -0,0 +1,274 @@
+"""
+Memory footprint introspection for IDF documents.
+
+Estimates where the bytes of an [IDFDocument][idfkit.document.IDFDocument]
+go, broken down by object type, using ``sys.getsizeof`` (no tracemalloc
+required).  Objects shared between several owners -- interned field
+names, cached small numbers, strings reused across fields -- are counted
+once, the first time they are reached.
+
+The schema is shared by every document of the same version, so its share
+is reported separately and not included in the document total.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .references import CompactReferenceGraph
+
+if TYPE_CHECKING:
+    from .document import IDFDocument
+    from .objects import IDFObject
+    from .references import ReferenceGraph
+
+
+@dataclass
+class TypeMemory:
+    """
+    Memory used by the objects of a single type.
+
+    Attributes:
+        obj_type: Object type
+        count: Number of objects
+        wrappers: Bytes used by the [IDFObject][idfkit.objects.IDFObject] instances
+        data: Bytes used by the field data dicts and their values
+        field_orders: Bytes used by field-order lists
+        references: Bytes used by this type's entries in the reference graph
+        schema: Bytes of the (shared) schema definition for this type
+    """
+
+    obj_type: str
+    count: int = 0
+    wrappers: int = 0
+    data: int = 0
+    field_orders: int = 0
+    references: int = 0
+    schema: int = 0
+
+    @property
+    def total(self) -> int:
+        """Bytes owned by the document for this type (excludes the shared schema)."""
+        return self.wrappers + self.data + self.field_orders + self.references
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a flat dict suitable for metrics export."""
+        return {
+            "obj_type": self.obj_type,
+            "count": self.count,
+            "wrappers": self.wrappers,
+            "data": self.data,
+            "field_orders": self.field_orders,
+            "references": self.references,
+            "schema": self.schema,
+            "total": self.total,
+        }
+
+
+@dataclass
+class MemoryReport:
+    """
+    Memory footprint of a document, as returned by
+    [IDFDocument.memory_report][idfkit.document.IDFDocument.memory_report].
+
+    Attributes:
+        types: Per-type breakdown, keyed by object type
+        graph_overhead: Bytes of reference-graph index tables not attributable
+            to a single object type
+        schema_total: Deep size of the whole shared schema, if requested
+    """
+
+    types: dict[str, TypeMemory] = field(default_factory=lambda: {})
+    graph_overhead: int = 0
+    schema_total: int | None = None
+
+    @property
+    def total(self) -> int:
+        """Bytes owned by the document (excludes the shared schema)."""
+        return sum(t.total for t in self.types.values()) + self.graph_overhead
+
+    @property
+    def schema_share(self) -> int:
+        """Bytes of schema definitions used by the object types in the document."""
+        return sum(t.schema for t in self.types.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to a JSON-serializable dict for metrics export.
+
+        Types are listed largest first.
+        """
+        ordered = sorted(self.types.values(), key=lambda t: t.total, reverse=True)
+        return {
+            "total": self.total,
+            "wrappers": sum(t.wrappers for t in ordered),
+            "data": sum(t.data for t in ordered),
+            "field_orders": sum(t.field_orders for t in ordered),
+            "references": sum(t.references for t in ordered) + self.graph_overhead,
+            "graph_overhead": self.graph_overhead,
+            "schema_share": self.schema_share,
+            "schema_total": self.schema_total,
+            "types": [t.to_dict() for t in ordered],
+        }
+
+    def __str__(self) -> str:
+        lines = [f"MemoryReport(total={self.total:,} bytes, schema_share={self.schema_share:,} bytes)"]
+        for t in sorted(self.types.values(), key=lambda t: t.total, reverse=True):
+            lines.append(f"  {t.obj_type}: {t.count} objects, {t.total:,} bytes")
+        return "\n".join(lines)
+
+
+def _deep_sizeof(root: Any, seen: set[int]) -> int:
+    """Sum ``sys.getsizeof`` over *root* and the containers/values it holds."""
+    total = 0
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        key = id(item)
+        if key in seen:
+            continue
+        seen.add(key)
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+            stack.extend(item.values())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)  # pyright: ignore[reportUnknownArgumentType]
+    return total
+
+
+def _sizeof_once(item: Any, seen: set[int]) -> int:
+    key = id(item)
+    if key in seen:
+        return 0
+    seen.add(key)
+    return sys.getsizeof(item)
+
+
+def _edge_usage(graph: ReferenceGraph, obj: IDFObject, seen: set[int]) -> int:
+    """Bytes of *obj*'s outgoing edges in a set-based graph."""
+    refs = graph._references.get(obj)  # pyright: ignore[reportPrivateUsage]
+    if not refs:
+        return 0
+    total = _sizeof_once(refs, seen)
+    for entry in refs:
+        # Each edge is stored twice: (name, field) here and (obj, field) in referenced_by.
+        total += 2 * sys.getsizeof(entry) + _sizeof_once(entry[0], seen)
+    return total
+
+
+def _compact_edge_usage(graph: CompactReferenceGraph, obj: IDFObject, seen: set[int]) -> int:
+    """Bytes of *obj*'s outgoing edges in a compact graph (edge columns plus both CSR entries)."""
+    oid = graph._obj_ids.get(obj)  # pyright: ignore[reportPrivateUsage]
+    if oid is None:
+        return 0
+    edges = graph._obj_edges(oid)  # pyright: ignore[reportPrivateUsage]
+    itemsize = graph._edge_src.itemsize  # pyright: ignore[reportPrivateUsage]
+    names = graph._names  # pyright: ignore[reportPrivateUsage]
+    edge_name = graph._edge_name  # pyright: ignore[reportPrivateUsage]
+    total = len(edges) * (5 * itemsize + 1)
+    for e in edges:
+        total += _sizeof_once(names[edge_name[e]], seen)
+    return total
+
+
+def _compact_graph_size(graph: CompactReferenceGraph, seen: set[int]) -> int:
+    """Bytes of every container held by a compact graph (names already counted are skipped)."""
+    containers: list[Any] = [
+        graph._objects,  # pyright: ignore[reportPrivateUsage]
+        graph._obj_ids,  # pyright: ignore[reportPrivateUsage]
+        graph._names,  # pyright: ignore[reportPrivateUsage]
+        graph._name_ids,  # pyright: ignore[reportPrivateUsage]
+        graph._edge_src,  # pyright: ignore[reportPrivateUsage]
+        graph._edge_name,  # pyright: ignore[reportPrivateUsage]
+        graph._edge_field,  # pyright: ignore[reportPrivateUsage]
+        graph._edge_flags,  # pyright: ignore[reportPrivateUsage]
+        graph._fwd_offsets,  # pyright: ignore[reportPrivateUsage]
+        graph._fwd_edges,  # pyright: ignore[reportPrivateUsage]
+        graph._rev_offsets,  # pyright: ignore[reportPrivateUsage]
+        graph._rev_edges,  # pyright: ignore[reportPrivateUsage]
+    ]
+    total = sum(sys.getsizeof(c) for c in containers)
+    for pending in (graph._pending_by_obj, graph._pending_by_name):  # pyright: ignore[reportPrivateUsage]
+        total += sys.getsizeof(pending) + sum(sys.getsizeof(v) for v in pending.values())
+    total += sum(_sizeof_once(name, seen) for name in graph._names)  # pyright: ignore[reportPrivateUsage]
+    total += _deep_sizeof(graph._object_lists, seen)  # pyright: ignore[reportPrivateUsage]
+    return total
+
+
+def memory_report(doc: IDFDocument, *, include_schema_total: bool = False) -> MemoryReport:
+    """
+    Estimate the memory footprint of *doc*, broken down by object type.
+
+    Args:
+        doc: The document to inspect
+        include_schema_total: Also walk the whole shared schema to report
+            its deep size (slower; the schema is usually tens of MB and
+            shared by every document of the same version)
+
+    Returns:
+        A [MemoryReport][idfkit.memory.MemoryReport]
+
+    Examples:
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+        Zone('Office')
+        >>> report = memory_report(model)
+        >>> report.types["Zone"].count
+        1
+        >>> report.total > 0
+        True
+        >>> sorted(report.to_dict())[:3]
+        ['data', 'field_orders', 'graph_overhead']
+    """
+    report = MemoryReport()
+    # Shared values are charged to the first object type that reaches them
+    seen: set[int] = set()
+    schema = doc.schema
+    schema_seen: set[int] = set()
+    # Read the graph as it is; doc.references would force a lazy build
+    graph: ReferenceGraph = object.__getattribute__(doc, "_references")
+    edges_total = 0
+
+    for obj_type, collection in doc.collections.items():
+        if not collection:
+            continue
+        usage = TypeMemory(obj_type)
+        report.types[obj_type] = usage
+        for obj in collection:
+            usage.count += 1
+            usage.wrappers += sys.getsizeof(obj)
+            usage.data += _deep_sizeof(obj.data, seen)
+            usage.data += _sizeof_once(obj.name, seen)
+            field_order = obj.field_order
+            if field_order is not None:
+                usage.field_orders += _sizeof_once(field_order, seen)
+            if isinstance(graph, CompactReferenceGraph):
+                edge_bytes = _compact_edge_usage(graph, obj, seen)
+                edges_total += edge_bytes
+            else:
+                edge_bytes = _edge_usage(graph, obj, seen)
+            usage.references += edge_bytes
+        if schema is not None:
+            obj_schema = schema.get_object_schema(obj_type)
+            if obj_schema is not None:
+                usage.schema = _deep_sizeof(obj_schema, schema_seen)
+
+    if isinstance(graph, CompactReferenceGraph):
+        report.graph_overhead = max(0, _compact_graph_size(graph, seen) - edges_total)
+    else:
+        referenced_by = graph._referenced_by  # pyright: ignore[reportPrivateUsage]
+        report.graph_overhead = (
+            sys.getsizeof(graph._references)  # pyright: ignore[reportPrivateUsage]
+            + sys.getsizeof(referenced_by)
+            + sum(sys.getsizeof(refs) for refs in referenced_by.values())
+            + _deep_sizeof(graph._object_lists, seen)  # pyright: ignore[reportPrivateUsage]
+        )
+
+    if include_schema_total and schema is not None:
+        report.schema_total = _deep_sizeof(schema._raw, set())  # pyright: ignore[reportPrivateUsage]
+
+    return report
@@ -7,9 +7,11 @@ IDFCollection: Indexed collection of IDFObjects with O(1) lookup.
 
 from __future__ import annotations
 
+import copy
 import re
-from collections.abc import Callable, Iterator
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from collections.abc import Callable, Iterator, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from ._compat_object import EppyObjectMixin
 
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
 
 # Field name conversion patterns
 _FIELD_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
+_CLASS_NAME_PATTERN = re.compile(r"[^A-Za-z0-9]")
 
 
 def to_python_name(idf_name: str) -> str:
@@ -29,6 +32,11 @@ def to_python_name(idf_name: str) -> str:
     return _FIELD_NAME_PATTERN.sub("_", idf_name.lower()).strip("_")
 
 
+# Memoized variant used on the attribute hot path.  Attribute names used in
+# code form a small, bounded set, so the cache stays tiny in practice.
+_cached_python_name = lru_cache(maxsize=4096)(to_python_name)
+
+
 def to_idf_name(python_name: str) -> str:
     """Convert Python name back to IDF-style name.
 
@@ -101,6 +109,9 @@ class IDFObject(EppyObjectMixin):
     _field_order: list[str] | None
     _ref_fields: frozenset[str] | None
 
+    # Set on per-type subclasses built by build_object_class()
+    _class_key: ClassVar[tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]] | None] = None
+
     def __init__(
         self,
         obj_type: str,
@@ -170,6 +181,10 @@ class IDFObject(EppyObjectMixin):
         if key.startswith("_"):
             raise AttributeError(key)
 
+        # Schema fields of per-type subclasses never get here: they are
+        # resolved by _FieldDescriptor.  This path handles extensible
+        # fields, unknown names, and objects created without a schema.
+
         # Try exact match first
         data = object.__getattribute__(self, "_data")
         if key in data:
@@ -181,7 +196,7 @@ class IDFObject(EppyObjectMixin):
             return data[key_lower]
 
         # Try python name conversion
-        python_key = to_python_name(key)
+        python_key = _cached_python_name(key)
         if python_key in data:
             return data[python_key]
 
@@ -208,7 +223,7 @@ class IDFObject(EppyObjectMixin):
             self._set_name(value)
         else:
             # Normalize key to python style
-            python_key = to_python_name(key)
+            python_key = _cached_python_name(key)
             self._set_field(python_key, value)
 
     def __getitem__(self, key: str | int) -> Any:
@@ -249,6 +264,49 @@ class IDFObject(EppyObjectMixin):
     def __hash__(self) -> int:
         return id(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle support that also works for runtime-generated per-type subclasses.
+
+        An object that belongs to a document is pickled as a lookup into
+        that (compactly pickled) document, so the schema is referenced by
+        version rather than copied and object identity is preserved.
+        """
+        doc = self._document
+        if doc is not None:
+            locator = _locate_object(doc, self)
+            if locator is not None:
+                return (_object_from_document, (doc, self._type, locator))
+        return (_new_object, (type(self)._class_key,), self._state())
+
+    def __copy__(self) -> IDFObject:
+        """Shallow copy: a new object of the same class sharing this one's data and document."""
+        new = _new_object(type(self)._class_key)
+        new.__setstate__(self._state())
+        return new
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> IDFObject:
+        """Deep copy of the object's state, detached from any document's collections."""
+        new = _new_object(type(self)._class_key)
+        memo[id(self)] = new
+        new.__setstate__(copy.deepcopy(self._state(), memo))
+        return new
+
+    def _state(self) -> tuple[Any, ...]:
+        return (
+            self._type,
+            self._name,
+            self._data,
+            self._schema,
+            self._document,
+            self._field_order,
+            self._ref_fields,
+            self._version,
+        )
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for slot, value in zip(_STATE_SLOTS, state, strict=True):
+            object.__setattr__(self, slot, value)
+
     def _set_name(self, value: str) -> None:
         """Centralized name-change logic with document notification."""
         old = self._name
@@ -310,7 +368,7 @@ class IDFObject(EppyObjectMixin):
 
     def copy(self) -> IDFObject:
         """Create a copy of this object."""
-        return IDFObject(
+        return type(self)(
             obj_type=self._type,
             name=self._name,
             data=dict(self._data),
@@ -377,6 +435,123 @@ class IDFObject(EppyObjectMixin):
             return None
 
 
+_STATE_SLOTS = ("_type", "_name", "_data", "_schema", "_document", "_field_order", "_ref_fields", "_version")
+
+
+class _FieldDescriptor:
+    """Data descriptor resolving an attribute straight to its data-dict key.
+
+    Installed on per-type subclasses so that reading a schema field skips
+    ``IDFObject.__getattr__`` (and its name normalization) entirely.
+    """
+
+    __slots__ = ("_field",)
+
+    def __init__(self, field: str) -> None:
+        self._field = field
+
+    def __get__(self, instance: IDFObject | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return instance._data.get(self._field)  # pyright: ignore[reportPrivateUsage]
+
+    def __set__(self, instance: IDFObject, value: Any) -> None:
+        instance._set_field(self._field, value)  # pyright: ignore[reportPrivateUsage]
+
+
+_OBJECT_CLASSES: dict[tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]], type[IDFObject]] = {}
+
+
+def build_object_class(
+    obj_type: str,
+    field_names: tuple[str, ...],
+    aliases: tuple[tuple[str, str], ...] = (),
+) -> type[IDFObject]:
+    """Build (or fetch) the IDFObject subclass for an object type.
+
+    The subclass carries one data descriptor per schema field, so ``obj.x_origin`` is a single descriptor call
+    instead of a ``__getattr__`` fallback.  *aliases* maps alternative
+    attribute spellings (e.g. eppy-style ``X_Origin``) to their canonical
+    field, so alias resolution happens once here rather than on every
+    access.  Field names that would shadow an existing ``IDFObject``
+    attribute (``name``, ``key``, ...) are skipped.
+
+    Classes are memoized, so equal arguments return the same class.  The
+    schema builds these once per object type via
+    [ParsingCache][idfkit.schema.ParsingCache].
+
+    Args:
+        obj_type: EnergyPlus object type (e.g. ``"Zone"``)
+        field_names: Python-style field names to expose as descriptors
+        aliases: ``(alias, field_name)`` pairs
+
+    Returns:
+        A subclass of [IDFObject][idfkit.objects.IDFObject].
+
+    Examples:
+        >>> from idfkit.objects import build_object_class
+        >>> Zone = build_object_class("Zone", ("x_origin",), (("X_Origin", "x_origin"),))
+        >>> zone = Zone("Zone", "Office", {"x_origin": 2.0})
+        >>> zone.x_origin, zone.X_Origin
+        (2.0, 2.0)
+        >>> build_object_class("Zone", ("x_origin",), (("X_Origin", "x_origin"),)) is Zone
+        True
+    """
+    key = (obj_type, field_names, aliases)
+    cls = _OBJECT_CLASSES.get(key)
+    if cls is not None:
+        return cls
+
+    reserved = _reserved_attribute_names()
+    namespace: dict[str, Any] = {"__slots__": (), "__module__": __name__, "_class_key": key}
+    for field_name in field_names:
+        if field_name not in reserved and field_name.isidentifier():
+            namespace[field_name] = _FieldDescriptor(field_name)
+    for alias, field_name in aliases:
+        if alias not in reserved and alias not in namespace and alias.isidentifier():
+            namespace[alias] = _FieldDescriptor(field_name)
+
+    class_name = _CLASS_NAME_PATTERN.sub("", obj_type) or "IDFObject"
+    cls = type(class_name, (IDFObject,), namespace)
+    _OBJECT_CLASSES[key] = cls
+    return cls
+
+
+@lru_cache(maxsize=1)
+def _reserved_attribute_names() -> frozenset[str]:
+    """Attribute names defined on IDFObject that fields must not shadow."""
+    return frozenset(dir(IDFObject))
+
+
+def _new_object(class_key: tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]] | None) -> IDFObject:
+    """Create an empty instance of the right (per-type) class for unpickling."""
+    cls = IDFObject if class_key is None else build_object_class(*class_key)
+    return cls.__new__(cls)
+
+
+def _locate_object(doc: IDFDocument[Any], obj: IDFObject) -> str | int | None:
+    """Return the name key or position of *obj* in *doc*'s collection, if *doc* still holds it."""
+    collection = doc.collections.get(obj.obj_type)
+    if collection is None:
+        return None
+    name = obj.name
+    if name:
+        key = name.upper()
+        return key if collection.by_name.get(key) is obj else None
+    for i, item in enumerate(collection):
+        if item is obj:
+            return i
+    return None
+
+
+def _object_from_document(doc: IDFDocument, obj_type: str, locator: str | int) -> IDFObject:
+    """Resolve a pickled object reference against its unpickled document."""
+    collection = doc.collections[obj_type]
+    if isinstance(locator, int):
+        return collection[locator]
+    return collection.by_name[locator]
+
+
 _T = TypeVar("_T", bound=IDFObject)
 
 
@@ -553,6 +728,104 @@ class IDFCollection(Generic[_T]):
         """
         return [obj.to_dict() for obj in self._items]
 
+    def to_columns(self, fields: Sequence[str] | None = None) -> dict[str, list[Any]]:
+        """Convert the collection to a columnar mapping in a single pass.
+
+        Each field becomes one list holding a value per object, in
+        collection order.  Blank fields are returned as ``None`` so that
+        numeric columns stay numeric.  The ``name`` column comes first.
+
+        Args:
+            fields: Field names to export (python-style or IDF-style).
+                Defaults to every field present on at least one object,
+                in schema order.
+
+        Returns:
+            Dict mapping ``"name"`` and each field name to a list of values.
+
+        Examples:
+            >>> from idfkit import new_document
+            >>> model = new_document()
+            >>> for name, k in [("Brick", 0.9), ("Gypsum", 0.16)]:
+            ...     _ = model.add("Material", name, roughness="Rough", thickness=0.1,
+            ...         conductivity=k, density=1800.0, specific_heat=900.0)
+            >>> cols = model["Material"].to_columns(fields=["conductivity", "thickness"])
+            >>> cols["name"], cols["conductivity"]
+            (['Brick', 'Gypsum'], [0.9, 0.16])
+        """
+        items = self._items
+        columns = [to_python_name(f) for f in fields] if fields is not None else self._column_names()
+
+        result: dict[str, list[Any]] = {"name": [obj.name for obj in items]}
+        datas = [obj.data for obj in items]
+        for field in columns:
+            if field == "name":
+                continue
+            values: list[Any] = []
+            append = values.append
+            for data in datas:
+                value = data.get(field)
+                append(None if value == "" else value)
+            result[field] = values
+        return result
+
+    def to_frame(self, fields: Sequence[str] | None = None) -> Any:
+        """Convert the collection to a pandas DataFrame.
+
+        Requires pandas to be installed.  Rows are indexed by object name
+        (a default integer index is used for unnamed object types such as
+        ``Output:Variable``).  Blank fields become ``NaN`` so numeric
+        columns get a numeric dtype.
+
+        The result can be edited and written back in one pass with
+        [update_from_frame][idfkit.document.IDFDocument.update_from_frame].
+
+        Args:
+            fields: Field names to export.  Defaults to every populated field.
+
+        Returns:
+            A pandas DataFrame with one row per object.
+
+        Raises:
+            ImportError: If pandas is not installed.
+
+        Examples:
+            Scale every material conductivity by 10%:
+
+                ```python
+                df = model["Material"].to_frame()
+                df["conductivity"] *= 1.1
+                model.update_from_frame("Material", df)
+                ```
+        """
+        try:
+            import pandas  # type: ignore[import-not-found]
+        except ImportError:
+            msg = "pandas is required for DataFrame conversion. Install it with: pip install idfkit[dataframes]"
+            raise ImportError(msg) from None
+        pd: Any = pandas
+
+        columns = self.to_columns(fields)
+        names = columns.pop("name")
+        if names and all(names):
+            index = pd.Index(names, name="name")
+            return pd.DataFrame(columns, index=index)  # type: ignore[no-any-return]
+        return pd.DataFrame(columns)  # type: ignore[no-any-return]
+
+    def _column_names(self) -> list[str]:
+        """Union of populated field names across objects, in schema order."""
+        seen: dict[str, None] = {}
+        for obj in self._items:
+            seen.update(dict.fromkeys(obj.data))
+        if not self._items:
+            return []
+        field_order = self._items[0].field_order
+        if not field_order:
+            return list(seen)
+        position = {name: i for i, name in enumerate(field_order)}
+        fallback = len(position)
+        return sorted(seen, key=lambda name: position.get(name, fallback))
+
     def filter(self, predicate: Callable[[_T], bool]) -> list[_T]:
         """Filter objects by predicate function.
 
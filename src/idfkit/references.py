@@ -10,8 +10,10 @@ Provides O(1) lookups for:
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from collections.abc import Iterator
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import accumulate
 from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
@@ -90,6 +92,25 @@ class ReferenceGraph:
         self._referenced_by[name_upper].add((obj, field_name))
         self._references[obj].add((name_upper, field_name))
 
+    def register_many(self, edges: Iterable[tuple[IDFObject, str, str]]) -> None:
+        """
+        Register many ``(obj, field_name, referenced_name)`` references at once.
+
+        Equivalent to calling [register][idfkit.references.ReferenceGraph.register]
+        for each tuple; used to build the graph in bulk.
+
+        Args:
+            edges: Iterable of ``(obj, field_name, referenced_name)`` tuples
+        """
+        referenced_by = self._referenced_by
+        references = self._references
+        for obj, field_name, referenced_name in edges:
+            if not referenced_name:
+                continue
+            name_upper = referenced_name.upper()
+            referenced_by[name_upper].add((obj, field_name))
+            references[obj].add((name_upper, field_name))
+
     def unregister(self, obj: IDFObject) -> None:
         """Remove all reference tracking for an object."""
         if obj in self._references:
@@ -102,9 +123,17 @@ class ReferenceGraph:
             del self._references[obj]
 
         # Also remove any references TO this object
-        obj_name_upper = obj.name.upper() if obj.name else ""
-        if obj_name_upper in self._referenced_by:
-            del self._referenced_by[obj_name_upper]
+        self.drop_referrers(obj.name or "")
+
+    def drop_referrers(self, name: str) -> None:
+        """Forget which objects reference *name* (a removed object's name).
+
+        The referencing objects keep the name in their forward index; only
+        reverse lookups such as
+        [get_referencing][idfkit.references.ReferenceGraph.get_referencing] stop
+        returning them.
+        """
+        self._referenced_by.pop(name.upper(), None)
 
     def get_referencing(self, name: str) -> set[IDFObject]:
         """
@@ -247,6 +276,43 @@ class ReferenceGraph:
         else:
             self._referenced_by[new_upper] = referrers
 
+    def rename_targets(self, renames: Mapping[str, str]) -> None:
+        """
+        Update indexes for many renamed targets at once.
+
+        All renames are applied simultaneously, so swaps and cycles
+        (``A -> B`` together with ``B -> A``) move each name's referrers
+        to the intended target.  Calling
+        [rename_target][idfkit.references.ReferenceGraph.rename_target]
+        once per name would merge them instead.
+
+        Args:
+            renames: Mapping of old name to new name (case-insensitive)
+
+        Raises:
+            ValueError: If two old names differ only in case.
+        """
+        moves: list[tuple[str, set[tuple[IDFObject, str]]]] = []
+        for old_upper, new_upper in _normalize_renames(renames):
+            referrers = self._referenced_by.pop(old_upper, None)
+            if referrers:
+                moves.append((new_upper, referrers))
+                for obj, field_name in referrers:
+                    obj_refs = self._references.get(obj)
+                    if obj_refs is not None:
+                        obj_refs.discard((old_upper, field_name))
+
+        for new_upper, referrers in moves:
+            for obj, field_name in referrers:
+                obj_refs = self._references.get(obj)
+                if obj_refs is not None:
+                    obj_refs.add((new_upper, field_name))
+            existing = self._referenced_by.get(new_upper)
+            if existing is None:
+                self._referenced_by[new_upper] = referrers
+            else:
+                existing.update(referrers)
+
     def update_reference(self, obj: IDFObject, field_name: str, old_value: str | None, new_value: str | None) -> None:
         """
         Update indexes when an object's reference field changes.
@@ -277,6 +343,35 @@ class ReferenceGraph:
             self._referenced_by[new_upper].add((obj, field_name))
             self._references[obj].add((new_upper, field_name))
 
+    def update_references(self, changes: Iterable[tuple[IDFObject, str, str | None, str | None]]) -> None:
+        """
+        Apply many reference field changes in a single pass.
+
+        Equivalent to calling [update_reference][idfkit.references.ReferenceGraph.update_reference]
+        for each ``(obj, field_name, old_value, new_value)`` tuple, but
+        avoids per-call overhead for bulk edits.
+
+        Args:
+            changes: Iterable of ``(obj, field_name, old_value, new_value)`` tuples
+        """
+        referenced_by = self._referenced_by
+        references = self._references
+        for obj, field_name, old_value, new_value in changes:
+            if old_value:
+                old_upper = old_value.upper()
+                refs_set = referenced_by.get(old_upper)
+                if refs_set is not None:
+                    refs_set.discard((obj, field_name))
+                    if not refs_set:
+                        del referenced_by[old_upper]
+                obj_refs = references.get(obj)
+                if obj_refs is not None:
+                    obj_refs.discard((old_upper, field_name))
+            if new_value and new_value.strip():
+                new_upper = new_value.upper()
+                referenced_by[new_upper].add((obj, field_name))
+                references[obj].add((new_upper, field_name))
+
     def clear(self) -> None:
         """Clear all reference tracking."""
         self._referenced_by.clear()
@@ -295,3 +390,541 @@ class ReferenceGraph:
             "names_referenced": len(self._referenced_by),
             "object_lists": len(self._object_lists),
         }
+
+
+def _normalize_renames(renames: Mapping[str, str]) -> list[tuple[str, str]]:
+    """Upper-case a rename mapping, dropping no-ops and rejecting old names that differ only in case."""
+    normalized: dict[str, str] = {}
+    for old_name, new_name in renames.items():
+        old_upper = old_name.upper()
+        if old_upper in normalized:
+            msg = f"Rename mapping has more than one entry for '{old_name}' (names are case-insensitive)"
+            raise ValueError(msg)
+        normalized[old_upper] = new_name.upper()
+    return [(old, new) for old, new in normalized.items() if old != new]
+
+
+# Edge flag bits for CompactReferenceGraph
+_DEAD = 1
+_HIDDEN = 2  # live in the object's forward index but dropped from the name's reverse index
+
+_COMPACT_MIN_PENDING = 4096
+
+
+class CompactReferenceGraph(ReferenceGraph):
+    """
+    Memory-compact [ReferenceGraph][idfkit.references.ReferenceGraph] backend.
+
+    Objects, referenced names and field names are interned to integer IDs,
+    and every reference is one row of parallel ``array`` columns instead
+    of a pair of tuples in two ``defaultdict(set)`` indexes.  Lookups go
+    through CSR (compressed sparse row) indexes in both directions, built
+    in bulk by [compact][idfkit.references.CompactReferenceGraph.compact].
+    Edits made after a compaction land in small append buffers and
+    removals are tombstoned; the graph re-compacts itself once the buffers
+    grow as large as the compacted part, so edits stay amortized O(1).
+
+    The query API and its semantics are identical to
+    [ReferenceGraph][idfkit.references.ReferenceGraph].
+
+    Examples:
+        >>> from idfkit.objects import IDFObject
+        >>> graph = CompactReferenceGraph()
+        >>> people = IDFObject("People", "Office People", {"zone_or_zonelist_or_space_or_spacelist_name": "Office"})
+        >>> graph.register(people, "zone_or_zonelist_or_space_or_spacelist_name", "Office")
+        >>> graph.compact()
+        >>> [obj.name for obj in graph.get_referencing("OFFICE")]
+        ['Office People']
+        >>> graph.get_references(people)
+        {'OFFICE'}
+    """
+
+    __slots__ = (
+        "_edge_field",
+        "_edge_flags",
+        "_edge_name",
+        "_edge_src",
+        "_field_ids",
+        "_fields",
+        "_fwd_edges",
+        "_fwd_offsets",
+        "_live_edges",
+        "_name_ids",
+        "_names",
+        "_obj_ids",
+        "_objects",
+        "_pending_by_name",
+        "_pending_by_obj",
+        "_pending_count",
+        "_rev_edges",
+        "_rev_offsets",
+    )
+
+    def __init__(self) -> None:
+        self._object_lists: dict[str, set[str]] = defaultdict(set)
+        self._reset()
+
+    def _reset(self) -> None:
+        # Interning tables
+        self._objects: list[IDFObject | None] = []
+        self._obj_ids: dict[IDFObject, int] = {}
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._fields: list[str] = []
+        self._field_ids: dict[str, int] = {}
+        # Edge table (one row per reference)
+        self._edge_src = array("i")
+        self._edge_name = array("i")
+        self._edge_field = array("i")
+        self._edge_flags = bytearray()
+        self._live_edges = 0
+        # CSR indexes over edges [0, len(_fwd_edges)), by source object and by name
+        self._fwd_offsets = array("i", [0])
+        self._fwd_edges = array("i")
+        self._rev_offsets = array("i", [0])
+        self._rev_edges = array("i")
+        # Append buffers for edges added (or re-targeted) since the last compaction
+        self._pending_by_obj: dict[int, list[int]] = {}
+        self._pending_by_name: dict[int, list[int]] = {}
+        self._pending_count = 0
+
+    # -- interning -----------------------------------------------------------
+
+    def _intern_obj(self, obj: IDFObject) -> int:
+        oid = self._obj_ids.get(obj)
+        if oid is None:
+            oid = len(self._objects)
+            self._objects.append(obj)
+            self._obj_ids[obj] = oid
+        return oid
+
+    def _intern_name(self, name_upper: str) -> int:
+        nid = self._name_ids.get(name_upper)
+        if nid is None:
+            nid = len(self._names)
+            self._names.append(name_upper)
+            self._name_ids[name_upper] = nid
+        return nid
+
+    def _intern_field(self, field_name: str) -> int:
+        fid = self._field_ids.get(field_name)
+        if fid is None:
+            fid = len(self._fields)
+            self._fields.append(field_name)
+            self._field_ids[field_name] = fid
+        return fid
+
+    # -- edge iteration ------------------------------------------------------
+
+    def _obj_edges(self, oid: int) -> list[int]:
+        """Live edges (including hidden ones) whose source is *oid*."""
+        flags = self._edge_flags
+        edges: list[int] = []
+        if oid + 1 < len(self._fwd_offsets):
+            start, end = self._fwd_offsets[oid], self._fwd_offsets[oid + 1]
+            edges.extend(e for e in self._fwd_edges[start:end] if not flags[e] & _DEAD)
+        pending = self._pending_by_obj.get(oid)
+        if pending:
+            edges.extend(e for e in pending if not flags[e] & _DEAD)
+        return edges
+
+    def _name_edges(self, nid: int) -> list[int]:
+        """Live, visible edges currently pointing at name *nid*."""
+        flags = self._edge_flags
+        edge_name = self._edge_name
+        candidates: list[int] = []
+        if nid + 1 < len(self._rev_offsets):
+            candidates.extend(self._rev_edges[self._rev_offsets[nid] : self._rev_offsets[nid + 1]])
+        pending = self._pending_by_name.get(nid)
+        if pending:
+            candidates.extend(pending)
+        # A re-targeted edge can be listed under its old name too; dedupe via dict order.
+        return [e for e in dict.fromkeys(candidates) if not flags[e] and edge_name[e] == nid]
+
+    def _find_edge(self, oid: int, nid: int, fid: int) -> int:
+        edge_name = self._edge_name
+        edge_field = self._edge_field
+        for e in self._obj_edges(oid):
+            if edge_name[e] == nid and edge_field[e] == fid:
+                return e
+        return -1
+
+    def _add_edge(self, oid: int, nid: int, fid: int) -> None:
+        pending_obj = self._pending_by_obj.get(oid)
+        # Objects first seen since the last compaction with no buffered edges
+        # cannot hold a duplicate, which keeps bulk indexing cheap.
+        if pending_obj is not None or oid + 1 < len(self._fwd_offsets):
+            existing = self._find_edge(oid, nid, fid)
+            if existing >= 0:
+                if self._edge_flags[existing] & _HIDDEN:
+                    self._edge_flags[existing] &= ~_HIDDEN
+                    self._pending_by_name.setdefault(nid, []).append(existing)
+                return
+
+        e = len(self._edge_flags)
+        self._edge_src.append(oid)
+        self._edge_name.append(nid)
+        self._edge_field.append(fid)
+        self._edge_flags.append(0)
+        self._live_edges += 1
+        if pending_obj is None:
+            self._pending_by_obj[oid] = [e]
+        else:
+            pending_obj.append(e)
+        pending_name = self._pending_by_name.get(nid)
+        if pending_name is None:
+            self._pending_by_name[nid] = [e]
+        else:
+            pending_name.append(e)
+        self._pending_count += 1
+        if self._pending_count > _COMPACT_MIN_PENDING and self._pending_count > len(self._fwd_edges):
+            self.compact()
+
+    def _kill_edge(self, e: int) -> None:
+        self._edge_flags[e] |= _DEAD
+        self._live_edges -= 1
+
+    # -- bulk build ----------------------------------------------------------
+
+    def compact(self) -> None:
+        """
+        Rebuild the CSR indexes in bulk, dropping tombstoned edges.
+
+        Merges the append buffers into the array-backed indexes.  When
+        edges have been removed, objects and names are renumbered so that
+        unregistered objects and names that are no longer referenced are
+        released.
+        """
+        if self._live_edges != len(self._edge_flags):
+            self._drop_dead_edges()
+        self._fwd_offsets, self._fwd_edges = self._build_csr(self._edge_src, len(self._objects))
+        self._rev_offsets, self._rev_edges = self._build_csr(self._edge_name, len(self._names))
+        self._pending_by_obj = {}
+        self._pending_by_name = {}
+        self._pending_count = 0
+
+    def _drop_dead_edges(self) -> None:
+        old_src, old_name, old_field, old_flags = self._edge_src, self._edge_name, self._edge_field, self._edge_flags
+        old_objects, old_names = self._objects, self._names
+
+        objects: list[IDFObject | None] = []
+        obj_ids: dict[IDFObject, int] = {}
+        obj_map: dict[int, int] = {}
+        names: list[str] = []
+        name_ids: dict[str, int] = {}
+        name_map: dict[int, int] = {}
+        src = array("i")
+        name_col = array("i")
+        field_col = array("i")
+        flags = bytearray()
+
+        for e in range(len(old_flags)):
+            flag = old_flags[e]
+            if flag & _DEAD:
+                continue
+            o = old_src[e]
+            oid = obj_map.get(o)
+            if oid is None:
+                obj = old_objects[o]
+                oid = obj_map[o] = len(objects)
+                objects.append(obj)
+                if obj is not None:
+                    obj_ids[obj] = oid
+            n = old_name[e]
+            nid = name_map.get(n)
+            if nid is None:
+                nid = name_map[n] = len(names)
+                names.append(old_names[n])
+                name_ids[old_names[n]] = nid
+            src.append(oid)
+            name_col.append(nid)
+            field_col.append(old_field[e])
+            flags.append(flag)
+
+        # Keep IDs for registered objects that currently have no edges
+        for obj, o in self._obj_ids.items():
+            if o not in obj_map:
+                obj_map[o] = len(objects)
+                objects.append(obj)
+                obj_ids[obj] = obj_map[o]
+
+        self._objects, self._obj_ids = objects, obj_ids
+        self._names, self._name_ids = names, name_ids
+        self._edge_src, self._edge_name, self._edge_field, self._edge_flags = src, name_col, field_col, flags
+        self._live_edges = len(flags)
+
+    @staticmethod
+    def _build_csr(keys: array[int], num_keys: int) -> tuple[array[int], array[int]]:
+        """Sort edge indices by *keys* into CSR ``(offsets, edges)`` arrays."""
+        counts = [0] * num_keys
+        for key, count in Counter(keys).items():
+            counts[key] = count
+        offsets = array("i", [0])
+        offsets.extend(accumulate(counts))
+        edges = array("i", sorted(range(len(keys)), key=keys.__getitem__))
+        return offsets, edges
+
+    @classmethod
+    def from_graph(cls, graph: ReferenceGraph) -> CompactReferenceGraph:
+        """Build a compact graph holding the same references as *graph*."""
+        compact = cls()
+        if isinstance(graph, CompactReferenceGraph):
+            for list_name, types in graph._object_lists.items():
+                compact._object_lists[list_name].update(types)
+            for obj, name_upper, field_name, hidden in graph._iter_edges():
+                compact._append_raw(obj, name_upper, field_name, hidden)
+        else:
+            for list_name, types in graph._object_lists.items():
+                compact._object_lists[list_name].update(types)
+            referenced_by = graph._referenced_by
+            for obj, refs in graph._references.items():
+                compact._intern_obj(obj)
+                for name_upper, field_name in refs:
+                    hidden = (obj, field_name) not in referenced_by.get(name_upper, ())
+                    compact._append_raw(obj, name_upper, field_name, hidden)
+        compact.compact()
+        return compact
+
+    def _append_raw(self, obj: IDFObject, name_upper: str, field_name: str, hidden: bool) -> None:
+        """Append an edge without dedupe or buffering; callers must compact() afterwards."""
+        self._edge_src.append(self._intern_obj(obj))
+        self._edge_name.append(self._intern_name(name_upper))
+        self._edge_field.append(self._intern_field(field_name))
+        self._edge_flags.append(_HIDDEN if hidden else 0)
+        self._live_edges += 1
+
+    def _iter_edges(self) -> Iterator[tuple[IDFObject, str, str, bool]]:
+        objects, names, fields, flags = self._objects, self._names, self._fields, self._edge_flags
+        for e in range(len(self._edge_src)):
+            if flags[e] & _DEAD:
+                continue
+            obj = objects[self._edge_src[e]]
+            if obj is not None:
+                yield obj, names[self._edge_name[e]], fields[self._edge_field[e]], bool(flags[e] & _HIDDEN)
+
+    # -- ReferenceGraph API --------------------------------------------------
+
+    def register(self, obj: IDFObject, field_name: str, referenced_name: str) -> None:
+        """Register that an object references another name."""
+        if not referenced_name:
+            return
+        self._add_edge(
+            self._intern_obj(obj),
+            self._intern_name(referenced_name.upper()),
+            self._intern_field(field_name),
+        )
+
+    def register_many(self, edges: Iterable[tuple[IDFObject, str, str]]) -> None:
+        """Register many references at once.
+
+        Into an empty graph the edges are appended straight to the edge
+        columns and the CSR indexes are built in a single compaction.
+        """
+        if self._edge_flags:
+            for obj, field_name, referenced_name in edges:
+                self.register(obj, field_name, referenced_name)
+            return
+        seen: set[tuple[int, int, int]] = set()
+        for obj, field_name, referenced_name in edges:
+            if not referenced_name:
+                continue
+            key = (
+                self._intern_obj(obj),
+                self._intern_name(referenced_name.upper()),
+                self._intern_field(field_name),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            self._edge_src.append(key[0])
+            self._edge_name.append(key[1])
+            self._edge_field.append(key[2])
+            self._edge_flags.append(0)
+        self._live_edges = len(self._edge_flags)
+        self.compact()
+
+    def unregister(self, obj: IDFObject) -> None:
+        """Remove all reference tracking for an object."""
+        oid = self._obj_ids.pop(obj, None)
+        if oid is not None:
+            for e in self._obj_edges(oid):
+                self._kill_edge(e)
+            self._objects[oid] = None
+            self._pending_by_obj.pop(oid, None)
+
+        # Also remove any references TO this object
+        self.drop_referrers(obj.name or "")
+
+    def drop_referrers(self, name: str) -> None:
+        """Forget which objects reference *name* (a removed object's name)."""
+        nid = self._name_ids.get(name.upper())
+        if nid is not None:
+            for e in self._name_edges(nid):
+                self._edge_flags[e] |= _HIDDEN
+
+    def get_referencing(self, name: str) -> set[IDFObject]:
+        """Get all objects that reference a given name."""
+        nid = self._name_ids.get(name.upper())
+        if nid is None:
+            return set()
+        objects, edge_src = self._objects, self._edge_src
+        return {obj for e in self._name_edges(nid) if (obj := objects[edge_src[e]]) is not None}
+
+    def get_referencing_with_fields(self, name: str) -> set[tuple[IDFObject, str]]:
+        """Get all (object, field_name) pairs that reference a given name."""
+        nid = self._name_ids.get(name.upper())
+        if nid is None:
+            return set()
+        objects, edge_src, fields, edge_field = self._objects, self._edge_src, self._fields, self._edge_field
+        return {
+            (obj, fields[edge_field[e]]) for e in self._name_edges(nid) if (obj := objects[edge_src[e]]) is not None
+        }
+
+    def get_references(self, obj: IDFObject) -> set[str]:
+        """Get all names (uppercase) that an object references."""
+        oid = self._obj_ids.get(obj)
+        if oid is None:
+            return set()
+        names, edge_name = self._names, self._edge_name
+        return {names[edge_name[e]] for e in self._obj_edges(oid)}
+
+    def get_references_with_fields(self, obj: IDFObject) -> set[tuple[str, str]]:
+        """Get all (name, field_name) pairs that an object references."""
+        oid = self._obj_ids.get(obj)
+        if oid is None:
+            return set()
+        names, edge_name, fields, edge_field = self._names, self._edge_name, self._fields, self._edge_field
+        return {(names[edge_name[e]], fields[edge_field[e]]) for e in self._obj_edges(oid)}
+
+    def is_referenced(self, name: str) -> bool:
+        """Check if a name is referenced by any object."""
+        nid = self._name_ids.get(name.upper())
+        return nid is not None and bool(self._name_edges(nid))
+
+    def get_dangling_references(self, valid_names: set[str]) -> Iterator[tuple[IDFObject, str, str]]:
+        """Find all references to non-existent objects."""
+        valid_upper = {n.upper() for n in valid_names}
+        for obj, name_upper, field_name, _hidden in self._iter_edges():
+            if name_upper not in valid_upper:
+                yield (obj, field_name, name_upper)
+
+    def rename_target(self, old_name: str, new_name: str) -> None:
+        """Update indexes when a referenced target is renamed."""
+        old_upper = old_name.upper()
+        new_upper = new_name.upper()
+        if old_upper == new_upper:
+            return
+        old_nid = self._name_ids.get(old_upper)
+        if old_nid is None:
+            return
+        edges = self._name_edges(old_nid)
+        if not edges:
+            return
+
+        new_nid = self._intern_name(new_upper)
+        edge_src, edge_field, edge_name = self._edge_src, self._edge_field, self._edge_name
+        pending = self._pending_by_name.setdefault(new_nid, [])
+        for e in edges:
+            existing = self._find_edge(edge_src[e], new_nid, edge_field[e])
+            if existing >= 0:
+                # Already references the new name through the same field: merge
+                self._kill_edge(e)
+                if self._edge_flags[existing] & _HIDDEN:
+                    self._edge_flags[existing] &= ~_HIDDEN
+                    pending.append(existing)
+            else:
+                edge_name[e] = new_nid
+                pending.append(e)
+        self._pending_count += len(edges)
+
+    def rename_targets(self, renames: Mapping[str, str]) -> None:
+        """Update indexes for many renamed targets at once (simultaneously, so swaps work).
+
+        Raises:
+            ValueError: If two old names differ only in case.
+        """
+        moves: list[tuple[int, list[int], bool]] = []
+        for old_upper, new_upper in _normalize_renames(renames):
+            old_nid = self._name_ids.get(old_upper)
+            if old_nid is None:
+                continue
+            edges = self._name_edges(old_nid)
+            if edges:
+                fresh = new_upper not in self._name_ids
+                moves.append((self._intern_name(new_upper), edges, fresh))
+
+        edge_name = self._edge_name
+        targets = Counter(new_nid for new_nid, _, _ in moves)
+        merge: list[tuple[int, list[int]]] = []
+        for new_nid, edges, fresh in moves:
+            for e in edges:
+                edge_name[e] = new_nid
+            self._pending_by_name.setdefault(new_nid, []).extend(edges)
+            self._pending_count += len(edges)
+            # A name nothing referenced before, targeted by a single move, cannot hold duplicates
+            if not fresh or targets[new_nid] > 1:
+                merge.append((new_nid, edges))
+
+        self._merge_duplicate_edges(merge)
+
+    def _merge_duplicate_edges(self, moves: list[tuple[int, list[int]]]) -> None:
+        """Drop re-targeted edges that now duplicate another reference through the same field."""
+        edge_src, edge_name, edge_field, flags = self._edge_src, self._edge_name, self._edge_field, self._edge_flags
+        for new_nid, edges in moves:
+            for e in edges:
+                if flags[e] & _DEAD:
+                    continue
+                fid = edge_field[e]
+                for other in self._obj_edges(edge_src[e]):
+                    if other != e and edge_name[other] == new_nid and edge_field[other] == fid:
+                        self._kill_edge(e)
+                        if flags[other] & _HIDDEN:
+                            flags[other] &= ~_HIDDEN
+                            self._pending_by_name[new_nid].append(other)
+                        break
+
+    def update_reference(self, obj: IDFObject, field_name: str, old_value: str | None, new_value: str | None) -> None:
+        """Update indexes when an object's reference field changes."""
+        oid = self._intern_obj(obj)
+        fid = self._intern_field(field_name)
+        if old_value:
+            old_nid = self._name_ids.get(old_value.upper())
+            if old_nid is not None:
+                e = self._find_edge(oid, old_nid, fid)
+                if e >= 0:
+                    self._kill_edge(e)
+        if new_value and new_value.strip():
+            self._add_edge(oid, self._intern_name(new_value.upper()), fid)
+
+    def update_references(self, changes: Iterable[tuple[IDFObject, str, str | None, str | None]]) -> None:
+        """Apply many reference field changes in a single pass."""
+        for obj, field_name, old_value, new_value in changes:
+            self.update_reference(obj, field_name, old_value, new_value)
+
+    def clear(self) -> None:
+        """Clear all reference tracking."""
+        self._reset()
+        self._object_lists.clear()
+
+    def __len__(self) -> int:
+        """Return total number of references tracked."""
+        return self._live_edges
+
+    def stats(self) -> dict[str, int]:
+        """Return statistics about the reference graph."""
+        flags = self._edge_flags
+        sources: set[int] = set()
+        visible_names: set[int] = set()
+        for e in range(len(flags)):
+            flag = flags[e]
+            if flag & _DEAD:
+                continue
+            sources.add(self._edge_src[e])
+            if not flag:
+                visible_names.add(self._edge_name[e])
+        return {
+            "total_references": self._live_edges,
+            "objects_with_references": len(sources),
+            "names_referenced": len(visible_names),
+            "object_lists": len(self._object_lists),
+        }
@@ -16,9 +16,10 @@ import time
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from .exceptions import SchemaNotFoundError
+from .objects import IDFObject, build_object_class, to_python_name
 from .versions import (
     ENERGYPLUS_VERSIONS,
     find_closest_version,
@@ -27,6 +28,9 @@ from .versions import (
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from .validation import CompiledValidator
+
 
 @dataclass(frozen=True, slots=True)
 class ParsingCache:
@@ -45,6 +49,7 @@ class ParsingCache:
     extensible: bool
     ext_size: int
     ext_field_names: tuple[str, ...]
+    object_class: type[IDFObject]
 
 
 def _resolve_field_type(
@@ -106,7 +111,15 @@ class EpJSONSchema:
         _properties: Object definitions
     """
 
-    __slots__ = ("_object_lists", "_parsing_cache", "_properties", "_raw", "_reference_lists", "version")
+    __slots__ = (
+        "_object_lists",
+        "_parsing_cache",
+        "_properties",
+        "_raw",
+        "_reference_lists",
+        "_validators",
+        "version",
+    )
 
     version: tuple[int, int, int]
     _raw: dict[str, Any]
@@ -114,6 +127,7 @@ class EpJSONSchema:
     _reference_lists: dict[str, list[str]]
     _object_lists: dict[str, set[str]]
     _parsing_cache: dict[str, ParsingCache]
+    _validators: dict[str, CompiledValidator]
 
     def __init__(self, version: tuple[int, int, int], schema_data: dict[str, Any]) -> None:
         self.version = version
@@ -124,8 +138,13 @@ class EpJSONSchema:
         self._reference_lists: dict[str, list[str]] = {}
         self._object_lists: dict[str, set[str]] = {}
         self._parsing_cache: dict[str, ParsingCache] = {}
+        self._validators: dict[str, CompiledValidator] = {}
         self._build_reference_indexes()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle only the raw schema data; indexes, parsing caches and validators are rebuilt."""
+        return (EpJSONSchema, (self.version, self._raw))
+
     def _build_reference_indexes(self) -> None:
         """Build indexes for reference and object lists."""
         for obj_type, obj_schema in self._properties.items():
@@ -300,6 +319,25 @@ class EpJSONSchema:
         self._parsing_cache[obj_type] = cached
         return cached
 
+    def get_validator(self, obj_type: str) -> CompiledValidator | None:
+        """Get or lazily compile the validator for an object type.
+
+        Returns None if *obj_type* is not in the schema.
+        """
+        cached = self._validators.get(obj_type)
+        if cached is not None:
+            return cached
+
+        inner = self.get_inner_schema(obj_type)
+        if not inner:
+            return None
+
+        from .validation import CompiledValidator
+
+        cached = CompiledValidator(obj_type, inner, self.is_extensible(obj_type))
+        self._validators[obj_type] = cached
+        return cached
+
     def _build_parsing_cache(self, obj_type: str, obj_schema: dict[str, Any]) -> ParsingCache:
         """Build parsing metadata for a single object type."""
         has_name = "name" in obj_schema
@@ -337,6 +375,18 @@ class EpJSONSchema:
             if ext_fname not in field_types:
                 field_types[ext_fname] = _resolve_field_type(ext_fname, props, field_info)
 
+        # Per-type IDFObject subclass with field descriptors; eppy-style
+        # aliases ("X_Origin") are resolved here instead of on every access.
+        descriptor_fields = tuple(field_types)
+        aliases: list[tuple[str, str]] = []
+        for fname in descriptor_fields:
+            display = field_info.get(fname, {}).get("field_name")
+            if display:
+                alias = display.replace(" ", "_")
+                if alias != fname and to_python_name(alias) == fname:
+                    aliases.append((alias, fname))
+        object_class = build_object_class(obj_type, descriptor_fields, tuple(aliases))
+
         return ParsingCache(
             obj_schema=obj_schema,
             has_name=has_name,
@@ -347,6 +397,7 @@ class EpJSONSchema:
             extensible=extensible,
             ext_size=ext_size,
             ext_field_names=tuple(ext_field_names_list),
+            object_class=object_class,
         )
 
     def get_types_providing_reference(self, ref_list: str) -> list[str]:
@@ -37,12 +37,14 @@ your use case.
 
 from __future__ import annotations
 
-from ._common import prep_outputs
+from ._common import prep_outputs, prune_input_store
 from .async_batch import SimulationEvent, async_simulate_batch, async_simulate_batch_stream
 from .async_runner import async_simulate
 from .batch import BatchResult, SimulationJob, simulate_batch
-from .cache import CacheKey, SimulationCache
+from .batch_store import BatchStore, RunExtract, TabularSpec, TimeSeriesSpec
+from .cache import CacheEntry, CacheKey, CacheStats, SimulationCache, simulation_key
 from .config import EnergyPlusConfig, find_energyplus
+from .distributed import SQLiteWorkQueue, WorkQueue, collect_batch, iter_batch_results, run_worker, submit_batch
 from .expand import (
     expand_objects,
     needs_ground_heat_preprocessing,
@@ -65,53 +67,72 @@ from .plotting import (
 )
 from .progress import ProgressParser, SimulationProgress
 from .progress_bars import tqdm_progress
+from .remote_cache import RemoteSimulationCache
 from .result import SimulationResult
 from .runner import simulate
+from .scheduling import JobScheduler, RuntimeStats
 
 __all__ = [
     "AsyncFileSystem",
     "AsyncLocalFileSystem",
     "AsyncS3FileSystem",
     "BatchResult",
+    "BatchStore",
     "CSVColumn",
     "CSVResult",
+    "CacheEntry",
     "CacheKey",
+    "CacheStats",
     "EnergyPlusConfig",
     "EnvironmentInfo",
     "ErrorMessage",
     "ErrorReport",
     "FileSystem",
+    "JobScheduler",
     "LocalFileSystem",
     "OutputMeter",
     "OutputVariable",
     "OutputVariableIndex",
     "PlotBackend",
     "ProgressParser",
+    "RemoteSimulationCache",
+    "RunExtract",
+    "RuntimeStats",
     "S3FileSystem",
     "SQLResult",
+    "SQLiteWorkQueue",
     "SimulationCache",
     "SimulationEvent",
     "SimulationJob",
     "SimulationProgress",
     "SimulationResult",
     "TabularRow",
+    "TabularSpec",
     "TimeSeriesResult",
+    "TimeSeriesSpec",
     "VariableInfo",
+    "WorkQueue",
     "async_simulate",
     "async_simulate_batch",
     "async_simulate_batch_stream",
+    "collect_batch",
     "expand_objects",
     "find_energyplus",
     "get_default_backend",
+    "iter_batch_results",
     "needs_ground_heat_preprocessing",
     "plot_comfort_hours",
     "plot_energy_balance",
     "plot_temperature_profile",
     "prep_outputs",
+    "prune_input_store",
     "run_basement_preprocessor",
     "run_preprocessing",
     "run_slab_preprocessor",
+    "run_worker",
     "simulate",
     "simulate_batch",
+    "simulation_key",
+    "submit_batch",
     "tqdm_progress",
 ]
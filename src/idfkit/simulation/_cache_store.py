@@ -0,0 +1,185 @@
+"""File storage for simulation cache entries.
+
+Copies the selected outputs of a run directory into a cache entry.  Large
+files are stored once in a content-addressed blob directory
+(``<size>/<sha256>``) and hard-linked into each entry that contains them,
+so identical weather files and outputs take disk space once.  Cold
+entries can be gzip-compressed in place and are expanded again on their
+next hit.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Files smaller than this are copied; deduplicating them costs more than it saves
+DEDUPE_MIN_BYTES = 64 * 1024
+
+# Files smaller than this are left uncompressed
+_COMPRESS_MIN_BYTES = 4 * 1024
+
+_GZ_SUFFIX = ".gz"
+
+# Name prefix of blobs whose digest has not been computed yet
+_PENDING = "pending-"
+
+
+def store_outputs(
+    run_dir: Path,
+    entry_dir: Path,
+    patterns: Sequence[str] | None,
+    blob_dir: Path | None,
+) -> None:
+    """Copy the files of *run_dir* matching *patterns* into *entry_dir*.
+
+    Args:
+        run_dir: Simulation run directory.
+        entry_dir: Destination (an empty temporary directory).
+        patterns: Filename globs to keep (e.g. ``"*.sql"``); ``None`` keeps
+            everything.
+        blob_dir: Content-addressed store for large files, or ``None`` to
+            copy every file.
+    """
+    for src in run_dir.rglob("*"):
+        if not src.is_file() or (patterns is not None and not _matches(src.name, patterns)):
+            continue
+        dest = entry_dir / src.relative_to(run_dir)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if blob_dir is not None and src.stat().st_size >= DEDUPE_MIN_BYTES:
+            _link_blob(src, dest, blob_dir)
+        else:
+            shutil.copy2(src, dest)
+
+
+def _matches(name: str, patterns: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def _link_blob(src: Path, dest: Path, blob_dir: Path) -> None:
+    """Hard-link *dest* to the blob holding *src*'s content, adding it if new.
+
+    Blobs are bucketed by size and only hashed once a second file of the
+    same size arrives, so unique outputs are never hashed.
+    """
+    bucket = blob_dir / str(src.stat().st_size)
+    if bucket.is_dir():
+        _name_pending(bucket)
+        blob = bucket / _sha256(src)
+        if not blob.is_file():
+            _add_blob(src, blob)
+    else:
+        bucket.mkdir(parents=True, exist_ok=True)
+        blob = bucket / f"{_PENDING}{uuid.uuid4().hex}"
+        _add_blob(src, blob)
+    try:
+        os.link(blob, dest)
+    except OSError:
+        # No hard links on this file system, or the blob was collected or
+        # renamed between the check and the link
+        shutil.copy2(src, dest)
+
+
+def _add_blob(src: Path, blob: Path) -> None:
+    fd, tmp = tempfile.mkstemp(dir=blob.parent, prefix=".tmp_")
+    os.close(fd)
+    shutil.copy2(src, tmp)
+    os.replace(tmp, blob)
+
+
+def _name_pending(bucket: Path) -> None:
+    """Rename not-yet-hashed blobs in *bucket* to their digests."""
+    for pending in bucket.glob(_PENDING + "*"):
+        try:
+            os.replace(pending, bucket / _sha256(pending))
+        except OSError:
+            continue  # renamed by another process
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def collect_blobs(blob_dir: Path) -> int:
+    """Delete blobs that no cache entry links to; return how many."""
+    removed = 0
+    if not blob_dir.is_dir():
+        return 0
+    for blob in blob_dir.glob("*/*"):
+        try:
+            if not blob.name.startswith(".tmp_") and blob.stat().st_nlink == 1:
+                blob.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def compress_entry(entry_dir: Path, keep: str) -> list[str]:
+    """Gzip the files of *entry_dir* in place, except *keep* and small files.
+
+    Returns:
+        The paths (relative to *entry_dir*) of the files compressed.
+    """
+    compressed: list[str] = []
+    for path in list(entry_dir.rglob("*")):
+        if not path.is_file() or path.name == keep or path.name.startswith(".tmp_"):
+            continue
+        if path.stat().st_size < _COMPRESS_MIN_BYTES:
+            continue
+        target = path.with_name(path.name + _GZ_SUFFIX)
+        tmp = target.with_name(".tmp_" + target.name)
+        with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp, target)
+        path.unlink()
+        compressed.append(path.relative_to(entry_dir).as_posix())
+    return compressed
+
+
+def decompress_entry(entry_dir: Path, files: Sequence[str], blob_dir: Path | None) -> None:
+    """Expand *files* gzipped by [compress_entry][idfkit.simulation._cache_store.compress_entry].
+
+    Large files are linked back to their blobs when *blob_dir* is given.
+    Safe to run concurrently from several threads or processes: each
+    caller expands into its own temporary file, each file is restored
+    before its ``.gz`` is removed, and files another caller already
+    restored are skipped.
+    """
+    for name in files:
+        target = entry_dir / name
+        path = target.with_name(target.name + _GZ_SUFFIX)
+        tmp = target.with_name(f".tmp_{uuid.uuid4().hex}_{target.name}")
+        try:
+            with gzip.open(path, "rb") as src, open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        except FileNotFoundError:
+            # Expanded by another caller in the meantime
+            tmp.unlink(missing_ok=True)
+            if target.is_file():
+                continue
+            raise
+        if blob_dir is not None and tmp.stat().st_size >= DEDUPE_MIN_BYTES:
+            linked = tmp.with_name(tmp.name + ".link")
+            _link_blob(tmp, linked, blob_dir)
+            tmp.unlink()
+            tmp = linked
+        os.replace(tmp, target)
+        # rename() is a no-op when another caller already linked *target*
+        # to the same blob, leaving *tmp* behind
+        tmp.unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
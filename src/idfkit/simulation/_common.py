@@ -5,16 +5,28 @@ Internal module — not part of the public API.
 
 from __future__ import annotations
 
+import contextlib
+import logging
+import os
 import shutil
+import stat
+import sys
 import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from .config import EnergyPlusConfig, find_energyplus
 
 if TYPE_CHECKING:
     from ..document import IDFDocument
+    from .batch import SimulationJob
+    from .cache import SimulationCache
     from .fs import AsyncFileSystem, FileSystem
+    from .result import SimulationResult
+
+logger = logging.getLogger(__name__)
 
 
 def resolve_config(energyplus: EnergyPlusConfig | None) -> EnergyPlusConfig:
@@ -146,26 +158,275 @@ async def async_upload_results(local_dir: Path, remote_dir: Path, fs: AsyncFileS
         await asyncio.gather(*tasks)
 
 
-def prepare_run_directory(output_dir: str | Path | None, weather_path: Path) -> Path:
+def find_duplicates(jobs: Sequence[SimulationJob]) -> list[int]:
+    """Map each job to the index of the first job with identical inputs.
+
+    Jobs are identical when their [simulation_key][idfkit.simulation.cache.simulation_key]
+    matches and they write to the same output directory with the same
+    prefix.  Jobs whose key cannot be computed (e.g. a missing weather
+    file) map to themselves, so they fail on their own.
+    """
+    from .cache import simulation_key
+
+    owners: list[int] = []
+    first: dict[tuple[str, str | None, str], int] = {}
+    # Sweeps often reuse one model object; hash it once per set of flags
+    digests: dict[tuple[object, ...], str] = {}
+    for idx, job in enumerate(jobs):
+        flags = (job.expand_objects, job.annual, job.design_day, job.output_suffix, job.readvars, job.extra_args)
+        memo = (id(job.model), str(job.weather), *flags)
+        digest = digests.get(memo)
+        if digest is None:
+            try:
+                digest = simulation_key(
+                    job.model,  # type: ignore[arg-type]
+                    job.weather,
+                    expand_objects=job.expand_objects,
+                    annual=job.annual,
+                    design_day=job.design_day,
+                    output_suffix=job.output_suffix,
+                    readvars=job.readvars,
+                    extra_args=job.extra_args,
+                ).hex_digest
+            except (OSError, TypeError, AttributeError, ValueError):
+                owners.append(idx)
+                continue
+            digests[memo] = digest
+        output_dir = str(job.output_dir) if job.output_dir is not None else None
+        owners.append(first.setdefault((digest, output_dir, job.output_prefix), idx))
+    return owners
+
+
+def group_jobs(jobs: Sequence[SimulationJob], *, dedupe: bool) -> dict[int, list[int]]:
+    """Map the index of each job that runs to the indices its result serves.
+
+    Without *dedupe* every job runs for itself.
+    """
+    if not dedupe:
+        return {idx: [idx] for idx in range(len(jobs))}
+    groups: dict[int, list[int]] = {}
+    for idx, owner in enumerate(find_duplicates(jobs)):
+        groups.setdefault(owner, []).append(idx)
+    if len(groups) < len(jobs):
+        logger.info("Running %d unique jobs for %d requested", len(groups), len(jobs))
+    return groups
+
+
+def reduce_result(
+    result: SimulationResult,
+    reducer: Callable[[SimulationResult], Any] | None,
+    *,
+    keep_run_dir: bool,
+    cache: SimulationCache | None,
+    output_dir: str | Path | None,
+) -> tuple[SimulationResult, Any]:
+    """Apply a batch *reducer* to *result* in the worker that produced it.
+
+    A successful result is passed to *reducer* and replaced by a copy
+    without its stdout and stderr; unless *keep_run_dir* is set, its run
+    directory is then deleted if idfkit created it (the job had no
+    explicit *output_dir*).  Explicit output directories, cache entries
+    and remote outputs are never deleted.  Failed results are returned
+    unchanged with their run directory kept.  A reducer that raises marks
+    the job failed.
+
+    Returns:
+        The result to keep and the reducer's return value (``None`` for
+        failed jobs or without a reducer).
+    """
+    if not result.success or (reducer is None and keep_run_dir):
+        return result, None
+    try:
+        value = reducer(result) if reducer is not None else None
+    except Exception as exc:
+        logger.warning("Reducer failed for %s: %r", result.run_dir, exc)
+        return replace(result, success=False, stderr=f"reducer failed: {exc!r}"), None
+    finally:
+        result.close()
+
+    slim = replace(result, stdout="", stderr="")
+    if (
+        not keep_run_dir
+        and output_dir is None
+        and result.fs is None
+        and result.async_fs is None
+        and not _is_cache_entry(result, cache)
+    ):
+        shutil.rmtree(result.run_dir, ignore_errors=True)
+    return slim, value
+
+
+def _is_cache_entry(result: SimulationResult, cache: SimulationCache | None) -> bool:
+    return cache is not None and result.run_dir.resolve().parent == cache.cache_dir.resolve()
+
+
+SCRATCH_DIR_ENV = "IDFKIT_SCRATCH_DIR"
+"""Environment variable naming the default parent of temporary run directories."""
+
+# Subdirectory of the scratch root holding shared read-only inputs (per user on POSIX)
+_INPUT_STORE = "idfkit_inputs"
+
+
+def scratch_root(scratch_dir: str | Path | None = None) -> Path | None:
+    """Return the parent directory for temporary run directories.
+
+    Args:
+        scratch_dir: Explicit directory (e.g. a tmpfs mount such as
+            ``/dev/shm``).  Defaults to ``$IDFKIT_SCRATCH_DIR``.
+
+    Returns:
+        The directory (created if missing), or ``None`` for the system
+        temp directory.
+    """
+    if scratch_dir is None:
+        scratch_dir = os.environ.get(SCRATCH_DIR_ENV) or None
+    if scratch_dir is None:
+        return None
+    root = Path(scratch_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def link_input(src: Path, dest: Path, scratch: Path | None = None) -> None:
+    """Place the read-only input file *src* at *dest* without copying it.
+
+    *src* is copied once into a content-addressed store
+    (``idfkit_inputs-<uid>/<sha256><suffix>`` under *scratch* or the system
+    temp directory) and hard-linked from there into each run directory.
+    The store is private to the current user, and an existing entry is
+    only reused if this user owns it and its size matches *src*.  Falls
+    back to a plain copy where hard links are unavailable (the store is on
+    another file system, or the platform refuses them) or the store
+    cannot be trusted.
+    """
+    try:
+        os.link(_stored_input(src, scratch), dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def _input_store_path(scratch: Path | None) -> Path:
+    """Return the current user's input store directory under *scratch*."""
+    root = scratch or Path(tempfile.gettempdir())
+    if sys.platform == "win32":
+        # The default temp directory is already per user on Windows
+        return root / _INPUT_STORE
+    return root / f"{_INPUT_STORE}-{os.getuid()}"
+
+
+def _input_store(scratch: Path | None) -> Path:
+    """Return the current user's input store, creating it with mode 0700.
+
+    Raises:
+        PermissionError: If the path exists but is not a directory that
+            only the current user can access.
+    """
+    store = _input_store_path(scratch)
+    if sys.platform == "win32":
+        store.mkdir(parents=True, exist_ok=True)
+        return store
+    with contextlib.suppress(FileExistsError):
+        store.mkdir(mode=0o700, parents=True)
+    info = store.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        msg = f"Input store {store} is not a private directory owned by the current user"
+        raise PermissionError(msg)
+    return store
+
+
+def _is_trusted_input(stored: Path, size: int) -> bool:
+    """Whether an existing store entry can be reused for an input of *size* bytes."""
+    try:
+        info = stored.lstat()
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISREG(info.st_mode) or info.st_size != size:
+        return False
+    return sys.platform == "win32" or info.st_uid == os.getuid()
+
+
+def _stored_input(src: Path, scratch: Path | None) -> Path:
+    """Return the store copy of *src*, adding (or replacing) it if missing or untrusted."""
+    from .cache import _weather_digest  # pyright: ignore[reportPrivateUsage]
+
+    store = _input_store(scratch)
+    stored = store / f"{_weather_digest(src, None)}{src.suffix}"
+    if not _is_trusted_input(stored, src.stat().st_size):
+        fd, tmp = tempfile.mkstemp(dir=store, prefix=".tmp_")
+        os.close(fd)
+        shutil.copy2(src, tmp)
+        if os.name != "nt":
+            # Shared by every run directory linking it: guard against edits
+            os.chmod(tmp, 0o444)
+        os.replace(tmp, stored)
+    return stored
+
+
+def prune_input_store(scratch_dir: str | Path | None = None) -> int:
+    """Delete shared simulation inputs that no run directory uses any more.
+
+    Weather and IDD files are kept in a per-user store under the scratch
+    directory and hard-linked into each run directory (see
+    [simulate][idfkit.simulation.runner.simulate]'s ``scratch_dir``).  The
+    store is never emptied automatically, which matters on a RAM-backed
+    scratch directory such as ``/dev/shm``.  This removes every stored
+    file with no remaining hard links, i.e. whose run directories have
+    all been deleted.  It is safe to call while simulations are running.
+
+    Args:
+        scratch_dir: Scratch directory whose store to prune.  Defaults to
+            ``$IDFKIT_SCRATCH_DIR``, else the system temp directory.
+
+    Returns:
+        Number of files removed.
+    """
+    if scratch_dir is None:
+        scratch_dir = os.environ.get(SCRATCH_DIR_ENV) or None
+    store = _input_store_path(Path(scratch_dir) if scratch_dir is not None else None)
+    if not store.is_dir():
+        return 0
+    removed = 0
+    for entry in store.iterdir():
+        try:
+            info = entry.lstat()
+            if stat.S_ISREG(info.st_mode) and info.st_nlink <= 1:
+                entry.unlink()
+                removed += 1
+        except OSError:
+            logger.debug("Could not prune %s", entry, exc_info=True)
+    logger.debug("Pruned %d unused input(s) from %s", removed, store)
+    return removed
+
+
+def prepare_run_directory(
+    output_dir: str | Path | None,
+    weather_path: Path,
+    scratch_dir: str | Path | None = None,
+) -> Path:
     """Create and populate the simulation run directory.
 
+    The weather file is hard-linked from a shared input store rather than
+    copied when possible (see [link_input][idfkit.simulation._common.link_input]).
+
     Args:
         output_dir: Explicit output directory, or None for a temp dir.
-        weather_path: Path to the weather file to copy.
+        weather_path: Path to the weather file to place in the directory.
+        scratch_dir: Parent for the temp dir (default ``$IDFKIT_SCRATCH_DIR``,
+            else the system temp directory).
 
     Returns:
         Path to the run directory.
     """
+    scratch = scratch_root(scratch_dir)
     if output_dir is not None:
         run_dir = Path(output_dir).resolve()
         run_dir.mkdir(parents=True, exist_ok=True)
     else:
-        run_dir = Path(tempfile.mkdtemp(prefix="idfkit_sim_"))
+        run_dir = Path(tempfile.mkdtemp(prefix="idfkit_sim_", dir=scratch))
 
-    # Copy weather file into run dir
     dest = run_dir / weather_path.name
     if not dest.exists():
-        shutil.copy2(weather_path, dest)
+        link_input(weather_path, dest, scratch)
 
     return run_dir
 
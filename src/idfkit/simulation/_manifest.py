@@ -0,0 +1,210 @@
+"""SQLite index of simulation cache entries.
+
+Keeps one row per cache entry (size, creation and access times, hit
+count) plus hit/miss/eviction counters, so that listing, sizing and
+pruning a [SimulationCache][idfkit.simulation.cache.SimulationCache] are
+queries instead of directory walks.  Writes run in immediate
+transactions, so processes sharing a cache directory see a consistent
+index.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal
+
+EvictionPolicy = Literal["lru", "lfu"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Connections are kept open per thread and process: closing the last
+# connection to a WAL database checkpoints it, which dominates short calls.
+_local = threading.local()
+
+_ORDER: dict[str, str] = {
+    "lru": "last_access ASC",
+    "lfu": "hits ASC, last_access ASC",
+}
+
+
+class CacheManifest:
+    """Entry index and counters stored in a SQLite file."""
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, (re)creating the file if needed."""
+        cache: dict[tuple[Path, int], sqlite3.Connection] = _local.__dict__.setdefault("connections", {})
+        slot = (self._path, os.getpid())
+        conn = cache.get(slot)
+        if conn is not None and self._path.is_file():
+            return conn
+        if conn is not None:
+            # The file was deleted underneath us (e.g. by clear())
+            conn.close()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        cache[slot] = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def exists(self) -> bool:
+        return self._path.is_file()
+
+    def add(self, key: str, size: int) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, size, created, last_access, hits) VALUES (?, ?, ?, ?, 0)",
+                (key, size, now, now),
+            )
+
+    def add_many(self, rows: Iterable[tuple[str, int, float]]) -> None:
+        """Insert ``(key, size, mtime)`` rows for entries not yet indexed."""
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries (key, size, created, last_access, hits) VALUES (?, ?, ?, ?, 0)",
+                [(key, size, mtime, mtime) for key, size, mtime in rows],
+            )
+
+    def resize(self, key: str, size: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE entries SET size = ? WHERE key = ?", (size, key))
+
+    def hit(self, key: str) -> bool:
+        """Record a hit on *key*; return whether the entry is indexed."""
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+            _bump(conn, "hits")
+        return cur.rowcount > 0
+
+    def miss(self) -> None:
+        with self._transaction() as conn:
+            _bump(conn, "misses")
+
+    def remove(self, key: str) -> bool:
+        with self._transaction() as conn:
+            cur = conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cur.rowcount > 0
+
+    def rows(self) -> list[tuple[str, int, float, float, int]]:
+        return (
+            self
+            ._connect()
+            .execute("SELECT key, size, created, last_access, hits FROM entries ORDER BY last_access DESC")
+            .fetchall()
+        )
+
+    def totals(self) -> tuple[int, int, dict[str, int]]:
+        """Return ``(entry count, total bytes, counters)``."""
+        with self._transaction() as conn:
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        return int(count), int(size), counters
+
+    def evict(
+        self, max_bytes: int | None, max_entries: int | None, policy: EvictionPolicy, keep: str | None = None
+    ) -> list[str]:
+        """Drop index rows until within limits; return the evicted keys.
+
+        *keep* is never chosen (a just-stored entry has no hits yet and
+        would otherwise be the first LFU victim).  The caller removes the
+        entry directories.
+        """
+        with self._transaction() as conn:
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            victims: list[str] = []
+            rows = conn.execute(f"SELECT key, size FROM entries ORDER BY {_ORDER[policy]}")  # noqa: S608
+            for key, entry_size in rows:
+                if key == keep:
+                    continue
+                if (max_entries is None or count <= max_entries) and (max_bytes is None or size <= max_bytes):
+                    break
+                victims.append(key)
+                count -= 1
+                size -= entry_size
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+            if victims:
+                _bump(conn, "evictions", len(victims))
+        return victims
+
+
+def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+    conn.execute(
+        "INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+        (name, amount),
+    )
+
+
+def directory_size(path: Path, seen: set[tuple[int, int]] | None = None) -> int:
+    """Total size in bytes of the files under *path*, charging shared blobs once.
+
+    A hard-linked file (a deduplicated blob) is charged to a single entry
+    so that entry sizes add up to the disk space actually used.  Without
+    *seen* it is charged only while no other entry links to it
+    (``st_nlink <= 2``: the blob store and this entry), which makes the
+    entry that first stored a blob pay for it.  With *seen*, as when
+    indexing many entries at once, it is charged to the first entry whose
+    walk meets its inode.
+    """
+    total = 0
+    for file in path.rglob("*"):
+        try:
+            if not file.is_file() or file.is_symlink():
+                continue
+            st = file.stat()
+        except OSError:
+            continue
+        if st.st_nlink > 1:
+            if seen is None:
+                if st.st_nlink > 2:
+                    continue
+            else:
+                inode = (st.st_dev, st.st_ino)
+                if inode in seen:
+                    continue
+                seen.add(inode)
+        total += st.st_size
+    return total
@@ -50,6 +50,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ._common import group_jobs, reduce_result
 from .async_runner import async_simulate
 from .batch import BatchResult, SimulationJob
 from .progress import SimulationProgress
@@ -77,6 +78,8 @@ class SimulationEvent:
         result: The simulation result.
         completed: Number of jobs completed so far (including this one).
         total: Total number of jobs in the batch.
+        value: Return value of the batch *reducer* (``None`` without one,
+            or for a failed job).
     """
 
     index: int
@@ -84,6 +87,7 @@ class SimulationEvent:
     result: SimulationResult
     completed: int
     total: int
+    value: Any = None
 
 
 async def async_simulate_batch(
@@ -94,6 +98,9 @@ async def async_simulate_batch(
     cache: SimulationCache | None = None,
     fs: FileSystem | AsyncFileSystem | None = None,
     on_progress: Callable[[SimulationProgress], Any] | None = None,
+    dedupe: bool = False,
+    reducer: Callable[[SimulationResult], Any] | None = None,
+    keep_run_dirs: bool = True,
 ) -> BatchResult:
     """Run multiple EnergyPlus simulations concurrently using asyncio.
 
@@ -122,6 +129,15 @@ async def async_simulate_batch(
             The ``"tqdm"`` shorthand is not supported for batch runners;
             use [tqdm_progress][idfkit.simulation.progress_bars.tqdm_progress]
             with a custom per-job callback instead.
+        dedupe: Run each distinct job once and share its result with the
+            identical jobs, as in
+            [simulate_batch][idfkit.simulation.batch.simulate_batch].
+        reducer: Optional callable applied to each successful result,
+            as in [simulate_batch][idfkit.simulation.batch.simulate_batch].
+            It runs in a worker thread, so it may do blocking reads.
+        keep_run_dirs: When ``False``, delete each successful job's
+            temporary run directory once it has been reduced (explicit
+            ``output_dir`` directories are kept).
 
     Returns:
         A [BatchResult][idfkit.simulation.batch.BatchResult] with results in the
@@ -152,13 +168,19 @@ async def async_simulate_batch(
 
         semaphore = asyncio.Semaphore(max_concurrent)
         results: list[SimulationResult | None] = [None] * len(jobs)
+        values: list[Any] = [None] * len(jobs)
         start = time.monotonic()
+        groups = await asyncio.to_thread(group_jobs, jobs, dedupe=dedupe)
 
         async def _run_one(idx: int, job: SimulationJob) -> None:
             async with semaphore:
-                results[idx] = await _async_run_job(idx, job, energyplus, cache, fs, progress_cb)
+                result = await _async_run_job(idx, job, energyplus, cache, fs, progress_cb)
+                result, value = await _reduce(result, reducer, keep_run_dirs, cache, job.output_dir)
+            for member in groups[idx]:
+                results[member] = result
+                values[member] = value
 
-        tasks = [asyncio.create_task(_run_one(i, job)) for i, job in enumerate(jobs)]
+        tasks = [asyncio.create_task(_run_one(idx, jobs[idx])) for idx in groups]
         await asyncio.gather(*tasks)
     finally:
         if progress_cleanup is not None:
@@ -171,11 +193,18 @@ async def async_simulate_batch(
         assert r is not None  # noqa: S101
         final.append(r)
 
-    batch_result = BatchResult(results=tuple(final), total_runtime_seconds=elapsed)
+    deduplicated = len(jobs) - len(groups)
+    batch_result = BatchResult(
+        results=tuple(final),
+        total_runtime_seconds=elapsed,
+        deduplicated=deduplicated,
+        values=tuple(values) if reducer is not None else (),
+    )
     logger.info(
-        "Async batch complete: %d succeeded, %d failed in %.1fs",
+        "Async batch complete: %d succeeded, %d failed (%d deduplicated) in %.1fs",
         len(batch_result.succeeded),
         len(batch_result.failed),
+        deduplicated,
         elapsed,
     )
     return batch_result
@@ -189,6 +218,9 @@ async def async_simulate_batch_stream(
     cache: SimulationCache | None = None,
     fs: FileSystem | AsyncFileSystem | None = None,
     on_progress: Callable[[SimulationProgress], Any] | None = None,
+    dedupe: bool = False,
+    reducer: Callable[[SimulationResult], Any] | None = None,
+    keep_run_dirs: bool = True,
 ) -> AsyncIterator[SimulationEvent]:
     """Run simulations concurrently, yielding events as each one completes.
 
@@ -216,6 +248,15 @@ async def async_simulate_batch_stream(
             is not supported for batch runners; use
             [tqdm_progress][idfkit.simulation.progress_bars.tqdm_progress]
             with a custom per-job callback instead.
+        dedupe: Run each distinct job once, as in
+            [simulate_batch][idfkit.simulation.batch.simulate_batch].  An
+            event is still yielded for every job; identical jobs complete
+            together.
+        reducer: Optional callable applied to each successful result in a
+            worker thread; its return value is the event's ``value``.
+        keep_run_dirs: When ``False``, delete each successful job's
+            temporary run directory once it has been reduced (explicit
+            ``output_dir`` directories are kept).
 
     Yields:
         [SimulationEvent][idfkit.simulation.async_batch.SimulationEvent] for each completed simulation, in the order
@@ -246,22 +287,27 @@ async def async_simulate_batch_stream(
     queue: asyncio.Queue[SimulationEvent] = asyncio.Queue()
     completed_count = 0
 
+    groups = await asyncio.to_thread(group_jobs, jobs, dedupe=dedupe)
+
     async def _run_one(idx: int, job: SimulationJob) -> None:
         nonlocal completed_count
         async with semaphore:
             result = await _async_run_job(idx, job, energyplus, cache, fs, progress_cb)
-        completed_count += 1
-        await queue.put(
-            SimulationEvent(
-                index=idx,
-                label=job.label,
-                result=result,
-                completed=completed_count,
-                total=total,
+            result, value = await _reduce(result, reducer, keep_run_dirs, cache, job.output_dir)
+        for member in groups[idx]:
+            completed_count += 1
+            await queue.put(
+                SimulationEvent(
+                    index=member,
+                    label=jobs[member].label,
+                    result=result,
+                    completed=completed_count,
+                    total=total,
+                    value=value,
+                )
             )
-        )
 
-    tasks = [asyncio.create_task(_run_one(i, job)) for i, job in enumerate(jobs)]
+    tasks = [asyncio.create_task(_run_one(idx, jobs[idx])) for idx in groups]
 
     try:
         for _ in range(total):
@@ -276,6 +322,21 @@ async def async_simulate_batch_stream(
         await asyncio.gather(*tasks, return_exceptions=True)
 
 
+async def _reduce(
+    result: SimulationResult,
+    reducer: Callable[[SimulationResult], Any] | None,
+    keep_run_dirs: bool,
+    cache: SimulationCache | None,
+    output_dir: str | Path | None,
+) -> tuple[SimulationResult, Any]:
+    """Apply *reducer* to *result* off the event loop."""
+    if reducer is None and keep_run_dirs:
+        return result, None
+    return await asyncio.to_thread(
+        reduce_result, result, reducer, keep_run_dir=keep_run_dirs, cache=cache, output_dir=output_dir
+    )
+
+
 async def _async_run_job(
     idx: int,
     job: SimulationJob,
@@ -295,6 +356,7 @@ async def _async_run_job(
             model=job.model,  # type: ignore[arg-type]
             weather=job.weather,
             output_dir=job.output_dir,
+            scratch_dir=job.scratch_dir,
             energyplus=energyplus,
             expand_objects=job.expand_objects,
             annual=job.annual,
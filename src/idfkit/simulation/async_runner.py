@@ -68,6 +68,7 @@ async def async_simulate(
     weather: str | Path,
     *,
     output_dir: str | Path | None = None,
+    scratch_dir: str | Path | None = None,
     energyplus: EnergyPlusConfig | None = None,
     expand_objects: bool = True,
     annual: bool = False,
@@ -95,6 +96,10 @@ async def async_simulate(
         model: The EnergyPlus model to simulate.
         weather: Path to the weather file (.epw).
         output_dir: Directory for output files (default: auto temp dir).
+        scratch_dir: Parent directory for the auto temp dir, e.g. a tmpfs
+            mount such as ``/dev/shm``.  Defaults to the
+            ``IDFKIT_SCRATCH_DIR`` environment variable, else the system
+            temp directory.
         energyplus: Pre-configured EnergyPlus installation. If None,
             uses [find_energyplus][idfkit.simulation.config.find_energyplus] for auto-discovery.
         expand_objects: Run ExpandObjects before simulation.  When
@@ -160,7 +165,7 @@ async def async_simulate(
                 readvars=readvars,
                 extra_args=extra_args,
             )
-            cached = cache.get(cache_key)
+            cached = await cache.aget(cache_key)
             if cached is not None:
                 return cached
 
@@ -176,7 +181,7 @@ async def async_simulate(
 
         # When using a remote fs, always run locally in a temp dir
         local_output_dir = None if fs is not None else output_dir
-        run_dir = prepare_run_directory(local_output_dir, weather_path)
+        run_dir = prepare_run_directory(local_output_dir, weather_path, scratch_dir)
         idf_path = run_dir / "model.idf"
 
         from ..writers import write_idf
@@ -248,7 +253,7 @@ async def async_simulate(
             output_prefix=output_prefix,
         )
     if cache is not None and cache_key is not None and result.success:
-        cache.put(cache_key, result)
+        await cache.aput(cache_key, result)
     return result
 
 
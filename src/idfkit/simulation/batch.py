@@ -1,9 +1,12 @@
-"""Batch simulation execution with thread-pool parallelism.
+"""Batch simulation execution with thread- or process-pool parallelism.
 
 Runs multiple EnergyPlus simulations concurrently using a
-[ThreadPoolExecutor][concurrent.futures.ThreadPoolExecutor].  Thread-based parallelism
+[ThreadPoolExecutor][concurrent.futures.ThreadPoolExecutor] by default.  Thread-based parallelism
 is appropriate because [simulate][idfkit.simulation.runner.simulate] delegates to ``subprocess.run``
-which releases the GIL.
+which releases the GIL.  With many workers the Python-side preparation
+(model copy, IDF serialization, cache hashing) becomes GIL-bound, so a
+[ProcessPoolExecutor][concurrent.futures.ProcessPoolExecutor] (or any other
+[Executor][concurrent.futures.Executor]) can be used instead.
 """
 
 from __future__ import annotations
@@ -11,13 +14,15 @@ from __future__ import annotations
 import logging
 import os
 import tempfile
+import threading
 import time
-from collections.abc import Callable, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Container, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+from ._common import group_jobs, reduce_result
 from .progress import SimulationProgress
 from .progress_bars import resolve_on_progress
 from .result import SimulationResult
@@ -27,6 +32,7 @@ if TYPE_CHECKING:
     from .cache import SimulationCache
     from .config import EnergyPlusConfig
     from .fs import FileSystem
+    from .scheduling import JobScheduler, SchedulePlan
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +46,9 @@ class SimulationJob:
         weather: Path to the weather file.
         label: Human-readable label for progress reporting.
         output_dir: Directory for output files (default: auto temp dir).
+        scratch_dir: Parent directory for the auto temp dir, e.g. a tmpfs
+            mount (default: ``$IDFKIT_SCRATCH_DIR``, else the system temp
+            directory).
         expand_objects: Run ExpandObjects before simulation.
         annual: Run annual simulation.
         design_day: Run design-day-only simulation.
@@ -54,6 +63,7 @@ class SimulationJob:
     weather: str | Path
     label: str = ""
     output_dir: str | Path | None = None
+    scratch_dir: str | Path | None = None
     expand_objects: bool = True
     annual: bool = False
     design_day: bool = False
@@ -71,10 +81,17 @@ class BatchResult:
     Attributes:
         results: Simulation results in the same order as the input jobs.
         total_runtime_seconds: Wall-clock time for the entire batch.
+        deduplicated: Number of jobs that were not run because an identical
+            job in the batch was; they share that job's result.
+        values: Return values of the batch *reducer*, in the same order as
+            the input jobs (``None`` for failed jobs).  Empty when no
+            reducer was given.
     """
 
     results: tuple[SimulationResult, ...]
     total_runtime_seconds: float
+    deduplicated: int = 0
+    values: tuple[Any, ...] = ()
 
     @property
     def succeeded(self) -> tuple[SimulationResult, ...]:
@@ -107,11 +124,19 @@ def simulate_batch(
     progress: Callable[..., None] | None = None,
     fs: FileSystem | None = None,
     on_progress: Callable[[SimulationProgress], None] | None = None,
+    executor: Literal["thread", "process"] | Executor = "thread",
+    scheduler: JobScheduler | None = None,
+    dedupe: bool = False,
+    reducer: Callable[[SimulationResult], Any] | None = None,
+    keep_run_dirs: bool = True,
 ) -> BatchResult:
     """Run multiple EnergyPlus simulations in parallel.
 
-    Uses [ThreadPoolExecutor][concurrent.futures.ThreadPoolExecutor] to dispatch
-    simulations concurrently.  Individual job failures are captured as
+    Jobs are dispatched on the pool chosen by *executor*: a
+    [ThreadPoolExecutor][concurrent.futures.ThreadPoolExecutor] by default, a
+    [ProcessPoolExecutor][concurrent.futures.ProcessPoolExecutor] with
+    ``executor="process"``, or any caller-supplied
+    [Executor][concurrent.futures.Executor].  Individual job failures are captured as
     failed [SimulationResult][idfkit.simulation.result.SimulationResult] entries -- the batch never raises
     due to a single job failing.
 
@@ -135,6 +160,37 @@ def simulate_batch(
             for batch runners; use
             [tqdm_progress][idfkit.simulation.progress_bars.tqdm_progress]
             with a custom per-job callback instead.
+        executor: Where jobs run.  ``"thread"`` (default) uses a thread
+            pool; ``"process"`` uses a process pool so that each worker
+            copies, serializes, hashes and collects its own jobs without
+            contending for the GIL.  An existing
+            [Executor][concurrent.futures.Executor] may also be passed; it
+            is used as-is and not shut down.  With anything other than a
+            thread pool, jobs, *energyplus*, *cache* and *fs* must be
+            picklable (models use their compact pickle form), and
+            *on_progress* events are relayed back to this process.
+        scheduler: Optional [JobScheduler][idfkit.simulation.scheduling.JobScheduler]
+            that starts jobs longest-estimated-first, holds back jobs that
+            would exceed its memory or CPU budget, and records observed
+            runtimes.  Results are still returned in input order.
+        dedupe: Run each distinct job once.  Jobs with the same model
+            content, weather file and simulation flags (the
+            [cache key][idfkit.simulation.cache.simulation_key]), output
+            directory and output prefix share one run, and its result is
+            returned at every such index.  Keys are computed before any job
+            starts, so concurrent duplicates do not all miss the cache.
+        reducer: Optional callable applied to each successful result in
+            the worker, right after its simulation (e.g. to pull a few KPIs
+            from ``result.sql``).  Its return values are collected in
+            [BatchResult.values][idfkit.simulation.batch.BatchResult], and
+            the kept results drop their stdout and stderr.  Must be
+            picklable when jobs run in other processes.  A reducer that
+            raises marks its job failed.
+        keep_run_dirs: When ``False``, delete each successful job's
+            temporary run directory once it has been reduced, so disk use
+            stays flat however many jobs run.  Failed runs, jobs with an
+            explicit ``output_dir``, cache entries and remote (*fs*)
+            outputs are kept.
 
     Returns:
         A [BatchResult][idfkit.simulation.batch.BatchResult] with results in the same order as *jobs*.
@@ -162,52 +218,234 @@ def simulate_batch(
 
         logger.info("Starting batch of %d jobs with %d workers", len(jobs), max_workers)
 
-        results: list[SimulationResult | None] = [None] * len(jobs)
-        completed_count = 0
-        total = len(jobs)
-
         start = time.monotonic()
+        groups = group_jobs(jobs, dedupe=dedupe)
+        reduction = _Reduction(reducer, keep_run_dirs)
+        results, values = _execute(
+            jobs, groups, executor, max_workers, energyplus, cache, fs, progress, progress_cb, scheduler, reduction
+        )
+    finally:
+        if progress_cleanup is not None:
+            progress_cleanup()
+
+    elapsed = time.monotonic() - start
+
+    deduplicated = len(jobs) - len(groups)
+    batch_result = BatchResult(
+        results=tuple(results),
+        total_runtime_seconds=elapsed,
+        deduplicated=deduplicated,
+        values=tuple(values) if reducer is not None else (),
+    )
+    logger.info(
+        "Batch complete: %d succeeded, %d failed (%d deduplicated) in %.1fs",
+        len(batch_result.succeeded),
+        len(batch_result.failed),
+        deduplicated,
+        elapsed,
+    )
+    return batch_result
+
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(_run_job, idx, job, energyplus, cache, fs, progress_cb): idx
-                for idx, job in enumerate(jobs)
-            }
-
-            for future in as_completed(future_to_index):
-                idx = future_to_index[future]
-                job = jobs[idx]
-                result = future.result()  # _run_job never raises
-                results[idx] = result
+def _execute(
+    jobs: Sequence[SimulationJob],
+    groups: dict[int, list[int]],
+    executor: Literal["thread", "process"] | Executor,
+    max_workers: int,
+    energyplus: EnergyPlusConfig | None,
+    cache: SimulationCache | None,
+    fs: FileSystem | None,
+    progress: Callable[..., None] | None,
+    progress_cb: Callable[[SimulationProgress], None] | None,
+    scheduler: JobScheduler | None,
+    reduction: _Reduction,
+) -> tuple[list[SimulationResult], list[Any]]:
+    """Run *jobs* on the chosen executor and return their results and reduced values in input order.
+
+    Only the jobs keyed in *groups* run; each result is stored at every
+    index of its group.
+    """
+    results: list[SimulationResult | None] = [None] * len(jobs)
+    values: list[Any] = [None] * len(jobs)
+    completed_count = 0
+    total = len(jobs)
+
+    pool, owned = _resolve_executor(executor, max_workers)
+    # Worker processes cannot call back into this one directly
+    relay: _ProgressRelay | None = None
+    if progress_cb is not None and not isinstance(pool, ThreadPoolExecutor):
+        relay = _ProgressRelay(progress_cb)
+    job_progress = relay.callback if relay is not None else progress_cb
+    plan = scheduler.plan(jobs) if scheduler is not None else None
+    dispatcher = _Dispatcher(
+        jobs,
+        plan,
+        lambda idx: pool.submit(_run_reduced_job, idx, jobs[idx], energyplus, cache, fs, job_progress, reduction),
+        groups,
+    )
+    try:
+        dispatcher.fill()
+        if relay is not None:
+            relay.start()
+
+        for idx, (result, value) in dispatcher:
+            for member in groups[idx]:
+                results[member] = result
+                values[member] = value
                 completed_count += 1
 
                 if progress is not None:
                     progress(
                         completed=completed_count,
                         total=total,
-                        label=job.label,
+                        label=jobs[member].label,
                         success=result.success,
                     )
     finally:
-        if progress_cleanup is not None:
-            progress_cleanup()
-
-    elapsed = time.monotonic() - start
+        if owned:
+            pool.shutdown()
+        if relay is not None:
+            relay.close()
+        if scheduler is not None:
+            scheduler.stats.save()
 
     # All slots filled — assert for type checker
     final: list[SimulationResult] = []
     for r in results:
         assert r is not None  # noqa: S101
         final.append(r)
+    return final, values
+
+
+class _Dispatcher:
+    """Submit jobs in plan order as budgets allow and yield ``(index, (result, value))`` as they finish."""
+
+    def __init__(
+        self,
+        jobs: Sequence[SimulationJob],
+        plan: SchedulePlan | None,
+        submit: Callable[[int], Future[_Outcome]],
+        runnable: Container[int],
+    ) -> None:
+        self._jobs = jobs
+        self._plan = plan
+        self._submit = submit
+        order = plan.order if plan is not None else range(len(jobs))
+        self._pending = [idx for idx in order if idx in runnable]
+        self._in_flight: dict[Future[_Outcome], int] = {}
+
+    def fill(self) -> None:
+        """Submit every pending job that fits the plan's budgets."""
+        still_pending: list[int] = []
+        for idx in self._pending:
+            if self._plan is None or self._plan.admit(idx, idle=not self._in_flight):
+                self._in_flight[self._submit(idx)] = idx
+            else:
+                still_pending.append(idx)
+        self._pending = still_pending
+
+    def __iter__(self) -> Iterator[tuple[int, _Outcome]]:
+        while self._in_flight:
+            done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = self._in_flight.pop(future)
+                outcome = _collect(future, self._jobs[idx])
+                if self._plan is not None:
+                    self._plan.release(idx, outcome[0])
+                yield idx, outcome
+            self.fill()
+
+
+def _resolve_executor(executor: Literal["thread", "process"] | Executor, max_workers: int) -> tuple[Executor, bool]:
+    """Return the executor to submit jobs to and whether this batch owns it."""
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers), True
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers), True
+    return executor, False
+
+
+def _collect(future: Future[_Outcome], job: SimulationJob) -> _Outcome:
+    """Return a job's outcome, turning executor-level failures into failed results."""
+    try:
+        return future.result()
+    except Exception as exc:
+        # _run_reduced_job itself never raises; this covers jobs that could
+        # not be shipped to a worker and workers that died mid-job.
+        return _failed_result(job, exc), None
 
-    batch_result = BatchResult(results=tuple(final), total_runtime_seconds=elapsed)
-    logger.info(
-        "Batch complete: %d succeeded, %d failed in %.1fs",
-        len(batch_result.succeeded),
-        len(batch_result.failed),
-        elapsed,
+
+class _ProgressRelay:
+    """Forward progress events from worker processes to a callback in this process."""
+
+    def __init__(self, callback: Callable[[SimulationProgress], None]) -> None:
+        import multiprocessing
+
+        self._manager = multiprocessing.Manager()
+        self._queue: Any = self._manager.Queue()
+        self._callback = callback
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+
+    def start(self) -> None:
+        # Started once workers exist: forking with a live thread can deadlock
+        self._thread.start()
+
+    @property
+    def callback(self) -> Callable[[SimulationProgress], None]:
+        return _QueuePut(self._queue)
+
+    def _drain(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            self._callback(event)
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._manager.shutdown()
+
+
+class _QueuePut:
+    """Picklable progress callback that puts events on a shared queue."""
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, queue: Any) -> None:
+        self._queue = queue
+
+    def __call__(self, event: SimulationProgress) -> None:
+        self._queue.put(event)
+
+
+@dataclass(frozen=True, slots=True)
+class _Reduction:
+    """Worker-side post-processing of each job's result."""
+
+    reducer: Callable[[SimulationResult], Any] | None = None
+    keep_run_dirs: bool = True
+
+
+# A job's (possibly slimmed) result and its reduced value
+_Outcome = tuple[SimulationResult, Any]
+
+
+def _run_reduced_job(
+    idx: int,
+    job: SimulationJob,
+    energyplus: EnergyPlusConfig | None,
+    cache: SimulationCache | None,
+    fs: FileSystem | None,
+    on_progress: Callable[[SimulationProgress], None] | None,
+    reduction: _Reduction,
+) -> _Outcome:
+    """Execute a single simulation job and reduce its result in the worker."""
+    result = _run_job(idx, job, energyplus, cache, fs, on_progress)
+    return reduce_result(
+        result, reduction.reducer, keep_run_dir=reduction.keep_run_dirs, cache=cache, output_dir=job.output_dir
     )
-    return batch_result
 
 
 def _run_job(
@@ -229,6 +467,7 @@ def _run_job(
             model=job.model,  # type: ignore[arg-type]
             weather=job.weather,
             output_dir=job.output_dir,
+            scratch_dir=job.scratch_dir,
             energyplus=energyplus,
             expand_objects=job.expand_objects,
             annual=job.annual,
@@ -246,18 +485,23 @@ def _run_job(
         # Catch all exceptions (SimulationError, ExpandObjectsError,
         # EnergyPlusNotFoundError, etc.) so that a single job failure
         # never crashes the entire batch.
-        failed_run_dir = Path(job.output_dir) if job.output_dir is not None else Path(tempfile.mkdtemp())
-        exit_code = getattr(exc, "exit_code", None)
-        stderr = getattr(exc, "stderr", None) or str(exc)
-        return SimulationResult(
-            run_dir=failed_run_dir,
-            success=False,
-            exit_code=exit_code,
-            stdout="",
-            stderr=stderr,
-            runtime_seconds=0.0,
-            output_prefix=job.output_prefix,
-        )
+        return _failed_result(job, exc)
+
+
+def _failed_result(job: SimulationJob, exc: BaseException) -> SimulationResult:
+    """Build the failed result recorded for a job that raised *exc*."""
+    failed_run_dir = Path(job.output_dir) if job.output_dir is not None else Path(tempfile.mkdtemp())
+    exit_code = getattr(exc, "exit_code", None)
+    stderr = getattr(exc, "stderr", None) or str(exc)
+    return SimulationResult(
+        run_dir=failed_run_dir,
+        success=False,
+        exit_code=exit_code,
+        stdout="",
+        stderr=stderr,
+        runtime_seconds=0.0,
+        output_prefix=job.output_prefix,
+    )
 
 
 def _make_job_progress_callback(
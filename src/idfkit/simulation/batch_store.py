@@ -0,0 +1,584 @@
+"""Consolidated store of selected outputs from many simulation runs.
+
+Opening thousands of ``eplusout.sql`` files one by one to pull the same
+variables is slow.  A [BatchStore][idfkit.simulation.batch_store.BatchStore]
+extracts the requested time series and tabular values from each run once,
+as runs complete, into a single indexed SQLite file keyed by job label.
+Cross-run comparisons are then one query against one file.
+
+Time series are stored column-wise: each series' values are one packed
+float array, and runs with the same timestamps share one packed time axis.
+
+Examples:
+    ```python
+    from idfkit.simulation import BatchStore, TabularSpec, TimeSeriesSpec, simulate_batch
+
+    store = BatchStore(
+        "sweep.sqlite3",
+        timeseries=[TimeSeriesSpec("Zone Mean Air Temperature", "ZONE 1", environment="annual")],
+        tabular=[TabularSpec("AnnualBuildingUtilityPerformanceSummary", "Site and Source Energy")],
+    )
+    batch = simulate_batch(jobs)
+    store.ingest((job.label, result) for job, result in zip(jobs, batch))
+
+    temps = store.get_timeseries("Zone Mean Air Temperature", "ZONE 1")
+    eui = store.get_tabular_value(
+        "AnnualBuildingUtilityPerformanceSummary",
+        "Site and Source Energy",
+        "Total Site Energy",
+        "Energy Per Total Building Area",
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from array import array
+from collections.abc import Collection, Iterable, Sequence
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .async_batch import SimulationEvent
+from .parsers.sql import Environment, SQLResult, TabularRow, TimeSeriesResult
+from .result import SimulationResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    label TEXT PRIMARY KEY,
+    run_dir TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    runtime_seconds REAL NOT NULL,
+    added REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS axes (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    timestamps BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS series (
+    variable_name TEXT NOT NULL,
+    key_value TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    label TEXT NOT NULL,
+    units TEXT NOT NULL,
+    axis INTEGER NOT NULL,
+    vals BLOB NOT NULL,
+    PRIMARY KEY (variable_name, key_value, frequency, label)
+);
+CREATE INDEX IF NOT EXISTS series_label ON series (label);
+CREATE TABLE IF NOT EXISTS tabular (
+    report_name TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    row_name TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    report_for TEXT NOT NULL,
+    label TEXT NOT NULL,
+    units TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tabular_cell ON tabular (report_name, table_name, row_name, column_name, report_for);
+CREATE INDEX IF NOT EXISTS tabular_label ON tabular (label);
+"""
+
+# Timestamps are stored as whole seconds since this (naive) epoch
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class TimeSeriesSpec:
+    """A time series to extract from every run.
+
+    Arguments match [SQLResult.get_timeseries][idfkit.simulation.parsers.sql.SQLResult.get_timeseries].
+
+    Attributes:
+        variable_name: The output variable or meter name.
+        key_value: The key value (e.g. zone name), or ``"*"`` for the first match.
+        frequency: Optional reporting frequency filter (e.g. ``"Hourly"``).
+        environment: ``"annual"``, ``"sizing"``, or ``None`` for all data.
+    """
+
+    variable_name: str
+    key_value: str = "*"
+    frequency: str | None = None
+    environment: Environment | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TabularSpec:
+    """Tabular report cells to extract from every run.
+
+    Arguments match [SQLResult.get_tabular_data][idfkit.simulation.parsers.sql.SQLResult.get_tabular_data];
+    ``None`` matches anything, so a spec may select a whole table.
+
+    Attributes:
+        report_name: Report name (e.g. ``"AnnualBuildingUtilityPerformanceSummary"``).
+        table_name: Optional table name filter.
+        row_name: Optional row label filter.
+        column_name: Optional column label filter.
+        report_for: Optional report scope filter (e.g. ``"Entire Facility"``).
+    """
+
+    report_name: str
+    table_name: str | None = None
+    row_name: str | None = None
+    column_name: str | None = None
+    report_for: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RunExtract:
+    """Outputs extracted from one run, ready to be written to a store.
+
+    Returned by [BatchStore.extract][idfkit.simulation.batch_store.BatchStore.extract],
+    which can be passed as the ``reducer`` of
+    [simulate_batch][idfkit.simulation.batch.simulate_batch] so extraction
+    happens in the workers before run directories are deleted.
+
+    Attributes:
+        run_dir: The run directory the outputs were read from.
+        success: Whether the simulation succeeded.
+        runtime_seconds: Simulation wall-clock time.
+        series: Extracted time series.
+        tabular: Extracted tabular rows.
+    """
+
+    run_dir: str
+    success: bool
+    runtime_seconds: float
+    series: tuple[TimeSeriesResult, ...] = ()
+    tabular: tuple[TabularRow, ...] = ()
+
+
+class BatchStore:
+    """Time series and tabular values from many runs in one SQLite file.
+
+    Every call opens its own connection and writes run in immediate
+    transactions, so threads and processes can add runs to the same file
+    concurrently.  A store pickles as its path and specs, so its
+    [extract][idfkit.simulation.batch_store.BatchStore.extract] method can
+    be used as a reducer in worker processes.
+
+    Args:
+        path: Database file (created on first use).
+        timeseries: Time series to extract from each run.
+        tabular: Tabular cells to extract from each run.
+    """
+
+    __slots__ = ("_path", "_tabular", "_timeseries")
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        timeseries: Sequence[TimeSeriesSpec] = (),
+        tabular: Sequence[TabularSpec] = (),
+    ) -> None:
+        self._path = Path(path)
+        self._timeseries = tuple(timeseries)
+        self._tabular = tuple(tabular)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def extract(self, result: SimulationResult) -> RunExtract:
+        """Read this store's time series and tabular values from *result*.
+
+        Variables missing from a run are skipped.  Failed runs and runs
+        without an SQL output yield an extract with no data.
+        """
+        if not result.success or result.sql_path is None:
+            return _extract(result)
+        if result.fs is not None:
+            # Downloaded (and cached) by the result itself
+            sql = result.sql
+            assert sql is not None  # noqa: S101
+            return _extract(result, self._read_series(sql), self._read_tabular(sql))
+        with SQLResult(result.sql_path) as sql:
+            return _extract(result, self._read_series(sql), self._read_tabular(sql))
+
+    def _read_series(self, sql: SQLResult) -> tuple[TimeSeriesResult, ...]:
+        series: list[TimeSeriesResult] = []
+        for spec in self._timeseries:
+            try:
+                series.append(sql.get_timeseries(spec.variable_name, spec.key_value, spec.frequency, spec.environment))
+            except KeyError:
+                logger.debug("Variable %r (key %r) not in run output", spec.variable_name, spec.key_value)
+        return tuple(series)
+
+    def _read_tabular(self, sql: SQLResult) -> tuple[TabularRow, ...]:
+        rows: list[TabularRow] = []
+        for spec in self._tabular:
+            rows.extend(
+                sql.get_tabular_data(
+                    spec.report_name, spec.table_name, spec.row_name, spec.column_name, spec.report_for
+                )
+            )
+        return tuple(rows)
+
+    def write(self, label: str, extract: RunExtract) -> None:
+        """Store *extract* under *label*, replacing any earlier data for it.
+
+        Raises:
+            ValueError: If *label* is empty.
+        """
+        msg = _label_error(label, ())
+        if msg is not None:
+            raise ValueError(msg)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                _delete_label(conn, label)
+                conn.execute(
+                    "INSERT INTO runs (label, run_dir, success, runtime_seconds, added) VALUES (?, ?, ?, ?, ?)",
+                    (label, extract.run_dir, int(extract.success), extract.runtime_seconds, time.time()),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO series (variable_name, key_value, frequency, label, units, axis, vals) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            ts.variable_name,
+                            ts.key_value,
+                            ts.frequency,
+                            label,
+                            ts.units,
+                            _axis_id(conn, ts.timestamps),
+                            array("d", ts.values).tobytes(),
+                        )
+                        for ts in extract.series
+                    ],
+                )
+                conn.executemany(
+                    "INSERT INTO tabular "
+                    "(report_name, table_name, row_name, column_name, report_for, label, units, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (r.report_name, r.table_name, r.row_name, r.column_name, r.report_for, label, r.units, r.value)
+                        for r in extract.tabular
+                    ],
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def add(self, label: str, result: SimulationResult | RunExtract) -> None:
+        """Extract (if needed) and store one run under *label*."""
+        extract = result if isinstance(result, RunExtract) else self.extract(result)
+        self.write(label, extract)
+
+    def ingest(
+        self,
+        runs: Iterable[tuple[str, SimulationResult | RunExtract | None] | SimulationEvent],
+        *,
+        max_workers: int | None = None,
+        replace: bool = False,
+    ) -> int:
+        """Extract and store many runs in parallel, as they arrive.
+
+        *runs* may be a lazy iterable such as
+        [iter_batch_results][idfkit.simulation.distributed.iter_batch_results]:
+        each run is extracted in a thread pool as soon as it is yielded and
+        written as soon as it is extracted, so the store fills while a batch
+        is still running.  Labels already in the store are skipped unless
+        *replace* is set, so an interrupted ingest can be resumed.  Every
+        run must have a non-empty label that is unique within *runs*
+        (set [SimulationJob.label][idfkit.simulation.batch.SimulationJob]);
+        runs are never dropped because their labels clash.
+
+        Args:
+            runs: ``(label, result)`` pairs, where a result may also be a
+                [RunExtract][idfkit.simulation.batch_store.RunExtract] (e.g.
+                the ``values`` of a batch reduced with
+                [extract][idfkit.simulation.batch_store.BatchStore.extract])
+                or ``None`` to skip; or
+                [SimulationEvent][idfkit.simulation.async_batch.SimulationEvent] objects.
+            max_workers: Extraction threads (default ``min(8, os.cpu_count())``).
+            replace: Re-extract labels that are already stored.
+
+        Returns:
+            The number of runs stored.
+
+        Raises:
+            ValueError: If a run's label is empty or repeats an earlier
+                label in *runs*.  Runs read before it are stored.
+        """
+        max_workers = max_workers or min(8, os.cpu_count() or 1)
+        existing: set[str] = set() if replace else set(self.labels())
+        seen: set[str] = set()
+        pending: dict[Future[RunExtract], str] = {}
+        stored = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for label, result in _pairs(runs):
+                msg = _label_error(label, seen)
+                if msg is not None:
+                    stored += self._drain(pending, ALL_COMPLETED)
+                    logger.info("Stored %d runs in %s before a bad label", stored, self._path)
+                    raise ValueError(msg)
+                seen.add(label)
+                if result is None or label in existing:
+                    continue
+                if isinstance(result, RunExtract):
+                    self.write(label, result)
+                    stored += 1
+                    continue
+                pending[pool.submit(self.extract, result)] = label
+                if len(pending) >= 2 * max_workers:
+                    stored += self._drain(pending, FIRST_COMPLETED)
+            stored += self._drain(pending, ALL_COMPLETED)
+        logger.info("Stored %d runs in %s", stored, self._path)
+        return stored
+
+    def _drain(self, pending: dict[Future[RunExtract], str], return_when: str) -> int:
+        """Write the extracts that are done; return how many were stored."""
+        done, _ = wait(pending, return_when=return_when)
+        stored = 0
+        for future in done:
+            label = pending.pop(future)
+            try:
+                extract = future.result()
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Could not read outputs of %r: %s", label, exc)
+                continue
+            self.write(label, extract)
+            stored += 1
+        return stored
+
+    def remove(self, label: str) -> bool:
+        """Delete everything stored for *label*; return whether it existed."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            existed = _delete_label(conn, label)
+            conn.execute("DELETE FROM axes WHERE id NOT IN (SELECT DISTINCT axis FROM series)")
+            conn.execute("COMMIT")
+        return existed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def labels(self) -> list[str]:
+        """Labels of all stored runs, in the order they were added."""
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute("SELECT label FROM runs ORDER BY added, rowid")]
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+
+    def __contains__(self, label: object) -> bool:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM runs WHERE label = ?", (label,)).fetchone() is not None
+
+    def get_timeseries(
+        self,
+        variable_name: str,
+        key_value: str = "*",
+        frequency: str | None = None,
+        *,
+        labels: Sequence[str] | None = None,
+    ) -> dict[str, TimeSeriesResult]:
+        """Retrieve one variable from every run that has it.
+
+        Args:
+            variable_name: The output variable name.
+            key_value: The key value (case-insensitive), or ``"*"`` for any.
+            frequency: Optional reporting frequency filter.
+            labels: Optional subset of runs.
+
+        Returns:
+            Time series keyed by run label, in the order runs were added.
+        """
+        query = (
+            "SELECT s.label, s.variable_name, s.key_value, s.units, s.frequency, a.timestamps, s.vals "
+            "FROM series s JOIN axes a ON s.axis = a.id JOIN runs r ON s.label = r.label "
+            "WHERE s.variable_name = ?"
+        )
+        params: list[object] = [variable_name]
+        if key_value != "*":
+            query += " AND UPPER(s.key_value) = UPPER(?)"
+            params.append(key_value)
+        if frequency is not None:
+            query += " AND s.frequency = ?"
+            params.append(frequency)
+        query, params = _filter_labels(query, params, "s.label", labels)
+        query += " ORDER BY r.added, r.rowid"
+
+        axes: dict[bytes, tuple[datetime, ...]] = {}
+        series: dict[str, TimeSeriesResult] = {}
+        with closing(self._connect()) as conn:
+            for label, name, key, units, freq, stamps, vals in conn.execute(query, params):
+                if label in series:
+                    continue  # first matching key, as SQLResult.get_timeseries
+                if stamps not in axes:
+                    axes[stamps] = _unpack_timestamps(stamps)
+                values = array("d")
+                values.frombytes(vals)
+                series[label] = TimeSeriesResult(
+                    variable_name=name,
+                    key_value=key,
+                    units=units,
+                    frequency=freq,
+                    timestamps=axes[stamps],
+                    values=tuple(values),
+                )
+        return series
+
+    def get_tabular_value(
+        self,
+        report_name: str,
+        table_name: str,
+        row_name: str,
+        column_name: str,
+        report_for: str = "Entire Facility",
+        *,
+        labels: Sequence[str] | None = None,
+    ) -> dict[str, str]:
+        """Retrieve one tabular cell from every run that has it.
+
+        Returns:
+            Cell values (as strings) keyed by run label, in the order runs
+            were added.
+        """
+        query = (
+            "SELECT t.label, t.value FROM tabular t JOIN runs r ON t.label = r.label "
+            "WHERE t.report_name = ? AND t.table_name = ? AND t.row_name = ? AND t.column_name = ? "
+            "AND t.report_for = ?"
+        )
+        params: list[object] = [report_name, table_name, row_name, column_name, report_for]
+        query, params = _filter_labels(query, params, "t.label", labels)
+        query += " ORDER BY r.added, r.rowid"
+        with closing(self._connect()) as conn:
+            return dict(conn.execute(query, params).fetchall())
+
+    def to_dataframe(
+        self,
+        variable_name: str,
+        key_value: str = "*",
+        frequency: str | None = None,
+        *,
+        labels: Sequence[str] | None = None,
+    ) -> Any:
+        """Return one variable across runs as a pandas DataFrame.
+
+        Requires pandas to be installed.
+
+        Returns:
+            A DataFrame with a ``timestamp`` index and one column per run label.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        try:
+            import pandas  # type: ignore[import-not-found]
+        except ImportError:
+            msg = "pandas is required for DataFrame conversion. Install it with: pip install idfkit[dataframes]"
+            raise ImportError(msg) from None
+        pd: Any = pandas
+        series = self.get_timeseries(variable_name, key_value, frequency, labels=labels)
+        frame = pd.DataFrame({
+            label: pd.Series(ts.values, index=pd.Index(ts.timestamps, name="timestamp")) for label, ts in series.items()
+        })
+        frame.index.name = "timestamp"
+        return frame
+
+    def query(self, sql: str, parameters: tuple[object, ...] = ()) -> list[tuple[object, ...]]:
+        """Execute a raw SQL query against the store.
+
+        Tables are ``runs``, ``series`` (values packed as float64 arrays),
+        ``axes`` (timestamps packed as int64 seconds since 1970) and
+        ``tabular``.
+        """
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, parameters).fetchall()
+
+
+def _extract(
+    result: SimulationResult,
+    series: tuple[TimeSeriesResult, ...] = (),
+    tabular: tuple[TabularRow, ...] = (),
+) -> RunExtract:
+    return RunExtract(
+        run_dir=str(result.run_dir),
+        success=result.success,
+        runtime_seconds=result.runtime_seconds,
+        series=series,
+        tabular=tabular,
+    )
+
+
+def _pairs(
+    runs: Iterable[tuple[str, SimulationResult | RunExtract | None] | SimulationEvent],
+) -> Iterator[tuple[str, SimulationResult | RunExtract | None]]:
+    for run in runs:
+        if isinstance(run, SimulationEvent):
+            yield run.label, run.value if isinstance(run.value, RunExtract) else run.result
+        else:
+            yield run
+
+
+def _label_error(label: str, seen: Collection[str]) -> str | None:
+    """Why *label* cannot be stored next to the *seen* labels, or None if it can."""
+    if not label:
+        return "Runs need a non-empty label to be stored (set SimulationJob.label)"
+    if label in seen:
+        return f"Duplicate run label {label!r}; every run needs a unique label"
+    return None
+
+
+def _delete_label(conn: sqlite3.Connection, label: str) -> bool:
+    cur = conn.execute("DELETE FROM runs WHERE label = ?", (label,))
+    conn.execute("DELETE FROM series WHERE label = ?", (label,))
+    conn.execute("DELETE FROM tabular WHERE label = ?", (label,))
+    return cur.rowcount > 0
+
+
+def _axis_id(conn: sqlite3.Connection, timestamps: tuple[datetime, ...]) -> int:
+    """Return the id of the stored time axis for *timestamps*, adding it if new."""
+    packed = array("q", [(ts - _EPOCH) // _SECOND for ts in timestamps]).tobytes()
+    digest = hashlib.sha256(packed).hexdigest()
+    conn.execute("INSERT OR IGNORE INTO axes (digest, timestamps) VALUES (?, ?)", (digest, packed))
+    return int(conn.execute("SELECT id FROM axes WHERE digest = ?", (digest,)).fetchone()[0])
+
+
+def _unpack_timestamps(packed: bytes) -> tuple[datetime, ...]:
+    seconds = array("q")
+    seconds.frombytes(packed)
+    return tuple(_EPOCH + timedelta(seconds=s) for s in seconds)
+
+
+def _filter_labels(
+    query: str, params: list[object], column: str, labels: Sequence[str] | None
+) -> tuple[str, list[object]]:
+    if labels is None:
+        return query, params
+    query += f" AND {column} IN ({', '.join('?' for _ in labels)})"
+    return query, [*params, *labels]
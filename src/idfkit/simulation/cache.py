@@ -3,6 +3,11 @@
 Caches simulation results keyed by a SHA-256 digest of the normalised model,
 weather file, and simulation flags.  Cache entries are full copies of the
 simulation run directory so that all output files remain available.
+
+A SQLite manifest in the cache directory indexes the entries with their
+size, access time and hit count.  It backs size and entry-count limits
+with LRU or LFU eviction and the hit/miss/eviction counters reported by
+[stats][idfkit.simulation.cache.SimulationCache.stats].
 """
 
 from __future__ import annotations
@@ -12,16 +17,25 @@ import json
 import logging
 import os
 import shutil
+import sqlite3
 import sys
 import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+from ._cache_store import collect_blobs, compress_entry, decompress_entry, store_outputs
+from ._manifest import CacheManifest, EvictionPolicy, directory_size
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from ..document import IDFDocument
+    from ..objects import IDFObject
     from .result import SimulationResult
 
 
@@ -45,19 +59,126 @@ class CacheKey:
     hex_digest: str
 
 
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """An entry in a [SimulationCache][idfkit.simulation.cache.SimulationCache].
+
+    Attributes:
+        key: The entry's cache key.
+        size_bytes: Disk space used by the entry.
+        created: When the entry was stored (Unix time).
+        last_access: When the entry was last stored or hit (Unix time).
+        hits: Number of cache hits served from the entry.
+    """
+
+    key: CacheKey
+    size_bytes: int
+    created: float
+    last_access: float
+    hits: int
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Size and usage counters of a [SimulationCache][idfkit.simulation.cache.SimulationCache].
+
+    Counters accumulate across every process sharing the cache directory
+    until [clear][idfkit.simulation.cache.SimulationCache.clear].
+
+    Attributes:
+        entries: Number of cached results.
+        total_bytes: Disk space used by all entries.
+        hits: Lookups that found an entry.
+        misses: Lookups that found nothing.
+        evictions: Entries removed to stay within the size limits.
+    """
+
+    entries: int
+    total_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (``0.0`` before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 class SimulationCache:
     """Content-addressed simulation result cache.
 
-    Each entry is a directory named by the cache key containing a full copy
-    of the simulation run directory plus a ``_cache_meta.json`` manifest.
+    Each entry is a directory named by the cache key containing the stored
+    outputs of the simulation run directory plus a ``_cache_meta.json``
+    manifest.  Files of 64 KiB and more are stored once in a
+    content-addressed ``_blobs`` directory and hard-linked into every entry
+    that contains them, so identical weather files and outputs use disk
+    space once.  Treat cached outputs as read-only.
+
+    Args:
+        cache_dir: Root directory (default: platform cache directory).
+        persist_digests: Also remember weather-file digests in the cache
+            directory, so other processes and later sessions skip
+            re-hashing unchanged files.
+        max_bytes: Evict entries after each [put][idfkit.simulation.cache.SimulationCache.put]
+            until the cache uses at most this many bytes.
+        max_entries: Evict entries after each put until at most this many
+            remain.
+        eviction: Which entries go first: ``"lru"`` (least recently used)
+            or ``"lfu"`` (fewest hits, then least recently used).
+        outputs: Filename globs of the run-directory files to store, e.g.
+            ``("*.sql", "*.err")``.  ``None`` (default) stores everything.
+            Results served from the cache only have the stored outputs.
+        dedupe: Store large files content-addressed and hard-link them into
+            entries (falls back to copies where hard links are unsupported).
     """
 
-    __slots__ = ("_cache_dir",)
+    __slots__ = ("_cache_dir", "_dedupe", "_eviction", "_max_bytes", "_max_entries", "_outputs", "_persist_digests")
 
     _META_FILE = "_cache_meta.json"
+    _DIGESTS_FILE = "_weather_digests.json"
+    _MANIFEST_FILE = "_manifest.sqlite3"
+    _BLOBS_DIR = "_blobs"
 
-    def __init__(self, cache_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        *,
+        persist_digests: bool = True,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        eviction: EvictionPolicy = "lru",
+        outputs: Sequence[str] | None = None,
+        dedupe: bool = True,
+    ) -> None:
+        if eviction not in ("lru", "lfu"):
+            msg = f"eviction must be 'lru' or 'lfu', got {eviction!r}"
+            raise ValueError(msg)
         self._cache_dir = Path(cache_dir) if cache_dir is not None else default_simulation_cache_dir()
+        self._persist_digests = persist_digests
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._eviction: EvictionPolicy = eviction
+        self._outputs = tuple(outputs) if outputs is not None else None
+        self._dedupe = dedupe
+
+    @property
+    def _blob_dir(self) -> Path | None:
+        return self._cache_dir / self._BLOBS_DIR if self._dedupe else None
+
+    def _manifest(self) -> CacheManifest:
+        """Open the entry index, indexing pre-existing entries on first use."""
+        manifest = CacheManifest(self._cache_dir / self._MANIFEST_FILE)
+        if not manifest.exists() and self._cache_dir.is_dir():
+            seen: set[tuple[int, int]] = set()
+            manifest.add_many(
+                (entry.name, directory_size(entry, seen), entry.stat().st_mtime)
+                for entry in self._cache_dir.iterdir()
+                # Dot-prefixed directories are entries still being staged
+                if not entry.name.startswith(".") and (entry / self._META_FILE).is_file()
+            )
+        return manifest
 
     @property
     def cache_dir(self) -> Path:
@@ -78,9 +199,11 @@ class SimulationCache:
     ) -> CacheKey:
         """Compute a deterministic cache key for a simulation invocation.
 
-        The model is copied and normalised (``Output:SQLite`` is ensured) so
-        that models differing only in the presence of that object produce the
-        same key.
+        The model is serialized straight into the hash, as if
+        ``Output:SQLite`` were present, so that models differing only in the
+        presence of that object produce the same key.  The model is not
+        copied.  The weather file contributes its
+        [weather_digest][idfkit.simulation.cache.SimulationCache.weather_digest].
 
         Args:
             model: The EnergyPlus model.
@@ -95,35 +218,33 @@ class SimulationCache:
         Returns:
             A [CacheKey][idfkit.simulation.cache.CacheKey] for use with [get][idfkit.simulation.cache.SimulationCache.get] / [put][idfkit.simulation.cache.SimulationCache.put].
         """
-        from ..writers import write_idf
-
-        normalised = model.copy()
-        if "Output:SQLite" not in normalised:
-            normalised.add("Output:SQLite", "", data={"option_type": "SimpleAndTabular"})
-        idf_text: str = write_idf(normalised) or ""
-
-        weather_path = Path(weather).resolve()
-        weather_bytes = weather_path.read_bytes()
-
-        flags = json.dumps(
-            {
-                "expand_objects": expand_objects,
-                "annual": annual,
-                "design_day": design_day,
-                "output_suffix": output_suffix,
-                "readvars": readvars,
-                "extra_args": list(extra_args) if extra_args else [],
-            },
-            sort_keys=True,
+        return simulation_key(
+            model,
+            weather,
+            expand_objects=expand_objects,
+            annual=annual,
+            design_day=design_day,
+            output_suffix=output_suffix,
+            readvars=readvars,
+            extra_args=extra_args,
+            weather_digest=self.weather_digest(weather),
         )
 
-        h = hashlib.sha256()
-        h.update(idf_text.encode("utf-8"))
-        h.update(weather_bytes)
-        h.update(flags.encode("utf-8"))
-        key = CacheKey(hex_digest=h.hexdigest())
-        logger.debug("Computed cache key %s", key.hex_digest[:12])
-        return key
+    def weather_digest(self, weather: str | Path) -> str:
+        """Return the SHA-256 hex digest of a weather file.
+
+        Digests are memoized by the file's resolved path, size, modification
+        time and inode, so a file is read once per change rather than once
+        per key.
+
+        Args:
+            weather: Path to the weather file.
+
+        Returns:
+            The hex digest of the file contents.
+        """
+        store = self._cache_dir / self._DIGESTS_FILE if self._persist_digests else None
+        return _weather_digest(Path(weather), store)
 
     def get(self, key: CacheKey) -> SimulationResult | None:
         """Retrieve a cached simulation result.
@@ -139,14 +260,18 @@ class SimulationCache:
         meta_path = entry_dir / self._META_FILE
         if not meta_path.is_file():
             logger.debug("Cache miss for %s", key.hex_digest[:12])
+            self._record_miss()
             return None
 
         try:
             meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("compressed"):
+                self._expand(key.hex_digest, meta)
 
             from .result import SimulationResult
 
             logger.debug("Cache hit for %s", key.hex_digest[:12])
+            self._record_hit(key.hex_digest, entry_dir)
             return SimulationResult(
                 run_dir=entry_dir,
                 success=meta["success"],
@@ -161,13 +286,40 @@ class SimulationCache:
             # a subsequent put() can write a fresh copy, then treat as miss.
             logger.debug("Removing corrupted cache entry %s", key.hex_digest[:12])
             shutil.rmtree(entry_dir, ignore_errors=True)
+            self._forget(key.hex_digest)
+            self._record_miss()
             return None
 
+    def _record_hit(self, hex_digest: str, entry_dir: Path) -> None:
+        try:
+            manifest = self._manifest()
+            if not manifest.hit(hex_digest):
+                # Entry written by an older version or a lost index update
+                manifest.add(hex_digest, directory_size(entry_dir))
+                manifest.hit(hex_digest)
+        except sqlite3.Error:
+            logger.debug("Could not update cache manifest", exc_info=True)
+
+    def _record_miss(self) -> None:
+        if not self._cache_dir.is_dir():
+            return
+        try:
+            self._manifest().miss()
+        except sqlite3.Error:
+            logger.debug("Could not update cache manifest", exc_info=True)
+
+    def _forget(self, hex_digest: str) -> None:
+        try:
+            self._manifest().remove(hex_digest)
+        except sqlite3.Error:
+            logger.debug("Could not update cache manifest", exc_info=True)
+
     def put(self, key: CacheKey, result: SimulationResult) -> None:
         """Store a successful simulation result in the cache.
 
-        Only results with ``success=True`` are cached.  The entire run
-        directory is copied into the cache atomically.
+        Only results with ``success=True`` are cached.  The run
+        directory's files (those matching ``outputs``, if set) are stored
+        in the cache atomically.
 
         Args:
             key: Cache key from [compute_key][idfkit.simulation.cache.SimulationCache.compute_key].
@@ -175,8 +327,20 @@ class SimulationCache:
         """
         if not result.success:
             return
-
-        target_dir = self._cache_dir / key.hex_digest
+        run_dir = Path(result.run_dir)
+        if not run_dir.is_dir():
+            return  # results uploaded to a remote file system
+        meta = {
+            "success": result.success,
+            "exit_code": result.exit_code,
+            "runtime_seconds": result.runtime_seconds,
+            "output_prefix": result.output_prefix,
+        }
+        self._store(key.hex_digest, run_dir, meta, self._outputs)
+
+    def _store(self, hex_digest: str, source: Path, meta: dict[str, Any], patterns: Sequence[str] | None) -> None:
+        """Atomically create entry *hex_digest* from the files in *source*."""
+        target_dir = self._cache_dir / hex_digest
         if target_dir.is_dir():
             return  # already cached
 
@@ -184,35 +348,285 @@ class SimulationCache:
 
         tmp_dir = Path(tempfile.mkdtemp(dir=self._cache_dir, prefix=".tmp_"))
         try:
-            # Copy output files (ignore_dangling_symlinks for robustness)
-            shutil.copytree(result.run_dir, tmp_dir, dirs_exist_ok=True)
+            store_outputs(source, tmp_dir, patterns, self._blob_dir)
 
             # Write metadata
-            meta = {
-                "success": result.success,
-                "exit_code": result.exit_code,
-                "runtime_seconds": result.runtime_seconds,
-                "output_prefix": result.output_prefix,
-            }
             meta_path = tmp_dir / self._META_FILE
             meta_path.write_text(json.dumps(meta), encoding="utf-8")
 
             # Atomic rename — os.rename fails if target_dir already exists
             # (another process beat us), unlike shutil.move which would nest
             # tmp_dir inside the existing target as a subdirectory.
+            size = directory_size(tmp_dir)
             os.rename(str(tmp_dir), str(target_dir))
-            logger.debug("Cached result for %s", key.hex_digest[:12])
+            logger.debug("Cached result for %s", hex_digest[:12])
         except OSError:
             # Another thread/process beat us, or a real filesystem error
             # — clean up the temporary directory.
             shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        try:
+            self._manifest().add(hex_digest, size)
+        except sqlite3.Error:
+            logger.debug("Could not update cache manifest", exc_info=True)
+        if self._max_bytes is not None or self._max_entries is not None:
+            self._evict(self._max_bytes, self._max_entries, keep=hex_digest)
+
+    async def aget(self, key: CacheKey) -> SimulationResult | None:
+        """Async variant of [get][idfkit.simulation.cache.SimulationCache.get], used by the async runner."""
+        return self.get(key)
+
+    async def aput(self, key: CacheKey, result: SimulationResult) -> None:
+        """Async variant of [put][idfkit.simulation.cache.SimulationCache.put], used by the async runner."""
+        self.put(key, result)
 
     def contains(self, key: CacheKey) -> bool:
         """Check whether a cache entry exists for *key*."""
         return (self._cache_dir / key.hex_digest / self._META_FILE).is_file()
 
+    def compress(self, *, older_than: float = 7 * 24 * 3600) -> int:
+        """Gzip the outputs of entries not used recently.
+
+        Compressed entries are expanded again on their next hit, so this
+        trades hit latency on cold entries for disk space.
+
+        Args:
+            older_than: Compress entries not accessed for this many seconds.
+
+        Returns:
+            The number of entries compressed.
+        """
+        if not self._cache_dir.is_dir():
+            return 0
+        cutoff = time.time() - older_than
+        manifest = self._manifest()
+        count = 0
+        for key, _size, _created, last_access, _hits in manifest.rows():
+            entry_dir = self._cache_dir / key
+            meta_path = entry_dir / self._META_FILE
+            if last_access > cutoff or not meta_path.is_file():
+                continue
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("compressed"):
+                continue
+            meta["compressed"] = compress_entry(entry_dir, keep=self._META_FILE)
+            _write_json(meta_path, meta)
+            manifest.resize(key, directory_size(entry_dir))
+            count += 1
+        if count:
+            collect_blobs(self._cache_dir / self._BLOBS_DIR)
+            logger.debug("Compressed %d cache entries", count)
+        return count
+
+    def _expand(self, hex_digest: str, meta: dict[str, Any]) -> None:
+        """Decompress an entry compressed by [compress][idfkit.simulation.cache.SimulationCache.compress]."""
+        entry_dir = self._cache_dir / hex_digest
+        decompress_entry(entry_dir, meta["compressed"], self._blob_dir)
+        meta["compressed"] = []
+        _write_json(entry_dir / self._META_FILE, meta)
+        try:
+            self._manifest().resize(hex_digest, directory_size(entry_dir))
+        except sqlite3.Error:
+            logger.debug("Could not update cache manifest", exc_info=True)
+
+    def remove(self, key: CacheKey) -> bool:
+        """Delete the entry for *key*.
+
+        Returns:
+            Whether an entry existed.
+        """
+        entry_dir = self._cache_dir / key.hex_digest
+        existed = entry_dir.is_dir()
+        if self._cache_dir.is_dir():
+            self._forget(key.hex_digest)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        if existed:
+            collect_blobs(self._cache_dir / self._BLOBS_DIR)
+        return existed
+
+    def prune(self, *, max_bytes: int | None = None, max_entries: int | None = None) -> int:
+        """Evict entries until the cache is within the given limits.
+
+        Entries are chosen by the cache's eviction policy.  Entries that
+        another process is reading at the same moment may disappear under
+        it; such a reader sees a missing output file.
+
+        Args:
+            max_bytes: Size limit (default: the cache's ``max_bytes``).
+            max_entries: Entry limit (default: the cache's ``max_entries``).
+
+        Returns:
+            The number of entries evicted.
+        """
+        max_bytes = max_bytes if max_bytes is not None else self._max_bytes
+        max_entries = max_entries if max_entries is not None else self._max_entries
+        return self._evict(max_bytes, max_entries)
+
+    def _evict(self, max_bytes: int | None, max_entries: int | None, keep: str | None = None) -> int:
+        if (max_bytes is None and max_entries is None) or not self._cache_dir.is_dir():
+            return 0
+        victims = self._manifest().evict(max_bytes, max_entries, self._eviction, keep)
+        for hex_digest in victims:
+            shutil.rmtree(self._cache_dir / hex_digest, ignore_errors=True)
+        if victims:
+            collect_blobs(self._cache_dir / self._BLOBS_DIR)
+            logger.debug("Evicted %d cache entries", len(victims))
+        return len(victims)
+
+    def entries(self) -> list[CacheEntry]:
+        """List cached entries, most recently used first."""
+        if not self._cache_dir.is_dir():
+            return []
+        return [
+            CacheEntry(CacheKey(key), size, created, last_access, hits)
+            for key, size, created, last_access, hits in self._manifest().rows()
+        ]
+
+    def stats(self) -> CacheStats:
+        """Return the cache's size and hit/miss/eviction counters."""
+        if not self._cache_dir.is_dir():
+            return CacheStats(entries=0, total_bytes=0, hits=0, misses=0, evictions=0)
+        count, size, counters = self._manifest().totals()
+        return CacheStats(
+            entries=count,
+            total_bytes=size,
+            hits=counters.get("hits", 0),
+            misses=counters.get("misses", 0),
+            evictions=counters.get("evictions", 0),
+        )
+
     def clear(self) -> None:
         """Remove all cached entries."""
         if self._cache_dir.is_dir():
             shutil.rmtree(self._cache_dir)
             logger.debug("Cleared simulation cache at %s", self._cache_dir)
+
+
+def simulation_key(
+    model: IDFDocument,
+    weather: str | Path,
+    *,
+    expand_objects: bool = True,
+    annual: bool = False,
+    design_day: bool = False,
+    output_suffix: Literal["C", "L", "D"] = "C",
+    readvars: bool = False,
+    extra_args: list[str] | tuple[str, ...] | None = None,
+    weather_digest: str | None = None,
+) -> CacheKey:
+    """Compute the content key of a simulation without a cache.
+
+    Identical to [SimulationCache.compute_key][idfkit.simulation.cache.SimulationCache.compute_key]:
+    two invocations with the same key produce the same results.
+
+    Args:
+        model: The EnergyPlus model.
+        weather: Path to the weather file.
+        expand_objects: Whether ExpandObjects will run.
+        annual: Whether annual simulation is used.
+        design_day: Whether design-day-only simulation is used.
+        output_suffix: Output file naming suffix (``"C"``, ``"L"``, or ``"D"``).
+        readvars: Whether ReadVarsESO post-processing will run.
+        extra_args: Additional command-line arguments.
+        weather_digest: Precomputed digest of *weather* (computed and
+            memoized in memory when ``None``).
+
+    Returns:
+        The [CacheKey][idfkit.simulation.cache.CacheKey] of the invocation.
+    """
+    from ..writers import IDFWriter
+
+    h = hashlib.sha256()
+    # Hash the model as if Output:SQLite were present, without copying it
+    extra = () if "Output:SQLite" in model else (_output_sqlite(),)
+    for chunk in IDFWriter(model, output_type="compressed", extra_objects=extra).iter_lines():
+        h.update(chunk.encode("utf-8"))
+        h.update(b"\n")
+
+    flags = json.dumps(
+        {
+            "expand_objects": expand_objects,
+            "annual": annual,
+            "design_day": design_day,
+            "output_suffix": output_suffix,
+            "readvars": readvars,
+            "extra_args": list(extra_args) if extra_args else [],
+        },
+        sort_keys=True,
+    )
+
+    if weather_digest is None:
+        weather_digest = _weather_digest(Path(weather), None)
+    h.update(weather_digest.encode("ascii"))
+    h.update(flags.encode("utf-8"))
+    key = CacheKey(hex_digest=h.hexdigest())
+    logger.debug("Computed cache key %s", key.hex_digest[:12])
+    return key
+
+
+# Weather digests by "path|size|mtime_ns|inode", shared by all caches
+_weather_digests: dict[str, str] = {}
+_digest_lock = threading.Lock()
+
+
+def _weather_digest(weather: Path, store: Path | None) -> str:
+    """Digest *weather*, memoized in memory and, if given, in the JSON *store*."""
+    path = weather.resolve()
+    st = path.stat()
+    stamp = f"{path}|{st.st_size}|{st.st_mtime_ns}|{st.st_ino}"
+    with _digest_lock:
+        digest = _weather_digests.get(stamp)
+    if digest is not None:
+        return digest
+
+    stored = _read_digests(store) if store is not None else {}
+    digest = stored.get(stamp)
+    if digest is None:
+        digest = _file_sha256(path)
+        if store is not None:
+            stored[stamp] = digest
+            _write_digests(store, stored)
+    with _digest_lock:
+        _weather_digests[stamp] = digest
+    return digest
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_digests(store: Path) -> dict[str, str]:
+    try:
+        return json.loads(store.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_digests(store: Path, digests: dict[str, str]) -> None:
+    try:
+        store.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=store.parent, prefix=".tmp_", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(digests, f)
+        os.replace(tmp, store)
+    except OSError:
+        logger.debug("Could not persist weather digests to %s", store, exc_info=True)
+
+
+def _output_sqlite() -> IDFObject:
+    """The ``Output:SQLite`` object that simulate() adds to models lacking one."""
+    from ..objects import IDFObject
+
+    return IDFObject("Output:SQLite", "", {"option_type": "SimpleAndTabular"})
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Replace *path* atomically with *data* as JSON."""
+    tmp = path.with_name(f".tmp_{uuid.uuid4().hex}_{path.name}")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,578 @@
+"""Multi-node batch simulation over a shared work queue.
+
+Splits [simulate_batch][idfkit.simulation.batch.simulate_batch] into three
+roles that can run on different machines:
+
+1. **Submit** -- [submit_batch][idfkit.simulation.distributed.submit_batch]
+   serializes each [SimulationJob][idfkit.simulation.batch.SimulationJob]
+   onto a [WorkQueue][idfkit.simulation.distributed.WorkQueue].
+2. **Work** -- [run_worker][idfkit.simulation.distributed.run_worker]
+   claims jobs, runs them and posts results back.  Start as many workers
+   as there are cores in the cluster.
+3. **Collect** -- [iter_batch_results][idfkit.simulation.distributed.iter_batch_results]
+   streams results as they complete;
+   [collect_batch][idfkit.simulation.distributed.collect_batch] gathers
+   them into a [BatchResult][idfkit.simulation.batch.BatchResult].
+
+Claimed jobs are leased.  Workers renew the lease while a job runs; if a
+worker dies, the lease expires and another worker retries the job, up
+to the queue's ``max_attempts``.  Jobs that fail inside EnergyPlus are
+not retried -- they are reported like any other failed result.
+
+[SQLiteWorkQueue][idfkit.simulation.distributed.SQLiteWorkQueue] is a
+queue backed by a single SQLite file in WAL mode.  WAL needs shared
+memory between the processes using the file, so this queue is for
+workers on **one host** (and for testing); do not put it on a network
+file system.  Multi-node backends (Redis, SQS, a database server)
+implement the [WorkQueue][idfkit.simulation.distributed.WorkQueue]
+protocol.
+
+!!! warning
+    Job payloads are pickles (models use their compact pickle form).
+    Only connect workers to queues you trust.
+
+Examples:
+    ```python
+    from idfkit.simulation import SQLiteWorkQueue, SimulationJob, collect_batch, submit_batch
+
+    queue = SQLiteWorkQueue("/var/tmp/sweep.db")
+    batch_id = submit_batch(queue, [SimulationJob(model=m, weather="weather.epw") for m in models])
+
+    # In any number of processes on this host:
+    #   python -m idfkit.simulation.distributed /var/tmp/sweep.db
+
+    batch = collect_batch(queue, batch_id)
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from .async_batch import SimulationEvent
+from .batch import BatchResult, SimulationJob, _failed_result, _run_job  # pyright: ignore[reportPrivateUsage]
+from .result import SimulationResult
+
+if TYPE_CHECKING:
+    from .cache import SimulationCache
+    from .config import EnergyPlusConfig
+    from .fs import FileSystem
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedTask:
+    """A job claimed from a [WorkQueue][idfkit.simulation.distributed.WorkQueue].
+
+    Attributes:
+        task_id: Queue-assigned identifier.
+        batch_id: Batch the job belongs to.
+        index: Position of the job in the submitted batch.
+        payload: Serialized job (see [encode_job][idfkit.simulation.distributed.encode_job]).
+        attempt: 1 for the first claim, incremented on every retry.
+    """
+
+    task_id: int
+    batch_id: str
+    index: int
+    payload: bytes
+    attempt: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskOutcome:
+    """A finished job as reported by a [WorkQueue][idfkit.simulation.distributed.WorkQueue].
+
+    Attributes:
+        seq: Completion sequence number within the queue (increasing).
+        index: Position of the job in the submitted batch.
+        label: Job label.
+        result: Serialized result (see [encode_result][idfkit.simulation.distributed.encode_result]),
+            or ``None`` if the job was abandoned.
+        error: Why the job was abandoned (e.g. every worker running it was lost).
+    """
+
+    seq: int
+    index: int
+    label: str
+    result: bytes | None
+    error: str | None = None
+
+
+@runtime_checkable
+class WorkQueue(Protocol):
+    """Protocol for queues that distribute simulation jobs to workers.
+
+    Implementations must be safe to use from several processes and hosts
+    at once.
+
+    Attributes:
+        lease_seconds: How long a claim lasts without renewal.
+    """
+
+    lease_seconds: float
+
+    def submit(self, batch_id: str, tasks: Sequence[tuple[str, bytes]]) -> None:
+        """Enqueue the jobs of a batch.
+
+        Args:
+            batch_id: Identifier for the batch.
+            tasks: ``(label, payload)`` pairs, in job order.
+        """
+        ...
+
+    def claim(self, worker_id: str) -> QueuedTask | None:
+        """Lease the next pending job (or one whose lease expired).
+
+        Args:
+            worker_id: Identifier of the claiming worker.
+
+        Returns:
+            The claimed task, or ``None`` if nothing is available.
+        """
+        ...
+
+    def renew(self, task_id: int, worker_id: str) -> None:
+        """Extend the lease on a claimed job by ``lease_seconds``."""
+        ...
+
+    def complete(self, task_id: int, result: bytes) -> None:
+        """Record the result of a job.  The first completion wins."""
+        ...
+
+    def results(self, batch_id: str, after: int = 0) -> list[TaskOutcome]:
+        """Return the outcomes with ``seq > after``, in completion order."""
+        ...
+
+    def size(self, batch_id: str) -> int:
+        """Return the number of jobs submitted for *batch_id*."""
+        ...
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    seq INTEGER,
+    result BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, task_id);
+CREATE INDEX IF NOT EXISTS tasks_batch_seq ON tasks (batch_id, seq);
+"""
+
+
+class SQLiteWorkQueue:
+    """[WorkQueue][idfkit.simulation.distributed.WorkQueue] stored in a single SQLite file.
+
+    Every call opens its own connection and claims run in an immediate
+    transaction, so any number of worker threads and processes on the
+    same host can share the file.  The database uses SQLite's WAL
+    journal, which relies on shared memory and does not work across
+    hosts: keep the file on a local disk and run all workers on that
+    host.  Use another [WorkQueue][idfkit.simulation.distributed.WorkQueue]
+    backend to spread jobs over several machines.
+
+    Args:
+        path: Database file (created on first use).
+        lease_seconds: How long a claim lasts without renewal.
+        max_attempts: Claims allowed per job before it is abandoned
+            because its workers keep disappearing.
+    """
+
+    __slots__ = ("_path", "lease_seconds", "max_attempts")
+
+    def __init__(self, path: str | Path, *, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        self._path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def submit(self, batch_id: str, tasks: Sequence[tuple[str, bytes]]) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO tasks (batch_id, idx, label, payload) VALUES (?, ?, ?, ?)",
+                [(batch_id, idx, label, payload) for idx, (label, payload) in enumerate(tasks)],
+            )
+            conn.execute("COMMIT")
+
+    def claim(self, worker_id: str) -> QueuedTask | None:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._abandon_expired(conn, now)
+            row = conn.execute(
+                "SELECT task_id, batch_id, idx, payload, attempts FROM tasks "
+                "WHERE state = 'pending' OR (state = 'running' AND lease_until < ?) "
+                "ORDER BY task_id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            task_id, batch_id, idx, payload, attempts = row
+            conn.execute(
+                "UPDATE tasks SET state = 'running', worker = ?, attempts = ?, lease_until = ? WHERE task_id = ?",
+                (worker_id, attempts + 1, now + self.lease_seconds, task_id),
+            )
+            conn.execute("COMMIT")
+        if attempts:
+            logger.info("Retrying task %d (attempt %d) on %s", task_id, attempts + 1, worker_id)
+        return QueuedTask(task_id, batch_id, idx, payload, attempts + 1)
+
+    def _abandon_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        """Fail jobs whose lease expired on their last allowed attempt."""
+        expired = conn.execute(
+            "SELECT task_id, attempts FROM tasks WHERE state = 'running' AND lease_until < ? AND attempts >= ?",
+            (now, self.max_attempts),
+        ).fetchall()
+        for task_id, attempts in expired:
+            msg = f"Job abandoned: worker lost on all {attempts} attempt(s)"
+            conn.execute(
+                "UPDATE tasks SET state = 'failed', error = ?, seq = (SELECT COALESCE(MAX(seq), 0) + 1 FROM tasks) "
+                "WHERE task_id = ?",
+                (msg, task_id),
+            )
+            logger.warning("Abandoned task %d after %d attempts", task_id, attempts)
+
+    def renew(self, task_id: int, worker_id: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE tasks SET lease_until = ? WHERE task_id = ? AND worker = ? AND state = 'running'",
+                (time.time() + self.lease_seconds, task_id, worker_id),
+            )
+
+    def complete(self, task_id: int, result: bytes) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE tasks SET state = 'done', result = ?, payload = x'', "
+                "seq = (SELECT COALESCE(MAX(seq), 0) + 1 FROM tasks) "
+                "WHERE task_id = ? AND state IN ('pending', 'running')",
+                (result, task_id),
+            )
+            conn.execute("COMMIT")
+
+    def results(self, batch_id: str, after: int = 0) -> list[TaskOutcome]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT seq, idx, label, result, error FROM tasks WHERE batch_id = ? AND seq > ? ORDER BY seq",
+                (batch_id, after),
+            ).fetchall()
+        return [TaskOutcome(*row) for row in rows]
+
+    def size(self, batch_id: str) -> int:
+        with closing(self._connect()) as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM tasks WHERE batch_id = ?", (batch_id,)).fetchone()
+        return int(count)
+
+
+# ---------------------------------------------------------------------------
+# Serialization
+# ---------------------------------------------------------------------------
+
+
+def encode_job(job: SimulationJob) -> bytes:
+    """Serialize a job for a work queue."""
+    return pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_job(payload: bytes) -> SimulationJob:
+    """Inverse of [encode_job][idfkit.simulation.distributed.encode_job]."""
+    job = pickle.loads(payload)  # noqa: S301
+    if not isinstance(job, SimulationJob):
+        msg = f"Payload does not contain a SimulationJob (got {type(job).__name__})"
+        raise TypeError(msg)
+    return job
+
+
+def encode_result(result: SimulationResult) -> bytes:
+    """Serialize a result as JSON.  File system backends are not included."""
+    return json.dumps({
+        "run_dir": str(result.run_dir),
+        "success": result.success,
+        "exit_code": result.exit_code,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "runtime_seconds": result.runtime_seconds,
+        "output_prefix": result.output_prefix,
+    }).encode("utf-8")
+
+
+def decode_result(data: bytes, *, fs: FileSystem | None = None) -> SimulationResult:
+    """Inverse of [encode_result][idfkit.simulation.distributed.encode_result].
+
+    Args:
+        data: Serialized result.
+        fs: File system the worker stored outputs on, if not local.
+    """
+    meta = json.loads(data)
+    return SimulationResult(
+        run_dir=Path(meta["run_dir"]),
+        success=meta["success"],
+        exit_code=meta["exit_code"],
+        stdout=meta["stdout"],
+        stderr=meta["stderr"],
+        runtime_seconds=meta["runtime_seconds"],
+        output_prefix=meta["output_prefix"],
+        fs=fs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Roles
+# ---------------------------------------------------------------------------
+
+
+def submit_batch(queue: WorkQueue, jobs: Sequence[SimulationJob], *, batch_id: str | None = None) -> str:
+    """Put a batch of jobs on a work queue.
+
+    Args:
+        queue: Destination queue.
+        jobs: Jobs to run.
+        batch_id: Identifier for the batch (default: a random UUID).
+
+    Returns:
+        The batch identifier, for [collect_batch][idfkit.simulation.distributed.collect_batch].
+
+    Raises:
+        ValueError: If *jobs* is empty.
+    """
+    if not jobs:
+        msg = "jobs must not be empty"
+        raise ValueError(msg)
+    batch_id = batch_id or uuid.uuid4().hex
+    queue.submit(batch_id, [(job.label, encode_job(job)) for job in jobs])
+    logger.info("Submitted batch %s with %d jobs", batch_id, len(jobs))
+    return batch_id
+
+
+class _LeaseKeeper:
+    """Renew a task's lease in the background while it runs."""
+
+    def __init__(self, queue: WorkQueue, task_id: int, worker_id: str) -> None:
+        self._queue = queue
+        self._task_id = task_id
+        self._worker_id = worker_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        interval = max(self._queue.lease_seconds / 3, 0.01)
+        while not self._stop.wait(interval):
+            try:
+                self._queue.renew(self._task_id, self._worker_id)
+            except Exception:
+                logger.warning("Could not renew lease on task %d", self._task_id, exc_info=True)
+
+    def __enter__(self) -> _LeaseKeeper:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(
+    queue: WorkQueue,
+    *,
+    energyplus: EnergyPlusConfig | None = None,
+    cache: SimulationCache | None = None,
+    fs: FileSystem | None = None,
+    worker_id: str | None = None,
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = 0.0,
+    max_jobs: int | None = None,
+) -> int:
+    """Claim and run jobs from a work queue until it stays empty.
+
+    Jobs run one at a time through the same code path as
+    [simulate_batch][idfkit.simulation.batch.simulate_batch]; start one
+    worker per core.
+
+    Args:
+        queue: Queue to take jobs from.
+        energyplus: EnergyPlus installation on this node (auto-discovered
+            if ``None``).
+        cache: Optional simulation cache on this node.
+        fs: Optional file system backend for job outputs.
+        worker_id: Identifier recorded on claims (default:
+            ``"<hostname>-<pid>"``).
+        poll_interval: Seconds between polls of an empty queue.
+        idle_timeout: Stop after the queue has been empty this long
+            (``0`` stops as soon as it is empty, ``None`` never stops).
+        max_jobs: Stop after this many jobs.
+
+    Returns:
+        The number of jobs this worker ran.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    ran = 0
+    idle_since: float | None = None
+    while max_jobs is None or ran < max_jobs:
+        task = queue.claim(worker_id)
+        if task is None:
+            idle_since = idle_since if idle_since is not None else time.monotonic()
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+        idle_since = None
+        with _LeaseKeeper(queue, task.task_id, worker_id):
+            result = _run_task(task, energyplus, cache, fs)
+        queue.complete(task.task_id, encode_result(result))
+        ran += 1
+    logger.info("Worker %s ran %d jobs", worker_id, ran)
+    return ran
+
+
+def _run_task(
+    task: QueuedTask,
+    energyplus: EnergyPlusConfig | None,
+    cache: SimulationCache | None,
+    fs: FileSystem | None,
+) -> SimulationResult:
+    try:
+        job = decode_job(task.payload)
+    except Exception as exc:
+        return _failed_result(SimulationJob(model=None, weather=""), exc)
+    return _run_job(task.index, job, energyplus, cache, fs, None)
+
+
+def iter_batch_results(
+    queue: WorkQueue,
+    batch_id: str,
+    *,
+    poll_interval: float = 1.0,
+    timeout: float | None = None,
+    fs: FileSystem | None = None,
+) -> Iterator[SimulationEvent]:
+    """Yield results of a submitted batch as they complete.
+
+    Args:
+        queue: Queue the batch was submitted to.
+        batch_id: Identifier returned by [submit_batch][idfkit.simulation.distributed.submit_batch].
+        poll_interval: Seconds between polls while waiting.
+        timeout: Give up after this many seconds without the batch finishing.
+        fs: File system the workers stored outputs on, attached to each result.
+
+    Yields:
+        A [SimulationEvent][idfkit.simulation.async_batch.SimulationEvent] per
+        job, in completion order.
+
+    Raises:
+        TimeoutError: If *timeout* elapses first.
+    """
+    total = queue.size(batch_id)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    cursor = 0
+    completed = 0
+    while completed < total:
+        outcomes = queue.results(batch_id, after=cursor)
+        for outcome in outcomes:
+            cursor = outcome.seq
+            completed += 1
+            yield SimulationEvent(outcome.index, outcome.label, _outcome_result(outcome, fs), completed, total)
+        if outcomes:
+            continue
+        if deadline is not None and time.monotonic() >= deadline:
+            msg = f"Batch {batch_id} incomplete after {timeout} seconds ({completed}/{total} done)"
+            raise TimeoutError(msg)
+        time.sleep(poll_interval)
+
+
+def _outcome_result(outcome: TaskOutcome, fs: FileSystem | None) -> SimulationResult:
+    if outcome.result is not None:
+        return decode_result(outcome.result, fs=fs)
+    return SimulationResult(
+        run_dir=Path(tempfile.mkdtemp()),
+        success=False,
+        exit_code=None,
+        stdout="",
+        stderr=outcome.error or "",
+        runtime_seconds=0.0,
+    )
+
+
+def collect_batch(
+    queue: WorkQueue,
+    batch_id: str,
+    *,
+    poll_interval: float = 1.0,
+    timeout: float | None = None,
+    fs: FileSystem | None = None,
+) -> BatchResult:
+    """Wait for a submitted batch and return its results in job order.
+
+    Arguments are as for [iter_batch_results][idfkit.simulation.distributed.iter_batch_results].
+    ``total_runtime_seconds`` is the time spent waiting in this call.
+
+    Raises:
+        TimeoutError: If *timeout* elapses first.
+    """
+    start = time.monotonic()
+    by_index: dict[int, SimulationResult] = {}
+    for event in iter_batch_results(queue, batch_id, poll_interval=poll_interval, timeout=timeout, fs=fs):
+        by_index[event.index] = event.result
+    return BatchResult(
+        results=tuple(by_index[i] for i in sorted(by_index)),
+        total_runtime_seconds=time.monotonic() - start,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a worker against a [SQLiteWorkQueue][idfkit.simulation.distributed.SQLiteWorkQueue] file."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run idfkit simulation jobs from a SQLite work queue.")
+    parser.add_argument("queue", help="path to the queue database")
+    parser.add_argument("--idle-timeout", type=float, default=0.0, help="seconds to wait on an empty queue")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--max-jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+    run_worker(
+        SQLiteWorkQueue(args.queue),
+        poll_interval=args.poll_interval,
+        idle_timeout=args.idle_timeout,
+        max_jobs=args.max_jobs,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
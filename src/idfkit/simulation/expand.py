@@ -86,7 +86,7 @@ to inspect or modify the preprocessed model before simulation.
 **File handling mirrors the simulation runner**
 
 The same care taken in [simulate][idfkit.simulation.runner.simulate] --
-copying ``Energy+.idd`` to the run directory, isolating work in a temp
+linking ``Energy+.idd`` into the run directory, isolating work in a temp
 directory, cleaning up afterward -- is applied here.  Each preprocessor
 also requires its own IDD (``SlabGHT.idd``, ``BasementGHT.idd``) and
 expects a weather file named ``in.epw`` in its working directory.
@@ -103,6 +103,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..exceptions import ExpandObjectsError
+from ._common import link_input, scratch_root
 from .config import EnergyPlusConfig, find_energyplus
 
 logger = logging.getLogger(__name__)
@@ -307,8 +308,8 @@ def _run_expand_objects(config: EnergyPlusConfig, run_dir: Path, *, timeout: flo
         )
         raise ExpandObjectsError(msg, preprocessor="ExpandObjects")
 
-    # Copy Energy+.idd so ExpandObjects can parse the model
-    shutil.copy2(config.idd_path, run_dir / "Energy+.idd")
+    # Link Energy+.idd so ExpandObjects can parse the model
+    link_input(config.idd_path, run_dir / "Energy+.idd", scratch_root())
 
     logger.info("Running ExpandObjects in %s", run_dir)
     proc = _run_subprocess(exe, cwd=run_dir, timeout=timeout, label="ExpandObjects")
@@ -319,19 +320,21 @@ def _run_expand_objects(config: EnergyPlusConfig, run_dir: Path, *, timeout: flo
 def _prepare_run_dir(model: IDFDocument, *, weather: str | Path | None = None) -> Path:
     """Write *model* to a temporary directory and return its path.
 
-    If *weather* is provided it is copied into the directory as ``in.epw``
-    (the filename the EnergyPlus preprocessors expect).
+    If *weather* is provided it is linked into the directory as ``in.epw``
+    (the filename the EnergyPlus preprocessors expect).  The directory is
+    created under ``$IDFKIT_SCRATCH_DIR`` when set.
     """
     from ..writers import write_idf
 
-    run_dir = Path(tempfile.mkdtemp(prefix="idfkit_expand_"))
+    scratch = scratch_root()
+    run_dir = Path(tempfile.mkdtemp(prefix="idfkit_expand_", dir=scratch))
     write_idf(model, run_dir / "in.idf")
     if weather is not None:
         weather = Path(weather)
         if not weather.is_file():
             msg = f"Weather file not found: {weather}"
             raise ExpandObjectsError(msg)
-        shutil.copy2(weather, run_dir / "in.epw")
+        link_input(weather, run_dir / "in.epw", scratch)
     return run_dir
 
 
@@ -357,7 +360,7 @@ def _append_file(target: Path, source: Path) -> None:
 def _run_slab_in_dir(config: EnergyPlusConfig, run_dir: Path, *, timeout: float) -> None:
     """Run the Slab preprocessor in a directory where ExpandObjects has already run.
 
-    Assumes ``GHTIn.idf`` exists in *run_dir*.  Copies ``SlabGHT.idd``,
+    Assumes ``GHTIn.idf`` exists in *run_dir*.  Links ``SlabGHT.idd``,
     invokes the Slab solver, validates the output, and appends the
     resulting ``SLABSurfaceTemps.TXT`` to ``expanded.idf``.
     """
@@ -370,7 +373,7 @@ def _run_slab_in_dir(config: EnergyPlusConfig, run_dir: Path, *, timeout: float)
         )
         raise ExpandObjectsError(msg, preprocessor="Slab")
 
-    shutil.copy2(slab_idd, run_dir / "SlabGHT.idd")
+    link_input(slab_idd, run_dir / "SlabGHT.idd", scratch_root())
 
     logger.info("Running Slab preprocessor in %s", run_dir)
     proc = _run_subprocess(slab_exe, cwd=run_dir, timeout=timeout, label="Slab")
@@ -387,7 +390,7 @@ def _run_slab_in_dir(config: EnergyPlusConfig, run_dir: Path, *, timeout: float)
 def _run_basement_in_dir(config: EnergyPlusConfig, run_dir: Path, *, timeout: float) -> None:
     """Run the Basement preprocessor in a directory where ExpandObjects has already run.
 
-    Assumes ``BasementGHTIn.idf`` exists in *run_dir*.  Copies
+    Assumes ``BasementGHTIn.idf`` exists in *run_dir*.  Links
     ``BasementGHT.idd``, invokes the Basement solver, validates the
     output, and appends the resulting ``EPObjects.TXT`` to
     ``expanded.idf``.
@@ -401,7 +404,7 @@ def _run_basement_in_dir(config: EnergyPlusConfig, run_dir: Path, *, timeout: fl
         )
         raise ExpandObjectsError(msg, preprocessor="Basement")
 
-    shutil.copy2(basement_idd, run_dir / "BasementGHT.idd")
+    link_input(basement_idd, run_dir / "BasementGHT.idd", scratch_root())
 
     logger.info("Running Basement preprocessor in %s", run_dir)
     proc = _run_subprocess(basement_exe, cwd=run_dir, timeout=timeout, label="Basement")
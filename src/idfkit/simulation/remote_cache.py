@@ -0,0 +1,360 @@
+"""Shared simulation cache on a remote file system.
+
+[RemoteSimulationCache][idfkit.simulation.remote_cache.RemoteSimulationCache]
+adds a second tier to [SimulationCache][idfkit.simulation.cache.SimulationCache]
+on any [FileSystem][idfkit.simulation.fs.FileSystem] or
+[AsyncFileSystem][idfkit.simulation.fs.AsyncFileSystem] (e.g. S3), so that
+workers on different hosts reuse each other's results.
+
+Lookups check the local cache directory first and then the remote store;
+a remote hit is downloaded into the local tier.  Stores write through:
+the entry is cached locally, then published to the remote store.
+
+Publishing is atomic.  Each entry is uploaded as one archive under a
+unique name, and only then is a small marker written that records the
+archive's name, size and SHA-256 digest.  Readers only look at markers
+and verify the archive against them, so a partial upload or a crashed
+publisher is never served, even on stores without atomic writes.
+Concurrent publishers of the same key each upload a complete archive;
+the last marker wins.
+
+Remote layout under *prefix*::
+
+    <key>.json              marker
+    <key>/<token>.tar.gz    archive of the entry directory
+
+Examples:
+    ```python
+    from idfkit.simulation import RemoteSimulationCache, S3FileSystem, simulate_batch
+
+    cache = RemoteSimulationCache(S3FileSystem(bucket="sim-cache"), prefix="v1")
+    batch = simulate_batch(jobs, cache=cache)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import io
+import json
+import logging
+import shutil
+import tarfile
+import tempfile
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from .cache import CacheKey, SimulationCache
+
+if TYPE_CHECKING:
+    from ._manifest import EvictionPolicy
+    from .fs import AsyncFileSystem, FileSystem
+    from .result import SimulationResult
+
+logger = logging.getLogger(__name__)
+
+_MARKER_VERSION = 1
+
+
+class RemoteSimulationCache(SimulationCache):
+    """Simulation cache with a local tier and a shared remote tier.
+
+    Pass it wherever a [SimulationCache][idfkit.simulation.cache.SimulationCache]
+    is accepted.  Size limits, eviction, [prune][idfkit.simulation.cache.SimulationCache.prune],
+    [compress][idfkit.simulation.cache.SimulationCache.compress] and
+    [clear][idfkit.simulation.cache.SimulationCache.clear] manage the local tier
+    only; expire remote entries with the store's own lifecycle rules.
+    [remove][idfkit.simulation.remote_cache.RemoteSimulationCache.remove]
+    deletes an entry from both tiers.
+
+    Remote errors are logged and treated as misses, so an unreachable
+    store slows a batch down but never fails it.
+
+    Args:
+        fs: Remote store.  With an [AsyncFileSystem][idfkit.simulation.fs.AsyncFileSystem]
+            the remote tier is used by the async API
+            ([async_simulate][idfkit.simulation.async_runner.async_simulate]
+            and the async batch functions); synchronous calls then see the
+            local tier only.
+        prefix: Remote directory holding the entries.
+        cache_dir: Local tier directory (default: platform cache directory).
+        persist_digests: See [SimulationCache][idfkit.simulation.cache.SimulationCache].
+        max_bytes: Local tier size limit.
+        max_entries: Local tier entry limit.
+        eviction: Local tier eviction policy.
+        outputs: Filename globs of the run-directory files to store.  The
+            filter applies before publishing, so it also bounds what is
+            uploaded.
+        dedupe: Deduplicate large files in the local tier.
+    """
+
+    __slots__ = ("_fs", "_prefix")
+
+    def __init__(
+        self,
+        fs: FileSystem | AsyncFileSystem,
+        prefix: str = "simulation-cache",
+        *,
+        cache_dir: str | Path | None = None,
+        persist_digests: bool = True,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        eviction: EvictionPolicy = "lru",
+        outputs: Sequence[str] | None = None,
+        dedupe: bool = True,
+    ) -> None:
+        super().__init__(
+            cache_dir,
+            persist_digests=persist_digests,
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            eviction=eviction,
+            outputs=outputs,
+            dedupe=dedupe,
+        )
+        self._fs = fs
+        self._prefix = prefix.rstrip("/")
+
+    @property
+    def fs(self) -> FileSystem | AsyncFileSystem:
+        """The remote store."""
+        return self._fs
+
+    @property
+    def prefix(self) -> str:
+        """Remote directory holding the entries."""
+        return self._prefix
+
+    def _remote(self, name: str) -> str:
+        return f"{self._prefix}/{name}" if self._prefix else name
+
+    def _sync_fs(self) -> FileSystem | None:
+        return None if _is_async_fs(self._fs) else self._fs  # type: ignore[return-value]
+
+    def _async_fs(self) -> AsyncFileSystem | None:
+        return self._fs if _is_async_fs(self._fs) else None  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    # Synchronous API
+    # ------------------------------------------------------------------
+
+    def get(self, key: CacheKey) -> SimulationResult | None:
+        """Retrieve a result from the local tier, else from the remote store.
+
+        A remote hit is downloaded into the local tier first.
+        """
+        fs = self._sync_fs()
+        if fs is not None and not super().contains(key):
+            self._pull(fs, key.hex_digest)
+        return super().get(key)
+
+    def put(self, key: CacheKey, result: SimulationResult) -> None:
+        """Store a successful result locally and publish it to the remote store."""
+        super().put(key, result)
+        fs = self._sync_fs()
+        if fs is not None and super().contains(key):
+            self._push(fs, key.hex_digest)
+
+    def contains(self, key: CacheKey) -> bool:
+        """Check whether either tier has an entry for *key*."""
+        if super().contains(key):
+            return True
+        fs = self._sync_fs()
+        if fs is None:
+            return False
+        try:
+            return fs.exists(self._remote(_marker_name(key.hex_digest)))
+        except Exception:
+            logger.warning("Could not reach remote cache", exc_info=True)
+            return False
+
+    def remove(self, key: CacheKey) -> bool:
+        """Delete the entry for *key* from both tiers.
+
+        Returns:
+            Whether either tier had the entry.
+        """
+        existed = super().remove(key)
+        fs = self._sync_fs()
+        if fs is None:
+            return existed
+        hex_digest = key.hex_digest
+        try:
+            marker = self._remote(_marker_name(hex_digest))
+            if fs.exists(marker):
+                fs.remove(marker)
+                existed = True
+            for archive in fs.glob(self._remote(hex_digest), "*"):
+                fs.remove(archive)
+        except Exception:
+            logger.warning("Could not remove remote cache entry %s", hex_digest[:12], exc_info=True)
+        return existed
+
+    def _pull(self, fs: FileSystem, hex_digest: str) -> None:
+        try:
+            marker_path = self._remote(_marker_name(hex_digest))
+            if not fs.exists(marker_path):
+                return
+            marker = _parse_marker(fs.read_bytes(marker_path))
+            if marker is None:
+                return
+            archive = fs.read_bytes(self._remote(marker["archive"]))
+        except Exception:
+            logger.warning("Could not read remote cache entry %s", hex_digest[:12], exc_info=True)
+            return
+        self._install(hex_digest, marker, archive)
+
+    def _push(self, fs: FileSystem, hex_digest: str) -> None:
+        try:
+            marker_path = self._remote(_marker_name(hex_digest))
+            if fs.exists(marker_path):
+                return
+            packed = self._pack(hex_digest)
+            if packed is None:
+                return
+            name, archive, marker = packed
+            fs.makedirs(self._remote(hex_digest), exist_ok=True)
+            fs.write_bytes(self._remote(name), archive)
+            fs.write_bytes(marker_path, marker)
+            logger.debug("Published cache entry %s", hex_digest[:12])
+        except Exception:
+            logger.warning("Could not publish cache entry %s", hex_digest[:12], exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def aget(self, key: CacheKey) -> SimulationResult | None:
+        """Async variant of [get][idfkit.simulation.remote_cache.RemoteSimulationCache.get]."""
+        fs = self._async_fs()
+        if fs is None:
+            return await asyncio.to_thread(self.get, key)
+        if not super().contains(key):
+            await self._apull(fs, key.hex_digest)
+        return super().get(key)
+
+    async def aput(self, key: CacheKey, result: SimulationResult) -> None:
+        """Async variant of [put][idfkit.simulation.remote_cache.RemoteSimulationCache.put]."""
+        fs = self._async_fs()
+        if fs is None:
+            await asyncio.to_thread(self.put, key, result)
+            return
+        await asyncio.to_thread(super().put, key, result)
+        if super().contains(key):
+            await self._apush(fs, key.hex_digest)
+
+    async def _apull(self, fs: AsyncFileSystem, hex_digest: str) -> None:
+        try:
+            marker_path = self._remote(_marker_name(hex_digest))
+            if not await fs.exists(marker_path):
+                return
+            marker = _parse_marker(await fs.read_bytes(marker_path))
+            if marker is None:
+                return
+            archive = await fs.read_bytes(self._remote(marker["archive"]))
+        except Exception:
+            logger.warning("Could not read remote cache entry %s", hex_digest[:12], exc_info=True)
+            return
+        await asyncio.to_thread(self._install, hex_digest, marker, archive)
+
+    async def _apush(self, fs: AsyncFileSystem, hex_digest: str) -> None:
+        try:
+            marker_path = self._remote(_marker_name(hex_digest))
+            if await fs.exists(marker_path):
+                return
+            packed = await asyncio.to_thread(self._pack, hex_digest)
+            if packed is None:
+                return
+            name, archive, marker = packed
+            await fs.makedirs(self._remote(hex_digest), exist_ok=True)
+            await fs.write_bytes(self._remote(name), archive)
+            await fs.write_bytes(marker_path, marker)
+            logger.debug("Published cache entry %s", hex_digest[:12])
+        except Exception:
+            logger.warning("Could not publish cache entry %s", hex_digest[:12], exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    def _pack(self, hex_digest: str) -> tuple[str, bytes, bytes] | None:
+        """Archive a local entry; return ``(archive name, archive, marker)``."""
+        entry_dir = self._cache_dir / hex_digest
+        if not (entry_dir / self._META_FILE).is_file():
+            return None
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz", compresslevel=1) as tar:
+            for path in sorted(entry_dir.rglob("*")):
+                if path.is_file() and not path.name.startswith(".tmp_"):
+                    tar.add(path, arcname=path.relative_to(entry_dir).as_posix(), recursive=False)
+        archive = buf.getvalue()
+        name = f"{hex_digest}/{uuid.uuid4().hex}.tar.gz"
+        marker = {
+            "version": _MARKER_VERSION,
+            "archive": name,
+            "size": len(archive),
+            "sha256": hashlib.sha256(archive).hexdigest(),
+        }
+        return name, archive, json.dumps(marker).encode("utf-8")
+
+    def _install(self, hex_digest: str, marker: dict[str, Any], archive: bytes) -> None:
+        """Verify a downloaded archive and add it to the local tier."""
+        if len(archive) != marker["size"] or hashlib.sha256(archive).hexdigest() != marker["sha256"]:
+            logger.warning("Ignoring remote cache entry %s: archive does not match its marker", hex_digest[:12])
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self._cache_dir, prefix=".tmp_"))
+        try:
+            _unpack(archive, staging)
+            meta = json.loads((staging / self._META_FILE).read_text(encoding="utf-8"))
+            self._store(hex_digest, staging, meta, None)
+            logger.debug("Downloaded cache entry %s", hex_digest[:12])
+        except (OSError, ValueError, tarfile.TarError):
+            logger.warning("Ignoring unreadable remote cache entry %s", hex_digest[:12], exc_info=True)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _is_async_fs(fs: object) -> bool:
+    return inspect.iscoroutinefunction(getattr(fs, "read_bytes", None))
+
+
+def _marker_name(hex_digest: str) -> str:
+    return f"{hex_digest}.json"
+
+
+def _parse_marker(data: bytes) -> dict[str, Any] | None:
+    """Decode a marker; ``None`` if it is torn, foreign or from a newer version."""
+    try:
+        decoded: Any = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(decoded, dict):
+        return None
+    marker = cast("dict[str, Any]", decoded)
+    if marker.get("version") != _MARKER_VERSION or not {"archive", "size", "sha256"} <= marker.keys():
+        return None
+    return marker
+
+
+def _unpack(archive: bytes, dest: Path) -> None:
+    """Extract the regular files of *archive* into *dest*.
+
+    Links, devices and paths escaping *dest* are skipped.
+    """
+    root = dest.resolve()
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+        for member in tar:
+            target = (root / member.name).resolve()
+            if not member.isfile() or not target.is_relative_to(root):
+                continue
+            src = tar.extractfile(member)
+            if src is None:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
@@ -194,6 +194,18 @@ class SimulationResult:
         object.__setattr__(self, "_cached_html", result)
         return result
 
+    def close(self) -> None:
+        """Close the cached SQL connection, if one is open.
+
+        Call this before deleting or moving the run directory.  Accessing
+        [sql][idfkit.simulation.result.SimulationResult.sql] again reopens
+        the database.
+        """
+        cached = object.__getattribute__(self, "_cached_sql")
+        if cached is not _UNSET and cached is not None:
+            cached.close()
+        object.__setattr__(self, "_cached_sql", _UNSET)
+
     @property
     def sql_path(self) -> Path | None:
         """Path to the SQLite output file, if present."""
@@ -528,3 +540,21 @@ class SimulationResult:
             fs=fs,
             async_fs=async_fs,
         )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Lazily parsed outputs (and open SQL connections) are not shipped;
+        # the receiving process re-reads them on demand.
+        return (
+            type(self),
+            (
+                self.run_dir,
+                self.success,
+                self.exit_code,
+                self.stdout,
+                self.stderr,
+                self.runtime_seconds,
+                self.output_prefix,
+                self.fs,
+                self.async_fs,
+            ),
+        )
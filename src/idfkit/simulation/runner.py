@@ -39,6 +39,7 @@ def simulate(
     weather: str | Path,
     *,
     output_dir: str | Path | None = None,
+    scratch_dir: str | Path | None = None,
     energyplus: EnergyPlusConfig | None = None,
     expand_objects: bool = True,
     annual: bool = False,
@@ -69,6 +70,10 @@ def simulate(
         model: The EnergyPlus model to simulate.
         weather: Path to the weather file (.epw).
         output_dir: Directory for output files (default: auto temp dir).
+        scratch_dir: Parent directory for the auto temp dir, e.g. a tmpfs
+            mount such as ``/dev/shm``.  Defaults to the
+            ``IDFKIT_SCRATCH_DIR`` environment variable, else the system
+            temp directory.
         energyplus: Pre-configured EnergyPlus installation. If None,
             uses [find_energyplus][idfkit.simulation.config.find_energyplus] for auto-discovery.
         expand_objects: Run ExpandObjects before simulation.  When
@@ -156,7 +161,7 @@ def simulate(
 
         # When using a remote fs, always run locally in a temp dir
         local_output_dir = None if fs is not None else output_dir
-        run_dir = prepare_run_directory(local_output_dir, weather_path)
+        run_dir = prepare_run_directory(local_output_dir, weather_path, scratch_dir)
         idf_path = run_dir / "model.idf"
 
         from ..writers import write_idf
@@ -0,0 +1,303 @@
+"""Runtime-aware ordering and admission for batch simulations.
+
+[simulate_batch][idfkit.simulation.batch.simulate_batch] runs jobs in input
+order by default.  When model sizes vary, a few large models that happen
+to start last leave the batch waiting on a long tail.  A
+[JobScheduler][idfkit.simulation.scheduling.JobScheduler] instead starts the
+longest jobs first, so short jobs fill in around them and the batch
+finishes sooner.
+
+Runtimes are estimated from model features (zones, surfaces, timesteps
+per hour, simulated days).  With a [RuntimeStats][idfkit.simulation.scheduling.RuntimeStats]
+store, observed ``runtime_seconds`` are recorded after every run and
+used for later estimates: an exact match on the feature set when one
+exists, otherwise the features scaled by the observed seconds per unit
+of work.
+
+Optional memory and CPU budgets limit which jobs run at once.  A job that
+does not fit waits while smaller jobs that do fit are started; a job
+larger than the whole budget runs alone.
+
+Examples:
+    ```python
+    from idfkit.simulation import JobScheduler, simulate_batch
+
+    scheduler = JobScheduler("~/.cache/idfkit/runtimes.json", memory_budget=16e9)
+    batch = simulate_batch(jobs, scheduler=scheduler)
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..geometry import VERTEX_SURFACE_TYPES
+
+if TYPE_CHECKING:
+    from .batch import SimulationJob
+    from .result import SimulationResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds per unit of work before any runtime has been observed.  Only the
+# relative size of estimates matters for ordering.
+_DEFAULT_SECONDS_PER_UNIT = 2e-5
+
+# Resident memory of an EnergyPlus process: a fixed base plus a share per
+# heat-transfer surface (view factors, interior radiation exchange).
+_BASE_MEMORY_BYTES = 150e6
+_MEMORY_PER_SURFACE_BYTES = 0.25e6
+
+
+@dataclass(frozen=True, slots=True)
+class ModelFeatures:
+    """Size of a simulation as seen by the scheduler.
+
+    Attributes:
+        zones: Number of ``Zone`` objects.
+        surfaces: Number of surfaces with vertex geometry.
+        timesteps_per_hour: Zone timesteps per hour.
+        days: Simulated days (run periods plus design days).
+    """
+
+    zones: int
+    surfaces: int
+    timesteps_per_hour: int
+    days: int
+
+    @property
+    def work(self) -> float:
+        """Relative amount of work: heat-balance elements times timesteps."""
+        return float((self.zones + self.surfaces) * self.timesteps_per_hour * self.days * 24)
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match runtime history."""
+        return f"{self.zones}:{self.surfaces}:{self.timesteps_per_hour}:{self.days}"
+
+    @classmethod
+    def from_job(cls, job: SimulationJob) -> ModelFeatures:
+        """Extract features from a job's model and run options."""
+        model: Any = job.model
+        try:
+            zones = len(model["Zone"])
+            surfaces = sum(len(model[stype]) for stype in VERTEX_SURFACE_TYPES)
+            timesteps = _timesteps_per_hour(model)
+            design_days = len(model["SizingPeriod:DesignDay"])
+            run_days = _run_period_days(model)
+        except (TypeError, KeyError, AttributeError):
+            # Not an IDFDocument; treat it as a small model
+            return cls(zones=1, surfaces=0, timesteps_per_hour=4, days=1)
+        if job.design_day:
+            days = design_days
+        elif job.annual:
+            days = 365
+        else:
+            days = run_days + design_days
+        return cls(zones=zones, surfaces=surfaces, timesteps_per_hour=timesteps, days=max(days, 1))
+
+
+def _timesteps_per_hour(model: Any) -> int:
+    for timestep in model["Timestep"]:
+        value = timestep.number_of_timesteps_per_hour
+        if isinstance(value, int | float) and value > 0:
+            return int(value)
+    return 4  # EnergyPlus default when Timestep is absent
+
+
+def _run_period_days(model: Any) -> int:
+    total = 0
+    for period in model["RunPeriod"]:
+        try:
+            # A leap year, so Feb 29 end dates are valid
+            begin = date(2024, int(period.begin_month), int(period.begin_day_of_month))
+            end = date(2024, int(period.end_month), int(period.end_day_of_month))
+        except (TypeError, ValueError):
+            total += 365
+            continue
+        days = (end - begin).days + 1
+        total += days if days > 0 else days + 366
+    return total
+
+
+@dataclass(frozen=True, slots=True)
+class JobEstimate:
+    """Predicted resource use of a job.
+
+    Attributes:
+        runtime_seconds: Predicted wall-clock runtime.
+        memory_bytes: Predicted peak memory.
+        cpus: CPU cores the job occupies (from ``-j``/``--jobs`` in
+            ``extra_args``, otherwise 1).
+        features: The model features the estimate was derived from.
+    """
+
+    runtime_seconds: float
+    memory_bytes: float
+    cpus: int
+    features: ModelFeatures
+
+
+class RuntimeStats:
+    """Observed runtimes, persisted as a JSON file.
+
+    Entries are keyed by [ModelFeatures.key][idfkit.simulation.scheduling.ModelFeatures.key].
+    The store is safe to share between threads; the file is rewritten
+    atomically by [save][idfkit.simulation.scheduling.RuntimeStats.save].
+
+    Args:
+        path: JSON file to load from and save to.  ``None`` keeps the
+            history in memory only.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self._path = Path(path).expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        # key -> [total runtime, count, work]
+        self._entries: dict[str, list[float]] = {}
+        if self._path is not None and self._path.is_file():
+            try:
+                self._entries = json.loads(self._path.read_text(encoding="utf-8"))["entries"]
+            except (OSError, ValueError, KeyError):
+                logger.warning("Ignoring unreadable runtime stats at %s", self._path)
+
+    @property
+    def path(self) -> Path | None:
+        """JSON file backing the store, if any."""
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, features: ModelFeatures, runtime_seconds: float) -> None:
+        """Add an observed runtime."""
+        with self._lock:
+            entry = self._entries.setdefault(features.key, [0.0, 0, features.work])
+            entry[0] += runtime_seconds
+            entry[1] += 1
+
+    def estimate(self, features: ModelFeatures) -> float:
+        """Predict the runtime of a model with *features*."""
+        with self._lock:
+            entry = self._entries.get(features.key)
+            if entry is not None:
+                return entry[0] / entry[1]
+            runtime = sum(e[0] for e in self._entries.values())
+            work = sum(e[2] * e[1] for e in self._entries.values())
+        rate = runtime / work if runtime > 0 and work > 0 else _DEFAULT_SECONDS_PER_UNIT
+        return features.work * rate
+
+    def save(self) -> None:
+        """Write the history to :attr:`path` (no-op for in-memory stores)."""
+        if self._path is None:
+            return
+        with self._lock:
+            payload = json.dumps({"version": 1, "entries": self._entries})
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        Path(tmp).replace(self._path)
+
+
+class JobScheduler:
+    """Longest-job-first ordering with optional resource budgets.
+
+    Pass to [simulate_batch][idfkit.simulation.batch.simulate_batch] as
+    ``scheduler=``.
+
+    Args:
+        stats: Runtime history used for estimates and updated after each
+            successful run: a [RuntimeStats][idfkit.simulation.scheduling.RuntimeStats],
+            or a path to its JSON file.  ``None`` estimates from model
+            features alone.
+        memory_budget: Bytes of memory the running jobs may use together.
+        cpu_budget: CPU cores the running jobs may use together.
+    """
+
+    def __init__(
+        self,
+        stats: RuntimeStats | str | Path | None = None,
+        *,
+        memory_budget: float | None = None,
+        cpu_budget: float | None = None,
+    ) -> None:
+        self.stats = stats if isinstance(stats, RuntimeStats) else RuntimeStats(stats)
+        self.memory_budget = memory_budget
+        self.cpu_budget = cpu_budget
+
+    def estimate(self, job: SimulationJob) -> JobEstimate:
+        """Predict the runtime, memory and CPU use of *job*."""
+        features = ModelFeatures.from_job(job)
+        return JobEstimate(
+            runtime_seconds=self.stats.estimate(features),
+            memory_bytes=_BASE_MEMORY_BYTES + features.surfaces * _MEMORY_PER_SURFACE_BYTES,
+            cpus=_requested_cpus(job.extra_args),
+            features=features,
+        )
+
+    def plan(self, jobs: Sequence[SimulationJob]) -> SchedulePlan:
+        """Estimate *jobs* and return their dispatch plan."""
+        return SchedulePlan(self, [self.estimate(job) for job in jobs])
+
+    def record(self, estimate: JobEstimate, result: SimulationResult) -> None:
+        """Add a finished job to the runtime history."""
+        if result.success and result.runtime_seconds > 0:
+            self.stats.record(estimate.features, result.runtime_seconds)
+
+
+def _requested_cpus(extra_args: tuple[str, ...] | None) -> int:
+    args = list(extra_args or ())
+    for i, arg in enumerate(args):
+        value = None
+        if arg in ("-j", "--jobs") and i + 1 < len(args):
+            value = args[i + 1]
+        elif arg.startswith("--jobs="):
+            value = arg.partition("=")[2]
+        if value is not None and value.isdigit():
+            return max(int(value), 1)
+    return 1
+
+
+class SchedulePlan:
+    """Dispatch state for one batch: job order and budget accounting.
+
+    Attributes:
+        order: Job indices, longest estimated runtime first.
+        estimates: Per-job estimates, in input order.
+    """
+
+    def __init__(self, scheduler: JobScheduler, estimates: list[JobEstimate]) -> None:
+        self.scheduler = scheduler
+        self.estimates = estimates
+        self.order = sorted(range(len(estimates)), key=lambda i: -estimates[i].runtime_seconds)
+        self._memory = 0.0
+        self._cpus = 0.0
+
+    def admit(self, index: int, *, idle: bool) -> bool:
+        """Reserve resources for job *index* if they fit (or nothing is running)."""
+        estimate = self.estimates[index]
+        fits = (
+            self.scheduler.memory_budget is None or self._memory + estimate.memory_bytes <= self.scheduler.memory_budget
+        ) and (self.scheduler.cpu_budget is None or self._cpus + estimate.cpus <= self.scheduler.cpu_budget)
+        if not (fits or idle):
+            return False
+        self._memory += estimate.memory_bytes
+        self._cpus += estimate.cpus
+        return True
+
+    def release(self, index: int, result: SimulationResult) -> None:
+        """Return job *index*'s resources and record its runtime."""
+        estimate = self.estimates[index]
+        self._memory -= estimate.memory_bytes
+        self._cpus -= estimate.cpus
+        self.scheduler.record(estimate, result)
@@ -0,0 +1,592 @@
+"""
+In-process EnergyPlus version upgrades.
+
+[upgrade][idfkit.transition.upgrade] moves an
+[IDFDocument][idfkit.document.IDFDocument] to a newer EnergyPlus version
+without running the external transition programs.  Each version hop is
+driven by the bundled schema diff (see [idfkit.compat][idfkit.compat])
+plus a small set of transition rules:
+
+- Fields whose name changed in place (same position, same field count --
+  which is how IDF files are read) are renamed automatically.
+- Object-type renames, field renames and removals that the diff cannot
+  infer, and remaps for removed choice values, come from registered
+  rules (see [register_transition][idfkit.transition.register_transition]).
+- Anything the rules do not cover is reported as an
+  [UpgradeIssue][idfkit.transition.UpgradeIssue] instead of being guessed.
+
+Hop plans are compiled once per process, and every object is rewritten
+in a single pass across all hops, so upgrading a model costs about as
+much as copying it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .compat._checker import _get_index, resolve_version  # pyright: ignore[reportPrivateUsage]
+from .document import IDFDocument
+from .objects import IDFObject
+from .references import CompactReferenceGraph
+from .schema import get_schema
+from .versions import ENERGYPLUS_VERSIONS, LATEST_VERSION, version_string
+
+if TYPE_CHECKING:
+    from .compat._diff import SchemaIndex
+    from .schema import EpJSONSchema
+
+logger = logging.getLogger(__name__)
+
+Version = tuple[int, int, int]
+
+
+# ---------------------------------------------------------------------------
+# Transition rules
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class RenameObjectType:
+    """
+    Rename an object type.
+
+    Attributes:
+        old: Object type in the older version
+        new: Object type in the newer version
+    """
+
+    old: str
+    new: str
+
+
+@dataclass(frozen=True, slots=True)
+class RenameField:
+    """
+    Rename a field of an object type.
+
+    Attributes:
+        obj_type: Object type in the older version
+        old: Field name in the older version
+        new: Field name in the newer version
+    """
+
+    obj_type: str
+    old: str
+    new: str
+
+
+@dataclass(frozen=True, slots=True)
+class RemoveField:
+    """
+    Drop a field of an object type without reporting it.
+
+    Attributes:
+        obj_type: Object type in the older version
+        field: Field name in the older version
+    """
+
+    obj_type: str
+    field: str
+
+
+@dataclass(frozen=True, slots=True)
+class RemapChoice:
+    """
+    Replace choice values that no longer exist in the newer version.
+
+    Keys are matched case-insensitively.  The mapping only applies to
+    values the newer schema no longer accepts for that field.
+
+    Attributes:
+        mapping: Old choice value to new choice value
+        obj_type: Restrict the remap to one object type (older-version
+            name); ``None`` applies it to every type
+        field: Restrict the remap to one field (older-version name);
+            ``None`` applies it to every field
+    """
+
+    mapping: Mapping[str, str]
+    obj_type: str | None = None
+    field: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TransformObject:
+    """
+    Run a custom transformation on every object of a type.
+
+    The function receives the object name and its field data (already
+    using newer-version field names) and edits the data in place.
+
+    Attributes:
+        obj_type: Object type in the older version
+        func: ``func(name, data) -> None``
+    """
+
+    obj_type: str
+    func: Callable[[str, dict[str, Any]], None]
+
+
+TransitionRule = RenameObjectType | RenameField | RemoveField | RemapChoice | TransformObject
+
+# (from_version, to_version) -> rules, for consecutive bundled versions
+_transitions: dict[tuple[Version, Version], list[TransitionRule]] = {}
+
+
+def register_transition(from_version: Version, to_version: Version, rules: Iterable[TransitionRule]) -> None:
+    """
+    Register transition rules for one version hop.
+
+    Rules add to the ones already registered for the hop (including the
+    built-in rules).
+
+    Args:
+        from_version: Older version
+        to_version: The bundled version directly after *from_version*
+        rules: Rules to register
+
+    Raises:
+        ValueError: If the versions are not consecutive bundled versions
+
+    Examples:
+        >>> register_transition((24, 1, 0), (25, 1, 0), [])
+        Traceback (most recent call last):
+        ...
+        ValueError: No direct transition from 24.1.0 to 25.1.0
+    """
+    if from_version not in ENERGYPLUS_VERSIONS or _next_version(from_version) != to_version:
+        msg = f"No direct transition from {version_string(from_version)} to {version_string(to_version)}"
+        raise ValueError(msg)
+    _transitions.setdefault((from_version, to_version), []).extend(rules)
+    _plan_cache.clear()
+
+
+def get_transition_rules(from_version: Version, to_version: Version) -> list[TransitionRule]:
+    """Return the rules registered for one version hop."""
+    return list(_transitions.get((from_version, to_version), ()))
+
+
+def _next_version(version: Version) -> Version | None:
+    idx = ENERGYPLUS_VERSIONS.index(version)
+    return ENERGYPLUS_VERSIONS[idx + 1] if idx + 1 < len(ENERGYPLUS_VERSIONS) else None
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeIssue:
+    """
+    Something an upgrade could not carry over faithfully.
+
+    Attributes:
+        code: ``U001`` (object type removed, object dropped), ``U002``
+            (choice value removed, value kept) or ``U003`` (field removed,
+            value dropped)
+        obj_type: Object type in the version where the issue arose
+        obj_name: Object name
+        field: Field name, if the issue concerns a single field
+        message: Human-readable description
+    """
+
+    code: str
+    obj_type: str
+    obj_name: str
+    field: str | None
+    message: str
+
+    def __str__(self) -> str:
+        location = f"{self.obj_type}:'{self.obj_name}'"
+        if self.field:
+            location += f".{self.field}"
+        return f"[{self.code}] {location}: {self.message}"
+
+
+@dataclass
+class UpgradeResult:
+    """
+    Result of [upgrade][idfkit.transition.upgrade].
+
+    Attributes:
+        document: The upgraded document (the input is left unchanged)
+        from_version: Version of the input document
+        to_version: Version of the upgraded document
+        issues: Changes that could not be carried over faithfully
+    """
+
+    document: IDFDocument[bool]
+    from_version: Version
+    to_version: Version
+    issues: list[UpgradeIssue] = field(default_factory=lambda: [])
+
+    @property
+    def is_lossless(self) -> bool:
+        """True if every object and value was carried over."""
+        return not self.issues
+
+    def __str__(self) -> str:
+        return (
+            f"UpgradeResult({version_string(self.from_version)} -> {version_string(self.to_version)}, "
+            f"{len(self.document)} objects, {len(self.issues)} issues)"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Hop plans
+# ---------------------------------------------------------------------------
+
+
+class _TypePlan:
+    """What one hop does to the objects of one (older-version) type."""
+
+    __slots__ = ("choices", "fields", "from_type", "removed", "to_type", "transforms", "version")
+
+    def __init__(self, from_type: str, to_type: str | None, version: Version) -> None:
+        self.from_type = from_type
+        self.to_type = to_type
+        self.version = version
+        # (old field, new field); applied in order
+        self.fields: list[tuple[str, str]] = []
+        # Fields dropped silently by RemoveField rules
+        self.removed: list[str] = []
+        # (field, remap keyed by lowercase value, lowercase values the newer version rejects)
+        self.choices: list[tuple[str, dict[str, str], frozenset[str]]] = []
+        self.transforms: list[Callable[[str, dict[str, Any]], None]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.to_type != self.from_type or self.fields or self.removed or self.choices or self.transforms)
+
+
+# (from_version, to_version) -> {older-version type: plan}, types that need no work omitted
+_plan_cache: dict[tuple[Version, Version], dict[str, _TypePlan]] = {}
+
+
+def _hop_plan(from_version: Version, to_version: Version) -> dict[str, _TypePlan]:
+    key = (from_version, to_version)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        plan = _compile_hop(_get_index(from_version), _get_index(to_version), _transitions.get(key, []))
+        _plan_cache[key] = plan
+    return plan
+
+
+def _field_map(
+    from_fields: tuple[str, ...],
+    to_fields: tuple[str, ...],
+    renames: dict[str, str],
+    removed: set[str],
+    to_extensible: tuple[str, ...] = (),
+) -> dict[str, str | None]:
+    """Map each field that disappears to its new name (``None`` when it has none).
+
+    *to_extensible* names the newer version's extensible group when
+    trailing fields of the older version were folded into one.
+    """
+    to_set = set(to_fields)
+    from_set = set(from_fields)
+    positional = len(from_fields) == len(to_fields) or bool(to_extensible)
+    mapping: dict[str, str | None] = {}
+    for i, name in enumerate(from_fields):
+        if name in renames:
+            mapping[name] = renames[name]
+        elif name in removed or name in to_set:
+            continue
+        elif positional and i < len(to_fields) and to_fields[i] not in from_set:
+            # IDF fields are positional, so an in-place name change is a rename
+            mapping[name] = to_fields[i]
+        elif to_extensible and i >= len(to_fields):
+            # Trailing fields folded into an extensible group keep their position
+            group, k = divmod(i - len(to_fields), len(to_extensible))
+            target = to_extensible[k] if group == 0 else f"{to_extensible[k]}_{group + 1}"
+            if target != name:
+                mapping[name] = target
+        else:
+            mapping[name] = None
+    # Renames of fields the older schema does not list (e.g. extensible fields)
+    for name, new in renames.items():
+        mapping.setdefault(name, new)
+    return mapping
+
+
+def _folded_group(from_version: Version, from_type: str, to_version: Version, to_type: str) -> tuple[str, ...]:
+    """Extensible group names of *to_type*, if it turned trailing fields of *from_type* into one."""
+    to_cache = get_schema(to_version).get_parsing_cache(to_type)
+    if to_cache is None or not to_cache.ext_field_names:
+        return ()
+    from_cache = get_schema(from_version).get_parsing_cache(from_type)
+    if from_cache is not None and from_cache.extensible:
+        return ()
+    return to_cache.ext_field_names
+
+
+def _choice_remaps(
+    plan: _TypePlan,
+    from_index: SchemaIndex,
+    to_index: SchemaIndex,
+    mapping: dict[str, str | None],
+    remaps: list[RemapChoice],
+) -> None:
+    """Record, per choice field, the values the newer version rejects and how to remap them."""
+    from_type = plan.from_type
+    for (obj_type, name), values in from_index.choices.items():
+        if obj_type != from_type:
+            continue
+        target = mapping.get(name, name)
+        to_values = to_index.choices.get((plan.to_type or "", target or ""))
+        if to_values is None:
+            continue
+        stale = frozenset(v.lower() for v in values) - {v.lower() for v in to_values}
+        if not stale:
+            continue
+        remap: dict[str, str] = {}
+        for rule in remaps:
+            if rule.obj_type not in (None, from_type) or rule.field not in (None, name):
+                continue
+            for old, new in rule.mapping.items():
+                if old.lower() in stale:
+                    remap.setdefault(old.lower(), new)
+        plan.choices.append((name, remap, stale))
+
+
+def _compile_hop(from_index: SchemaIndex, to_index: SchemaIndex, rules: list[TransitionRule]) -> dict[str, _TypePlan]:
+    """Turn a schema diff plus transition rules into per-type plans."""
+    type_renames = {r.old: r.new for r in rules if isinstance(r, RenameObjectType)}
+    remaps = [r for r in rules if isinstance(r, RemapChoice)]
+
+    plans: dict[str, _TypePlan] = {}
+    for from_type in from_index.object_types:
+        to_type = type_renames.get(from_type, from_type)
+        if to_type not in to_index.object_types:
+            plans[from_type] = _TypePlan(from_type, None, from_index.version)
+            continue
+        plan = _TypePlan(from_type, to_type, from_index.version)
+        renames = {r.old: r.new for r in rules if isinstance(r, RenameField) and r.obj_type == from_type}
+        removed = {r.field for r in rules if isinstance(r, RemoveField) and r.obj_type == from_type}
+        from_fields = from_index.fields.get(from_type, ())
+        to_fields = to_index.fields.get(to_type, ())
+        to_extensible: tuple[str, ...] = ()
+        if len(from_fields) > len(to_fields):
+            to_extensible = _folded_group(from_index.version, from_type, to_index.version, to_type)
+        mapping = _field_map(from_fields, to_fields, renames, removed, to_extensible)
+        _choice_remaps(plan, from_index, to_index, mapping, remaps)
+        # Values are moved out first so renames that swap or chain do not collide
+        plan.fields = [(old, new or "") for old, new in mapping.items()]
+        plan.removed = sorted(removed)
+        plan.transforms = [r.func for r in rules if isinstance(r, TransformObject) and r.obj_type == from_type]
+        if plan:
+            plans[from_type] = plan
+    return plans
+
+
+# ---------------------------------------------------------------------------
+# Upgrading
+# ---------------------------------------------------------------------------
+
+
+def _remap_choices(plan: _TypePlan, name: str, data: dict[str, Any], issues: list[UpgradeIssue]) -> None:
+    for field_name, remap, stale in plan.choices:
+        value = data.get(field_name)
+        if not isinstance(value, str) or not value:
+            continue
+        key = value.lower()
+        if key in remap:
+            data[field_name] = remap[key]
+        elif key in stale:
+            msg = f"Choice '{value}' is not available after {version_string(plan.version)}; value kept"
+            issues.append(UpgradeIssue("U002", plan.from_type, name, field_name, msg))
+
+
+def _move_fields(plan: _TypePlan, name: str, data: dict[str, Any], issues: list[UpgradeIssue]) -> None:
+    moved: list[tuple[str, Any]] = []
+    for old, new in plan.fields:
+        if old not in data:
+            continue
+        value = data.pop(old)
+        if new:
+            moved.append((new, value))
+        elif value is not None and value != "":
+            msg = f"Field was removed after {version_string(plan.version)}; value {value!r} dropped"
+            issues.append(UpgradeIssue("U003", plan.from_type, name, old, msg))
+    data.update(moved)
+
+
+def _apply_plan(plan: _TypePlan, name: str, data: dict[str, Any], issues: list[UpgradeIssue]) -> None:
+    """Rewrite one object's data for one hop."""
+    if plan.choices:
+        _remap_choices(plan, name, data, issues)
+    if plan.fields:
+        _move_fields(plan, name, data, issues)
+    for field_name in plan.removed:
+        data.pop(field_name, None)
+    for func in plan.transforms:
+        func(name, data)
+
+
+class _TargetType:
+    """Per-type construction details in the target schema."""
+
+    __slots__ = ("base_order", "object_class", "parsing_cache", "ref_fields", "schema")
+
+    def __init__(self, schema: EpJSONSchema, obj_type: str) -> None:
+        self.schema = schema.get_object_schema(obj_type)
+        self.base_order: list[str] | None = None
+        self.ref_fields: frozenset[str] | None = None
+        self.parsing_cache = schema.get_parsing_cache(obj_type)
+        self.object_class: type[IDFObject] = IDFObject
+        if self.schema is not None:
+            if schema.has_name(obj_type):
+                self.base_order = schema.get_field_names(obj_type)
+            else:
+                self.base_order = schema.get_all_field_names(obj_type)
+            self.ref_fields = IDFDocument._compute_ref_fields(schema, obj_type)  # pyright: ignore[reportPrivateUsage]
+        if self.parsing_cache is not None:
+            self.object_class = self.parsing_cache.object_class
+
+
+def _hops(from_version: Version, to_version: Version) -> list[tuple[Version, Version]]:
+    start = ENERGYPLUS_VERSIONS.index(from_version)
+    stop = ENERGYPLUS_VERSIONS.index(to_version)
+    return list(zip(ENERGYPLUS_VERSIONS[start:stop], ENERGYPLUS_VERSIONS[start + 1 : stop + 1], strict=True))
+
+
+def upgrade(doc: IDFDocument[bool], to_version: Version = LATEST_VERSION) -> UpgradeResult:
+    """
+    Upgrade *doc* to a newer EnergyPlus version, in process.
+
+    The document is moved through every bundled version between its own
+    version and *to_version*, applying the schema-diff field mapping and
+    the registered transition rules for each hop.  The input document is
+    not modified.
+
+    Args:
+        doc: Document to upgrade
+        to_version: Target version (defaults to the latest bundled version)
+
+    Returns:
+        An [UpgradeResult][idfkit.transition.UpgradeResult] holding the new
+        document and any issues
+
+    Raises:
+        ValueError: If *to_version* is older than the document, or either
+            version has no bundled schema
+
+    Examples:
+        Move a 22.1 model to 22.2, where infiltration objects can point
+        at spaces:
+
+        >>> from idfkit import new_document
+        >>> model = new_document(version=(22, 1, 0))
+        >>> _ = model.add("Zone", "Office")
+        >>> _ = model.add("ZoneInfiltration:DesignFlowRate", "Office Infil",
+        ...     zone_or_zonelist_name="Office", validate=False)
+        >>> result = upgrade(model, (22, 2, 0))
+        >>> result.document.version
+        (22, 2, 0)
+        >>> infil = result.document["ZoneInfiltration:DesignFlowRate"]["Office Infil"]
+        >>> infil.zone_or_zonelist_or_space_or_spacelist_name
+        'Office'
+        >>> result.is_lossless
+        True
+    """
+    from_version = resolve_version(doc.version)  # pyright: ignore[reportArgumentType]  # stub types .version as the Version collection
+    to_version = resolve_version(to_version)
+    if to_version < from_version:
+        msg = f"Cannot downgrade from {version_string(from_version)} to {version_string(to_version)}"
+        raise ValueError(msg)
+
+    plans = [_hop_plan(a, b) for a, b in _hops(from_version, to_version)]
+    schema = get_schema(to_version)
+    new_doc: IDFDocument[bool] = IDFDocument(  # type: ignore[reportCallIssue]  # .pyi uses covariant Strict
+        version=to_version,
+        schema=schema,
+        filepath=doc.filepath,
+        strict=doc.strict,
+        compact_references=isinstance(object.__getattribute__(doc, "_references"), CompactReferenceGraph),
+    )
+    result = UpgradeResult(new_doc, from_version, to_version)
+    issues = result.issues
+    targets: dict[str, _TargetType] = {}
+    build_order = IDFDocument._build_field_order_for_add  # pyright: ignore[reportPrivateUsage, reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+
+    for obj in doc.all_objects:
+        obj_type = obj.obj_type
+        name = obj.name
+        data = dict(obj.data)
+        for hop in plans:
+            plan = hop.get(obj_type)
+            if plan is None:
+                continue
+            if plan.to_type is None:
+                msg = f"Object type was removed after {version_string(plan.version)}; object dropped"
+                issues.append(UpgradeIssue("U001", obj_type, name, None, msg))
+                break
+            _apply_plan(plan, name, data, issues)
+            obj_type = plan.to_type
+        else:
+            if obj_type == "Version":
+                data["version_identifier"] = f"{to_version[0]}.{to_version[1]}"
+            target = targets.get(obj_type)
+            if target is None:
+                target = targets[obj_type] = _TargetType(schema, obj_type)
+            new_obj = target.object_class(
+                obj_type=obj_type,
+                name=name,
+                data=data,
+                schema=target.schema,
+                document=new_doc,
+                field_order=build_order(target.base_order, data, target.parsing_cache),  # pyright: ignore[reportUnknownArgumentType]
+                ref_fields=target.ref_fields,
+            )
+            new_doc.addidfobject(new_obj)
+
+    logger.debug(
+        "Upgraded document from %s to %s (%d hops, %d issues)",
+        version_string(from_version),
+        version_string(to_version),
+        len(plans),
+        len(issues),
+    )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Built-in rules
+# ---------------------------------------------------------------------------
+
+_DX_FAN_POWER_FIELDS: dict[str, list[str]] = {
+    "Coil:Cooling:DX:SingleSpeed": ["rated_evaporator_fan_power_per_volume_flow_rate"],
+    "Coil:Cooling:DX:CurveFit:Speed": ["rated_evaporator_fan_power_per_volume_flow_rate"],
+    "Coil:Heating:DX:SingleSpeed": ["rated_supply_fan_power_per_volume_flow_rate"],
+    "Coil:Cooling:DX:MultiSpeed": [f"speed_{i}_rated_evaporator_fan_power_per_volume_flow_rate" for i in range(1, 5)],
+    "Coil:Heating:DX:MultiSpeed": [f"speed_{i}_rated_supply_air_fan_power_per_volume_flow_rate" for i in range(1, 5)],
+}
+
+register_transition(
+    (22, 1, 0),
+    (22, 2, 0),
+    [
+        # 22.2 split rated fan power into 2017 and 2023 rating standards
+        *(
+            RenameField(obj_type, name, f"2017_{name}")
+            for obj_type, names in _DX_FAN_POWER_FIELDS.items()
+            for name in names
+        ),
+        RemoveField("FuelFactors", "units_of_measure"),
+        RemoveField("FuelFactors", "energy_per_unit_factor"),
+    ],
+)
+
+register_transition(
+    (23, 1, 0),
+    (23, 2, 0),
+    [
+        RenameObjectType("DistrictHeating", "DistrictHeating:Water"),
+        RemapChoice({"DistrictHeating": "DistrictHeatingWater", "Steam": "DistrictHeatingSteam"}),
+        RenameField("Boiler:HotWater", "parasitic_electric_load", "on_cycle_parasitic_electric_load"),
+    ],
+)
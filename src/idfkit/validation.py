@@ -8,8 +8,12 @@ eager validation during parsing.
 from __future__ import annotations
 
 import logging
+import operator
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from itertools import repeat
 from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
@@ -17,6 +21,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from .document import IDFDocument
     from .objects import IDFObject
+    from .references import ReferenceGraph
     from .schema import EpJSONSchema
 
 
@@ -102,6 +107,7 @@ def validate_document(  # noqa: C901
     check_ranges: bool = True,
     check_singletons: bool = True,
     object_types: list[str] | None = None,
+    workers: int | None = None,
 ) -> ValidationResult:
     """
     Validate an IDF document against schema.
@@ -115,6 +121,14 @@ def validate_document(  # noqa: C901
         check_ranges: Check numeric ranges
         check_singletons: Check singleton (maxProperties) constraints
         object_types: Only validate these types (None = all)
+        workers: Run the field checks in this many worker processes.
+            Object types are sharded across a process pool; each worker
+            loads the schema once and receives only the objects' names
+            and field data.  Reference and singleton checks still run in
+            this process, and the result is identical to (and ordered
+            like) a serial run.  Worth it for very large documents only:
+            starting the pool and loading the schema in each worker
+            costs far more than validating a typical model.
 
     Returns:
         ValidationResult with all issues found
@@ -145,16 +159,7 @@ def validate_document(  # noqa: C901
     info: list[ValidationError] = []
 
     if schema is None:
-        warnings.append(
-            ValidationError(
-                severity=Severity.WARNING,
-                obj_type="Document",
-                obj_name="",
-                field=None,
-                message="No schema available - skipping schema validation",
-                code="W001",
-            )
-        )
+        warnings.append(_no_schema_warning())
         return ValidationResult(errors, warnings, info)
 
     # Determine which object types to validate
@@ -163,47 +168,24 @@ def validate_document(  # noqa: C901
 
     # Check singleton (maxProperties) constraints
     if check_singletons:
-        for obj_type in types_to_check:
-            if obj_type not in doc.collections:
-                continue
-            obj_schema = schema.get_object_schema(obj_type)
-            if obj_schema and obj_schema.get("maxProperties") == 1:
-                coll = doc.get_collection(obj_type)
-                count = len(coll)
-                if count > 1:
-                    first = coll.first()
-                    obj_name = first.name if first and first.name else obj_type
-                    errors.append(
-                        ValidationError(
-                            severity=Severity.ERROR,
-                            obj_type=obj_type,
-                            obj_name=obj_name,
-                            field=None,
-                            message=f"Singleton type '{obj_type}' has {count} instances (maximum 1 allowed)",
-                            code="E010",
-                        )
-                    )
-
-    for obj_type in types_to_check:
-        if obj_type not in doc.collections:
-            continue
-
-        for obj in doc.get_collection(obj_type):
-            obj_errors = _validate_object(
-                obj,
-                schema,
-                check_required=check_required,
-                check_types=check_types,
-                check_ranges=check_ranges,
-            )
-
-            for err in obj_errors:
-                if err.severity == Severity.ERROR:
-                    errors.append(err)
-                elif err.severity == Severity.WARNING:
-                    warnings.append(err)
-                else:
-                    info.append(err)
+        errors.extend(_singleton_errors(doc, schema, types_to_check))
+
+    field_checks = (check_required, check_types, check_ranges)
+    if workers is not None and workers > 1:
+        issues = _field_issues_parallel(doc, schema, types_to_check, field_checks, workers)
+    else:
+        issues = _field_issues(
+            schema,
+            ((t, doc.get_collection(t)) for t in types_to_check if t in doc.collections),
+            field_checks,
+        )
+    for err in issues:
+        if err.severity == Severity.ERROR:
+            errors.append(err)
+        elif err.severity == Severity.WARNING:
+            warnings.append(err)
+        else:
+            info.append(err)
 
     # Check reference integrity
     if check_references:
@@ -224,6 +206,151 @@ def validate_document(  # noqa: C901
     return result
 
 
+def _field_issues(
+    schema: EpJSONSchema,
+    objects_by_type: Iterable[tuple[str, Iterable[IDFObject]]],
+    field_checks: tuple[bool, bool, bool],
+) -> list[ValidationError]:
+    """Run the per-object field checks over *objects_by_type*, in order."""
+    check_required, check_types, check_ranges = field_checks
+    issues: list[ValidationError] = []
+    for obj_type, objects in objects_by_type:
+        # Compiled once per type (and cached on the schema), then run over every object
+        validator = schema.get_validator(obj_type)
+        for obj in objects:
+            if validator is None:
+                issues.append(_unknown_type_error(obj))
+            else:
+                issues.extend(
+                    validator.validate(
+                        obj,
+                        check_required=check_required,
+                        check_types=check_types,
+                        check_ranges=check_ranges,
+                    )
+                )
+    return issues
+
+
+def _result_from_parse(  # pyright: ignore[reportUnusedFunction]  # used by the IDF parser
+    doc: IDFDocument,
+    schema: EpJSONSchema,
+    issues_by_type: dict[str, list[ValidationError]],
+) -> ValidationResult:
+    """
+    Complete the validation of a freshly parsed document.
+
+    *issues_by_type* holds the field-level issues the parser collected
+    while coercing values; only object types it did not see (e.g. the
+    Version object) are field-checked here.  Singleton and reference
+    checks run as in [validate_document][idfkit.validation.validate_document],
+    and the result is ordered the same way.
+    """
+    collections = doc.collections
+    issues = _singleton_errors(doc, schema, collections)
+    for obj_type, collection in collections.items():
+        type_issues = issues_by_type.get(obj_type)
+        if type_issues is None:
+            type_issues = _field_issues(schema, [(obj_type, collection)], (True, True, True))
+        issues.extend(type_issues)
+    issues.extend(_validate_references(doc, schema))
+
+    errors: list[ValidationError] = []
+    warnings: list[ValidationError] = []
+    info: list[ValidationError] = []
+    for err in issues:
+        if err.severity == Severity.ERROR:
+            errors.append(err)
+        elif err.severity == Severity.WARNING:
+            warnings.append(err)
+        else:
+            info.append(err)
+    return ValidationResult(errors, warnings, info)
+
+
+# Schema of the current worker process, set by _init_worker
+_worker_schema: EpJSONSchema | None = None
+
+# Object type and the (name, data) rows of its objects
+_Shard = list[tuple[str, list[tuple[str, dict[str, Any]]]]]
+
+
+def _init_worker(schema: EpJSONSchema | tuple[int, int, int]) -> None:
+    """Load the schema once per worker (by version when it is a bundled one)."""
+    global _worker_schema
+    if isinstance(schema, tuple):
+        from .schema import get_schema
+
+        schema = get_schema(schema)
+    _worker_schema = schema
+
+
+def _validate_shard(shard: _Shard, field_checks: tuple[bool, bool, bool]) -> list[tuple[str, list[ValidationError]]]:
+    """Worker entry point: validate every object type of one shard."""
+    from .objects import IDFObject
+
+    schema = _worker_schema
+    if schema is None:
+        msg = "Validation worker was not initialized"
+        raise RuntimeError(msg)
+    return [
+        (obj_type, _field_issues(schema, [(obj_type, [IDFObject(obj_type, n, d) for n, d in rows])], field_checks))
+        for obj_type, rows in shard
+    ]
+
+
+def _shard_types(sizes: dict[str, int], num_shards: int) -> list[list[str]]:
+    """Split object types into at most *num_shards* groups of similar object counts (largest first)."""
+    shards: list[list[str]] = [[] for _ in range(num_shards)]
+    loads = [0] * num_shards
+    for obj_type in sorted(sizes, key=lambda t: sizes[t], reverse=True):
+        i = loads.index(min(loads))
+        shards[i].append(obj_type)
+        loads[i] += sizes[obj_type]
+    return [shard for shard in shards if shard]
+
+
+def _schema_handle(schema: EpJSONSchema) -> EpJSONSchema | tuple[int, int, int]:
+    """Ship a bundled schema by version so workers load it from disk instead of unpickling it."""
+    from .exceptions import SchemaNotFoundError
+    from .schema import get_schema
+
+    try:
+        if get_schema(schema.version) is schema:
+            return schema.version
+    except SchemaNotFoundError:
+        pass
+    return schema
+
+
+def _field_issues_parallel(
+    doc: IDFDocument,
+    schema: EpJSONSchema,
+    types_to_check: list[str],
+    field_checks: tuple[bool, bool, bool],
+    workers: int,
+) -> list[ValidationError]:
+    """Run the field checks in a process pool, sharded by object type, and merge in type order."""
+    collections = doc.collections
+    sizes = {t: len(collections[t]) for t in types_to_check if t in collections}
+    # A few shards per worker keeps the pool busy when type sizes are uneven
+    shards = _shard_types(sizes, workers * 4)
+    if len(shards) < 2:
+        return _field_issues(schema, ((t, collections[t]) for t in sizes), field_checks)
+
+    payloads: list[_Shard] = [
+        [(t, [(obj.name, obj.data) for obj in collections[t]]) for t in shard] for shard in shards
+    ]
+    logger.debug("Validating %d object type(s) in %d shard(s) on %d worker(s)", len(sizes), len(shards), workers)
+    by_type: dict[str, list[ValidationError]] = {}
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(shards)), initializer=_init_worker, initargs=(_schema_handle(schema),)
+    ) as pool:
+        for shard_result in pool.map(_validate_shard, payloads, repeat(field_checks)):
+            by_type.update(shard_result)
+    return [err for t in sizes for err in by_type[t]]
+
+
 def validate_object(
     obj: IDFObject,
     schema: EpJSONSchema,
@@ -270,249 +397,631 @@ def validate_object(
     )
 
 
-def _validate_object(  # noqa: C901
-    obj: IDFObject,
-    schema: EpJSONSchema,
-    check_required: bool = True,
-    check_types: bool = True,
-    check_ranges: bool = True,
-    check_unknown: bool = True,
-) -> list[ValidationError]:
-    """Validate a single object against schema."""
-    errors: list[ValidationError] = []
-    obj_type = obj.obj_type
-    obj_name = obj.name
+class _ObjectEntry:
+    """Cached validation state of one object in a [Validator][idfkit.validation.Validator] session."""
 
-    inner_schema = schema.get_inner_schema(obj_type)
-    if not inner_schema:
-        # Unknown object type
-        errors.append(
-            ValidationError(
-                severity=Severity.WARNING,
-                obj_type=obj_type,
-                obj_name=obj_name,
-                field=None,
-                message=f"Unknown object type '{obj_type}'",
-                code="W002",
-            )
-        )
-        return errors
+    __slots__ = ("issues", "name", "obj", "ref_errors", "refs", "version")
 
-    properties = inner_schema.get("properties", {})
-    required = set(inner_schema.get("required", []))
+    def __init__(self, obj: IDFObject, issues: list[ValidationError], refs: list[tuple[str, str]]) -> None:
+        self.obj = obj
+        self.version = obj.mutation_version
+        self.name = obj.name.upper() if obj.name else ""
+        self.issues = issues
+        # (field_name, target name upper), sorted for a stable error order
+        self.refs = refs
+        self.ref_errors: list[ValidationError] = []
 
-    # Check required fields
-    if check_required:
-        for field_name in required:
-            value = obj.data.get(field_name)
-            if value is None or value == "":
-                errors.append(
-                    ValidationError(
-                        severity=Severity.ERROR,
-                        obj_type=obj_type,
-                        obj_name=obj_name,
-                        field=field_name,
-                        message=f"Required field '{field_name}' is missing",
-                        code="E001",
-                    )
-                )
-
-    # Check field types and ranges
-    for field_name, value in obj.data.items():
-        if value is None or value == "":
-            continue
 
-        field_schema = properties.get(field_name)
-        if not field_schema:
-            # Unknown field - could be extensible or error
-            if check_unknown and not schema.is_extensible(obj_type):
-                errors.append(
-                    ValidationError(
-                        severity=Severity.WARNING,
-                        obj_type=obj_type,
-                        obj_name=obj_name,
-                        field=field_name,
-                        message=f"Unknown field '{field_name}'",
-                        code="W003",
-                    )
-                )
-            continue
-
-        # Check type
-        if check_types:
-            type_errors = _validate_field_type(obj, field_name, value, field_schema)
-            errors.extend(type_errors)
-
-        # Check range
-        if check_ranges and isinstance(value, (int, float)):
-            range_errors = _validate_field_range(obj, field_name, value, field_schema)
-            errors.extend(range_errors)
+class Validator:
+    """
+    Incremental validation session bound to one document.
+
+    The first [validate][idfkit.validation.Validator.validate] call checks
+    every object, like [validate_document][idfkit.validation.validate_document].
+    Later calls only re-run the field checks of objects added or modified
+    since (detected through
+    [mutation_version][idfkit.objects.IDFObject.mutation_version]), drop
+    removed objects, and re-check references only for objects whose
+    reference fields changed or whose targets appeared or disappeared
+    (added, removed or renamed).  This keeps validation cheap in edit loops
+    and parametric generators that touch a handful of objects per step.
+
+    Edits made through the object API (attribute assignment, ``rename``,
+    ``add``, ``removeidfobject``...) are tracked; writing to
+    ``obj.data`` directly bypasses ``mutation_version`` and is not.
 
-    return errors
+    Args:
+        doc: The document to validate
+        schema: Schema to validate against (uses doc's schema if not provided)
+        check_references: Check reference integrity
+        check_required: Check required fields
+        check_types: Check field types
+        check_ranges: Check numeric ranges
+        check_singletons: Check singleton (maxProperties) constraints
 
+    Examples:
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> model.add("Zone", "Office")  # doctest: +ELLIPSIS
+        Zone('Office')
+        >>> validator = Validator(model)
+        >>> validator.validate().is_valid
+        True
+        >>> validator.last_checked == len(model)  # every object on the first pass
+        True
+        >>> model.add("Material", "Brick", roughness="Bumpy", thickness=0.1,
+        ...     conductivity=0.7, density=1900.0, specific_heat=800.0, validate=False)  # doctest: +ELLIPSIS
+        Material('Brick')
+        >>> [err.code for err in validator.validate().errors]
+        ['E004']
+        >>> validator.last_checked  # only the new material
+        1
+    """
 
-def _validate_field_type(
-    obj: IDFObject,
-    field_name: str,
-    value: Any,
-    field_schema: dict[str, Any],
-) -> list[ValidationError]:
-    """Validate field value type."""
-    errors: list[ValidationError] = []
+    __slots__ = (
+        "_doc",
+        "_entries",
+        "_name_counts",
+        "_referrers",
+        "_schema",
+        "check_ranges",
+        "check_references",
+        "check_required",
+        "check_singletons",
+        "check_types",
+        "last_checked",
+    )
 
-    # Handle anyOf (multiple valid types)
-    if "anyOf" in field_schema:
-        valid = False
-        for sub_schema in field_schema["anyOf"]:
-            if _value_matches_type(value, sub_schema):
-                valid = True
-                break
-        if not valid:
-            errors.append(
+    def __init__(
+        self,
+        doc: IDFDocument,
+        schema: EpJSONSchema | None = None,
+        *,
+        check_references: bool = True,
+        check_required: bool = True,
+        check_types: bool = True,
+        check_ranges: bool = True,
+        check_singletons: bool = True,
+    ) -> None:
+        self._doc = doc
+        self._schema = schema or doc.schema
+        self.check_references = check_references
+        self.check_required = check_required
+        self.check_types = check_types
+        self.check_ranges = check_ranges
+        self.check_singletons = check_singletons
+        # Number of objects whose field checks ran on the last validate() call
+        self.last_checked = 0
+        # id(obj) -> entry, in document order as of the last pass
+        self._entries: dict[int, _ObjectEntry] = {}
+        # Upper-case object name -> number of objects with that name
+        self._name_counts: dict[str, int] = {}
+        # Upper-case target name -> ids of objects referencing it
+        self._referrers: dict[str, set[int]] = {}
+
+    def reset(self) -> None:
+        """Drop all cached results; the next validate() checks every object."""
+        self._entries.clear()
+        self._name_counts.clear()
+        self._referrers.clear()
+
+    def validate(self) -> ValidationResult:
+        """
+        Validate the document, re-checking only what changed since the last call.
+
+        Returns:
+            ValidationResult with all issues currently present, in the same
+            form as [validate_document][idfkit.validation.validate_document]
+        """
+        schema = self._schema
+        if schema is None:
+            return ValidationResult([], [_no_schema_warning()], [])
+
+        doc = self._doc
+        old = self._entries
+        entries: dict[int, _ObjectEntry] = {}
+        # Objects whose reference errors must be recomputed, and names that appeared or vanished
+        recheck: set[int] = set()
+        flipped: set[str] = set()
+        graph = doc.references if self.check_references else None
+
+        for obj_type, collection in doc.collections.items():
+            validator = schema.get_validator(obj_type) if collection else None
+            for obj in collection:
+                key = id(obj)
+                entry = old.pop(key, None)
+                if entry is not None:
+                    if entry.version == obj.mutation_version:
+                        entries[key] = entry
+                        continue
+                    self._unindex(key, entry, flipped)
+                entry = self._check(obj, validator, graph)
+                entries[key] = entry
+                self._index(key, entry, flipped)
+                recheck.add(key)
+
+        # Whatever is left in the old cache was removed from the document
+        for key, entry in old.items():
+            self._unindex(key, entry, flipped)
+
+        self.last_checked = len(recheck)
+        self._entries = entries
+        if graph is not None:
+            self._refresh_references(recheck, flipped)
+
+        return self._collect(schema)
+
+    def _check(self, obj: IDFObject, validator: CompiledValidator | None, graph: ReferenceGraph | None) -> _ObjectEntry:
+        if validator is None:
+            issues = [_unknown_type_error(obj)]
+        else:
+            issues = validator.validate(
+                obj,
+                check_required=self.check_required,
+                check_types=self.check_types,
+                check_ranges=self.check_ranges,
+            )
+        refs = sorted((field, target) for target, field in graph.get_references_with_fields(obj)) if graph else []
+        return _ObjectEntry(obj, issues, refs)
+
+    def _index(self, key: int, entry: _ObjectEntry, flipped: set[str]) -> None:
+        name_counts = self._name_counts
+        if entry.name:
+            count = name_counts.get(entry.name, 0)
+            if count == 0:
+                flipped.add(entry.name)
+            name_counts[entry.name] = count + 1
+        referrers = self._referrers
+        for _field, target in entry.refs:
+            referrers.setdefault(target, set()).add(key)
+
+    def _unindex(self, key: int, entry: _ObjectEntry, flipped: set[str]) -> None:
+        name_counts = self._name_counts
+        if entry.name:
+            count = name_counts[entry.name] - 1
+            if count == 0:
+                del name_counts[entry.name]
+                flipped.add(entry.name)
+            else:
+                name_counts[entry.name] = count
+        referrers = self._referrers
+        for _field, target in entry.refs:
+            keys = referrers.get(target)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del referrers[target]
+
+    def _refresh_references(self, recheck: set[int], flipped: set[str]) -> None:
+        """Recompute dangling-reference errors for changed objects and referrers of flipped names."""
+        referrers = self._referrers
+        for name in flipped:
+            keys = referrers.get(name)
+            if keys:
+                recheck |= keys
+        entries = self._entries
+        name_counts = self._name_counts
+        for key in recheck:
+            entry = entries[key]
+            obj = entry.obj
+            entry.ref_errors = [
                 ValidationError(
                     severity=Severity.ERROR,
                     obj_type=obj.obj_type,
                     obj_name=obj.name,
                     field=field_name,
-                    message=f"Value '{value}' does not match any valid type",
-                    code="E002",
+                    message=f"Reference to non-existent object '{target}'",
+                    code="E009",
                 )
-            )
-        return errors
+                for field_name, target in entry.refs
+                if target not in name_counts
+            ]
+
+    def _collect(self, schema: EpJSONSchema) -> ValidationResult:
+        doc = self._doc
+        errors = _singleton_errors(doc, schema, doc.collections) if self.check_singletons else []
+        warnings: list[ValidationError] = []
+        info: list[ValidationError] = []
+        entries = self._entries.values()
+        for entry in entries:
+            for err in entry.issues:
+                if err.severity == Severity.ERROR:
+                    errors.append(err)
+                elif err.severity == Severity.WARNING:
+                    warnings.append(err)
+                else:
+                    info.append(err)
+        if self.check_references:
+            for entry in entries:
+                errors.extend(entry.ref_errors)
+        return ValidationResult(errors, warnings, info)
 
-    # Handle single type
-    expected_type = field_schema.get("type")
-    if expected_type and not _value_matches_type(value, field_schema):
-        errors.append(
-            ValidationError(
-                severity=Severity.ERROR,
-                obj_type=obj.obj_type,
-                obj_name=obj.name,
-                field=field_name,
-                message=f"Expected {expected_type}, got {type(value).__name__}",
-                code="E003",
-            )
-        )
 
-    # Check enum values
-    if "enum" in field_schema and value not in field_schema["enum"]:
-        # Case-insensitive check for strings
-        if isinstance(value, str):
-            enum_lower = [str(e).lower() for e in field_schema["enum"]]
-            if value.lower() not in enum_lower:
+def _no_schema_warning() -> ValidationError:
+    return ValidationError(
+        severity=Severity.WARNING,
+        obj_type="Document",
+        obj_name="",
+        field=None,
+        message="No schema available - skipping schema validation",
+        code="W001",
+    )
+
+
+def _singleton_errors(doc: IDFDocument, schema: EpJSONSchema, types_to_check: Iterable[str]) -> list[ValidationError]:
+    """Report singleton (maxProperties) types with more than one instance."""
+    errors: list[ValidationError] = []
+    for obj_type in types_to_check:
+        if obj_type not in doc.collections:
+            continue
+        obj_schema = schema.get_object_schema(obj_type)
+        if obj_schema and obj_schema.get("maxProperties") == 1:
+            coll = doc.get_collection(obj_type)
+            count = len(coll)
+            if count > 1:
+                first = coll.first()
+                obj_name = first.name if first and first.name else obj_type
                 errors.append(
                     ValidationError(
                         severity=Severity.ERROR,
-                        obj_type=obj.obj_type,
-                        obj_name=obj.name,
-                        field=field_name,
-                        message=f"Value '{value}' not in allowed values: {field_schema['enum']}",
-                        code="E004",
+                        obj_type=obj_type,
+                        obj_name=obj_name,
+                        field=None,
+                        message=f"Singleton type '{obj_type}' has {count} instances (maximum 1 allowed)",
+                        code="E010",
                     )
                 )
-        else:
-            errors.append(
-                ValidationError(
-                    severity=Severity.ERROR,
-                    obj_type=obj.obj_type,
-                    obj_name=obj.name,
-                    field=field_name,
-                    message=f"Value '{value}' not in allowed values: {field_schema['enum']}",
-                    code="E004",
-                )
-            )
-
     return errors
 
 
-def _value_matches_type(value: Any, schema: dict[str, Any]) -> bool:
-    """Check if a value matches a type schema."""
-    expected_type = schema.get("type")
-
-    if expected_type == "number":
-        return isinstance(value, (int, float))
-    elif expected_type == "integer":
-        return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
-    elif expected_type == "string":
-        return isinstance(value, str)
-    elif expected_type == "boolean":
-        return isinstance(value, bool)
-    elif expected_type == "array":
-        return isinstance(value, list)
-    elif expected_type == "object":
-        return isinstance(value, dict)
-
-    # Check enum
+def _validate_object(
+    obj: IDFObject,
+    schema: EpJSONSchema,
+    check_required: bool = True,
+    check_types: bool = True,
+    check_ranges: bool = True,
+    check_unknown: bool = True,
+) -> list[ValidationError]:
+    """Validate a single object against schema."""
+    validator = schema.get_validator(obj.obj_type)
+    if validator is None:
+        return [_unknown_type_error(obj)]
+    return validator.validate(
+        obj,
+        check_required=check_required,
+        check_types=check_types,
+        check_ranges=check_ranges,
+        check_unknown=check_unknown,
+    )
+
+
+def _unknown_type_error(obj: IDFObject) -> ValidationError:
+    return ValidationError(
+        severity=Severity.WARNING,
+        obj_type=obj.obj_type,
+        obj_name=obj.name,
+        field=None,
+        message=f"Unknown object type '{obj.obj_type}'",
+        code="W002",
+    )
+
+
+# -----------------------------------------------------------------------------
+# Compiled validators
+# -----------------------------------------------------------------------------
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "number": _is_number,
+    "integer": _is_integer,
+    "string": _is_string,
+    "boolean": _is_boolean,
+    "array": _is_array,
+    "object": _is_object,
+}
+
+# Value classes that always satisfy each schema type
+_PASSING_CLASSES: dict[str, frozenset[type]] = {
+    "number": frozenset((int, float)),
+    "integer": frozenset((int,)),
+    "string": frozenset((str,)),
+    "boolean": frozenset((bool,)),
+    "array": frozenset((list,)),
+    "object": frozenset((dict,)),
+}
+_ANY_CLASS: frozenset[type] = frozenset((str, int, float, bool, list, dict))
+_NUMERIC_CLASSES: frozenset[type] = frozenset((int, float, bool))
+
+
+class _Enum:
+    """Allowed values of an enum field, pre-extracted for O(1) membership tests."""
+
+    __slots__ = ("lowered", "values", "values_list")
+
+    def __init__(self, values_list: list[Any]) -> None:
+        self.values_list = values_list
+        self.values = frozenset(values_list)
+        self.lowered = frozenset(str(e).lower() for e in values_list)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            if value in self.values:
+                return True
+        except TypeError:  # unhashable array/object value
+            if value in self.values_list:
+                return True
+        return isinstance(value, str) and value.lower() in self.lowered
+
+
+def _compile_type_check(schema: dict[str, Any]) -> Callable[[Any], bool] | None:
+    """Compile a ``type``/``enum`` schema into a predicate; ``None`` accepts any value."""
+    check = _TYPE_CHECKS.get(schema.get("type"))  # pyright: ignore[reportArgumentType]
+    if check is not None:
+        return check
     if "enum" in schema:
-        return value in schema["enum"] or (
-            isinstance(value, str) and value.lower() in [str(e).lower() for e in schema["enum"]]
-        )
+        return _Enum(schema["enum"]).__contains__
+    return None
 
-    return True  # Unknown type - assume valid
 
+def _branch_passing_values(schema: dict[str, Any]) -> tuple[frozenset[type], frozenset[str]]:
+    """Value classes and exact strings always accepted by `_compile_type_check(schema)`."""
+    expected = schema.get("type")
+    if expected in _PASSING_CLASSES:
+        return _PASSING_CLASSES[expected], frozenset()
+    if "enum" in schema:
+        return frozenset(), frozenset(e for e in schema["enum"] if isinstance(e, str))
+    return _ANY_CLASS, frozenset()
 
-def _validate_field_range(
-    obj: IDFObject,
-    field_name: str,
-    value: float | int,
-    field_schema: dict[str, Any],
-) -> list[ValidationError]:
-    """Validate numeric field range."""
-    errors: list[ValidationError] = []
 
-    # Check minimum
-    if "minimum" in field_schema and value < field_schema["minimum"]:
-        errors.append(
-            ValidationError(
-                severity=Severity.ERROR,
-                obj_type=obj.obj_type,
-                obj_name=obj.name,
-                field=field_name,
-                message=f"Value {value} is below minimum {field_schema['minimum']}",
-                code="E005",
-            )
+def _passing_values(field_schema: dict[str, Any]) -> tuple[frozenset[type], frozenset[str]]:
+    """Value classes and exact strings that pass a field's type and enum checks."""
+    if "anyOf" in field_schema:
+        classes: frozenset[type] = frozenset()
+        strings: frozenset[str] = frozenset()
+        for sub in field_schema["anyOf"]:
+            sub_classes, sub_strings = _branch_passing_values(sub)
+            classes |= sub_classes
+            strings |= sub_strings
+        return classes, strings
+    if field_schema.get("type"):
+        classes, strings = _branch_passing_values(field_schema)
+    else:
+        classes, strings = _ANY_CLASS, frozenset()
+    if "enum" in field_schema:
+        enum_strings = frozenset(e for e in field_schema["enum"] if isinstance(e, str))
+        return frozenset(), enum_strings if str in classes or strings else strings & enum_strings
+    return classes, strings
+
+
+# (schema key, violated if op(value, limit), error code, message template); checked in this order
+_BOUNDS: tuple[tuple[str, Callable[[Any, Any], bool], str, str], ...] = (
+    ("minimum", operator.lt, "E005", "Value {value} is below minimum {limit}"),
+    ("exclusiveMinimum", operator.le, "E006", "Value {value} must be greater than {limit}"),
+    ("maximum", operator.gt, "E007", "Value {value} is above maximum {limit}"),
+    ("exclusiveMaximum", operator.ge, "E008", "Value {value} must be less than {limit}"),
+)
+
+
+class _FieldValidator:
+    """Type, enum and range checks for one field, extracted from its schema once."""
+
+    __slots__ = ("any_of", "bounds", "enum", "expected_type", "passing_classes", "passing_strings", "type_check")
+
+    def __init__(self, field_schema: dict[str, Any]) -> None:
+        # anyOf: a value is valid if any branch accepts it (None accepts everything)
+        self.any_of: tuple[Callable[[Any], bool] | None, ...] | None = None
+        self.expected_type: Any = None
+        self.type_check: Callable[[Any], bool] | None = None
+        self.enum: _Enum | None = None
+        if "anyOf" in field_schema:
+            self.any_of = tuple(_compile_type_check(sub) for sub in field_schema["anyOf"])
+        else:
+            self.expected_type = field_schema.get("type")
+            if self.expected_type:
+                self.type_check = _compile_type_check(field_schema)
+            if "enum" in field_schema:
+                self.enum = _Enum(field_schema["enum"])
+        self.bounds = tuple(
+            (violated, field_schema[key], code, template)
+            for key, violated, code, template in _BOUNDS
+            if key in field_schema
         )
+        # Fast path: values of these classes, and these exact strings, pass every check
+        classes, strings = _passing_values(field_schema)
+        self.passing_classes = classes - _NUMERIC_CLASSES if self.bounds else classes
+        self.passing_strings = strings
+
+    def check(
+        self,
+        obj_type: str,
+        obj_name: str,
+        field_name: str,
+        value: Any,
+        check_types: bool,
+        check_ranges: bool,
+        errors: list[ValidationError],
+    ) -> None:
+        if check_types:
+            if self.any_of is not None:
+                if not any(check is None or check(value) for check in self.any_of):
+                    errors.append(
+                        _field_error(
+                            obj_type, obj_name, field_name, f"Value '{value}' does not match any valid type", "E002"
+                        )
+                    )
+            else:
+                type_check = self.type_check
+                if type_check is not None and not type_check(value):
+                    message = f"Expected {self.expected_type}, got {type(value).__name__}"
+                    errors.append(_field_error(obj_type, obj_name, field_name, message, "E003"))
+                enum = self.enum
+                if enum is not None and value not in enum:
+                    message = f"Value '{value}' not in allowed values: {enum.values_list}"
+                    errors.append(_field_error(obj_type, obj_name, field_name, message, "E004"))
+
+        if check_ranges and self.bounds and isinstance(value, (int, float)):
+            for violated, limit, code, template in self.bounds:
+                if violated(value, limit):
+                    message = template.format(value=value, limit=limit)
+                    errors.append(_field_error(obj_type, obj_name, field_name, message, code))
+
+
+def _field_error(obj_type: str, obj_name: str, field_name: str, message: str, code: str) -> ValidationError:
+    return ValidationError(
+        severity=Severity.ERROR,
+        obj_type=obj_type,
+        obj_name=obj_name,
+        field=field_name,
+        message=message,
+        code=code,
+    )
 
-    # Check exclusive minimum
-    if "exclusiveMinimum" in field_schema and value <= field_schema["exclusiveMinimum"]:
-        errors.append(
-            ValidationError(
-                severity=Severity.ERROR,
-                obj_type=obj.obj_type,
-                obj_name=obj.name,
-                field=field_name,
-                message=f"Value {value} must be greater than {field_schema['exclusiveMinimum']}",
-                code="E006",
-            )
-        )
 
-    # Check maximum
-    if "maximum" in field_schema and value > field_schema["maximum"]:
-        errors.append(
-            ValidationError(
-                severity=Severity.ERROR,
-                obj_type=obj.obj_type,
-                obj_name=obj.name,
-                field=field_name,
-                message=f"Value {value} is above maximum {field_schema['maximum']}",
-                code="E007",
-            )
-        )
+class CompiledValidator:
+    """
+    Field checks for one object type, compiled once from its schema.
 
-    # Check exclusive maximum
-    if "exclusiveMaximum" in field_schema and value >= field_schema["exclusiveMaximum"]:
-        errors.append(
-            ValidationError(
-                severity=Severity.ERROR,
-                obj_type=obj.obj_type,
-                obj_name=obj.name,
-                field=field_name,
-                message=f"Value {value} must be less than {field_schema['exclusiveMaximum']}",
-                code="E008",
-            )
+    Enum choices are held as frozensets, numeric bounds and type
+    predicates are pre-extracted, and required fields are a tuple, so
+    validating an object is a tight loop over its data without walking
+    the raw schema dicts.  Obtain one with
+    [EpJSONSchema.get_validator][idfkit.schema.EpJSONSchema.get_validator],
+    which caches it per object type.
+
+    Examples:
+        >>> from idfkit import new_document, get_schema, LATEST_VERSION
+        >>> model = new_document()
+        >>> material = model.add("Material", "Brick", roughness="Rough", thickness=0.1,
+        ...     conductivity=0.7, density=1900.0, specific_heat=800.0)
+        >>> validator = get_schema(LATEST_VERSION).get_validator("Material")
+        >>> validator.validate(material)
+        []
+        >>> material.data["roughness"] = "Bumpy"
+        >>> [err.code for err in validator.validate(material)]
+        ['E004']
+    """
+
+    __slots__ = ("extensible", "fields", "obj_type", "required")
+
+    def __init__(self, obj_type: str, inner_schema: dict[str, Any], extensible: bool) -> None:
+        self.obj_type = obj_type
+        self.extensible = extensible
+        self.required: tuple[str, ...] = tuple(dict.fromkeys(inner_schema.get("required", [])))
+        properties: dict[str, Any] = inner_schema.get("properties", {})
+        self.fields: dict[str, _FieldValidator] = {
+            name: _FieldValidator(field_schema) for name, field_schema in properties.items() if field_schema
+        }
+
+    def validate(
+        self,
+        obj: IDFObject,
+        *,
+        check_required: bool = True,
+        check_types: bool = True,
+        check_ranges: bool = True,
+        check_unknown: bool = True,
+    ) -> list[ValidationError]:
+        """Validate *obj* (an object of this type); same checks as [validate_object][idfkit.validation.validate_object]."""
+        return self.validate_data(
+            obj.obj_type,
+            obj.name,
+            obj.data,
+            check_required=check_required,
+            check_types=check_types,
+            check_ranges=check_ranges,
+            check_unknown=check_unknown,
         )
 
-    return errors
+    def validate_data(
+        self,
+        obj_type: str,
+        obj_name: str,
+        data: dict[str, Any],
+        *,
+        check_required: bool = True,
+        check_types: bool = True,
+        check_ranges: bool = True,
+        check_unknown: bool = True,
+    ) -> list[ValidationError]:
+        """
+        Validate the field *data* of an object that may not exist yet.
+
+        Same checks as [validate][idfkit.validation.CompiledValidator.validate];
+        the IDF parser uses it to check values as soon as they are coerced.
+        """
+        errors = self.missing_required(obj_type, obj_name, data) if check_required else []
+        if not (check_types or check_ranges or check_unknown):
+            return errors
+
+        fields = self.fields
+        report_unknown = check_unknown and not self.extensible
+        for field_name, value in data.items():
+            if value is None or value == "":
+                continue
+            field = fields.get(field_name)
+            if field is None:
+                if report_unknown:
+                    errors.append(_unknown_field_warning(obj_type, obj_name, field_name))
+                continue
+            cls = value.__class__
+            if cls in field.passing_classes or (cls is str and value in field.passing_strings):
+                continue
+            field.check(obj_type, obj_name, field_name, value, check_types, check_ranges, errors)
+
+        return errors
+
+    def missing_required(self, obj_type: str, obj_name: str, data: dict[str, Any]) -> list[ValidationError]:
+        """Return an E001 error for every required field that is missing or blank in *data*."""
+        errors: list[ValidationError] = []
+        for field_name in self.required:
+            value = data.get(field_name)
+            if value is None or value == "":
+                errors.append(
+                    ValidationError(
+                        severity=Severity.ERROR,
+                        obj_type=obj_type,
+                        obj_name=obj_name,
+                        field=field_name,
+                        message=f"Required field '{field_name}' is missing",
+                        code="E001",
+                    )
+                )
+        return errors
+
+
+def _unknown_field_warning(obj_type: str, obj_name: str, field_name: str) -> ValidationError:
+    return ValidationError(
+        severity=Severity.WARNING,
+        obj_type=obj_type,
+        obj_name=obj_name,
+        field=field_name,
+        message=f"Unknown field '{field_name}'",
+        code="W003",
+    )
 
 
 def _validate_references(
@@ -13,8 +13,10 @@ mirrors eppy's ``idf.outputtype`` options:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -172,47 +174,61 @@ class IDFWriter:
     - ``"compressed"`` — each object on a single line.
     """
 
-    def __init__(self, doc: IDFDocument, output_type: OutputType = "standard"):
+    def __init__(
+        self,
+        doc: IDFDocument,
+        output_type: OutputType = "standard",
+        extra_objects: Sequence[IDFObject] = (),
+    ):
         self._doc = doc
         self._output_type = output_type
+        # Written as if they were in the document, without modifying it
+        self._extra: dict[str, list[IDFObject]] = {}
+        for obj in extra_objects:
+            self._extra.setdefault(obj.obj_type, []).append(obj)
 
     def to_string(self) -> str:
         """Convert document to IDF string."""
-        lines: list[str] = []
+        return "\n".join(self.iter_lines())
 
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the IDF text one object (or header line) at a time.
+
+        Joining the yielded strings with ``"\\n"`` gives
+        [to_string][idfkit.writers.IDFWriter.to_string]; consumers such as
+        hashers can process them without building the whole text.
+        """
         if self._output_type != "compressed":
             # Write header comment
-            lines.append("!-Generator archetypal")
-            lines.append("!-Option SortedOrder")
-            lines.append("")
+            yield "!-Generator archetypal"
+            yield "!-Option SortedOrder"
+            yield ""
 
         # Write Version first
         version_identifier = _resolve_version_identifier(self._doc)
         if self._output_type == "compressed":
-            lines.append(f"Version,{version_identifier};")
+            yield f"Version,{version_identifier};"
         else:
-            lines.append("Version,")
+            yield "Version,"
             if self._output_type == "standard":
-                lines.append(f"  {version_identifier};                    !- Version Identifier")
+                yield f"  {version_identifier};                    !- Version Identifier"
             else:
-                lines.append(f"  {version_identifier};")
-            lines.append("")
+                yield f"  {version_identifier};"
+            yield ""
 
         # Write objects grouped by type
-        for obj_type in sorted(self._doc.collections.keys()):
+        collections = self._doc.collections
+        for obj_type in sorted(collections.keys() | self._extra.keys()):
             if obj_type.upper() == "VERSION":
                 continue
-            collection = self._doc.collections[obj_type]
-            if not collection:
-                continue
+            objects: Iterable[IDFObject] = collections.get(obj_type, ())
+            if obj_type in self._extra:
+                objects = itertools.chain(objects, self._extra[obj_type])
 
-            for obj in collection:
-                obj_str = self._object_to_string(obj)
-                lines.append(obj_str)
+            for obj in objects:
+                yield self._object_to_string(obj)
                 if self._output_type != "compressed":
-                    lines.append("")
-
-        return "\n".join(lines)
+                    yield ""
 
     def _get_field_values_and_comments(self, obj: IDFObject) -> tuple[list[str], list[str]]:
         """Get the ordered field values and comment labels for *obj*."""
@@ -233,24 +249,20 @@ class IDFWriter:
         else:
             field_names = ["name", *list(obj.data.keys())] if obj_has_name else list(obj.data.keys())
 
-        values: list[str] = []
-        comments: list[str] = []
-
-        for field_name in field_names:
-            if field_name == "name":
-                values.append(obj.name or "")
-                comments.append("Name")
-            else:
-                value = obj.data.get(field_name)
-                values.append(self._format_value(value))
-                comment = field_name.replace("_", " ").title()
-                comments.append(comment)
+        data = obj.data
+        fmt = self._format_value
+        values = [(obj.name or "") if f == "name" else fmt(data.get(f)) for f in field_names]
 
         # Trim trailing empty fields
-        while len(values) > 1 and values[-1] == "":
-            values.pop()
-            comments.pop()
-
+        end = len(values)
+        while end > 1 and values[end - 1] == "":
+            end -= 1
+        del values[end:]
+
+        # Comments are only written in "standard" mode
+        if self._output_type != "standard":
+            return values, []
+        comments = ["Name" if f == "name" else f.replace("_", " ").title() for f in field_names[:end]]
         return values, comments
 
     def _object_to_string(self, obj: IDFObject) -> str:
@@ -263,14 +275,14 @@ class IDFWriter:
             return f"{obj_type},{parts};"
 
         lines: list[str] = [f"{obj_type},"]
-        for i, (value, comment) in enumerate(zip(values, comments, strict=False)):
+        for i, value in enumerate(values):
             is_last = i == len(values) - 1
             terminator = ";" if is_last else ","
 
             if self._output_type == "standard":
                 field_str = f"  {value}{terminator}"
                 field_str = field_str.ljust(30)
-                field_str += f"!- {comment}"
+                field_str += f"!- {comments[i]}"
             else:
                 # nocomment
                 field_str = f"  {value}{terminator}"
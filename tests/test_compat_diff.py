@@ -135,3 +135,21 @@ class TestDiffSchemas:
         # Both should still have Zone
         assert "Zone" not in diff.removed_types
         assert "Zone" not in diff.added_types
+
+    def test_synthetic_field_diff(self) -> None:
+        """Test diffing with synthetic field changes on a shared type."""
+        idx_a = SchemaIndex(
+            version=(1, 0, 0),
+            object_types=frozenset({"ZoneInfiltration"}),
+            choices={},
+            fields={"ZoneInfiltration": ("name", "zone_name", "design_flow_rate")},
+        )
+        idx_b = SchemaIndex(
+            version=(2, 0, 0),
+            object_types=frozenset({"ZoneInfiltration"}),
+            choices={},
+            fields={"ZoneInfiltration": ("name", "zone_or_space_name", "design_flow_rate")},
+        )
+        diff = diff_schemas(idx_a, idx_b)
+        assert diff.removed_fields == {"ZoneInfiltration": frozenset({"zone_name"})}
+        assert diff.added_fields == {"ZoneInfiltration": frozenset({"zone_or_space_name"})}
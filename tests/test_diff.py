@@ -0,0 +1,153 @@
+"""Tests for structural document diffing."""
+
+from __future__ import annotations
+
+from idfkit import IDFDocument, diff_documents, new_document
+from idfkit.diff import DocumentDiff, object_digest
+
+
+class TestObjectDigest:
+    def test_equal_content_equal_digest(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        a = doc.add("Zone", "A", x_origin=1.0)
+        other = new_document(version=(24, 1, 0))
+        b = other.add("Zone", "A", x_origin=1.0)
+        assert object_digest(a) == object_digest(b)
+
+    def test_blank_and_none_treated_as_unset(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        a = doc.add("Zone", "A")
+        other = new_document(version=(24, 1, 0))
+        b = other.add("Zone", "A", x_origin="")
+        assert object_digest(a) == object_digest(b)
+
+    def test_digest_invalidated_by_mutation(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "A")
+        before = object_digest(zone)
+        zone.name = "B"
+        assert object_digest(zone) != before
+
+    def test_digest_invalidated_by_rename_propagation(self, simple_doc: IDFDocument) -> None:
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        before = object_digest(wall)
+        simple_doc.rename("Zone", "TestZone", "Other")
+        assert object_digest(wall) != before
+
+    def test_hash_colliding_values_differ(self) -> None:
+        # hash(-1) == hash(-2) in CPython
+        doc = new_document(version=(24, 1, 0))
+        a = doc.add("Zone", "A", x_origin=-1.0)
+        other = new_document(version=(24, 1, 0))
+        b = other.add("Zone", "A", x_origin=-2.0)
+        assert object_digest(a) != object_digest(b)
+
+    def test_equal_numbers_equal_digest(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        a = doc.add("Zone", "A", x_origin=1)
+        other = new_document(version=(24, 1, 0))
+        b = other.add("Zone", "A", x_origin=1.0)
+        assert object_digest(a) == object_digest(b)
+
+    def test_nested_values_hashable(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        obj = doc.add("Zone", "A", validate=False)
+        obj.data["vertices"] = [{"x": 1.0}, {"x": 2.0}]
+        assert isinstance(object_digest(obj), int)
+
+
+class TestDiffDocuments:
+    def test_identical_documents(self, simple_doc: IDFDocument) -> None:
+        result = diff_documents(simple_doc, simple_doc.copy())
+        assert isinstance(result, DocumentDiff)
+        assert result.is_empty
+
+    def test_added_and_removed(self, simple_doc: IDFDocument) -> None:
+        variant = simple_doc.copy()
+        variant.add("Zone", "NewZone")
+        variant.removeidfobject(variant["Material"]["TestMaterial"])
+        result = diff_documents(simple_doc, variant)
+        assert [o.name for o in result.added] == ["NewZone"]
+        assert [o.name for o in result.removed] == ["TestMaterial"]
+        assert result.changed == []
+
+    def test_removed_type(self, simple_doc: IDFDocument) -> None:
+        variant = simple_doc.copy()
+        variant.removeidfobject(variant["Zone"]["TestZone"])
+        result = diff_documents(simple_doc, variant)
+        assert [o.obj_type for o in result.removed] == ["Zone"]
+
+    def test_field_changes(self, simple_doc: IDFDocument) -> None:
+        variant = simple_doc.copy()
+        variant["Material"]["TestMaterial"].thickness = 0.2
+        variant["Material"]["TestMaterial"].visible_absorptance = 0.5
+        result = diff_documents(simple_doc, variant)
+        assert len(result.changed) == 1
+        change = result.changed[0]
+        assert change.obj_type == "Material"
+        assert change.name == "TestMaterial"
+        assert [(f.field, f.old, f.new) for f in change.fields] == [
+            ("thickness", 0.1, 0.2),
+            ("visible_absorptance", None, 0.5),
+        ]
+
+    def test_names_matched_case_insensitively(self, simple_doc: IDFDocument) -> None:
+        variant = simple_doc.copy()
+        variant["Zone"]["TestZone"].name = "TESTZONE"
+        result = diff_documents(simple_doc, variant)
+        zone_changes = [c for c in result.changed if c.obj_type == "Zone"]
+        assert len(zone_changes) == 1
+        assert zone_changes[0].fields[0].field == "name"
+        assert result.added == []
+        assert result.removed == []
+
+    def test_hash_colliding_change_detected(self) -> None:
+        baseline = new_document(version=(24, 1, 0))
+        baseline.add("Zone", "Office", x_origin=-1.0)
+        variant = baseline.copy()
+        variant["Zone"]["Office"].x_origin = -2.0
+        result = diff_documents(baseline, variant)
+        assert not result.is_empty
+        assert [(f.field, f.old, f.new) for f in result.changed[0].fields] == [("x_origin", -1.0, -2.0)]
+
+    def test_reordered_unnamed_objects_unchanged(self) -> None:
+        a = new_document(version=(24, 1, 0))
+        a.add("Output:Variable", "", key_value="*", variable_name="A")
+        a.add("Output:Variable", "", key_value="*", variable_name="B")
+        b = new_document(version=(24, 1, 0))
+        b.add("Output:Variable", "", key_value="*", variable_name="B")
+        b.add("Output:Variable", "", key_value="*", variable_name="A")
+        assert diff_documents(a, b).is_empty
+
+        b.add("Output:Variable", "", key_value="*", variable_name="C")
+        result = diff_documents(a, b)
+        assert result.changed == []
+        assert result.removed == []
+        assert [o.variable_name for o in result.added] == ["C"]
+
+    def test_unnamed_objects_matched_by_position(self) -> None:
+        a = new_document(version=(24, 1, 0))
+        a.add("Output:Variable", "", key_value="*", variable_name="A")
+        a.add("Output:Variable", "", key_value="*", variable_name="B")
+        b = a.copy()
+        b["Output:Variable"][1].variable_name = "C"
+        b.add("Output:Variable", "", key_value="*", variable_name="D")
+        result = diff_documents(a, b)
+        assert [c.fields[0].new for c in result.changed] == ["C"]
+        assert [o.variable_name for o in result.added] == ["D"]
+
+    def test_unchanged_types_skipped(self, simple_doc: IDFDocument, monkeypatch) -> None:
+        import idfkit.diff as diff_module
+
+        variant = simple_doc.copy()
+        variant["Zone"]["TestZone"].x_origin = 99.0
+        compared: list[str] = []
+        original = diff_module._diff_collection
+
+        def spy(obj_type, *args):  # type: ignore[no-untyped-def]
+            compared.append(obj_type)
+            return original(obj_type, *args)
+
+        monkeypatch.setattr(diff_module, "_diff_collection", spy)
+        diff_documents(simple_doc, variant)
+        assert compared == ["Zone"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 import pytest
@@ -221,6 +222,101 @@ class TestIDFDocumentRename:
             empty_doc.rename("Zone", "Nonexistent", "New")
 
 
+class TestIDFDocumentRenameMany:
+    def test_mapping_updates_references(self, simple_doc: IDFDocument) -> None:
+        renamed = simple_doc.rename_many({
+            ("Zone", "TestZone"): "Z1",
+            ("Construction", "testconstruction"): "C1",
+        })
+        assert renamed == 2
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        assert (wall.zone_name, wall.construction_name) == ("Z1", "C1")
+        assert simple_doc.getobject("Zone", "TestZone") is None
+        assert {o.name for o in simple_doc.get_referencing("Z1")} == {"TestWall", "TestFloor"}
+        assert simple_doc.get_referencing("TestZone") == set()
+
+    def test_callable_mapper(self, simple_doc: IDFDocument) -> None:
+        renamed = simple_doc.rename_many(lambda obj: f"B1 {obj.name}")
+        assert renamed == len([o for o in simple_doc.all_objects if o.name])
+        wall = simple_doc["BuildingSurface:Detailed"]["B1 TestWall"]
+        assert wall.zone_name == "B1 TestZone"
+        assert simple_doc["Construction"]["B1 TestConstruction"].outside_layer == "B1 TestMaterial"
+
+    def test_swap(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "Other")
+        simple_doc.rename_many({("Zone", "TestZone"): "Other", ("Zone", "Other"): "TestZone"})
+        assert simple_doc["BuildingSurface:Detailed"]["TestWall"].zone_name == "Other"
+        assert simple_doc["Zone"]["Other"].x_origin == 0.0
+        assert {o.name for o in simple_doc.get_referencing("Other")} == {"TestWall", "TestFloor"}
+        assert simple_doc.get_referencing("TestZone") == set()
+
+    def test_swap_with_compact_graph(self, simple_doc: IDFDocument) -> None:
+        simple_doc.use_compact_references()
+        simple_doc.add("Zone", "Other")
+        simple_doc.rename_many({("Zone", "TestZone"): "Other", ("Zone", "Other"): "TestZone"})
+        assert {o.name for o in simple_doc.get_referencing("Other")} == {"TestWall", "TestFloor"}
+        assert simple_doc.get_referencing("TestZone") == set()
+
+    def test_collision_rejected_before_changes(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "Other")
+        with pytest.raises(DuplicateObjectError):
+            simple_doc.rename_many({("Zone", "TestZone"): "other", ("Construction", "TestConstruction"): "C1"})
+        assert "TestZone" in simple_doc["Zone"]
+        assert "TestConstruction" in simple_doc["Construction"]
+
+    def test_two_objects_to_same_name_rejected(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "Other")
+        with pytest.raises(DuplicateObjectError):
+            simple_doc.rename_many({("Zone", "TestZone"): "Same", ("Zone", "Other"): "Same"})
+
+    def test_missing_object_raises(self, simple_doc: IDFDocument) -> None:
+        with pytest.raises(KeyError):
+            simple_doc.rename_many({("Zone", "Nope"): "X"})
+
+    def test_empty_name_rejected(self, simple_doc: IDFDocument) -> None:
+        with pytest.raises(ValueError, match="empty name"):
+            simple_doc.rename_many({("Zone", "TestZone"): " "})
+
+    def test_shared_old_name_resolved_by_type(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Schedule:Constant", "TestZone", hourly_value=1.0, validate=False)
+        people = simple_doc.add(
+            "People",
+            "P",
+            zone_or_zonelist_or_space_or_spacelist_name="TestZone",
+            number_of_people_schedule_name="TestZone",
+            validate=False,
+        )
+        simple_doc.rename_many({("Zone", "TestZone"): "Z", ("Schedule:Constant", "TestZone"): "S"})
+        assert people.zone_or_zonelist_or_space_or_spacelist_name == "Z"
+        assert people.number_of_people_schedule_name == "S"
+        assert simple_doc.get_referencing("S") == {people}
+
+    def test_shared_old_name_leaves_other_types(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Schedule:Constant", "TestZone", hourly_value=1.0, validate=False)
+        simple_doc.add("Construction", "TestZone", outside_layer="TestMaterial", validate=False)
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        wall.construction_name = "TestZone"
+        simple_doc.rename_many({("Zone", "TestZone"): "Z", ("Schedule:Constant", "TestZone"): "S"})
+        assert wall.zone_name == "Z"
+        assert wall.construction_name == "TestZone"
+        assert wall in simple_doc.get_referencing("TestZone")
+
+    def test_shared_old_name_ambiguous_raises(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("ZoneList", "TestZone", zone_1_name="TestZone", validate=False)
+        simple_doc.add("People", "P", zone_or_zonelist_or_space_or_spacelist_name="TestZone", validate=False)
+        with pytest.raises(ValueError, match="Cannot tell"):
+            simple_doc.rename_many({("Zone", "TestZone"): "Z", ("ZoneList", "TestZone"): "L"})
+        assert "TestZone" in simple_doc["Zone"]
+
+    def test_bumps_mutation_versions(self, simple_doc: IDFDocument) -> None:
+        zone = simple_doc["Zone"]["TestZone"]
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        versions = (zone.mutation_version, wall.mutation_version)
+        simple_doc.rename_many({("Zone", "TestZone"): "Z1"})
+        assert zone.mutation_version > versions[0]
+        assert wall.mutation_version > versions[1]
+
+
 class TestIDFDocumentSchedules:
     def test_get_schedule(self, empty_doc: IDFDocument) -> None:
         empty_doc.add("Schedule:Constant", "AlwaysOn", {"hourly_value": 1.0})
@@ -308,6 +404,133 @@ class TestIDFDocumentCopy:
         assert len(simple_doc["Zone"]) == 1
 
 
+class TestIDFDocumentExtract:
+    def test_dependencies_followed(self, simple_doc: IDFDocument) -> None:
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        sub = simple_doc.extract([wall])
+        names = {(o.obj_type, o.name) for o in sub.all_objects if o.obj_type != "Version"}
+        assert names == {
+            ("BuildingSurface:Detailed", "TestWall"),
+            ("Zone", "TestZone"),
+            ("Construction", "TestConstruction"),
+            ("Material", "TestMaterial"),
+        }
+
+    def test_copies_are_independent(self, simple_doc: IDFDocument) -> None:
+        sub = simple_doc.extract([simple_doc["Construction"]["TestConstruction"]])
+        sub["Material"]["TestMaterial"].thickness = 0.5
+        assert simple_doc["Material"]["TestMaterial"].thickness == 0.1
+        assert sub["Material"]["TestMaterial"] is not simple_doc["Material"]["TestMaterial"]
+        assert sub.schema is simple_doc.schema
+        assert "Version" in sub
+
+    def test_without_dependencies(self, simple_doc: IDFDocument) -> None:
+        sub = simple_doc.extract([simple_doc["Construction"]["TestConstruction"]], include_dependencies=False)
+        assert "Material" not in sub
+        assert len(sub["Construction"]) == 1
+
+    def test_include_referencing(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "OtherZone")
+        sub = simple_doc.extract([simple_doc["Zone"]["TestZone"]], include_referencing=True)
+        assert {o.name for o in sub["BuildingSurface:Detailed"]} == {"TestWall", "TestFloor"}
+        assert "TestMaterial" in sub["Material"]
+        assert "OtherZone" not in sub["Zone"]
+        assert {o.name for o in sub.get_referencing("TestZone")} == {"TestWall", "TestFloor"}
+
+    def test_referencing_not_followed_from_dependencies(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "OtherZone")
+        simple_doc.add(
+            "BuildingSurface:Detailed",
+            "OtherWall",
+            surface_type="Wall",
+            construction_name="TestConstruction",
+            zone_name="OtherZone",
+            outside_boundary_condition="Outdoors",
+            validate=False,
+        )
+        sub = simple_doc.extract([simple_doc["Zone"]["TestZone"]], include_referencing=True)
+        assert "OtherWall" not in sub["BuildingSurface:Detailed"]
+        assert "OtherZone" not in sub["Zone"]
+
+    def test_same_name_different_type_not_confused(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Schedule:Constant", "TestZone", hourly_value=1.0, validate=False)
+        sub = simple_doc.extract([simple_doc["Zone"]["TestZone"]], include_referencing=True)
+        assert "Schedule:Constant" not in sub
+        sub = simple_doc.extract([simple_doc["BuildingSurface:Detailed"]["TestWall"]])
+        assert "Schedule:Constant" not in sub
+
+    def test_foreign_object_rejected(self, simple_doc: IDFDocument) -> None:
+        other = new_document(version=(24, 1, 0))
+        zone = other.add("Zone", "TestZone")
+        with pytest.raises(ValueError, match="not in this document"):
+            simple_doc.extract([zone])
+
+
+class TestIDFDocumentPickle:
+    def test_roundtrip_preserves_objects(self, simple_doc: IDFDocument) -> None:
+        restored = pickle.loads(pickle.dumps(simple_doc))  # noqa: S301
+        assert len(restored) == len(simple_doc)
+        assert restored.version == simple_doc.version
+        wall = restored["BuildingSurface:Detailed"]["TestWall"]
+        original = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        assert wall.data == original.data
+        assert wall.field_order == original.field_order
+        assert type(wall) is type(original)
+        assert wall.theidf is restored
+
+    def test_schema_referenced_by_version(self, simple_doc: IDFDocument) -> None:
+        payload = pickle.dumps(simple_doc)
+        assert b"patternProperties" not in payload
+        restored = pickle.loads(payload)  # noqa: S301
+        assert restored.schema is simple_doc.schema
+
+    def test_unmanaged_schema_is_shipped(self) -> None:
+        from idfkit.schema import EpJSONSchema, get_schema
+
+        managed = get_schema((24, 1, 0))
+        custom = EpJSONSchema(managed.version, managed._raw)
+        doc = IDFDocument(version=(24, 1, 0), schema=custom)
+        doc.add("Zone", "Office")
+        restored = pickle.loads(pickle.dumps(doc))  # noqa: S301
+        assert restored.schema is not managed
+        assert "Zone" in restored.schema
+
+    def test_references_rebuilt(self, simple_doc: IDFDocument) -> None:
+        restored = pickle.loads(pickle.dumps(simple_doc))  # noqa: S301
+        assert len(restored.references) == len(simple_doc.references)
+        assert {o.name for o in restored.get_referencing("TestZone")} == {
+            o.name for o in simple_doc.get_referencing("TestZone")
+        }
+        restored.rename("Zone", "TestZone", "Renamed")
+        assert restored["BuildingSurface:Detailed"]["TestWall"].zone_name == "Renamed"
+
+    def test_strict_and_filepath_preserved(self, tmp_path: Path) -> None:
+        doc = IDFDocument(version=(24, 1, 0), filepath=tmp_path / "model.idf", strict=True)
+        restored = pickle.loads(pickle.dumps(doc))  # noqa: S301
+        assert restored.strict is True
+        assert restored.filepath == tmp_path / "model.idf"
+
+    def test_object_pickled_with_document(self, simple_doc: IDFDocument) -> None:
+        zone = simple_doc["Zone"]["TestZone"]
+        restored_zone, restored_doc = pickle.loads(pickle.dumps((zone, simple_doc)))  # noqa: S301
+        assert restored_doc["Zone"]["TestZone"] is restored_zone
+        assert restored_zone.theidf is restored_doc
+
+    def test_unnamed_object_located_by_position(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Output:Variable", "", key_value="*", variable_name="A")
+        second = doc.add("Output:Variable", "", key_value="*", variable_name="B")
+        restored = pickle.loads(pickle.dumps(second))  # noqa: S301
+        assert restored.variable_name == "B"
+        assert restored.theidf["Output:Variable"][1] is restored
+
+    def test_removed_object_pickles_standalone(self, simple_doc: IDFDocument) -> None:
+        zone = simple_doc["Zone"]["TestZone"]
+        simple_doc.removeidfobject(zone)
+        restored = pickle.loads(pickle.dumps(zone))  # noqa: S301
+        assert restored.name == "TestZone"
+
+
 class TestIDFDocumentStringRepresentation:
     def test_repr(self, empty_doc: IDFDocument) -> None:
         r = repr(empty_doc)
@@ -476,6 +699,86 @@ class TestReferenceFieldChangeConsistency:
         assert obj.x_origin == 5.0
 
 
+class TestLazyReferenceGraph:
+    """The reference graph is built on first use unless requested eagerly."""
+
+    def test_graph_unbuilt_after_add(self, simple_doc: IDFDocument) -> None:
+        assert simple_doc._references_built is False
+        assert len(simple_doc._references) == 0
+
+    def test_query_builds_graph(self, simple_doc: IDFDocument) -> None:
+        referencing = simple_doc.get_referencing("TestZone")
+        assert {o.name for o in referencing} == {"TestWall", "TestFloor"}
+        assert simple_doc._references_built is True
+
+    def test_rename_builds_graph(self, simple_doc: IDFDocument) -> None:
+        simple_doc.rename("Zone", "TestZone", "Renamed")
+        assert simple_doc._references_built is True
+        assert simple_doc["BuildingSurface:Detailed"]["TestWall"].zone_name == "Renamed"
+
+    def test_edits_before_build_are_picked_up(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "Zone2")
+        wall = simple_doc["BuildingSurface:Detailed"]["TestWall"]
+        wall.zone_name = "Zone2"
+        simple_doc.removeidfobject(simple_doc["Construction"]["TestConstruction"])
+        assert simple_doc.get_referencing("Zone2") == {wall}
+        assert wall not in simple_doc.get_referencing("TestZone")
+        assert {o.name for o in simple_doc.get_referencing("TestMaterial")} == set()
+
+    def test_eager_matches_lazy(self, simple_doc: IDFDocument) -> None:
+        eager = IDFDocument(version=(24, 1, 0), schema=simple_doc.schema, eager_references=True)
+        for obj in simple_doc.all_objects:
+            eager.add(obj.obj_type, obj.name, dict(obj.data), validate=False)
+        assert len(eager._references) == len(simple_doc.references)
+        assert {o.name for o in eager.get_referencing("TestConstruction")} == {
+            o.name for o in simple_doc.get_referencing("TestConstruction")
+        }
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_removed_targets_match_eager(self, compact: bool) -> None:
+        def run(eager: bool) -> list[object]:
+            doc = new_document(version=(24, 1, 0))
+            if compact:
+                doc.use_compact_references()
+            if eager:
+                doc.build_references()
+            doc.add("Zone", "Z1")
+            doc.add("Zone", "Z2")
+            doc.add("People", "P1", zone_or_zonelist_or_space_or_spacelist_name="Z1", validate=False)
+            doc.add("People", "P2", zone_or_zonelist_or_space_or_spacelist_name="Z2", validate=False)
+            doc.removeidfobject(doc["Zone"]["Z1"])
+            doc.removeidfobject(doc["People"]["P2"])
+            return [
+                sorted(o.name for o in doc.get_referencing("Z1")),
+                doc.references.is_referenced("Z1"),
+                sorted(o.name for o in doc.get_referencing("Z2")),
+                doc.references.is_referenced("Z2"),
+                sorted(doc.references.get_references(doc["People"]["P1"])),
+            ]
+
+        assert run(eager=False) == run(eager=True)
+        assert run(eager=False)[:4] == [[], False, [], False]
+
+    def test_build_is_idempotent(self, simple_doc: IDFDocument) -> None:
+        simple_doc.build_references()
+        count = len(simple_doc.references)
+        simple_doc.build_references()
+        assert len(simple_doc.references) == count
+
+    def test_compact_switch_before_build(self, simple_doc: IDFDocument) -> None:
+        from idfkit.references import CompactReferenceGraph
+
+        simple_doc.use_compact_references()
+        assert simple_doc._references_built is False
+        assert isinstance(simple_doc.references, CompactReferenceGraph)
+        assert {o.name for o in simple_doc.get_referencing("TestZone")} == {"TestWall", "TestFloor"}
+
+    def test_pickle_restore_is_lazy(self, simple_doc: IDFDocument) -> None:
+        restored = pickle.loads(pickle.dumps(simple_doc))  # noqa: S301
+        assert restored._references_built is False
+        assert {o.name for o in restored.get_referencing("TestZone")} == {"TestWall", "TestFloor"}
+
+
 class TestGetIddGroupDict:
     def test_basic(self, simple_doc: IDFDocument) -> None:
         groups = simple_doc.getiddgroupdict()
@@ -547,3 +850,106 @@ class TestAddWithValidation:
         # By default, validation is enabled to catch errors early
         with pytest.raises(ValidationFailedError):
             empty_doc.add("Zone", "TestZone", unknown_param=42)
+
+
+class TestUpdateFromFrame:
+    def _materials(self) -> IDFDocument:
+        doc = new_document(version=(24, 1, 0))
+        for name, k in [("Brick", 0.9), ("Gypsum", 0.16)]:
+            doc.add(
+                "Material",
+                name,
+                roughness="Rough",
+                thickness=0.1,
+                conductivity=k,
+                density=1800.0,
+                specific_heat=900.0,
+            )
+        return doc
+
+    def test_roundtrip_mapping(self) -> None:
+        doc = self._materials()
+        cols = doc["Material"].to_columns(fields=["conductivity"])
+        cols["conductivity"] = [k * 10 for k in cols["conductivity"]]
+        assert doc.update_from_frame("Material", cols) == 2
+        assert doc["Material"]["Brick"].conductivity == pytest.approx(9.0)
+        assert doc["Material"]["Gypsum"].conductivity == pytest.approx(1.6)
+
+    def test_unchanged_rows_not_counted(self) -> None:
+        doc = self._materials()
+        gypsum = doc["Material"]["Gypsum"]
+        version = gypsum.mutation_version
+        changed = doc.update_from_frame("Material", {"name": ["Brick", "Gypsum"], "conductivity": [1.0, 0.16]})
+        assert changed == 1
+        assert gypsum.mutation_version == version
+        assert doc["Material"]["Brick"].mutation_version > 0
+
+    def test_dataframe_roundtrip(self) -> None:
+        pytest.importorskip("pandas")
+        doc = self._materials()
+        frame = doc["Material"].to_frame()
+        frame["conductivity"] *= 2
+        assert doc.update_from_frame("Material", frame) == 2
+        assert doc["Material"]["Gypsum"].conductivity == pytest.approx(0.32)
+        assert isinstance(doc["Material"]["Gypsum"].conductivity, float)
+
+    def test_missing_value_clears_field(self) -> None:
+        doc = self._materials()
+        doc.update_from_frame("Material", {"name": ["Brick"], "thermal_absorptance": [None], "density": [None]})
+        brick = doc["Material"]["Brick"]
+        assert brick.density == ""
+        assert "thermal_absorptance" not in brick.data
+
+    def test_nullable_dtype_missing_values(self) -> None:
+        pd = pytest.importorskip("pandas")
+        doc = self._materials()
+        frame = pd.DataFrame({
+            "name": pd.Series(["Brick", "Gypsum"], dtype="string"),
+            "density": pd.Series([pd.NA, 900.0], dtype="Float64"),
+            "roughness": pd.Series([pd.NA, "Smooth"], dtype="string"),
+        })
+        assert doc.update_from_frame("Material", frame) == 2
+        brick = doc["Material"]["Brick"]
+        assert brick.density == ""
+        assert brick.roughness == ""
+        assert doc["Material"]["Gypsum"].density == pytest.approx(900.0)
+        assert doc["Material"]["Gypsum"].roughness == "Smooth"
+
+    def test_reference_fields_update_graph(self, simple_doc: IDFDocument) -> None:
+        simple_doc.add("Zone", "Zone2")
+        simple_doc.update_from_frame(
+            "BuildingSurface:Detailed",
+            {"name": ["TestWall", "TestFloor"], "zone_name": ["Zone2", "Zone2"]},
+        )
+        assert len(simple_doc.get_referencing("Zone2")) == 2
+        assert simple_doc.get_referencing("TestZone") == set()
+
+    def test_unknown_row_raises(self) -> None:
+        doc = self._materials()
+        with pytest.raises(KeyError, match="Concrete"):
+            doc.update_from_frame("Material", {"name": ["Concrete"], "conductivity": [1.0]})
+
+    def test_unknown_type_raises(self) -> None:
+        doc = self._materials()
+        with pytest.raises(KeyError):
+            doc.update_from_frame("Zone", {"name": ["Z"], "x_origin": [1.0]})
+
+    def test_unknown_column_raises(self) -> None:
+        doc = self._materials()
+        with pytest.raises(ValueError, match="conductivty"):
+            doc.update_from_frame("Material", {"name": ["Brick"], "conductivity": [2.0], "conductivty": [1.0]})
+        brick = doc["Material"]["Brick"]
+        assert "conductivty" not in brick.data
+        assert brick.conductivity == pytest.approx(0.9)
+
+    def test_ragged_columns_raise(self) -> None:
+        doc = self._materials()
+        with pytest.raises(ValueError, match="same length"):
+            doc.update_from_frame("Material", {"name": ["Brick", "Gypsum"], "conductivity": [1.0]})
+
+    def test_positional_rows_for_unnamed_types(self, empty_doc: IDFDocument) -> None:
+        empty_doc.add("Output:Variable", key_value="*", variable_name="A", validate=False)
+        empty_doc.add("Output:Variable", key_value="*", variable_name="B", validate=False)
+        empty_doc.update_from_frame("Output:Variable", {"reporting_frequency": ["Hourly", "Daily"]})
+        freqs = [o.reporting_frequency for o in empty_doc["Output:Variable"]]
+        assert freqs == ["Hourly", "Daily"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +10,7 @@ import pytest
 from idfkit import IDFDocument, new_document
 from idfkit.exceptions import ExpandObjectsError
 from idfkit.objects import IDFObject
+from idfkit.simulation._common import link_input
 from idfkit.simulation.config import EnergyPlusConfig
 from idfkit.simulation.expand import (
     _check_for_fatal_preprocessor_message,
@@ -620,17 +620,17 @@ class TestRunSlabPreprocessor:
             run_slab_preprocessor(doc, energyplus=config)
         assert exc_info.value.preprocessor == "Slab"
 
-    def test_copies_idds_to_run_dir(self, mock_config: EnergyPlusConfig) -> None:
+    def test_links_idds_to_run_dir(self, mock_config: EnergyPlusConfig) -> None:
         doc = new_document(version=(24, 1, 0))
         doc.add("GroundHeatTransfer:Slab:Materials", "", {}, validate=False)
 
         idd_copied: list[str] = []
 
-        original_copy2 = shutil.copy2
+        original_link = link_input
 
-        def track_copy(src: object, dst: object) -> object:
+        def track_link(src: Path, dst: Path, scratch: Path | None = None) -> None:
             idd_copied.append(str(dst))
-            return original_copy2(src, dst)  # type: ignore[arg-type]
+            original_link(src, dst, scratch)
 
         def fake_run(cmd: list[str], **kwargs: object) -> MagicMock:
             cwd = Path(str(kwargs.get("cwd", "")))
@@ -648,7 +648,7 @@ class TestRunSlabPreprocessor:
 
         with (
             patch("idfkit.simulation.expand.subprocess.run", side_effect=fake_run),
-            patch("idfkit.simulation.expand.shutil.copy2", side_effect=track_copy),
+            patch("idfkit.simulation.expand.link_input", side_effect=track_link),
         ):
             run_slab_preprocessor(doc, energyplus=mock_config)
 
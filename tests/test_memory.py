@@ -0,0 +1,65 @@
+"""Tests for document memory introspection."""
+
+from __future__ import annotations
+
+import json
+
+from idfkit import IDFDocument, new_document
+from idfkit.memory import MemoryReport, TypeMemory, memory_report
+
+
+class TestMemoryReport:
+    def test_per_type_breakdown(self, simple_doc: IDFDocument) -> None:
+        report = simple_doc.memory_report()
+        assert isinstance(report, MemoryReport)
+        assert set(report.types) == {k for k, c in simple_doc.collections.items() if c}
+        zone = report.types["Zone"]
+        assert isinstance(zone, TypeMemory)
+        assert zone.count == 1
+        assert zone.wrappers > 0
+        assert zone.data > 0
+        assert zone.field_orders > 0
+        assert zone.schema > 0
+
+    def test_references_attributed_to_referencing_type(self, simple_doc: IDFDocument) -> None:
+        simple_doc.build_references()
+        report = simple_doc.memory_report()
+        assert report.types["BuildingSurface:Detailed"].references > 0
+        assert report.types["Zone"].references == 0
+        assert report.graph_overhead > 0
+
+    def test_does_not_build_lazy_graph(self, simple_doc: IDFDocument) -> None:
+        report = simple_doc.memory_report()
+        assert all(t.references == 0 for t in report.types.values())
+        assert simple_doc._references_built is False
+
+    def test_total_excludes_schema(self, simple_doc: IDFDocument) -> None:
+        report = simple_doc.memory_report()
+        assert report.total == sum(t.total for t in report.types.values()) + report.graph_overhead
+        assert report.schema_share == sum(t.schema for t in report.types.values())
+        assert report.schema_total is None
+
+    def test_grows_with_objects(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Zone", "A", x_origin=1.0)
+        small = memory_report(doc).total
+        for i in range(20):
+            doc.add("Zone", f"Z{i}", x_origin=float(i))
+        assert memory_report(doc).total > small
+
+    def test_schema_total(self, simple_doc: IDFDocument) -> None:
+        report = simple_doc.memory_report(include_schema_total=True)
+        assert report.schema_total is not None
+        assert report.schema_total > report.schema_share
+
+    def test_to_dict_is_json_serializable(self, simple_doc: IDFDocument) -> None:
+        data = simple_doc.memory_report().to_dict()
+        json.dumps(data)
+        totals = [t["total"] for t in data["types"]]
+        assert totals == sorted(totals, reverse=True)
+        assert data["total"] == simple_doc.memory_report().total
+
+    def test_empty_document(self) -> None:
+        report = IDFDocument(version=(24, 1, 0)).memory_report()
+        assert report.types == {}
+        assert report.total == report.graph_overhead
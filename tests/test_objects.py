@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from idfkit.exceptions import DuplicateObjectError
-from idfkit.objects import IDFCollection, IDFObject, to_idf_name, to_python_name
+from idfkit.objects import IDFCollection, IDFObject, build_object_class, to_idf_name, to_python_name
 
 # ---------------------------------------------------------------------------
 # Name conversion helpers
@@ -432,3 +432,158 @@ class TestIDFCollection:
         coll.add(obj)
         assert "MYZONE" in coll.by_name
         assert coll.by_name["MYZONE"] is obj
+
+    def test_to_columns(self) -> None:
+        coll = IDFCollection("Zone")
+        coll.add(IDFObject(obj_type="Zone", name="A", data={"x_origin": 1.0, "type": ""}))
+        coll.add(IDFObject(obj_type="Zone", name="B", data={"x_origin": 2.0, "multiplier": 3}))
+        result = coll.to_columns()
+        assert result == {
+            "name": ["A", "B"],
+            "x_origin": [1.0, 2.0],
+            "type": [None, None],
+            "multiplier": [None, 3],
+        }
+
+    def test_to_columns_schema_order(self) -> None:
+        order = ["direction_of_relative_north", "x_origin", "y_origin"]
+        coll = IDFCollection("Zone")
+        coll.add(IDFObject(obj_type="Zone", name="A", data={"y_origin": 1.0, "x_origin": 2.0}, field_order=order))
+        assert list(coll.to_columns()) == ["name", "x_origin", "y_origin"]
+
+    def test_to_columns_selected_fields(self) -> None:
+        coll = IDFCollection("Zone")
+        coll.add(IDFObject(obj_type="Zone", name="A", data={"x_origin": 1.0, "y_origin": 2.0}))
+        assert coll.to_columns(fields=["Y Origin"]) == {"name": ["A"], "y_origin": [2.0]}
+
+    def test_to_frame_numeric_dtypes(self) -> None:
+        pytest.importorskip("pandas")
+        coll = IDFCollection("Zone")
+        coll.add(IDFObject(obj_type="Zone", name="A", data={"x_origin": 1.0, "multiplier": ""}))
+        coll.add(IDFObject(obj_type="Zone", name="B", data={"x_origin": 2.5, "multiplier": 2}))
+        frame = coll.to_frame()
+        assert list(frame.index) == ["A", "B"]
+        assert frame.index.name == "name"
+        assert frame["x_origin"].dtype.kind == "f"
+        assert frame["multiplier"].dtype.kind == "f"
+        assert frame["multiplier"].isna().tolist() == [True, False]
+
+    def test_to_frame_unnamed_objects_use_positional_index(self) -> None:
+        pytest.importorskip("pandas")
+        coll = IDFCollection("Output:Variable")
+        coll.add(IDFObject(obj_type="Output:Variable", name="", data={"variable_name": "A"}))
+        coll.add(IDFObject(obj_type="Output:Variable", name="", data={"variable_name": "B"}))
+        frame = coll.to_frame()
+        assert list(frame.index) == [0, 1]
+
+
+# ---------------------------------------------------------------------------
+# Per-type subclasses
+# ---------------------------------------------------------------------------
+
+
+class TestPerTypeObjectClasses:
+    def test_schema_objects_use_per_type_class(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        assert type(zone) is not IDFObject
+        assert isinstance(zone, IDFObject)
+        assert type(zone).__name__ == "Zone"
+        assert type(doc.add("Zone", "Core")) is type(zone)
+
+    def test_descriptor_reads_and_writes_data(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        assert zone.x_origin == 1.0
+        assert zone.y_origin is None
+        zone.x_origin = 3.0
+        assert zone.data["x_origin"] == 3.0
+        assert zone.mutation_version == 1
+
+    def test_eppy_alias_resolved_at_class_creation(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        assert "X_Origin" in vars(type(zone))
+        assert zone.X_Origin == 1.0
+        zone.X_Origin = 2.0
+        assert zone.x_origin == 2.0
+
+    def test_reserved_names_not_shadowed(self) -> None:
+        cls = build_object_class("Test:Reserved", ("name", "key", "data", "x_origin"))
+        obj = cls("Test:Reserved", "A", {"key": "field-value", "x_origin": 1.0})
+        assert obj.key == "Test:Reserved"
+        assert obj.name == "A"
+        assert obj.x_origin == 1.0
+
+    def test_build_object_class_memoized(self) -> None:
+        a = build_object_class("Test:Memo", ("a", "b"))
+        assert build_object_class("Test:Memo", ("a", "b")) is a
+        assert build_object_class("Test:Memo", ("a",)) is not a
+
+    def test_unknown_fields_fall_back_to_getattr(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        surface = doc.add(
+            "BuildingSurface:Detailed",
+            "Wall",
+            surface_type="Wall",
+            construction_name="",
+            zone_name="",
+            outside_boundary_condition="Outdoors",
+            vertex_x_coordinate_2=4.0,
+            validate=False,
+        )
+        assert surface.vertex_x_coordinate_2 == 4.0
+        assert surface.vertex_9_x_coordinate is None
+
+    def test_strict_mode_still_raises_for_unknown(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0), strict=True)
+        zone = doc.add("Zone", "Office")
+        assert zone.x_origin is None
+        with pytest.raises(AttributeError, match="no field"):
+            _ = zone.not_a_field
+
+    def test_copy_preserves_class(self) -> None:
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        assert type(zone.copy()) is type(zone)
+
+    def test_copy_module_returns_new_object(self) -> None:
+        import copy
+
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        shallow = copy.copy(zone)
+        assert shallow is not zone
+        assert type(shallow) is type(zone)
+        assert shallow.data is zone.data
+        deep = copy.deepcopy(zone)
+        assert deep is not zone
+        assert deep.x_origin == 1.0
+        assert deep.data is not zone.data
+        assert doc["Zone"]["Office"] is zone
+
+    def test_pickle_roundtrip(self) -> None:
+        import pickle
+
+        from idfkit import new_document
+
+        doc = new_document(version=(24, 1, 0))
+        zone = doc.add("Zone", "Office", x_origin=1.0)
+        restored = pickle.loads(pickle.dumps(zone))  # noqa: S301
+        assert type(restored) is type(zone)
+        assert restored.x_origin == 1.0
+        assert restored.name == "Office"
@@ -12,6 +12,7 @@ from idfkit.epjson_parser import get_epjson_version, parse_epjson
 from idfkit.epjson_parser import load_epjson as raw_load_epjson
 from idfkit.exceptions import IDFParseError, VersionNotFoundError
 from idfkit.idf_parser import get_idf_version, iter_idf_objects, parse_idf
+from idfkit.validation import validate_document
 
 # ---------------------------------------------------------------------------
 # IDF Parser
@@ -107,6 +108,43 @@ Zone,
         assert zone.name == "TestZone"
 
 
+class TestParseIDFValidate:
+    def test_returns_document_and_result(self, idf_file: Path) -> None:
+        doc, result = parse_idf(idf_file, validate=True)
+        assert len(doc["Zone"]) == 1
+        expected = validate_document(parse_idf(idf_file))
+        assert [str(e) for e in result.errors] == [str(e) for e in expected.errors]
+        assert [str(e) for e in result.warnings] == [str(e) for e in expected.warnings]
+
+    def test_field_and_reference_errors(self, tmp_path: Path) -> None:
+        content = """\
+Version, 24.1;
+Material, Brick, Bumpy, -0.1, 0.7, 1900, 800;
+Construction, Wall, Brick;
+Construction, Roof, MissingMaterial;
+"""
+        filepath = tmp_path / "invalid.idf"
+        filepath.write_text(content)
+        _doc, result = parse_idf(filepath, validate=True)
+        assert sorted((e.obj_name, e.field, e.code) for e in result.errors) == [
+            ("Brick", "roughness", "E004"),
+            ("Brick", "thickness", "E006"),
+            ("Roof", "outside_layer", "E009"),
+        ]
+
+    def test_skipped_objects_not_reported(self, tmp_path: Path) -> None:
+        content = """\
+Version, 24.1;
+NotAType, Foo, 1;
+Zone, Office, x;
+"""
+        filepath = tmp_path / "skipped.idf"
+        filepath.write_text(content)
+        doc, result = parse_idf(filepath, strict=False, validate=True)
+        assert "NotAType" not in doc
+        assert [(e.obj_name, e.code) for e in result.errors] == [("Office", "E003")]
+
+
 class TestGetIDFVersion:
     def test_basic(self, idf_file: Path) -> None:
         version = get_idf_version(idf_file)
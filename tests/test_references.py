@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import pytest
+
 from idfkit.objects import IDFObject
-from idfkit.references import ReferenceGraph
+from idfkit.references import CompactReferenceGraph, ReferenceGraph
 
 
 class TestReferenceGraphRegister:
@@ -35,6 +37,20 @@ class TestReferenceGraphRegister:
         stats = graph.stats()
         assert stats["object_lists"] == 1
 
+    def test_register_many_matches_register(self) -> None:
+        p1 = IDFObject(obj_type="People", name="P1")
+        p2 = IDFObject(obj_type="People", name="P2")
+        edges = [(p1, "zone_name", "Z1"), (p1, "schedule_name", "S1"), (p2, "zone_name", "z1"), (p2, "x", "")]
+        for cls in (ReferenceGraph, CompactReferenceGraph):
+            bulk = cls()
+            bulk.register_many([*edges, edges[0]])
+            single = cls()
+            for obj, field, name in edges:
+                single.register(obj, field, name)
+            assert len(bulk) == len(single) == 3
+            assert bulk.get_referencing_with_fields("Z1") == single.get_referencing_with_fields("Z1")
+            assert bulk.get_references(p1) == {"Z1", "S1"}
+
 
 class TestReferenceGraphLookup:
     def test_get_referencing(self, reference_graph: ReferenceGraph) -> None:
@@ -200,6 +216,56 @@ class TestReferenceGraphRenameTarget:
         assert obj_b in refs
 
 
+class TestReferenceGraphRenameTargets:
+    def test_swap(self) -> None:
+        for cls in (ReferenceGraph, CompactReferenceGraph):
+            graph = cls()
+            a = IDFObject(obj_type="People", name="P1")
+            b = IDFObject(obj_type="People", name="P2")
+            graph.register(a, "zone_name", "Z1")
+            graph.register(b, "zone_name", "Z2")
+            graph.rename_targets({"Z1": "Z2", "z2": "Z1"})
+            assert graph.get_referencing("Z2") == {a}
+            assert graph.get_referencing("Z1") == {b}
+            assert graph.get_references(a) == {"Z2"}
+            assert len(graph) == 2
+
+    def test_merges_duplicates(self) -> None:
+        for cls in (ReferenceGraph, CompactReferenceGraph):
+            graph = cls()
+            obj = IDFObject(obj_type="ZoneList", name="L")
+            graph.register(obj, "zone_name", "Z1")
+            graph.register(obj, "zone_name", "Z2")
+            graph.rename_targets({"Z1": "Z3", "Z2": "Z3"})
+            assert graph.get_referencing_with_fields("Z3") == {(obj, "zone_name")}
+            assert not graph.is_referenced("Z1")
+            assert len(graph) == 1
+
+    def test_matches_sequential_renames(self) -> None:
+        for cls in (ReferenceGraph, CompactReferenceGraph):
+            bulk, single = cls(), cls()
+            objs = [IDFObject(obj_type="People", name=f"P{i}") for i in range(6)]
+            for i, obj in enumerate(objs):
+                for graph in (bulk, single):
+                    graph.register(obj, "zone_name", f"Z{i % 3}")
+                    graph.register(obj, "schedule_name", f"S{i}")
+            bulk.rename_targets({"Z0": "A", "S1": "B", "Z2": "Z2"})
+            for old, new in (("Z0", "A"), ("S1", "B")):
+                single.rename_target(old, new)
+            for name in ("A", "B", "Z1", "Z2", "Z0", "S1"):
+                assert bulk.get_referencing_with_fields(name) == single.get_referencing_with_fields(name)
+
+    def test_case_duplicate_keys_rejected(self) -> None:
+        for cls in (ReferenceGraph, CompactReferenceGraph):
+            graph = cls()
+            obj = IDFObject(obj_type="People", name="P1")
+            graph.register(obj, "zone_name", "Z1")
+            with pytest.raises(ValueError, match="case-insensitive"):
+                graph.rename_targets({"Z1": "A", "z1": "B"})
+            assert graph.get_referencing("Z1") == {obj}
+            assert not graph.is_referenced("A")
+
+
 class TestReferenceGraphUpdateReference:
     def test_update_reference_basic(self) -> None:
         graph = ReferenceGraph()
@@ -231,3 +297,114 @@ class TestReferenceGraphUpdateReference:
         graph.register(obj, "zone_name", "Z1")
         graph.update_reference(obj, "zone_name", "Z1", "")
         assert not graph.is_referenced("Z1")
+
+
+class TestCompactReferenceGraph:
+    def _random_ops(self, seed: int, steps: int = 60) -> None:
+        import random
+
+        rng = random.Random(seed)  # noqa: S311
+        expected = ReferenceGraph()
+        graph = CompactReferenceGraph()
+        objs = [IDFObject(obj_type="People", name=f"O{i}") for i in range(6)]
+        names = ["A", "b", "C", "o1", "O2", ""]
+        fields = ["zone_name", "schedule_name"]
+        for _ in range(steps):
+            op = rng.random()
+            obj, name, field = rng.choice(objs), rng.choice(names), rng.choice(fields)
+            if op < 0.35:
+                expected.register(obj, field, name)
+                graph.register(obj, field, name)
+            elif op < 0.5:
+                expected.unregister(obj)
+                graph.unregister(obj)
+            elif op < 0.65:
+                new = rng.choice(names)
+                expected.rename_target(name, new)
+                graph.rename_target(name, new)
+            elif op < 0.85:
+                new = rng.choice([*names, None])
+                expected.update_reference(obj, field, name, new)
+                graph.update_reference(obj, field, name, new)
+            elif op < 0.9:
+                graph.compact()
+            else:
+                graph = CompactReferenceGraph.from_graph(graph)
+
+            for n in [*names, "missing"]:
+                assert graph.get_referencing_with_fields(n) == expected.get_referencing_with_fields(n)
+                assert graph.is_referenced(n) == expected.is_referenced(n)
+            for o in objs:
+                assert graph.get_references_with_fields(o) == expected.get_references_with_fields(o)
+            assert len(graph) == len(expected)
+
+    def test_matches_reference_graph(self, monkeypatch) -> None:
+        import idfkit.references as references_module
+
+        monkeypatch.setattr(references_module, "_COMPACT_MIN_PENDING", 3)
+        for seed in range(200):
+            self._random_ops(seed)
+
+    def test_register_dedupes(self) -> None:
+        graph = CompactReferenceGraph()
+        obj = IDFObject(obj_type="People", name="P1")
+        graph.register(obj, "zone_name", "Z1")
+        graph.compact()
+        graph.register(obj, "zone_name", "z1")
+        assert len(graph) == 1
+
+    def test_compact_drops_tombstones(self) -> None:
+        graph = CompactReferenceGraph()
+        keep = IDFObject(obj_type="People", name="Keep")
+        drop = IDFObject(obj_type="People", name="Drop")
+        graph.register(keep, "zone_name", "Z1")
+        graph.register(drop, "zone_name", "Z2")
+        graph.unregister(drop)
+        graph.compact()
+        assert len(graph._edge_src) == 1
+        assert graph._names == ["Z1"]
+        assert graph.get_referencing("Z1") == {keep}
+        assert not graph.is_referenced("Z2")
+
+    def test_auto_compaction(self, monkeypatch) -> None:
+        import idfkit.references as references_module
+
+        monkeypatch.setattr(references_module, "_COMPACT_MIN_PENDING", 4)
+        graph = CompactReferenceGraph()
+        objs = [IDFObject(obj_type="People", name=f"P{i}") for i in range(20)]
+        for obj in objs:
+            graph.register(obj, "zone_name", "Z1")
+        assert len(graph._fwd_edges) > 0
+        assert graph._pending_count <= len(graph._fwd_edges)
+        assert graph.get_referencing("Z1") == set(objs)
+
+    def test_from_graph(self, reference_graph: ReferenceGraph) -> None:
+        compact = CompactReferenceGraph.from_graph(reference_graph)
+        assert compact.get_referencing("ZONE1") == reference_graph.get_referencing("ZONE1")
+        assert compact.stats() == reference_graph.stats()
+
+    def test_document_option(self, simple_doc) -> None:
+        import pickle
+
+        from idfkit import IDFDocument
+
+        doc = IDFDocument(version=(24, 1, 0), schema=simple_doc.schema, compact_references=True)
+        for obj in simple_doc.all_objects:
+            doc.addidfobject(obj.copy())
+        assert isinstance(doc.references, CompactReferenceGraph)
+        assert {o.name for o in doc.get_referencing("TestZone")} == {
+            o.name for o in simple_doc.get_referencing("TestZone")
+        }
+        assert isinstance(doc.copy().references, CompactReferenceGraph)
+        assert isinstance(pickle.loads(pickle.dumps(doc)).references, CompactReferenceGraph)  # noqa: S301
+
+    def test_use_compact_references(self, simple_doc) -> None:
+        before = simple_doc.get_referencing("TestZone")
+        simple_doc.use_compact_references()
+        assert isinstance(simple_doc.references, CompactReferenceGraph)
+        assert simple_doc.get_referencing("TestZone") == before
+        simple_doc.rename("Zone", "TestZone", "Renamed")
+        assert simple_doc["BuildingSurface:Detailed"]["TestWall"].zone_name == "Renamed"
+        assert simple_doc.get_referencing("Renamed") == before
+        report = simple_doc.memory_report()
+        assert report.types["BuildingSurface:Detailed"].references > 0
@@ -282,6 +282,45 @@ class TestAsyncSimulateBatch:
         assert result2[0].success
         assert mock_exec.call_count == 1  # no additional call
 
+    @pytest.mark.asyncio
+    @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
+    async def test_dedupe(self, mock_exec: AsyncMock, mock_config: EnergyPlusConfig, weather_file: Path) -> None:
+        mock_exec.return_value = _make_mock_process()
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, label=f"job-{i}") for i in range(3)]
+        result = await async_simulate_batch(jobs, energyplus=mock_config, dedupe=True)
+        assert mock_exec.call_count == 1
+        assert result.deduplicated == 2
+        assert result.all_succeeded
+        assert len(result) == 3
+
+    @pytest.mark.asyncio
+    @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
+    async def test_reducer(
+        self, mock_exec: AsyncMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_exec.return_value = _make_mock_process()
+        scratch = tmp_path / "scratch"
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, scratch_dir=scratch) for _ in range(2)]
+        result = await async_simulate_batch(
+            jobs, energyplus=mock_config, reducer=lambda r: r.run_dir.parent, keep_run_dirs=False
+        )
+        assert result.values == (scratch, scratch)
+        assert all(r.stdout == "" for r in result)
+        assert list(scratch.glob("idfkit_sim_*")) == []
+
+    @pytest.mark.asyncio
+    @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
+    async def test_reducer_keeps_explicit_output_dir(
+        self, mock_exec: AsyncMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_exec.return_value = _make_mock_process()
+        job = SimulationJob(model=new_document(), weather=weather_file, output_dir=tmp_path / "run")
+        result = await async_simulate_batch(
+            [job], energyplus=mock_config, reducer=lambda r: r.run_dir.name, keep_run_dirs=False
+        )
+        assert result.values == ("run",)
+        assert (tmp_path / "run").is_dir()
+
 
 # ---------------------------------------------------------------------------
 # async_simulate_batch_stream
@@ -317,6 +356,30 @@ class TestAsyncSimulateBatchStream:
         # All indices should be present
         assert sorted(e.index for e in events) == [0, 1, 2]
 
+    @pytest.mark.asyncio
+    @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
+    async def test_dedupe_yields_every_job(
+        self, mock_exec: AsyncMock, mock_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        mock_exec.return_value = _make_mock_process()
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, label=f"job-{i}") for i in range(3)]
+        events = [e async for e in async_simulate_batch_stream(jobs, energyplus=mock_config, dedupe=True)]
+        assert mock_exec.call_count == 1
+        assert [e.completed for e in events] == [1, 2, 3]
+        assert sorted(e.label for e in events) == ["job-0", "job-1", "job-2"]
+
+    @pytest.mark.asyncio
+    @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
+    async def test_reducer_value_on_events(
+        self, mock_exec: AsyncMock, mock_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        mock_exec.return_value = _make_mock_process()
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, label=f"job-{i}") for i in range(2)]
+        events = [
+            e async for e in async_simulate_batch_stream(jobs, energyplus=mock_config, reducer=lambda r: r.success)
+        ]
+        assert [e.value for e in events] == [True, True]
+
     @pytest.mark.asyncio
     @patch("idfkit.simulation.async_runner.asyncio.create_subprocess_exec")
     async def test_event_contains_result(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +14,7 @@ from idfkit import new_document
 from idfkit.simulation.batch import BatchResult, SimulationJob, simulate_batch
 from idfkit.simulation.cache import SimulationCache
 from idfkit.simulation.config import EnergyPlusConfig
+from idfkit.simulation.progress import SimulationProgress
 from idfkit.simulation.result import SimulationResult
 
 # ---------------------------------------------------------------------------
@@ -62,6 +65,7 @@ class TestSimulationJob:
         job = SimulationJob(model=model, weather="test.epw")
         assert job.label == ""
         assert job.output_dir is None
+        assert job.scratch_dir is None
         assert job.expand_objects is True
         assert job.annual is False
         assert job.design_day is False
@@ -241,6 +245,18 @@ class TestSimulateBatch:
         assert result2[0].success
         assert mock_run.call_count == 1  # no additional call
 
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_jobs_share_linked_weather_in_scratch_dir(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        scratch = tmp_path / "scratch"
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, scratch_dir=scratch) for _ in range(2)]
+        result = simulate_batch(jobs, energyplus=mock_config)
+        assert all(r.run_dir.parent == scratch for r in result)
+        inodes = {(r.run_dir / weather_file.name).stat().st_ino for r in result}
+        assert len(inodes) == 1
+
     @patch("idfkit.simulation.runner.subprocess.run")
     def test_total_runtime_populated(
         self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path
@@ -261,3 +277,224 @@ class TestSimulateBatch:
         result = simulate_batch([job], energyplus=mock_config, fs=fs, max_workers=1)
         assert result[0].success
         assert result[0].fs is fs
+
+
+# ---------------------------------------------------------------------------
+# Deduplication
+# ---------------------------------------------------------------------------
+
+
+class TestDeduplication:
+    """Tests for simulate_batch(dedupe=True)."""
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_identical_jobs_run_once(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        progress_labels: list[str] = []
+
+        def on_progress(**kwargs: object) -> None:
+            progress_labels.append(str(kwargs["label"]))
+
+        shared = new_document()
+        jobs = [
+            SimulationJob(model=new_document(), weather=weather_file, label="a"),
+            SimulationJob(model=shared, weather=weather_file, label="b"),
+            SimulationJob(model=shared, weather=weather_file, label="c"),
+        ]
+        result = simulate_batch(jobs, energyplus=mock_config, dedupe=True, progress=on_progress)
+        assert mock_run.call_count == 1
+        assert result.deduplicated == 2
+        assert result[0] is result[1] is result[2]
+        assert sorted(progress_labels) == ["a", "b", "c"]
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_different_inputs_not_merged(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        zoned = new_document()
+        zoned.add("Zone", "Office")
+        jobs = [
+            SimulationJob(model=new_document(), weather=weather_file),
+            SimulationJob(model=zoned, weather=weather_file),
+            SimulationJob(model=new_document(), weather=weather_file, annual=True),
+            SimulationJob(model=new_document(), weather=weather_file, output_dir=tmp_path / "own"),
+            SimulationJob(model=new_document(), weather=tmp_path / "missing.epw"),
+            SimulationJob(model=new_document(), weather=tmp_path / "missing.epw"),
+        ]
+        result = simulate_batch(jobs, energyplus=mock_config, dedupe=True)
+        assert result.deduplicated == 0
+        assert mock_run.call_count == 4
+        assert [r.success for r in result] == [True, True, True, True, False, False]
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_off_by_default(self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        jobs = [SimulationJob(model=new_document(), weather=weather_file) for _ in range(3)]
+        result = simulate_batch(jobs, energyplus=mock_config)
+        assert mock_run.call_count == 3
+        assert result.deduplicated == 0
+
+
+def _model_size(result: SimulationResult) -> int:
+    """Module-level reducer so it pickles to worker processes."""
+    return (result.run_dir / "model.idf").stat().st_size
+
+
+class TestReducer:
+    """Tests for simulate_batch(reducer=..., keep_run_dirs=...)."""
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_values_collected_in_job_order(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="lots of output", stderr="")
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, label=f"job-{i}") for i in range(3)]
+        result = simulate_batch(jobs, energyplus=mock_config, reducer=_model_size)
+        assert len(result.values) == 3
+        assert all(isinstance(v, int) and v > 0 for v in result.values)
+        assert all(r.success and r.stdout == "" for r in result)
+        assert all(r.run_dir.is_dir() for r in result)
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_no_reducer_leaves_values_empty(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        result = simulate_batch([SimulationJob(model=new_document(), weather=weather_file)], energyplus=mock_config)
+        assert result.values == ()
+        assert result[0].stdout == "ok"
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_run_dirs_deleted_after_reduction(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        scratch = tmp_path / "scratch"
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, scratch_dir=scratch) for _ in range(2)]
+        result = simulate_batch(jobs, energyplus=mock_config, reducer=_model_size, keep_run_dirs=False)
+        assert all(v > 0 for v in result.values)
+        assert list(scratch.glob("idfkit_sim_*")) == []
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_explicit_output_dirs_kept(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        out = tmp_path / "results"
+        out.mkdir()
+        (out / "notes.txt").write_text("keep me")
+        job = SimulationJob(model=new_document(), weather=weather_file, output_dir=out)
+        result = simulate_batch([job], energyplus=mock_config, reducer=_model_size, keep_run_dirs=False)
+        assert result.values[0] > 0
+        assert (out / "notes.txt").read_text() == "keep me"
+        assert (out / "model.idf").is_file()
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_failed_jobs_not_reduced_and_kept(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Severe error")
+        job = SimulationJob(model=new_document(), weather=weather_file, output_dir=tmp_path / "run")
+        result = simulate_batch([job], energyplus=mock_config, reducer=_model_size, keep_run_dirs=False)
+        assert result.values == (None,)
+        assert result[0].stderr == "Severe error"
+        assert (tmp_path / "run").is_dir()
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_raising_reducer_marks_job_failed(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+
+        def broken(result: SimulationResult) -> float:
+            msg = "Site EUI"
+            raise KeyError(msg)
+
+        job = SimulationJob(model=new_document(), weather=weather_file, output_dir=tmp_path / "run")
+        result = simulate_batch([job], energyplus=mock_config, reducer=broken, keep_run_dirs=False)
+        assert not result[0].success
+        assert "Site EUI" in result[0].stderr
+        assert result.values == (None,)
+        assert (tmp_path / "run").is_dir()
+
+    @patch("idfkit.simulation.runner.subprocess.run")
+    def test_cache_entries_never_deleted(
+        self, mock_run: MagicMock, mock_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        cache = SimulationCache(cache_dir=tmp_path / "cache")
+        job = SimulationJob(model=new_document(), weather=weather_file)
+        simulate_batch([job], energyplus=mock_config, cache=cache, reducer=_model_size, keep_run_dirs=False)
+        hit = simulate_batch([job], energyplus=mock_config, cache=cache, reducer=_model_size, keep_run_dirs=False)
+        assert mock_run.call_count == 1
+        assert hit.values[0] > 0
+        assert hit[0].run_dir.is_dir()
+        assert cache.get(cache.compute_key(new_document(), weather_file)) is not None
+
+
+# ---------------------------------------------------------------------------
+# Executors
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def script_config(tmp_path: Path) -> EnergyPlusConfig:
+    """EnergyPlusConfig whose executable is a shell script (mocks do not cross processes)."""
+    exe = tmp_path / "energyplus"
+    exe.write_text('#!/bin/sh\necho "Warming up {1}"\necho "EnergyPlus Completed Successfully"\n')
+    exe.chmod(0o755)
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text("!IDD_Version 24.1.0\n")
+    return EnergyPlusConfig(executable=exe, version=(24, 1, 0), install_dir=tmp_path, idd_path=idd)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the EnergyPlus executable")
+class TestExecutors:
+    """Tests for simulate_batch(executor=...)."""
+
+    def test_process_executor(self, script_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path) -> None:
+        jobs = [
+            SimulationJob(model=new_document(), weather=weather_file, label="ok", output_dir=tmp_path / "run0"),
+            SimulationJob(model=new_document(), weather=tmp_path / "missing.epw", label="no-weather"),
+            SimulationJob(model=new_document(), weather=weather_file, label="ok2", output_dir=tmp_path / "run2"),
+        ]
+        result = simulate_batch(jobs, energyplus=script_config, executor="process", max_workers=2)
+        assert [r.success for r in result] == [True, False, True]
+        assert "Completed Successfully" in result[0].stdout
+        assert "Weather file not found" in result[1].stderr
+        assert result[2].run_dir == (tmp_path / "run2").resolve()
+        assert (tmp_path / "run2" / "model.idf").is_file()
+
+    def test_process_executor_reduces_in_workers(
+        self, script_config: EnergyPlusConfig, weather_file: Path, tmp_path: Path
+    ) -> None:
+        scratch = tmp_path / "scratch"
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, scratch_dir=scratch) for _ in range(2)]
+        result = simulate_batch(
+            jobs, energyplus=script_config, executor="process", reducer=_model_size, keep_run_dirs=False
+        )
+        assert result.all_succeeded
+        assert all(v > 0 for v in result.values)
+        assert list(scratch.glob("idfkit_sim_*")) == []
+
+    def test_process_executor_relays_progress(self, script_config: EnergyPlusConfig, weather_file: Path) -> None:
+        events: list[SimulationProgress] = []
+        jobs = [SimulationJob(model=new_document(), weather=weather_file, label=f"job-{i}") for i in range(2)]
+        simulate_batch(jobs, energyplus=script_config, executor="process", on_progress=events.append)
+        assert {e.job_label for e in events} == {"job-0", "job-1"}
+        assert {e.phase for e in events} >= {"warmup", "complete"}
+
+    def test_custom_executor_not_shut_down(self, script_config: EnergyPlusConfig, weather_file: Path) -> None:
+        jobs = [SimulationJob(model=new_document(), weather=weather_file)]
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert simulate_batch(jobs, energyplus=script_config, executor=pool).all_succeeded
+            assert simulate_batch(jobs, energyplus=script_config, executor=pool).all_succeeded
+
+    def test_unpicklable_job_fails_without_raising(self, script_config: EnergyPlusConfig, weather_file: Path) -> None:
+        jobs = [SimulationJob(model=lambda: None, weather=weather_file)]
+        result = simulate_batch(jobs, energyplus=script_config, executor="process")
+        assert not result[0].success
+        assert "pickle" in result[0].stderr.lower()
@@ -0,0 +1,168 @@
+"""Tests for the consolidated batch output store."""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from idfkit.simulation.async_batch import SimulationEvent
+from idfkit.simulation.batch_store import BatchStore, RunExtract, TabularSpec, TimeSeriesSpec
+from idfkit.simulation.result import SimulationResult
+
+_TABLES = """
+CREATE TABLE ReportDataDictionary (
+    ReportDataDictionaryIndex INTEGER PRIMARY KEY, IsMeter INTEGER, Type TEXT, IndexGroup TEXT,
+    TimestepType TEXT, KeyValue TEXT, Name TEXT, ReportingFrequency TEXT, ScheduleName TEXT, Units TEXT
+);
+CREATE TABLE Time (
+    TimeIndex INTEGER PRIMARY KEY, Year INTEGER, Month INTEGER, Day INTEGER, Hour INTEGER, Minute INTEGER,
+    Dst INTEGER, Interval INTEGER, IntervalType INTEGER, SimulationDays INTEGER, DayType TEXT,
+    EnvironmentPeriodIndex INTEGER, WarmupFlag INTEGER
+);
+CREATE TABLE EnvironmentPeriods (
+    EnvironmentPeriodIndex INTEGER PRIMARY KEY, SimulationIndex INTEGER, EnvironmentName TEXT,
+    EnvironmentType INTEGER
+);
+CREATE TABLE ReportData (
+    ReportDataIndex INTEGER PRIMARY KEY, TimeIndex INTEGER, ReportDataDictionaryIndex INTEGER, Value REAL
+);
+CREATE TABLE TabularDataWithStrings (
+    TabularDataIndex INTEGER PRIMARY KEY, ReportName TEXT, ReportForString TEXT, TableName TEXT,
+    RowName TEXT, ColumnName TEXT, Units TEXT, Value TEXT
+);
+INSERT INTO EnvironmentPeriods VALUES (1, 1, 'RUN PERIOD 1', 3);
+INSERT INTO ReportDataDictionary VALUES
+    (1, 0, 'Zone', 'Facility', 'Zone', 'THERMAL ZONE 1', 'Zone Mean Air Temperature', 'Hourly', '', 'C');
+INSERT INTO Time VALUES (1, 2017, 1, 1, 1, 0, 0, 60, 1, 1, 'Monday', 1, 0);
+INSERT INTO Time VALUES (2, 2017, 1, 1, 2, 0, 0, 60, 1, 1, 'Monday', 1, 0);
+INSERT INTO Time VALUES (3, 2017, 1, 1, 24, 0, 0, 60, 1, 1, 'Monday', 1, 0);
+"""
+
+
+def _run(tmp_path: Path, name: str, offset: float, *, sql: bool = True) -> SimulationResult:
+    """Create a run directory whose eplusout.sql values are shifted by *offset*."""
+    run_dir = tmp_path / name
+    run_dir.mkdir()
+    if sql:
+        conn = sqlite3.connect(run_dir / "eplusout.sql")
+        conn.executescript(_TABLES)
+        conn.executemany(
+            "INSERT INTO ReportData (TimeIndex, ReportDataDictionaryIndex, Value) VALUES (?, 1, ?)",
+            [(1, 20.0 + offset), (2, 21.0 + offset), (3, 22.0 + offset)],
+        )
+        conn.execute(
+            "INSERT INTO TabularDataWithStrings (ReportName, ReportForString, TableName, RowName, ColumnName, "
+            "Units, Value) VALUES ('AnnualBuildingUtilityPerformanceSummary', 'Entire Facility', 'End Uses', "
+            "'Heating', 'Electricity', 'GJ', ?)",
+            (f"{10 + offset:.2f}",),
+        )
+        conn.commit()
+        conn.close()
+    return SimulationResult(run_dir=run_dir, success=True, exit_code=0, stdout="", stderr="", runtime_seconds=1.0)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BatchStore:
+    return BatchStore(
+        tmp_path / "store.sqlite3",
+        timeseries=[
+            TimeSeriesSpec("Zone Mean Air Temperature", "Thermal Zone 1"),
+            TimeSeriesSpec("Site Outdoor Air Drybulb Temperature"),
+        ],
+        tabular=[TabularSpec("AnnualBuildingUtilityPerformanceSummary", "End Uses")],
+    )
+
+
+class TestBatchStore:
+    def test_ingest_and_query_across_runs(self, tmp_path: Path, store: BatchStore) -> None:
+        runs = [(f"run-{i}", _run(tmp_path, f"r{i}", float(i))) for i in range(3)]
+        assert store.ingest(runs, max_workers=2) == 3
+        assert sorted(store.labels()) == ["run-0", "run-1", "run-2"]
+
+        temps = store.get_timeseries("Zone Mean Air Temperature", "THERMAL ZONE 1")
+        assert list(temps) == store.labels()
+        assert temps["run-2"].values == (22.0, 23.0, 24.0)
+        assert temps["run-0"].units == "C"
+        assert temps["run-0"].timestamps[0] == datetime(2017, 1, 1, 1, 0)
+        assert temps["run-0"].timestamps[2] == datetime(2017, 1, 2, 0, 0)
+
+        heating = store.get_tabular_value(
+            "AnnualBuildingUtilityPerformanceSummary", "End Uses", "Heating", "Electricity"
+        )
+        assert heating == {"run-0": "10.00", "run-1": "11.00", "run-2": "12.00"}
+
+    def test_runs_share_time_axis(self, tmp_path: Path, store: BatchStore) -> None:
+        store.ingest([(f"run-{i}", _run(tmp_path, f"r{i}", float(i))) for i in range(3)])
+        assert store.query("SELECT COUNT(*) FROM axes") == [(1,)]
+
+    def test_ingest_is_incremental(self, tmp_path: Path, store: BatchStore) -> None:
+        assert store.ingest([("a", _run(tmp_path, "a", 0.0))]) == 1
+        assert store.ingest([("a", _run(tmp_path, "a2", 5.0)), ("b", _run(tmp_path, "b", 1.0))]) == 1
+        assert store.get_timeseries("Zone Mean Air Temperature")["a"].values[0] == 20.0
+        assert store.ingest([("a", _run(tmp_path, "a3", 5.0))], replace=True) == 1
+        assert store.get_timeseries("Zone Mean Air Temperature")["a"].values[0] == 25.0
+        assert len(store) == 2
+
+    def test_empty_labels_rejected(self, tmp_path: Path, store: BatchStore) -> None:
+        extracts = [("", store.extract(_run(tmp_path, f"r{i}", float(i)))) for i in range(3)]
+        with pytest.raises(ValueError, match="non-empty label"):
+            store.ingest(extracts)
+        assert len(store) == 0
+        with pytest.raises(ValueError, match="non-empty label"):
+            store.add("", extracts[0][1])
+
+    def test_duplicate_labels_rejected(self, tmp_path: Path, store: BatchStore) -> None:
+        runs = [("a", _run(tmp_path, "a", 0.0)), ("b", _run(tmp_path, "b", 1.0)), ("a", _run(tmp_path, "a2", 2.0))]
+        with pytest.raises(ValueError, match="Duplicate run label 'a'"):
+            store.ingest(runs)
+        assert sorted(store.labels()) == ["a", "b"]
+        assert store.get_timeseries("Zone Mean Air Temperature")["a"].values[0] == 20.0
+
+    def test_label_filter(self, tmp_path: Path, store: BatchStore) -> None:
+        store.ingest([(f"run-{i}", _run(tmp_path, f"r{i}", float(i))) for i in range(3)])
+        temps = store.get_timeseries("Zone Mean Air Temperature", labels=["run-1"])
+        assert list(temps) == ["run-1"]
+
+    def test_runs_without_sql_or_variable(self, tmp_path: Path, store: BatchStore) -> None:
+        store.ingest([("empty", _run(tmp_path, "empty", 0.0, sql=False)), ("skipped", None)])
+        assert "empty" in store
+        assert "skipped" not in store
+        assert store.get_timeseries("Zone Mean Air Temperature") == {}
+        assert store.get_timeseries("Site Outdoor Air Drybulb Temperature") == {}
+
+    def test_events_and_extracts(self, tmp_path: Path, store: BatchStore) -> None:
+        result = _run(tmp_path, "r", 0.0)
+        event = SimulationEvent(index=0, label="event", result=result, completed=1, total=2)
+        reduced = SimulationEvent(
+            index=1, label="reduced", result=result, completed=2, total=2, value=store.extract(result)
+        )
+        assert store.ingest([event, reduced]) == 2
+        assert set(store.get_timeseries("Zone Mean Air Temperature")) == {"event", "reduced"}
+
+    def test_extract_pickles_for_worker_processes(self, tmp_path: Path, store: BatchStore) -> None:
+        clone = pickle.loads(pickle.dumps(store))  # noqa: S301
+        assert clone.path == store.path
+        extract = pickle.loads(pickle.dumps(clone.extract(_run(tmp_path, "r", 0.0))))  # noqa: S301
+        assert isinstance(extract, RunExtract)
+        assert len(extract.series) == 1
+        store.add("pickled", extract)
+        assert "pickled" in store
+
+    def test_remove(self, tmp_path: Path, store: BatchStore) -> None:
+        store.add("a", _run(tmp_path, "a", 0.0))
+        assert store.remove("a")
+        assert not store.remove("a")
+        assert store.query("SELECT COUNT(*) FROM series") == [(0,)]
+        assert store.query("SELECT COUNT(*) FROM axes") == [(0,)]
+
+    def test_to_dataframe(self, tmp_path: Path, store: BatchStore) -> None:
+        pytest.importorskip("pandas")
+        store.ingest([(f"run-{i}", _run(tmp_path, f"r{i}", float(i))) for i in range(2)])
+        frame = store.to_dataframe("Zone Mean Air Temperature")
+        assert sorted(frame.columns) == ["run-0", "run-1"]
+        assert frame.index.name == "timestamp"
+        assert frame["run-1"].tolist() == [21.0, 22.0, 23.0]
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from idfkit import new_document
-from idfkit.simulation.cache import CacheKey, SimulationCache, default_simulation_cache_dir
+from idfkit.simulation import cache as cache_module
+from idfkit.simulation.cache import (
+    CacheKey,
+    CacheStats,
+    SimulationCache,
+    default_simulation_cache_dir,
+    simulation_key,
+)
 from idfkit.simulation.result import SimulationResult
 
 # ---------------------------------------------------------------------------
@@ -93,6 +102,10 @@ class TestComputeKey:
         k2 = cache.compute_key(model, weather_file)
         assert k1 == k2
 
+    def test_matches_simulation_key(self, cache: SimulationCache, weather_file: Path) -> None:
+        model = new_document()
+        assert simulation_key(model, weather_file, annual=True) == cache.compute_key(model, weather_file, annual=True)
+
     def test_different_model(self, cache: SimulationCache, weather_file: Path) -> None:
         m1 = new_document()
         m2 = new_document()
@@ -126,6 +139,38 @@ class TestComputeKey:
         k2 = cache.compute_key(m2, weather_file)
         assert k1 == k2
 
+    def test_model_not_copied_or_modified(self, cache: SimulationCache, weather_file: Path) -> None:
+        model = new_document()
+        with patch.object(type(model), "copy", side_effect=AssertionError("copied")):
+            cache.compute_key(model, weather_file)
+        assert "Output:SQLite" not in model
+
+    def test_weather_read_once(self, cache: SimulationCache, weather_file: Path) -> None:
+        with patch("idfkit.simulation.cache._file_sha256", wraps=cache_module._file_sha256) as spy:  # pyright: ignore[reportPrivateUsage]
+            k1 = cache.compute_key(new_document(), weather_file)
+            k2 = cache.compute_key(new_document(), weather_file)
+        assert k1 == k2
+        assert spy.call_count == 1
+
+    def test_weather_change_detected(self, cache: SimulationCache, weather_file: Path) -> None:
+        model = new_document()
+        k1 = cache.compute_key(model, weather_file)
+        weather_file.write_text("LOCATION,Denver,CO\n")
+        assert cache.compute_key(model, weather_file) != k1
+
+    def test_weather_digest_persisted(self, cache: SimulationCache, weather_file: Path) -> None:
+        digest = cache.weather_digest(weather_file)
+        cache_module._weather_digests.clear()  # pyright: ignore[reportPrivateUsage]
+        fresh = SimulationCache(cache.cache_dir)
+        with patch("idfkit.simulation.cache._file_sha256") as spy:
+            assert fresh.weather_digest(weather_file) == digest
+        spy.assert_not_called()
+
+    def test_weather_digest_not_persisted(self, tmp_path: Path, weather_file: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", persist_digests=False)
+        cache.weather_digest(weather_file)
+        assert not (tmp_path / "cache").exists()
+
 
 # ---------------------------------------------------------------------------
 # get / put / contains / clear
@@ -337,3 +382,232 @@ class TestGetPut:
         assert cache.contains(key)
         for child in entry_dir.iterdir():
             assert not child.name.startswith(".tmp_"), f"Leaked temp dir: {child}"
+
+
+# ---------------------------------------------------------------------------
+# manifest, limits and eviction
+# ---------------------------------------------------------------------------
+
+
+def _put_entry(cache: SimulationCache, run_dir: Path, name: str) -> CacheKey:
+    key = CacheKey(hex_digest=name)
+    cache.put(
+        key,
+        SimulationResult(run_dir=run_dir, success=True, exit_code=0, stdout="", stderr="", runtime_seconds=1.0),
+    )
+    return key
+
+
+def _put_many(cache: SimulationCache, run_dir: Path, *names: str) -> list[CacheKey]:
+    keys: list[CacheKey] = []
+    for name in names:
+        keys.append(_put_entry(cache, run_dir, name))
+        time.sleep(0.01)  # distinct access times
+    return keys
+
+
+class TestManifest:
+    """Tests for cache listing, stats, limits and eviction."""
+
+    @pytest.fixture
+    def run_dir(self, tmp_path: Path) -> Path:
+        d = tmp_path / "run"
+        d.mkdir()
+        (d / "eplusout.sql").write_bytes(b"x" * 1000)
+        return d
+
+    def test_entries_and_stats(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        assert cache.stats().entries == 0
+        a, _ = _put_many(cache, run_dir, "a", "b")
+        assert cache.get(a) is not None
+        assert cache.get(CacheKey("missing")) is None
+
+        stats = cache.stats()
+        assert (stats.entries, stats.hits, stats.misses, stats.evictions) == (2, 1, 1, 0)
+        assert stats.total_bytes >= 2000
+        assert stats.hit_rate == 0.5
+        entries = cache.entries()
+        assert [e.key for e in entries] == [a, CacheKey("b")]
+        assert entries[0].hits == 1
+
+    def test_max_entries_lru(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", max_entries=2)
+        a, b = _put_many(cache, run_dir, "a", "b")
+        assert cache.get(a) is not None  # b is now least recently used
+        _put_entry(cache, run_dir, "c")
+        assert cache.contains(a)
+        assert not cache.contains(b)
+        assert cache.stats().evictions == 1
+
+    def test_max_entries_lfu(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", max_entries=2, eviction="lfu")
+        a, b = _put_many(cache, run_dir, "a", "b")
+        assert cache.get(a) is not None
+        assert cache.get(a) is not None
+        assert cache.get(b) is not None  # b is most recent but has fewer hits
+        _put_entry(cache, run_dir, "c")
+        assert cache.contains(a)
+        assert not cache.contains(b)
+
+    def test_max_bytes(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", max_bytes=2500)
+        _put_many(cache, run_dir, "a", "b", "c")
+        assert [e.key.hex_digest for e in cache.entries()] == ["c", "b"]
+        assert cache.stats().total_bytes <= 2500
+
+    def test_prune_explicit_limits(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_many(cache, run_dir, "a", "b", "c")
+        assert cache.prune() == 0
+        assert cache.prune(max_entries=1) == 2
+        assert [e.key.hex_digest for e in cache.entries()] == ["c"]
+        assert sorted(p.name for p in cache.cache_dir.iterdir() if not p.name.startswith("_")) == ["c"]
+
+    def test_remove(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        key = _put_entry(cache, run_dir, "a")
+        assert cache.remove(key)
+        assert not cache.contains(key)
+        assert cache.stats().entries == 0
+        assert not cache.remove(key)
+
+    def test_indexes_existing_entries(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_many(cache, run_dir, "a", "b")
+        (cache.cache_dir / "_manifest.sqlite3").unlink()
+        assert {e.key.hex_digest for e in cache.entries()} == {"a", "b"}
+        assert cache.stats().total_bytes >= 2000
+
+    def test_clear_resets(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_entry(cache, run_dir, "a")
+        cache.clear()
+        assert cache.stats() == CacheStats(entries=0, total_bytes=0, hits=0, misses=0, evictions=0)
+
+    def test_invalid_eviction(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="eviction"):
+            SimulationCache(tmp_path, eviction="fifo")  # type: ignore[arg-type]
+
+    def test_shared_across_processes(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", max_entries=5)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            list(pool.map(_put_entry, [cache] * 8, [run_dir] * 8, [f"k{i}" for i in range(8)]))
+        stats = cache.stats()
+        assert stats.entries == 5
+        assert stats.evictions == 3
+        on_disk = [p for p in cache.cache_dir.iterdir() if (p / "_cache_meta.json").is_file()]
+        assert len(on_disk) == 5
+
+
+# ---------------------------------------------------------------------------
+# output selection, deduplication and compression
+# ---------------------------------------------------------------------------
+
+
+class TestStorage:
+    """Tests for selective, deduplicated and compressed entry storage."""
+
+    @pytest.fixture
+    def run_dir(self, tmp_path: Path) -> Path:
+        d = tmp_path / "run"
+        d.mkdir()
+        (d / "eplusout.sql").write_bytes(b"sql" * 50_000)
+        (d / "eplusout.err").write_text("** Warning ** something\n" * 300)
+        (d / "eplusout.eso").write_text("eso")
+        (d / "in.epw").write_bytes(os.urandom(100_000))
+        (d / "extra.csv.gz").write_bytes(b"not really gzip" * 1000)
+        return d
+
+    def test_outputs_filter(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", outputs=("*.sql", "*.err"))
+        key = _put_entry(cache, run_dir, "a")
+        stored = sorted(p.name for p in (cache.cache_dir / "a").iterdir())
+        assert stored == ["_cache_meta.json", "eplusout.err", "eplusout.sql"]
+        restored = cache.get(key)
+        assert restored is not None
+        assert (restored.run_dir / "eplusout.sql").read_bytes() == b"sql" * 50_000
+
+    def test_large_files_deduplicated(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_many(cache, run_dir, "a", "b")
+        a_epw = (cache.cache_dir / "a" / "in.epw").stat()
+        b_epw = (cache.cache_dir / "b" / "in.epw").stat()
+        assert a_epw.st_ino == b_epw.st_ino
+        assert a_epw.st_nlink == 3  # blob + two entries
+        # Small files are plain copies
+        assert (cache.cache_dir / "a" / "eplusout.eso").stat().st_nlink == 1
+
+    def test_same_size_different_content_not_shared(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_entry(cache, run_dir, "a")
+        (run_dir / "in.epw").write_bytes(os.urandom(100_000))
+        _put_entry(cache, run_dir, "b")
+        a_epw = cache.cache_dir / "a" / "in.epw"
+        b_epw = cache.cache_dir / "b" / "in.epw"
+        assert a_epw.stat().st_ino != b_epw.stat().st_ino
+        assert a_epw.read_bytes() != b_epw.read_bytes()
+        assert not list((cache.cache_dir / "_blobs").glob("*/pending-*"))
+
+    def test_shared_blobs_counted_once(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        _put_many(cache, run_dir, "a", "b")
+        sizes = {e.key.hex_digest: e.size_bytes for e in cache.entries()}
+        shared = (run_dir / "in.epw").stat().st_size + (run_dir / "eplusout.sql").stat().st_size
+        assert sizes["a"] - sizes["b"] == shared
+        total = cache.stats().total_bytes
+        assert total == sizes["a"] + sizes["b"]
+
+        # Re-indexing existing entries charges each blob to one of them
+        (cache.cache_dir / "_manifest.sqlite3").unlink()
+        assert cache.stats().total_bytes == total
+
+    def test_dedupe_disabled(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache", dedupe=False)
+        _put_many(cache, run_dir, "a", "b")
+        assert (cache.cache_dir / "a" / "in.epw").stat().st_nlink == 1
+        assert not (cache.cache_dir / "_blobs").exists()
+
+    def test_unreferenced_blobs_collected(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        a, b = _put_many(cache, run_dir, "a", "b")
+        blobs = cache.cache_dir / "_blobs"
+        assert len(list(blobs.glob("*/*"))) == 2  # in.epw and eplusout.sql
+        cache.remove(a)
+        assert len(list(blobs.glob("*/*"))) == 2
+        cache.remove(b)
+        assert list(blobs.glob("*/*")) == []
+
+    def test_compress_and_expand(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        key = _put_entry(cache, run_dir, "a")
+        size_before = cache.stats().total_bytes
+        assert cache.compress(older_than=3600) == 0
+        assert cache.compress(older_than=0) == 1
+        entry = cache.cache_dir / "a"
+        assert (entry / "eplusout.sql.gz").is_file()
+        assert not (entry / "eplusout.sql").exists()
+        assert cache.stats().total_bytes < size_before
+        assert cache.compress(older_than=0) == 0  # already compressed
+
+        restored = cache.get(key)
+        assert restored is not None
+        assert (restored.run_dir / "eplusout.sql").read_bytes() == b"sql" * 50_000
+        assert (restored.run_dir / "in.epw").read_bytes() == (run_dir / "in.epw").read_bytes()
+        assert (restored.run_dir / "extra.csv.gz").read_bytes() == b"not really gzip" * 1000
+        assert (restored.run_dir / "in.epw").stat().st_nlink == 2  # relinked to its blob
+        assert not list(entry.glob(".tmp_*"))
+
+    def test_concurrent_expand(self, tmp_path: Path, run_dir: Path) -> None:
+        cache = SimulationCache(tmp_path / "cache")
+        key = _put_entry(cache, run_dir, "a")
+        assert cache.compress(older_than=0) == 1
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            restored = list(pool.map(lambda _: cache.get(key), range(8)))
+        assert all(r is not None for r in restored)
+        entry = cache.cache_dir / "a"
+        assert (entry / "eplusout.sql").read_bytes() == b"sql" * 50_000
+        assert (entry / "in.epw").read_bytes() == (run_dir / "in.epw").read_bytes()
+        assert [p.name for p in entry.glob("*.gz")] == ["extra.csv.gz"]
+        assert not list(entry.glob(".tmp_*"))
+        assert cache.stats().misses == 0
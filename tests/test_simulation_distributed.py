@@ -0,0 +1,200 @@
+"""Tests for distributed batch simulation over a work queue."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from idfkit import new_document
+from idfkit.simulation.batch import SimulationJob
+from idfkit.simulation.config import EnergyPlusConfig
+from idfkit.simulation.distributed import (
+    SQLiteWorkQueue,
+    WorkQueue,
+    collect_batch,
+    decode_job,
+    decode_result,
+    encode_job,
+    encode_result,
+    iter_batch_results,
+    run_worker,
+    submit_batch,
+)
+from idfkit.simulation.result import SimulationResult
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the EnergyPlus executable")
+
+
+@pytest.fixture
+def script_config(tmp_path: Path) -> EnergyPlusConfig:
+    """EnergyPlusConfig whose executable is a shell script."""
+    exe = tmp_path / "energyplus"
+    exe.write_text('#!/bin/sh\necho "EnergyPlus Completed Successfully"\n')
+    exe.chmod(0o755)
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text("!IDD_Version 24.1.0\n")
+    return EnergyPlusConfig(executable=exe, version=(24, 1, 0), install_dir=tmp_path, idd_path=idd)
+
+
+@pytest.fixture
+def weather_file(tmp_path: Path) -> Path:
+    epw = tmp_path / "weather.epw"
+    epw.write_text("LOCATION,Chicago\n")
+    return epw
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> SQLiteWorkQueue:
+    return SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=0.2, max_attempts=2)
+
+
+def _jobs(weather: Path, n: int) -> list[SimulationJob]:
+    return [SimulationJob(model=new_document(), weather=weather, label=f"job-{i}") for i in range(n)]
+
+
+class TestSerialization:
+    def test_job_roundtrip(self, weather_file: Path) -> None:
+        model = new_document()
+        model.add("Zone", "Office")
+        job = decode_job(encode_job(SimulationJob(model=model, weather=weather_file, label="a", annual=True)))
+        assert job.label == "a"
+        assert job.annual
+        assert "Office" in job.model["Zone"]  # type: ignore[index]
+
+    def test_decode_rejects_other_payloads(self) -> None:
+        import pickle
+
+        with pytest.raises(TypeError, match="SimulationJob"):
+            decode_job(pickle.dumps({"model": None}))
+
+    def test_result_roundtrip(self, tmp_path: Path) -> None:
+        result = SimulationResult(
+            run_dir=tmp_path, success=False, exit_code=1, stdout="out", stderr="err", runtime_seconds=1.5
+        )
+        decoded = decode_result(encode_result(result))
+        assert (decoded.run_dir, decoded.success, decoded.exit_code) == (tmp_path, False, 1)
+        assert (decoded.stdout, decoded.stderr, decoded.runtime_seconds) == ("out", "err", 1.5)
+
+
+class TestSQLiteWorkQueue:
+    def test_satisfies_protocol(self, queue: SQLiteWorkQueue) -> None:
+        assert isinstance(queue, WorkQueue)
+
+    def test_claims_in_order_until_empty(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1"), ("b", b"2")])
+        first = queue.claim("w")
+        second = queue.claim("w")
+        assert first is not None and second is not None
+        assert (first.index, first.payload, first.attempt) == (0, b"1", 1)
+        assert second.index == 1
+        assert queue.claim("w") is None
+        assert queue.size("b") == 2
+
+    def test_expired_lease_is_retried(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1")])
+        assert queue.claim("lost") is not None
+        time.sleep(0.3)
+        retry = queue.claim("w2")
+        assert retry is not None
+        assert retry.attempt == 2
+
+    def test_renewed_lease_is_not_retried(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1")])
+        task = queue.claim("w")
+        assert task is not None
+        time.sleep(0.15)
+        queue.renew(task.task_id, "w")
+        time.sleep(0.15)
+        assert queue.claim("w2") is None
+
+    def test_abandoned_after_max_attempts(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1")])
+        for _ in range(2):
+            assert queue.claim("lost") is not None
+            time.sleep(0.3)
+        assert queue.claim("w") is None
+        (outcome,) = queue.results("b")
+        assert outcome.result is None
+        assert "2 attempt" in (outcome.error or "")
+
+    def test_first_completion_wins(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1")])
+        task = queue.claim("w")
+        assert task is not None
+        queue.complete(task.task_id, b"first")
+        queue.complete(task.task_id, b"second")
+        assert [o.result for o in queue.results("b")] == [b"first"]
+
+    def test_results_after_cursor(self, queue: SQLiteWorkQueue) -> None:
+        queue.submit("b", [("a", b"1"), ("b", b"2")])
+        for _ in range(2):
+            task = queue.claim("w")
+            assert task is not None
+            queue.complete(task.task_id, b"r")
+        first, second = queue.results("b")
+        assert queue.results("b", after=first.seq) == [second]
+
+
+class TestWorkerAndCollection:
+    def test_submit_run_collect(
+        self, queue: SQLiteWorkQueue, script_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        batch_id = submit_batch(queue, _jobs(weather_file, 3))
+        assert run_worker(queue, energyplus=script_config) == 3
+        batch = collect_batch(queue, batch_id, timeout=5)
+        assert len(batch) == 3
+        assert batch.all_succeeded
+        assert "Completed Successfully" in batch[0].stdout
+
+    def test_streams_while_workers_run(
+        self, queue: SQLiteWorkQueue, script_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        batch_id = submit_batch(queue, _jobs(weather_file, 4))
+        workers = [
+            threading.Thread(
+                target=run_worker, args=(queue,), kwargs={"energyplus": script_config, "worker_id": f"w{i}"}
+            )
+            for i in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        events = list(iter_batch_results(queue, batch_id, poll_interval=0.01, timeout=10))
+        for worker in workers:
+            worker.join()
+        assert [e.completed for e in events] == [1, 2, 3, 4]
+        assert {e.label for e in events} == {f"job-{i}" for i in range(4)}
+        assert all(e.total == 4 for e in events)
+
+    def test_failed_job_is_reported_not_retried(
+        self, queue: SQLiteWorkQueue, script_config: EnergyPlusConfig, tmp_path: Path
+    ) -> None:
+        batch_id = submit_batch(queue, _jobs(tmp_path / "missing.epw", 1))
+        assert run_worker(queue, energyplus=script_config) == 1
+        batch = collect_batch(queue, batch_id, timeout=5)
+        assert not batch[0].success
+        assert "Weather file not found" in batch[0].stderr
+
+    def test_lost_worker_job_completes_elsewhere(
+        self, queue: SQLiteWorkQueue, script_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        batch_id = submit_batch(queue, _jobs(weather_file, 1))
+        assert queue.claim("crashed") is not None
+        assert run_worker(queue, energyplus=script_config, poll_interval=0.05, idle_timeout=1.0, max_jobs=1) == 1
+        assert collect_batch(queue, batch_id, timeout=5).all_succeeded
+
+    def test_max_jobs(self, queue: SQLiteWorkQueue, script_config: EnergyPlusConfig, weather_file: Path) -> None:
+        submit_batch(queue, _jobs(weather_file, 3))
+        assert run_worker(queue, energyplus=script_config, max_jobs=2) == 2
+
+    def test_collect_timeout(self, queue: SQLiteWorkQueue, weather_file: Path) -> None:
+        batch_id = submit_batch(queue, _jobs(weather_file, 1))
+        with pytest.raises(TimeoutError, match="0/1"):
+            collect_batch(queue, batch_id, poll_interval=0.01, timeout=0.05)
+
+    def test_submit_empty_raises(self, queue: SQLiteWorkQueue) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            submit_batch(queue, [])
@@ -0,0 +1,163 @@
+"""Tests for the shared remote simulation cache."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from conftest import InMemoryAsyncFileSystem, InMemoryFileSystem
+
+from idfkit import new_document
+from idfkit.simulation.async_runner import async_simulate
+from idfkit.simulation.cache import CacheKey
+from idfkit.simulation.config import EnergyPlusConfig
+from idfkit.simulation.fs import LocalFileSystem
+from idfkit.simulation.remote_cache import RemoteSimulationCache
+from idfkit.simulation.result import SimulationResult
+from idfkit.simulation.runner import simulate
+
+
+@pytest.fixture
+def run_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "run"
+    d.mkdir()
+    (d / "eplusout.sql").write_bytes(b"sql" * 30_000)
+    (d / "eplusout.err").write_text("Completed\n")
+    return d
+
+
+def _result(run_dir: Path) -> SimulationResult:
+    return SimulationResult(run_dir=run_dir, success=True, exit_code=0, stdout="", stderr="", runtime_seconds=2.5)
+
+
+class TestRemoteSimulationCache:
+    def test_write_through_and_remote_hit(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        key = CacheKey("abc123")
+        RemoteSimulationCache(fs, cache_dir=tmp_path / "host-a").put(key, _result(run_dir))
+        assert (tmp_path / "host-a" / "abc123").is_dir()
+        assert fs.exists("simulation-cache/abc123.json")
+
+        other = RemoteSimulationCache(fs, cache_dir=tmp_path / "host-b")
+        assert other.contains(key)
+        hit = other.get(key)
+        assert hit is not None
+        assert hit.runtime_seconds == 2.5
+        assert hit.run_dir == tmp_path / "host-b" / "abc123"
+        assert (hit.run_dir / "eplusout.sql").read_bytes() == b"sql" * 30_000
+        assert other.stats().hits == 1
+
+    def test_remote_hit_indexes_one_entry(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        key = CacheKey("abc123")
+        RemoteSimulationCache(fs, cache_dir=tmp_path / "host-a").put(key, _result(run_dir))
+
+        other = RemoteSimulationCache(fs, cache_dir=tmp_path / "host-b")
+        assert other.get(key) is not None
+        assert [e.key for e in other.entries()] == [key]
+        assert other.stats().entries == 1
+
+    def test_miss(self, tmp_path: Path) -> None:
+        cache = RemoteSimulationCache(InMemoryFileSystem(), cache_dir=tmp_path / "cache")
+        assert cache.get(CacheKey("missing")) is None
+        assert not cache.contains(CacheKey("missing"))
+
+    def test_archive_without_marker_is_not_served(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        RemoteSimulationCache(fs, cache_dir=tmp_path / "a").put(CacheKey("k"), _result(run_dir))
+        fs.remove("simulation-cache/k.json")  # publisher died before writing the marker
+        assert RemoteSimulationCache(fs, cache_dir=tmp_path / "b").get(CacheKey("k")) is None
+
+    def test_torn_or_mismatched_uploads_are_ignored(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        RemoteSimulationCache(fs, cache_dir=tmp_path / "a").put(CacheKey("k"), _result(run_dir))
+        marker = fs.read_bytes("simulation-cache/k.json")
+        archive_path = "simulation-cache/" + json.loads(marker)["archive"]
+        archive = fs.read_bytes(archive_path)
+
+        fs.write_bytes("simulation-cache/k.json", marker[: len(marker) // 2])
+        assert RemoteSimulationCache(fs, cache_dir=tmp_path / "b").get(CacheKey("k")) is None
+
+        fs.write_bytes("simulation-cache/k.json", marker)
+        fs.write_bytes(archive_path, archive[:-10])
+        assert RemoteSimulationCache(fs, cache_dir=tmp_path / "c").get(CacheKey("k")) is None
+        assert not (tmp_path / "c" / "k").exists()
+
+    def test_unreachable_store_degrades_to_local(self, tmp_path: Path, run_dir: Path) -> None:
+        class BrokenFileSystem(InMemoryFileSystem):
+            def exists(self, path: str | Path) -> bool:
+                raise ConnectionError
+
+        cache = RemoteSimulationCache(BrokenFileSystem(), cache_dir=tmp_path / "cache")
+        key = CacheKey("k")
+        assert cache.get(key) is None
+        cache.put(key, _result(run_dir))
+        assert cache.get(key) is not None
+
+    def test_remove_deletes_both_tiers(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        cache = RemoteSimulationCache(fs, prefix="shared/v1", cache_dir=tmp_path / "cache")
+        key = CacheKey("k")
+        cache.put(key, _result(run_dir))
+        assert cache.remove(key)
+        assert fs.glob("shared/v1", "*") == []
+        assert fs.glob("shared/v1/k", "*") == []
+        assert not cache.contains(key)
+
+    def test_local_directory_store(self, tmp_path: Path, run_dir: Path) -> None:
+        shared = tmp_path / "shared"
+        key = CacheKey("k")
+        RemoteSimulationCache(LocalFileSystem(), str(shared), cache_dir=tmp_path / "a").put(key, _result(run_dir))
+        assert (shared / "k.json").is_file()
+        assert RemoteSimulationCache(LocalFileSystem(), str(shared), cache_dir=tmp_path / "b").get(key) is not None
+
+    def test_outputs_filter_bounds_upload(self, tmp_path: Path, run_dir: Path) -> None:
+        fs = InMemoryFileSystem()
+        key = CacheKey("k")
+        RemoteSimulationCache(fs, cache_dir=tmp_path / "a", outputs=("*.err",)).put(key, _result(run_dir))
+        hit = RemoteSimulationCache(fs, cache_dir=tmp_path / "b").get(key)
+        assert hit is not None
+        assert (hit.run_dir / "eplusout.err").is_file()
+        assert not (hit.run_dir / "eplusout.sql").exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the EnergyPlus executable")
+class TestSimulateWithRemoteCache:
+    @pytest.fixture
+    def counting_config(self, tmp_path: Path) -> EnergyPlusConfig:
+        """EnergyPlusConfig whose executable counts its invocations."""
+        exe = tmp_path / "energyplus"
+        exe.write_text(f'#!/bin/sh\necho run >> "{tmp_path / "calls"}"\necho "EnergyPlus Completed Successfully"\n')
+        exe.chmod(0o755)
+        idd = tmp_path / "Energy+.idd"
+        idd.write_text("!IDD_Version 24.1.0\n")
+        return EnergyPlusConfig(executable=exe, version=(24, 1, 0), install_dir=tmp_path, idd_path=idd)
+
+    @pytest.fixture
+    def weather_file(self, tmp_path: Path) -> Path:
+        epw = tmp_path / "weather.epw"
+        epw.write_text("LOCATION,Chicago\n")
+        return epw
+
+    def test_second_host_reuses_run(
+        self, tmp_path: Path, counting_config: EnergyPlusConfig, weather_file: Path
+    ) -> None:
+        fs = InMemoryFileSystem()
+        model = new_document()
+        for host in ("a", "b"):
+            cache = RemoteSimulationCache(fs, cache_dir=tmp_path / host)
+            assert simulate(model, weather_file, energyplus=counting_config, cache=cache).success
+        assert (tmp_path / "calls").read_text().count("run") == 1
+
+    @pytest.mark.asyncio
+    async def test_async_store(self, tmp_path: Path, counting_config: EnergyPlusConfig, weather_file: Path) -> None:
+        fs = InMemoryAsyncFileSystem()
+        model = new_document()
+        for host in ("a", "b"):
+            cache = RemoteSimulationCache(fs, cache_dir=tmp_path / host)
+            result = await async_simulate(model, weather_file, energyplus=counting_config, cache=cache)
+            assert result.success
+        assert (tmp_path / "calls").read_text().count("run") == 1
+        assert await fs.glob("simulation-cache", "*.json")
@@ -99,6 +99,18 @@ class TestSqlProperty:
         sql2 = result.sql
         assert sql1 is sql2
 
+    def test_close_releases_connection(self, result: SimulationResult) -> None:
+        sql = result.sql
+        assert sql is not None
+        result.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            sql.query("SELECT 1")
+        reopened = result.sql
+        assert reopened is not None
+        assert reopened is not sql
+        result.close()
+        result.close()
+
     def test_none_when_no_file(self, tmp_path: Path) -> None:
         r = SimulationResult(
             run_dir=tmp_path,
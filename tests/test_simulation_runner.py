@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +13,7 @@ from conftest import InMemoryFileSystem
 
 from idfkit import new_document
 from idfkit.exceptions import ExpandObjectsError, SimulationError
+from idfkit.simulation import prune_input_store
 from idfkit.simulation.config import EnergyPlusConfig
 from idfkit.simulation.runner import _build_command, _ensure_sql_output, _prepare_run_directory, simulate
 
@@ -205,6 +208,77 @@ class TestPrepareRunDirectory:
         _prepare_run_directory(out, weather_file)
         assert dest.read_text() == "existing content"
 
+    def test_weather_linked_from_shared_store(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        first = _prepare_run_directory(None, weather_file, scratch)
+        second = _prepare_run_directory(None, weather_file, scratch)
+        assert first.parent == second.parent == scratch
+        a, b = first / weather_file.name, second / weather_file.name
+        assert a.read_text() == "LOCATION,Chicago\n"
+        assert a.stat().st_ino == b.stat().st_ino
+        (store,) = scratch.glob("idfkit_inputs*")
+        assert len(list(store.iterdir())) == 1
+
+    def test_edited_weather_gets_new_store_entry(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        _prepare_run_directory(None, weather_file, scratch)
+        weather_file.write_text("LOCATION,Denver\n")
+        run_dir = _prepare_run_directory(None, weather_file, scratch)
+        assert (run_dir / weather_file.name).read_text() == "LOCATION,Denver\n"
+
+    def test_falls_back_to_copy_without_hard_links(self, tmp_path: Path, weather_file: Path) -> None:
+        with patch("idfkit.simulation._common.os.link", side_effect=OSError("cross-device link")):
+            run_dir = _prepare_run_directory(None, weather_file, tmp_path / "scratch")
+        dest = run_dir / weather_file.name
+        assert dest.read_text() == "LOCATION,Chicago\n"
+        assert dest.stat().st_nlink == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_store_is_private(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        _prepare_run_directory(None, weather_file, scratch)
+        (store,) = scratch.glob("idfkit_inputs*")
+        assert store.stat().st_mode & 0o077 == 0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_shared_store_not_trusted(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        _prepare_run_directory(None, weather_file, scratch)
+        (store,) = scratch.glob("idfkit_inputs*")
+        store.chmod(0o777)
+        run_dir = _prepare_run_directory(None, weather_file, scratch)
+        dest = run_dir / weather_file.name
+        assert dest.read_text() == "LOCATION,Chicago\n"
+        assert dest.stat().st_nlink == 1
+
+    def test_mismatched_store_entry_replaced(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        first = _prepare_run_directory(None, weather_file, scratch)
+        (store,) = scratch.glob("idfkit_inputs*")
+        (entry,) = store.iterdir()
+        (first / weather_file.name).unlink()
+        entry.chmod(0o644)
+        entry.write_text("LOCATION,Elsewhere,with,other,data\n")
+        run_dir = _prepare_run_directory(None, weather_file, scratch)
+        assert (run_dir / weather_file.name).read_text() == "LOCATION,Chicago\n"
+
+    def test_prune_input_store(self, tmp_path: Path, weather_file: Path) -> None:
+        scratch = tmp_path / "scratch"
+        run_dir = _prepare_run_directory(None, weather_file, scratch)
+        assert prune_input_store(scratch) == 0
+        shutil.rmtree(run_dir)
+        assert prune_input_store(scratch) == 1
+        (store,) = scratch.glob("idfkit_inputs*")
+        assert list(store.iterdir()) == []
+        assert prune_input_store(tmp_path / "missing") == 0
+
+    def test_scratch_dir_from_environment(
+        self, tmp_path: Path, weather_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("IDFKIT_SCRATCH_DIR", str(tmp_path / "shm"))
+        run_dir = _prepare_run_directory(None, weather_file)
+        assert run_dir.parent == tmp_path / "shm"
+
 
 # ---------------------------------------------------------------------------
 # simulate
@@ -0,0 +1,177 @@
+"""Tests for runtime-aware batch scheduling."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from idfkit import new_document
+from idfkit.document import IDFDocument
+from idfkit.simulation.batch import SimulationJob, simulate_batch
+from idfkit.simulation.config import EnergyPlusConfig
+from idfkit.simulation.result import SimulationResult
+from idfkit.simulation.scheduling import JobScheduler, ModelFeatures, RuntimeStats
+
+
+def _model(zones: int = 1, surfaces: int = 0, timesteps: int | None = None) -> IDFDocument[bool]:
+    doc = new_document()
+    for i in range(zones):
+        doc.add("Zone", f"Z{i}")
+    for i in range(surfaces):
+        doc.add("Shading:Site:Detailed", f"S{i}", validate=False)
+    if timesteps is not None:
+        doc.add("Timestep", data={"number_of_timesteps_per_hour": timesteps})
+    return doc
+
+
+def _result(runtime: float, success: bool = True) -> SimulationResult:
+    return SimulationResult(
+        run_dir=Path("run"), success=success, exit_code=0, stdout="", stderr="", runtime_seconds=runtime
+    )
+
+
+@pytest.fixture
+def mock_config(tmp_path: Path) -> EnergyPlusConfig:
+    exe = tmp_path / "energyplus"
+    exe.touch()
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text("!IDD_Version 24.1.0\n")
+    return EnergyPlusConfig(executable=exe, version=(24, 1, 0), install_dir=tmp_path, idd_path=idd)
+
+
+class TestModelFeatures:
+    def test_counts_zones_surfaces_and_timestep(self) -> None:
+        features = ModelFeatures.from_job(SimulationJob(model=_model(3, 5, timesteps=6), weather="w.epw"))
+        assert (features.zones, features.surfaces, features.timesteps_per_hour) == (3, 5, 6)
+
+    def test_days_from_run_mode(self) -> None:
+        model = _model()
+        model.add("SizingPeriod:DesignDay", "Winter", validate=False)
+        model.add("SizingPeriod:DesignDay", "Summer", validate=False)
+        model.add(
+            "RunPeriod",
+            "Q1",
+            {"begin_month": 1, "begin_day_of_month": 1, "end_month": 3, "end_day_of_month": 31},
+        )
+        assert ModelFeatures.from_job(SimulationJob(model=model, weather="w")).days == 31 + 29 + 31 + 2
+        assert ModelFeatures.from_job(SimulationJob(model=model, weather="w", design_day=True)).days == 2
+        assert ModelFeatures.from_job(SimulationJob(model=model, weather="w", annual=True)).days == 365
+
+    def test_work_grows_with_size(self) -> None:
+        small = ModelFeatures.from_job(SimulationJob(model=_model(1), weather="w"))
+        large = ModelFeatures.from_job(SimulationJob(model=_model(10, 40), weather="w"))
+        assert large.work > small.work
+
+    def test_non_document_model(self) -> None:
+        assert ModelFeatures.from_job(SimulationJob(model=object(), weather="w")).zones == 1
+
+
+class TestRuntimeStats:
+    def test_exact_match_wins(self) -> None:
+        stats = RuntimeStats()
+        features = ModelFeatures(zones=1, surfaces=6, timesteps_per_hour=4, days=1)
+        stats.record(features, 10.0)
+        stats.record(features, 20.0)
+        assert stats.estimate(features) == pytest.approx(15.0)
+
+    def test_scales_observed_rate(self) -> None:
+        stats = RuntimeStats()
+        seen = ModelFeatures(zones=1, surfaces=9, timesteps_per_hour=4, days=1)
+        stats.record(seen, 8.0)
+        unseen = ModelFeatures(zones=2, surfaces=18, timesteps_per_hour=4, days=1)
+        assert stats.estimate(unseen) == pytest.approx(16.0)
+
+    def test_persists(self, tmp_path: Path) -> None:
+        path = tmp_path / "stats" / "runtimes.json"
+        features = ModelFeatures(zones=1, surfaces=0, timesteps_per_hour=4, days=1)
+        stats = RuntimeStats(path)
+        stats.record(features, 3.0)
+        stats.save()
+        assert RuntimeStats(path).estimate(features) == pytest.approx(3.0)
+
+    def test_unreadable_file_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "runtimes.json"
+        path.write_text("not json")
+        assert len(RuntimeStats(path)) == 0
+
+
+class TestJobScheduler:
+    def test_longest_first_order(self) -> None:
+        jobs = [SimulationJob(model=_model(z), weather="w") for z in (1, 5, 3)]
+        assert JobScheduler().plan(jobs).order == [1, 2, 0]
+
+    def test_cpus_from_extra_args(self) -> None:
+        scheduler = JobScheduler()
+        assert scheduler.estimate(SimulationJob(model=_model(), weather="w", extra_args=("-j", "4"))).cpus == 4
+        assert scheduler.estimate(SimulationJob(model=_model(), weather="w", extra_args=("--jobs=2",))).cpus == 2
+        assert scheduler.estimate(SimulationJob(model=_model(), weather="w")).cpus == 1
+
+    def test_budget_admission(self) -> None:
+        jobs = [SimulationJob(model=_model(), weather="w", extra_args=("-j", "2")) for _ in range(3)]
+        plan = JobScheduler(cpu_budget=4).plan(jobs)
+        assert plan.admit(0, idle=True)
+        assert plan.admit(1, idle=False)
+        assert not plan.admit(2, idle=False)
+        plan.release(0, _result(1.0))
+        assert plan.admit(2, idle=False)
+
+    def test_oversized_job_runs_alone(self) -> None:
+        plan = JobScheduler(memory_budget=1.0).plan([SimulationJob(model=_model(), weather="w")])
+        assert not plan.admit(0, idle=False)
+        assert plan.admit(0, idle=True)
+
+    def test_failed_runs_not_recorded(self) -> None:
+        scheduler = JobScheduler()
+        job = SimulationJob(model=_model(), weather="w")
+        scheduler.record(scheduler.estimate(job), _result(5.0, success=False))
+        assert len(scheduler.stats) == 0
+
+
+class TestSimulateBatchScheduler:
+    @patch("idfkit.simulation.batch.simulate")
+    def test_starts_longest_first_and_records(
+        self, mock_sim: MagicMock, mock_config: EnergyPlusConfig, tmp_path: Path
+    ) -> None:
+        started: list[int] = []
+
+        def fake(model: IDFDocument[bool], *args: object, **kwargs: object) -> SimulationResult:
+            started.append(len(model.get_collection("Zone")))
+            return _result(2.0)
+
+        mock_sim.side_effect = fake
+        jobs = [SimulationJob(model=_model(z), weather="w", label=str(z)) for z in (1, 4, 2)]
+        scheduler = JobScheduler(tmp_path / "runtimes.json")
+        batch = simulate_batch(jobs, energyplus=mock_config, max_workers=1, scheduler=scheduler)
+        assert started == [4, 2, 1]
+        assert [r.runtime_seconds for r in batch] == [2.0, 2.0, 2.0]
+        assert len(RuntimeStats(tmp_path / "runtimes.json")) == 3
+
+    @patch("idfkit.simulation.batch.simulate")
+    def test_order_and_budget(self, mock_sim: MagicMock, mock_config: EnergyPlusConfig) -> None:
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        order: list[int] = []
+
+        def fake(model: IDFDocument[bool], *args: object, **kwargs: object) -> SimulationResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+                order.append(len(model.get_collection("Zone")))
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return _result(1.0)
+
+        mock_sim.side_effect = fake
+        jobs = [SimulationJob(model=_model(z), weather="w", extra_args=("-j", "2")) for z in (1, 3, 2, 4)]
+        batch = simulate_batch(jobs, energyplus=mock_config, max_workers=4, scheduler=JobScheduler(cpu_budget=2))
+        assert order == [4, 3, 2, 1]
+        assert peak == 1
+        assert batch.all_succeeded
+        assert len(batch) == 4
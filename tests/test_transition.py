@@ -0,0 +1,156 @@
+"""Tests for in-process version upgrades."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from idfkit import new_document
+from idfkit.transition import (
+    RemapChoice,
+    RenameField,
+    TransformObject,
+    _plan_cache,  # pyright: ignore[reportPrivateUsage]
+    _transitions,  # pyright: ignore[reportPrivateUsage]
+    get_transition_rules,
+    register_transition,
+    upgrade,
+)
+
+
+@pytest.fixture
+def restore_transitions() -> Iterator[None]:
+    saved = {key: list(rules) for key, rules in _transitions.items()}
+    yield
+    _transitions.clear()
+    _transitions.update(saved)
+    _plan_cache.clear()
+
+
+class TestUpgrade:
+    def test_positional_rename(self) -> None:
+        doc = new_document(version=(22, 1, 0))
+        doc.add("Zone", "Office")
+        doc.add("ZoneMixing", "Mix", zone_name="Office", source_zone_name="Office", validate=False)
+        result = upgrade(doc, (22, 2, 0))
+        mixing = result.document["ZoneMixing"]["Mix"]
+        assert mixing.data["zone_or_space_name"] == "Office"
+        assert mixing.data["source_zone_or_space_name"] == "Office"
+        assert "zone_name" not in mixing.data
+        assert result.is_lossless
+
+    def test_input_document_unchanged(self) -> None:
+        doc = new_document(version=(22, 1, 0))
+        mixing = doc.add("ZoneMixing", "Mix", zone_name="Office", validate=False)
+        upgrade(doc, (22, 2, 0))
+        assert doc.version == (22, 1, 0)
+        assert mixing.data["zone_name"] == "Office"
+
+    def test_type_rename_and_choice_remap(self) -> None:
+        doc = new_document(version=(23, 1, 0))
+        doc.add("DistrictHeating", "DH", nominal_capacity=1000.0, validate=False)
+        doc.add("WaterHeater:Mixed", "WH", heater_fuel_type="Steam", validate=False)
+        result = upgrade(doc, (23, 2, 0))
+        new_doc = result.document
+        assert "DistrictHeating" not in new_doc
+        assert new_doc["DistrictHeating:Water"]["DH"].data["nominal_capacity"] == 1000.0
+        assert new_doc["WaterHeater:Mixed"]["WH"].heater_fuel_type == "DistrictHeatingSteam"
+        assert result.is_lossless
+
+    def test_removed_field_reported(self) -> None:
+        doc = new_document(version=(23, 1, 0))
+        doc.add("ZoneHVAC:WaterToAirHeatPump", "HP", maximum_cycling_rate=2.5, validate=False)
+        result = upgrade(doc, (23, 2, 0))
+        assert [(i.code, i.field) for i in result.issues] == [("U003", "maximum_cycling_rate")]
+        assert "maximum_cycling_rate" not in result.document["ZoneHVAC:WaterToAirHeatPump"]["HP"].data
+
+    def test_removed_type_reported(self) -> None:
+        doc = new_document(version=(9, 2, 0))
+        doc.add("AirTerminal:SingleDuct:Uncontrolled", "ATU", validate=False)
+        result = upgrade(doc, (9, 3, 0))
+        assert [i.code for i in result.issues] == ["U001"]
+        assert "AirTerminal:SingleDuct:Uncontrolled" not in result.document
+
+    def test_fields_folded_into_extensible_group(self) -> None:
+        doc = new_document(version=(8, 9, 0))
+        doc.add(
+            "Schedule:Year",
+            "Year",
+            schedule_week_name_1="Week A",
+            start_month_1=1,
+            schedule_week_name_2="Week B",
+            start_month_2=7,
+            validate=False,
+        )
+        result = upgrade(doc, (9, 0, 1))
+        data = result.document["Schedule:Year"]["Year"].data
+        assert data["schedule_week_name"] == "Week A"
+        assert data["start_month"] == 1
+        assert data["schedule_week_name_2"] == "Week B"
+        assert data["start_month_2"] == 7
+
+    def test_multi_hop_keeps_references(self) -> None:
+        doc = new_document(version=(22, 1, 0))
+        doc.add("Zone", "Office")
+        doc.add("ZoneInfiltration:DesignFlowRate", "Infil", zone_or_zonelist_name="Office", validate=False)
+        result = upgrade(doc)
+        new_doc = result.document
+        assert new_doc.version == result.to_version
+        assert new_doc["Version"].first().version_identifier == f"{result.to_version[0]}.{result.to_version[1]}"
+        assert {obj.name for obj in new_doc.get_referencing("Office")} == {"Infil"}
+        assert len(new_doc) == len(doc)
+
+    def test_same_version_copies(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Zone", "Office", x_origin=1.0)
+        result = upgrade(doc, (24, 1, 0))
+        assert result.document is not doc
+        assert result.document["Zone"]["Office"].x_origin == 1.0
+
+    def test_downgrade_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Cannot downgrade"):
+            upgrade(new_document(version=(24, 1, 0)), (23, 1, 0))
+
+    def test_unknown_target_rejected(self) -> None:
+        with pytest.raises(ValueError, match="No bundled schema"):
+            upgrade(new_document(version=(24, 1, 0)), (1, 0, 0))
+
+
+class TestTransitionRules:
+    def test_builtin_rules_registered(self) -> None:
+        assert get_transition_rules((23, 1, 0), (23, 2, 0))
+        assert get_transition_rules((24, 2, 0), (25, 1, 0)) == []
+
+    @pytest.mark.usefixtures("restore_transitions")
+    def test_custom_rules(self) -> None:
+        seen: list[str] = []
+
+        def scale(name: str, data: dict[str, Any]) -> None:
+            seen.append(name)
+            data["thickness"] = data["thickness"] * 2
+
+        register_transition(
+            (24, 1, 0),
+            (24, 2, 0),
+            [
+                TransformObject("Material", scale),
+                RemapChoice({"VeryRough": "Rough"}, obj_type="Material", field="roughness"),
+                RenameField("Zone", "x_origin", "y_origin"),
+            ],
+        )
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Material", "Brick", roughness="VeryRough", thickness=0.1, validate=False)
+        doc.add("Zone", "Office", x_origin=3.0)
+        result = upgrade(doc, (24, 2, 0))
+        brick = result.document["Material"]["Brick"]
+        assert seen == ["Brick"]
+        assert brick.thickness == pytest.approx(0.2)
+        # VeryRough is still valid in 24.2, so the remap does not apply
+        assert brick.roughness == "VeryRough"
+        assert result.document["Zone"]["Office"].data["y_origin"] == 3.0
+
+    def test_register_rejects_non_consecutive(self) -> None:
+        with pytest.raises(ValueError, match="No direct transition"):
+            register_transition((24, 1, 0), (25, 1, 0), [])
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from idfkit import IDFDocument
+from idfkit import IDFDocument, get_schema
+from idfkit.objects import IDFObject
 from idfkit.validation import (
+    CompiledValidator,
     Severity,
     ValidationError,
     ValidationResult,
+    Validator,
+    _shard_types,  # pyright: ignore[reportPrivateUsage]
     validate_document,
+    validate_object,
 )
 
 # ---------------------------------------------------------------------------
@@ -117,6 +122,20 @@ class TestValidateDocument:
         result = validate_document(simple_doc, check_references=False)
         assert isinstance(result, ValidationResult)
 
+    def test_validate_parallel_matches_serial(self, simple_doc: IDFDocument) -> None:
+        simple_doc["Material"]["TestMaterial"].thickness = -1.0
+        simple_doc["Zone"]["TestZone"].x_origin = "far"
+        serial = validate_document(simple_doc)
+        parallel = validate_document(simple_doc, workers=2)
+        assert [str(e) for e in parallel.errors] == [str(e) for e in serial.errors]
+        assert [str(e) for e in parallel.warnings] == [str(e) for e in serial.warnings]
+        assert {e.code for e in parallel.errors} == {"E003", "E006"}
+
+    def test_shard_types_balances_counts(self) -> None:
+        shards = _shard_types({"A": 10, "B": 6, "C": 5, "D": 1}, 2)
+        assert shards == [["A", "D"], ["B", "C"]]
+        assert _shard_types({"A": 1}, 4) == [["A"]]
+
     def test_validate_all_checks_disabled(self, simple_doc: IDFDocument) -> None:
         result = validate_document(
             simple_doc,
@@ -128,6 +147,55 @@ class TestValidateDocument:
         assert isinstance(result, ValidationResult)
 
 
+class TestCompiledValidator:
+    def test_cached_on_schema(self) -> None:
+        schema = get_schema((24, 1, 0))
+        validator = schema.get_validator("Material")
+        assert isinstance(validator, CompiledValidator)
+        assert schema.get_validator("Material") is validator
+
+    def test_unknown_type(self) -> None:
+        schema = get_schema((24, 1, 0))
+        assert schema.get_validator("NotAType") is None
+        errors = validate_object(IDFObject(obj_type="NotAType", name="X"), schema)
+        assert [(e.code, e.message) for e in errors] == [("W002", "Unknown object type 'NotAType'")]
+
+    def test_enum_case_insensitive(self) -> None:
+        schema = get_schema((24, 1, 0))
+        obj = IDFObject(obj_type="Material", name="M", data={"roughness": "mediumsmooth"})
+        assert validate_object(obj, schema, check_required=False) == []
+        obj.data["roughness"] = "Bumpy"
+        (err,) = validate_object(obj, schema, check_required=False)
+        assert err.code == "E004"
+        assert err.message.startswith("Value 'Bumpy' not in allowed values: ['MediumRough',")
+
+    def test_range_messages(self) -> None:
+        schema = get_schema((24, 1, 0))
+        obj = IDFObject(obj_type="Material", name="M", data={"thickness": 0.0, "solar_absorptance": 1.5})
+        errors = validate_object(obj, schema, check_required=False)
+        assert {(e.field, e.code, e.message) for e in errors} == {
+            ("thickness", "E006", "Value 0.0 must be greater than 0.0"),
+            ("solar_absorptance", "E007", "Value 1.5 is above maximum 1.0"),
+        }
+
+    def test_type_and_any_of(self) -> None:
+        schema = get_schema((24, 1, 0))
+        obj = IDFObject(obj_type="Zone", name="Z", data={"x_origin": "east", "volume": "Autocalculate"})
+        (err,) = validate_object(obj, schema)
+        assert (err.field, err.code, err.message) == ("x_origin", "E003", "Expected number, got str")
+        obj.data["x_origin"] = 0.0
+        obj.data["volume"] = [1.0]
+        (err,) = validate_object(obj, schema)
+        assert (err.field, err.code, err.message) == ("volume", "E002", "Value '[1.0]' does not match any valid type")
+
+    def test_required_and_unknown(self) -> None:
+        schema = get_schema((24, 1, 0))
+        obj = IDFObject(obj_type="Construction", name="C", data={"bogus": 1})
+        codes = {(e.field, e.code) for e in validate_object(obj, schema)}
+        assert codes == {("outside_layer", "E001"), ("bogus", "W003")}
+        assert validate_object(obj, schema, check_unknown=False, check_required=False) == []
+
+
 class TestValidateReferences:
     def test_dangling_reference_detected(self, empty_doc: IDFDocument) -> None:
         """Add a People object that references a non-existent zone."""
@@ -153,6 +221,64 @@ class TestValidateReferences:
         assert isinstance(result, ValidationResult)
 
 
+class TestValidator:
+    def _codes(self, result: ValidationResult) -> list[tuple[str, str | None, str]]:
+        return sorted((e.obj_name, e.field, e.code) for e in result.errors + result.warnings)
+
+    def test_matches_validate_document(self, simple_doc: IDFDocument) -> None:
+        simple_doc["Zone"]["TestZone"].x_origin = "far"
+        validator = Validator(simple_doc)
+        assert self._codes(validator.validate()) == self._codes(validate_document(simple_doc))
+        assert validator.last_checked == len(simple_doc)
+
+    def test_unchanged_document_checks_nothing(self, simple_doc: IDFDocument) -> None:
+        validator = Validator(simple_doc)
+        validator.validate()
+        assert validator.validate().is_valid
+        assert validator.last_checked == 0
+
+    def test_modified_object_rechecked(self, simple_doc: IDFDocument) -> None:
+        validator = Validator(simple_doc)
+        validator.validate()
+        material = simple_doc["Material"]["TestMaterial"]
+        material.thickness = -1.0
+        result = validator.validate()
+        assert validator.last_checked == 1
+        assert [(e.obj_name, e.code) for e in result.errors] == [("TestMaterial", "E006")]
+        material.thickness = 0.2
+        assert validator.validate().is_valid
+
+    def test_removed_target_dangles_referrers(self, simple_doc: IDFDocument) -> None:
+        validator = Validator(simple_doc)
+        validator.validate()
+        simple_doc.removeidfobject(simple_doc["Zone"]["TestZone"])
+        result = validator.validate()
+        assert validator.last_checked == 0
+        assert sorted((e.obj_name, e.code) for e in result.errors) == [("TestFloor", "E009"), ("TestWall", "E009")]
+        simple_doc.add("Zone", "TestZone")
+        assert validator.validate().is_valid
+        assert validator.last_checked == 1
+
+    def test_reference_field_change(self, simple_doc: IDFDocument) -> None:
+        validator = Validator(simple_doc)
+        validator.validate()
+        simple_doc["BuildingSurface:Detailed"]["TestWall"].construction_name = "Missing"
+        result = validator.validate()
+        assert [(e.obj_name, e.field, e.code) for e in result.errors] == [("TestWall", "construction_name", "E009")]
+
+    def test_flags_and_reset(self, simple_doc: IDFDocument) -> None:
+        simple_doc.removeidfobject(simple_doc["Material"]["TestMaterial"])
+        validator = Validator(simple_doc, check_references=False)
+        assert validator.validate().is_valid
+        validator.reset()
+        validator.validate()
+        assert validator.last_checked == len(simple_doc)
+
+    def test_no_schema(self) -> None:
+        result = Validator(IDFDocument()).validate()
+        assert [w.code for w in result.warnings] == ["W001"]
+
+
 class TestValidateSingletons:
     """Tests for maxProperties (singleton) constraint checking in validate_document."""
 
@@ -6,7 +6,9 @@ import json
 from pathlib import Path
 
 from idfkit import IDFDocument, new_document, parse_idf, write_epjson, write_idf
+from idfkit.objects import IDFObject
 from idfkit.writers import (
+    IDFWriter,
     convert_epjson_to_idf,
     convert_idf_to_epjson,
 )
@@ -168,6 +170,21 @@ class TestWriteIDF:
         assert schedule.data.get("field") == "Through: 12/31"
         assert schedule.data.get("field_4") == "1.0"
 
+    def test_iter_lines_matches_to_string(self, simple_doc: IDFDocument) -> None:
+        for output_type in ("standard", "nocomment", "compressed"):
+            writer = IDFWriter(simple_doc, output_type=output_type)
+            assert "\n".join(writer.iter_lines()) == writer.to_string()
+
+    def test_extra_objects_written_in_type_order(self, simple_doc: IDFDocument) -> None:
+        extra = IDFObject("Output:SQLite", "", {"option_type": "SimpleAndTabular"})
+        output = IDFWriter(simple_doc, output_type="compressed", extra_objects=[extra]).to_string()
+        assert "Output:SQLite,SimpleAndTabular;" in output
+        assert "Output:SQLite" not in simple_doc
+
+        expected = simple_doc.copy()
+        expected.add("Output:SQLite", "", data={"option_type": "SimpleAndTabular"})
+        assert output == write_idf(expected, output_type="compressed")
+
 
 # ---------------------------------------------------------------------------
 # write_epjson